@@ -10,6 +10,7 @@ from api.luckydraw import router as luckydraw_router
 from api.events import router as events_router
 from api.forms import router as forms_router
 from api.admins import router as admins_router
+from api.metrics import router as metrics_router
 
 __all__ = [
     "survey_router",
@@ -17,5 +18,6 @@ __all__ = [
     "luckydraw_router",
     "events_router",
     "forms_router",
-    "admins_router"
+    "admins_router",
+    "metrics_router"
 ]
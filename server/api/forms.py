@@ -11,6 +11,7 @@ from fastapi import APIRouter, HTTPException, status, Query
 from pydantic import BaseModel, Field
 from sqlalchemy import text
 from db.connection import get_engine
+from db.form_cache import invalidate_form_cache
 
 logger = logging.getLogger(__name__)
 
@@ -79,7 +80,10 @@ async def create_form(payload: FormCreate):
             "expires_at": payload.expires_at,
             "share_url": payload.share_url,
         }).fetchone()
-        return {"id": str(row[0])}
+
+    # 없는 폼으로 캐시된 share_url 제거
+    invalidate_form_cache(share_url=payload.share_url)
+    return {"id": str(row[0])}
 
 
 @router.get(
@@ -165,7 +169,10 @@ async def update_form(form_id: str, payload: FormCreate):
         }).fetchone()
         if not row:
             raise HTTPException(status_code=404, detail="Form not found")
-        return {"id": str(row[0])}
+
+    # 이전 share_url 항목(form_id 기준)과 새 share_url 항목 모두 무효화
+    invalidate_form_cache(share_url=payload.share_url, form_id=form_id)
+    return {"id": str(row[0])}
 
 
 @router.post(
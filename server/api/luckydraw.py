@@ -6,11 +6,14 @@ REST API와 WebSocket 엔드포인트를 모두 포함합니다.
 """
 
 import logging
-from typing import Optional
+from typing import List, Optional
 from fastapi import APIRouter, HTTPException, status, Query, Header, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from services import get_luckydraw_service, get_connection_manager
+from services.export_stream import EXPORT_MEDIA_TYPES, iter_export_chunks
+from services.draw_scheduler import ScheduledPrize, ScheduleIntervals
 
 logger = logging.getLogger(__name__)
 
@@ -446,6 +449,156 @@ async def complete_draw(event_id: str):
         )
 
 
+class DrawScheduleRequest(BaseModel):
+    """자동 추첨 시작 요청"""
+    prizes: List[DrawAnimationRequest] = Field(..., description="추첨할 상품 목록 (순서대로 진행)")
+    standby_seconds: float = Field(5.0, ge=0, description="대기 → 추첨 시작 간격 (초)")
+    reveal_seconds: float = Field(5.0, ge=0, description="추첨 시작 → 결과 발표 간격 (초)")
+    complete_seconds: float = Field(8.0, ge=0, description="결과 발표 → 추첨 완료 간격 (초)")
+    next_seconds: float = Field(5.0, ge=0, description="추첨 완료 → 다음 상품 대기 간격 (초)")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "prizes": [
+                    {"prize_name": "3등 상", "prize_rank": 3, "draw_mode": "card", "winner_count": 5},
+                    {"prize_name": "1등 상", "prize_rank": 1, "draw_mode": "slot", "winner_count": 1}
+                ],
+                "standby_seconds": 5,
+                "reveal_seconds": 5,
+                "complete_seconds": 8,
+                "next_seconds": 5
+            }
+        }
+
+
+@router.post(
+    "/admin/{event_id}/schedule",
+    summary="자동 추첨 시작",
+    description="상품 대기열을 서버 타이머로 standby → start → reveal → complete 순서로 자동 진행"
+)
+async def start_draw_schedule(event_id: str, request: DrawScheduleRequest):
+    """
+    자동 추첨 시작 API
+
+    **플로우** (상품마다 반복):
+    1. draw_standby 브로드캐스트 → standby_seconds 대기
+    2. 추첨 실행 + draw_started 브로드캐스트 → reveal_seconds 대기
+    3. winner_revealed 브로드캐스트 → complete_seconds 대기
+    4. 추첨 기록 + winner_announced 브로드캐스트 → next_seconds 대기
+
+    main 페이지가 draw_complete를 먼저 보내 완료된 경우 4단계는 건너뜁니다.
+    """
+    try:
+        service = get_luckydraw_service()
+        result = service.start_draw_schedule(
+            event_id=event_id,
+            prizes=[ScheduledPrize(**prize.model_dump()) for prize in request.prizes],
+            intervals=ScheduleIntervals(
+                standby_seconds=request.standby_seconds,
+                reveal_seconds=request.reveal_seconds,
+                complete_seconds=request.complete_seconds,
+                next_seconds=request.next_seconds
+            )
+        )
+
+        return {
+            "success": True,
+            "data": result
+        }
+
+    except ValueError as e:
+        logger.error(f"[ERROR] 자동 추첨 시작 실패: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "code": "SCHEDULE_FAILED",
+                "message": str(e)
+            }
+        )
+    except Exception as e:
+        logger.error(f"[ERROR] 서버 오류: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "code": "INTERNAL_ERROR",
+                "message": "서버 내부 에러가 발생했습니다"
+            }
+        )
+
+
+@router.get(
+    "/admin/{event_id}/schedule",
+    summary="자동 추첨 상태 조회",
+    description="자동 추첨 진행 상태 (현재 상품, 다음 단계, 남은 시간) 조회"
+)
+async def get_draw_schedule(event_id: str):
+    """
+    자동 추첨 상태 조회 API
+
+    **응답**:
+    - state: running | paused | finished | cancelled | failed (스케줄이 없으면 data=null)
+    - current_prize / next_step / next_run_in: 현재 상품, 다음 단계, 남은 시간(초)
+    """
+    service = get_luckydraw_service()
+    return {
+        "success": True,
+        "data": service.get_draw_schedule_status(event_id)
+    }
+
+
+@router.post(
+    "/admin/{event_id}/schedule/{action}",
+    summary="자동 추첨 제어",
+    description="자동 추첨 일시정지(pause) / 재개(resume) / 현재 상품 건너뛰기(skip) / 중단(cancel)"
+)
+async def control_draw_schedule(event_id: str, action: str):
+    """
+    자동 추첨 제어 API
+
+    **action**:
+    - pause: 남은 대기 시간을 보존하고 일시정지
+    - resume: 보존된 남은 시간부터 재개
+    - skip: 추첨 시작 전이면 현재 상품을 건너뛰고, 시작 후면 남은 단계를 즉시 진행
+    - cancel: 자동 추첨 중단
+    """
+    service = get_luckydraw_service()
+    handlers = {
+        "pause": service.pause_draw_schedule,
+        "resume": service.resume_draw_schedule,
+        "skip": service.skip_draw_schedule,
+        "cancel": service.cancel_draw_schedule,
+    }
+
+    try:
+        if action not in handlers:
+            raise ValueError(f"지원하지 않는 동작입니다: {action}")
+
+        return {
+            "success": True,
+            "data": handlers[action](event_id)
+        }
+
+    except ValueError as e:
+        logger.error(f"[ERROR] 자동 추첨 제어 실패: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "code": "SCHEDULE_CONTROL_FAILED",
+                "message": str(e)
+            }
+        )
+    except Exception as e:
+        logger.error(f"[ERROR] 서버 오류: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "code": "INTERNAL_ERROR",
+                "message": "서버 내부 에러가 발생했습니다"
+            }
+        )
+
+
 @router.get(
     "/check-winner",
     summary="당첨 여부 확인",
@@ -593,6 +746,109 @@ async def get_winners_info(event_id: str):
         )
 
 
+@router.get(
+    "/admin/{event_id}/dashboard",
+    summary="관리자 대시보드 스냅샷 조회",
+    description="통계, 추첨 이력, 당첨자 정보, 대기 중인 추첨을 한 번에 조회 (long-poll 지원)"
+)
+async def get_dashboard(
+    event_id: str,
+    since_version: Optional[int] = Query(None, description="마지막으로 받은 스냅샷 버전"),
+    wait: float = Query(0, ge=0, le=30, description="변경 대기 시간 (초, 최대 30)")
+):
+    """
+    관리자 대시보드 스냅샷 API
+
+    **사용 방법**:
+    - 최초 조회: `GET /admin/{event_id}/dashboard`
+    - 변경 대기: `GET /admin/{event_id}/dashboard?since_version={version}&wait=25`
+      → 상태가 바뀌면 즉시, 아니면 wait초 후 응답 (changed=false)
+
+    **응답**:
+    - data: 버전이 붙은 대시보드 스냅샷
+    - changed: since_version 이후 상태 변경 여부
+    """
+    try:
+        service = get_luckydraw_service()
+
+        if since_version is not None and wait > 0:
+            await service.wait_for_change(event_id, since_version, timeout=wait)
+
+        snapshot = await service.get_dashboard_snapshot(event_id)
+        return {
+            "success": True,
+            "data": snapshot,
+            "changed": snapshot["version"] != since_version
+        }
+
+    except Exception as e:
+        logger.error(f"[ERROR] 서버 오류: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "code": "INTERNAL_ERROR",
+                "message": "서버 내부 에러가 발생했습니다"
+            }
+        )
+
+
+@router.get(
+    "/admin/{event_id}/export/{dataset}",
+    summary="데이터 내보내기 (스트리밍)",
+    description="참가자/추첨 이력/당첨자 정보를 CSV 또는 NDJSON으로 스트리밍 다운로드"
+)
+async def export_event_data(
+    event_id: str,
+    dataset: str,
+    format: str = Query("csv", description="내보내기 포맷 (csv, ndjson)")
+):
+    """
+    데이터 내보내기 API
+
+    **데이터셋**:
+    - participants: 참가자 목록 (등록 순)
+    - draws: 추첨 이력
+    - winners: 당첨자 정보 (연락처 전체 포함, Admin 전용)
+
+    **특징**:
+    - 청크 단위 스트리밍으로 행 수와 무관하게 일정한 메모리 사용
+    - 직렬화는 스레드풀에서 수행되어 다른 이벤트의 WebSocket 처리를 막지 않음
+    """
+    try:
+        if format not in EXPORT_MEDIA_TYPES:
+            raise ValueError(f"지원하지 않는 내보내기 포맷입니다: {format}")
+
+        service = get_luckydraw_service()
+        fieldnames, rows = service.iter_export_rows(event_id, dataset)
+
+        return StreamingResponse(
+            iter_export_chunks(format, fieldnames, rows),
+            media_type=EXPORT_MEDIA_TYPES[format],
+            headers={
+                "Content-Disposition": f'attachment; filename="{event_id}_{dataset}.{format}"'
+            }
+        )
+
+    except ValueError as e:
+        logger.error(f"[ERROR] 내보내기 실패: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "code": "INVALID_REQUEST",
+                "message": str(e)
+            }
+        )
+    except Exception as e:
+        logger.error(f"[ERROR] 서버 오류: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "code": "INTERNAL_ERROR",
+                "message": "서버 내부 에러가 발생했습니다"
+            }
+        )
+
+
 # ============================================================
 # WebSocket 엔드포인트
 # ============================================================
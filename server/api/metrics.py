@@ -0,0 +1,23 @@
+"""
+지표 API 엔드포인트
+
+Prometheus 수집용 분류 지표 (services/metrics_exporter.py)
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from services.metrics_exporter import CONTENT_TYPE, render_prometheus
+
+# API 라우터 생성
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get(
+    "/metrics",
+    summary="Prometheus 지표",
+    description="분류 카운터/지연 시간 히스토그램과 분류 구성 요소 통계를 Prometheus 텍스트 형식으로 반환합니다"
+)
+async def metrics():
+    """Prometheus 지표 API"""
+    return Response(content=render_prometheus(), media_type=CONTENT_TYPE)
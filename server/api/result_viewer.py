@@ -40,6 +40,8 @@ async def get_result(
     - 모바일 QR 코드 스캔 → `/test/2/share?memberId={id}`
     - 해당 페이지에서 GET /api/result?member_id={id}&share_url=test/2 호출
     - result_type 획득 → resultData[result_type] 표시
+    - 백그라운드 AI 분류 모드에서 ai_status가 "pending"이면 Fallback 결과이며,
+      AI 분류가 끝나면 같은 요청이 갱신된 결과(ai_status "done")를 반환
 
     **응답**:
     - 200: 결과 조회 성공
@@ -54,7 +56,7 @@ async def get_result(
         supabase_client = get_supabase_client()
 
         # Step 1: share_url로 form_id 조회
-        form = supabase_client.get_form_by_share_url(share_url)
+        form = await supabase_client.get_form_by_share_url(share_url)
 
         if not form:
             logger.error(f"[FAIL] 폼을 찾을 수 없습니다 | share_url: {share_url}")
@@ -122,7 +124,9 @@ async def get_result(
                 "result_type": result.get("type"),
                 "source": result.get("source"),
                 "classified_at": result.get("classified_at"),
-                "ai_error": result.get("ai_error")
+                "ai_error": result.get("ai_error"),
+                # 백그라운드 AI 분류 상태 (pending이면 AI 결과 갱신 전)
+                "ai_status": result.get("ai_status")
             }
         }
 
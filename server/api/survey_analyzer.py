@@ -11,7 +11,19 @@ from datetime import datetime
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, Field
 
-from services.classifier import classify_with_fallback
+from services.classifier import (
+    classify_fallback_first,
+    classify_with_fallback,
+    get_classification_stats,
+)
+from services.background_classifier import (
+    AI_STATUS_PENDING,
+    AI_STATUS_SKIPPED,
+    ClassificationJob,
+    get_background_classifier,
+    new_job_id,
+)
+from services.survey_schema import get_form_schema
 from db.supabase_client import get_supabase_client
 
 logger = logging.getLogger(__name__)
@@ -59,7 +71,7 @@ class SurveyRequest(BaseModel):
 class AnalysisResult(BaseModel):
     """분석 결과"""
     type: str = Field(..., description="피부 타입 (8가지 중 하나)")
-    source: str = Field(..., description="분류 출처 (ai, fallback, none)")
+    source: str = Field(..., description="분류 출처 (ai, local, fallback, none)")
     ai_error: Optional[str] = Field(None, description="AI 에러 메시지 (있을 경우)")
     classified_at: str = Field(..., description="분류 시간 (ISO 8601)")
 
@@ -132,6 +144,11 @@ async def analyze_survey(request: SurveyRequest):
     2. Supabase에 응답 + 결과 저장
     3. 프론트엔드에 결과 반환
 
+    **백그라운드 AI 분류 모드** (AI_BACKGROUND_ENABLED=true):
+    1. 캐시된 AI 결과 또는 Fallback 결과로 즉시 분류 (ai_status=pending)
+    2. 저장 후 바로 응답, AI 분류는 백그라운드 작업자가 수행하여 결과 갱신
+    3. /api/result가 갱신된 결과(ai_status=done)를 반환
+
     **에러 처리**:
     - AI 및 Fallback 모두 실패 → 500 에러
     - Supabase 저장 실패 → 500 에러
@@ -140,7 +157,7 @@ async def analyze_survey(request: SurveyRequest):
     try:
         # Step 0: share_url로 폼 조회
         supabase_client = get_supabase_client()
-        form = supabase_client.get_form_by_share_url(request.share_url)
+        form = await supabase_client.get_form_by_share_url(request.share_url)
 
         if not form:
             logger.error(f"[FAIL] 폼을 찾을 수 없습니다 | share_url: {request.share_url}")
@@ -154,6 +171,8 @@ async def analyze_survey(request: SurveyRequest):
             )
 
         form_id = form["id"]  # UUID form_id 추출
+        # 폼 fields에 분류 속성이 있으면 폼 전용 스키마 (폼 수정 시각 단위로 컴파일 캐시)
+        schema = get_form_schema(form)
 
         # Step 1: AI 분류 (+ Fallback)
         logger.info(f"=== 설문 분석 시작 ===")
@@ -161,9 +180,15 @@ async def analyze_survey(request: SurveyRequest):
         logger.info(f"share_url: {request.share_url}")
         logger.info(f"form_id: {form_id}")
 
-        result_type, source, ai_error = await classify_with_fallback(
-            request.responses
-        )
+        background = get_background_classifier()
+        if background is not None:
+            result_type, source, ai_error = await classify_fallback_first(
+                request.responses, schema
+            )
+        else:
+            result_type, source, ai_error = await classify_with_fallback(
+                request.responses, schema
+            )
 
         # 분류 실패 처리
         if not result_type:
@@ -197,41 +222,50 @@ async def analyze_survey(request: SurveyRequest):
             "classified_at": datetime.now().isoformat()
         }
 
-        # 기존 응답 확인
-        existing_response = await supabase_client.get_form_response(
+        # 백그라운드 AI 분류 대상 (캐시된 AI 결과가 없는 경우)
+        job = None
+        if background is not None and source == "fallback":
+            if background.accepting():
+                job = ClassificationJob(
+                    job_id=new_job_id(),
+                    member_id=request.member_id,
+                    form_id=form_id,
+                    answers=request.responses,
+                    fallback_result=result,
+                    schema=schema
+                )
+                result = {**result, "ai_status": AI_STATUS_PENDING, "job_id": job.job_id}
+            else:
+                background.record_skipped()
+                logger.warning("[백그라운드 AI 분류] 대기 작업 상한 초과로 AI 분류 생략")
+                result = {**result, "ai_status": AI_STATUS_SKIPPED}
+
+        # 응답 저장 (없으면 생성, 있으면 수정 - 단일 upsert)
+        saved_data = await supabase_client.upsert_form_response(
             member_id=request.member_id,
-            form_id=form_id
+            form_id=form_id,
+            responses=request.responses,
+            result=result
         )
 
-        if existing_response:
-            # 응답 수정
-            logger.info(f"기존 응답 수정 중...")
-            saved_data = await supabase_client.update_form_response(
-                member_id=request.member_id,
-                form_id=form_id,
-                responses=request.responses,
-                result=result
-            )
-        else:
-            # 새 응답 저장
-            logger.info(f"새 응답 저장 중...")
-            saved_data = await supabase_client.insert_form_response(
-                member_id=request.member_id,
-                form_id=form_id,
-                responses=request.responses,
-                result=result
-            )
-
         logger.info(f"[SUCCESS] Supabase 저장 완료")
 
+        # 저장된 행의 결과를 백그라운드 작업이 갱신
+        if job is not None:
+            background.submit(job)
+
         # Step 3: 프론트엔드 응답
+        data = {
+            "result_type": result_type,
+            "source": source,
+            "response_id": saved_data.get("id")
+        }
+        if "ai_status" in result:
+            data["ai_status"] = result["ai_status"]
+
         return SurveyResponse(
             success=True,
-            data={
-                "result_type": result_type,
-                "source": source,
-                "response_id": saved_data.get("id")
-            },
+            data=data,
             message="분석 완료"
         )
 
@@ -252,6 +286,24 @@ async def analyze_survey(request: SurveyRequest):
         )
 
 
+@router.get(
+    "/stats",
+    summary="분류 통계",
+    description="출처별 분류 수, AI 실패 원인, 단계별 지연 시간 히스토그램, 재시도 횟수를 반환합니다"
+)
+async def classification_stats():
+    """
+    분류 통계 API (프로세스 시작 이후 누적)
+
+    OpenAI 할당량/타임아웃 설정 근거로 사용합니다.
+    Prometheus 수집은 /metrics를 사용하세요.
+    """
+    return {
+        "success": True,
+        "data": get_classification_stats()
+    }
+
+
 @router.get(
     "/health",
     summary="헬스 체크",
@@ -277,11 +329,35 @@ async def health_check():
 
         SupabaseConfig.validate_config()
 
+        from db.form_cache import get_form_cache_stats
+        from services.classification_cache import get_classification_cache_stats
+        from services.ai_classifier import get_admission_stats, get_retry_stats
+        from services.background_classifier import get_background_classifier_stats
+        from services.local_classifier import get_local_classifier_stats
+        from services.openai_http import get_openai_http_stats
+        from services.openai_replay import get_replay_stats
+        from services.classifier import (
+            get_circuit_breaker_status,
+            get_latency_budget_stats,
+            get_single_flight_stats,
+        )
+
         return {
             "status": "healthy",
             "ai_configured": True,
             "supabase_configured": True,
             "fallback_enabled": AIConfig.ENABLE_FALLBACK,
+            "form_cache": get_form_cache_stats(),
+            "classification_cache": get_classification_cache_stats(),
+            "ai_single_flight": get_single_flight_stats(),
+            "ai_latency_budget": get_latency_budget_stats(),
+            "ai_circuit_breaker": get_circuit_breaker_status(),
+            "ai_admission": get_admission_stats(),
+            "ai_retry": get_retry_stats(),
+            "ai_http": get_openai_http_stats(),
+            "ai_replay": get_replay_stats(),
+            "ai_background": get_background_classifier_stats(),
+            "ai_local_model": get_local_classifier_stats(),
             "timestamp": datetime.now().isoformat()
         }
 
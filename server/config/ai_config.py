@@ -21,16 +21,115 @@ class AIConfig:
     OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
     OPENAI_MAX_TOKENS: int = int(os.getenv("OPENAI_MAX_TOKENS", "50"))
     OPENAI_TEMPERATURE: float = float(os.getenv("OPENAI_TEMPERATURE", "0"))
+    # 응답 형식 (text: 자유 텍스트에서 결과 타입 추출 / json_schema: Structured Outputs로 결과 타입 강제 /
+    # code: logit_bias로 숫자 코드 1토큰만 생성, services/ai_output.py 참고)
+    AI_OUTPUT_MODE: str = os.getenv("AI_OUTPUT_MODE", "text").lower()
 
     # ===== 타임아웃 및 재시도 설정 =====
     AI_TIMEOUT_SECONDS: int = int(os.getenv("AI_TIMEOUT_SECONDS", "10"))
     AI_MAX_RETRIES: int = int(os.getenv("AI_MAX_RETRIES", "2"))
+    # 재시도 대기 = 0 ~ min(AI_RETRY_MAX_DELAY, AI_RETRY_DELAY * 2^재시도 횟수) 무작위 (full jitter)
+    # Retry-After 헤더가 있으면 그 이상 대기
     AI_RETRY_DELAY: float = float(os.getenv("AI_RETRY_DELAY", "0.5"))
+    AI_RETRY_MAX_DELAY: float = float(os.getenv("AI_RETRY_MAX_DELAY", "8"))
+    # 요청당 재시도 시간 예산 (초, 첫 시도부터 이 시간을 넘기는 재시도는 하지 않음)
+    AI_RETRY_BUDGET_SECONDS: float = float(os.getenv("AI_RETRY_BUDGET_SECONDS", "20"))
+    # 프로세스 재시도 예산: 재시도 수 <= 요청 수 * RATIO + 초당 MIN_PER_SECOND
+    # (장애 시 재시도로 늘어나는 OpenAI 요청을 최대 (1 + RATIO)배로 제한)
+    AI_RETRY_BUDGET_RATIO: float = float(os.getenv("AI_RETRY_BUDGET_RATIO", "0.2"))
+    AI_RETRY_BUDGET_MIN_PER_SECOND: float = float(
+        os.getenv("AI_RETRY_BUDGET_MIN_PER_SECOND", "1")
+    )
+    # 요청당 AI 응답 대기 상한 (초, 0이면 재시도 포함 AI 완료까지 대기)
+    # 초과 시 Fallback 결과를 반환하고 AI 결과는 도착하면 캐시에 기록
+    AI_LATENCY_BUDGET_SECONDS: float = float(os.getenv("AI_LATENCY_BUDGET_SECONDS", "4"))
+
+    # ===== OpenAI 연결 풀 설정 =====
+    # 최대 연결 수 / 유휴 상태로 유지할 연결 수 / 유휴 연결 유지 시간 (초)
+    # (SDK 기본값은 유휴 연결을 5초 만에 닫아 요청이 뜸할 때마다 TCP/TLS 연결을 새로 맺음)
+    AI_HTTP_MAX_CONNECTIONS: int = int(os.getenv("AI_HTTP_MAX_CONNECTIONS", "100"))
+    AI_HTTP_MAX_KEEPALIVE: int = int(os.getenv("AI_HTTP_MAX_KEEPALIVE", "20"))
+    AI_HTTP_KEEPALIVE_SECONDS: float = float(os.getenv("AI_HTTP_KEEPALIVE_SECONDS", "60"))
+    # 서버 시작 시 미리 열어 둘 연결 수 (0이면 사전 연결 안 함)
+    AI_HTTP_WARMUP_CONNECTIONS: int = int(os.getenv("AI_HTTP_WARMUP_CONNECTIONS", "4"))
+
+    # ===== OpenAI 응답 기록/재생 설정 (테스트/벤치마크용, services/openai_replay.py) =====
+    # 빈 값: 사용 안 함 / record: 기록에 없는 요청만 실제로 보내고 응답 기록 /
+    # replay: 기록된 응답만 사용 (네트워크 사용 안 함, OPENAI_API_KEY는 임의 값 가능)
+    AI_REPLAY_MODE: str = os.getenv("AI_REPLAY_MODE", "").lower()
+    AI_REPLAY_PATH: str = os.getenv("AI_REPLAY_PATH", "recordings/openai.ndjson")
+
+    # ===== 요청 한도 설정 (승인 제어) =====
+    # 동시 OpenAI 요청 수 / 분당 요청 수 / 분당 토큰 수 (RPM/TPM은 0이면 제한 없음)
+    # 계정 등급의 OpenAI 한도에 맞춰 설정하면 RateLimitError 없이 한도까지 처리
+    # (예: gpt-4o-mini Tier 1 = 500 RPM / 200000 TPM)
+    AI_MAX_CONCURRENCY: int = int(os.getenv("AI_MAX_CONCURRENCY", "16"))
+    AI_RATE_LIMIT_RPM: float = float(os.getenv("AI_RATE_LIMIT_RPM", "0"))
+    AI_RATE_LIMIT_TPM: float = float(os.getenv("AI_RATE_LIMIT_TPM", "0"))
+    # 승인 대기 요청 수 상한 (초과 시 바로 Fallback)
+    AI_ADMISSION_QUEUE_SIZE: int = int(os.getenv("AI_ADMISSION_QUEUE_SIZE", "200"))
+
+    # ===== 서킷 브레이커 설정 =====
+    # 최근 호출의 실패율/느린 호출 비율이 기준을 넘으면 AI 호출을 차단하고 바로 Fallback 사용
+    AI_BREAKER_ENABLED: bool = os.getenv("AI_BREAKER_ENABLED", "true").lower() == "true"
+    AI_BREAKER_WINDOW_SIZE: int = int(os.getenv("AI_BREAKER_WINDOW_SIZE", "20"))
+    AI_BREAKER_MIN_CALLS: int = int(os.getenv("AI_BREAKER_MIN_CALLS", "10"))
+    AI_BREAKER_FAILURE_RATE: float = float(os.getenv("AI_BREAKER_FAILURE_RATE", "0.5"))
+    AI_BREAKER_SLOW_CALL_SECONDS: float = float(os.getenv("AI_BREAKER_SLOW_CALL_SECONDS", "8"))
+    AI_BREAKER_SLOW_CALL_RATE: float = float(os.getenv("AI_BREAKER_SLOW_CALL_RATE", "0.8"))
+    # open 유지 시간 (초), 이후 시험 호출로 복구 확인
+    AI_BREAKER_OPEN_SECONDS: float = float(os.getenv("AI_BREAKER_OPEN_SECONDS", "30"))
+    AI_BREAKER_HALF_OPEN_CALLS: int = int(os.getenv("AI_BREAKER_HALF_OPEN_CALLS", "2"))
+
+    # ===== 마이크로 배칭 설정 =====
+    # 동시에 들어온 분류 요청을 모아 한 번의 API 요청으로 전송
+    AI_BATCH_ENABLED: bool = os.getenv("AI_BATCH_ENABLED", "false").lower() == "true"
+    AI_BATCH_WINDOW_MS: float = float(os.getenv("AI_BATCH_WINDOW_MS", "20"))
+    AI_BATCH_MAX_SIZE: int = int(os.getenv("AI_BATCH_MAX_SIZE", "16"))
+    # 일괄 요청의 항목당 max_tokens (JSON 배열 원소 1개 기준)
+    AI_BATCH_TOKENS_PER_ITEM: int = int(os.getenv("AI_BATCH_TOKENS_PER_ITEM", "12"))
+
+    # ===== 백그라운드 AI 분류 설정 =====
+    # 설문 제출 시 Fallback 결과로 즉시 응답하고, AI 분류는 작업자가 처리하여 결과를 갱신
+    AI_BACKGROUND_ENABLED: bool = os.getenv("AI_BACKGROUND_ENABLED", "false").lower() == "true"
+    AI_BACKGROUND_WORKERS: int = int(os.getenv("AI_BACKGROUND_WORKERS", "4"))
+    # 대기 작업 상한 (초과 시 AI 분류 없이 Fallback 결과로 확정)
+    AI_BACKGROUND_QUEUE_SIZE: int = int(os.getenv("AI_BACKGROUND_QUEUE_SIZE", "1000"))
+    # 작업당 최대 시도 횟수 / 재시도 대기 시간 (초, 시도마다 2배, 최대 60초)
+    AI_BACKGROUND_MAX_ATTEMPTS: int = int(os.getenv("AI_BACKGROUND_MAX_ATTEMPTS", "4"))
+    AI_BACKGROUND_RETRY_DELAY_SECONDS: float = float(
+        os.getenv("AI_BACKGROUND_RETRY_DELAY_SECONDS", "5")
+    )
+
+    # ===== 로컬 분류 모델 설정 =====
+    # 저장된 AI 분류 결과로 학습한 모델(python -m services.local_classifier train)이
+    # 확신하는 응답은 AI 호출 없이 분류 (source=local)
+    AI_LOCAL_MODEL_ENABLED: bool = os.getenv("AI_LOCAL_MODEL_ENABLED", "false").lower() == "true"
+    # 모델 파일 경로 (빈 값이면 services/data/local_model.json)
+    AI_LOCAL_MODEL_PATH: str = os.getenv("AI_LOCAL_MODEL_PATH", "")
+    # 로컬 결과를 사용할 최소 확신도 (사후 확률)
+    AI_LOCAL_MODEL_THRESHOLD: float = float(os.getenv("AI_LOCAL_MODEL_THRESHOLD", "0.95"))
+    # 모델을 사용할 최소 학습 샘플 수
+    AI_LOCAL_MODEL_MIN_SAMPLES: int = int(os.getenv("AI_LOCAL_MODEL_MIN_SAMPLES", "500"))
+    # 로컬 결과 중 AI 분류도 실행하여 일치율을 측정할 비율 (0~1)
+    AI_LOCAL_MODEL_SHADOW_RATE: float = float(os.getenv("AI_LOCAL_MODEL_SHADOW_RATE", "0.05"))
+
+    # ===== 설문 스키마 설정 =====
+    # 기본 설문 스키마 파일 경로 (빈 값이면 services/data/surveys/test2.json)
+    # 폼의 fields에 option_ids/scores가 있으면 그 폼은 fields로 컴파일한 스키마 사용
+    SURVEY_SCHEMA_PATH: str = os.getenv("SURVEY_SCHEMA_PATH", "")
 
     # ===== Fallback 설정 =====
     ENABLE_FALLBACK: bool = os.getenv("ENABLE_FALLBACK", "true").lower() == "true"
     LOG_FALLBACK: bool = os.getenv("LOG_FALLBACK", "true").lower() == "true"
 
+    # ===== 분류 결과 캐시 설정 =====
+    # 같은 응답 조합의 AI 분류 결과 재사용 (프롬프트/모델 변경 시 자동 무효화)
+    AI_CACHE_ENABLED: bool = os.getenv("AI_CACHE_ENABLED", "true").lower() == "true"
+    AI_CACHE_MAX_ENTRIES: int = int(os.getenv("AI_CACHE_MAX_ENTRIES", "10000"))
+    # 영속 저장소 SQLite 파일 경로 (빈 값이면 메모리 전용)
+    AI_CACHE_DB_PATH: str = os.getenv("AI_CACHE_DB_PATH", "classification_cache.db")
+
     # ===== 유효한 결과 타입 (resultData.js와 동일) =====
     VALID_RESULT_TYPES: List[str] = [
         "office_thirst",        # 오후 3시 사무실의 갈증형
@@ -107,6 +206,64 @@ Response: sensitive_fragile"""
                 f"현재 값: {cls.AI_MAX_RETRIES}"
             )
 
+        # 재시도 대기/예산 검증
+        if cls.AI_RETRY_DELAY < 0 or cls.AI_RETRY_MAX_DELAY < cls.AI_RETRY_DELAY:
+            raise ValueError(
+                f"AI_RETRY_DELAY는 0 이상, AI_RETRY_MAX_DELAY는 AI_RETRY_DELAY 이상이어야 합니다. "
+                f"현재 값: {cls.AI_RETRY_DELAY}, {cls.AI_RETRY_MAX_DELAY}"
+            )
+        if cls.AI_RETRY_BUDGET_SECONDS <= 0:
+            raise ValueError(
+                f"AI_RETRY_BUDGET_SECONDS는 0보다 커야 합니다. "
+                f"현재 값: {cls.AI_RETRY_BUDGET_SECONDS}"
+            )
+        if cls.AI_RETRY_BUDGET_RATIO < 0 or cls.AI_RETRY_BUDGET_RATIO > 1:
+            raise ValueError(
+                f"AI_RETRY_BUDGET_RATIO는 0~1 사이여야 합니다. "
+                f"현재 값: {cls.AI_RETRY_BUDGET_RATIO}"
+            )
+        if cls.AI_RETRY_BUDGET_MIN_PER_SECOND < 0:
+            raise ValueError(
+                f"AI_RETRY_BUDGET_MIN_PER_SECOND는 0 이상이어야 합니다. "
+                f"현재 값: {cls.AI_RETRY_BUDGET_MIN_PER_SECOND}"
+            )
+
+        # 응답 시간 예산 검증 (0~60초)
+        if cls.AI_LATENCY_BUDGET_SECONDS < 0 or cls.AI_LATENCY_BUDGET_SECONDS > 60:
+            raise ValueError(
+                f"AI_LATENCY_BUDGET_SECONDS는 0~60 사이여야 합니다. "
+                f"현재 값: {cls.AI_LATENCY_BUDGET_SECONDS}"
+            )
+
+        # 연결 풀 설정 검증
+        if cls.AI_HTTP_MAX_CONNECTIONS < 1:
+            raise ValueError(
+                f"AI_HTTP_MAX_CONNECTIONS는 1 이상이어야 합니다. "
+                f"현재 값: {cls.AI_HTTP_MAX_CONNECTIONS}"
+            )
+        if cls.AI_HTTP_MAX_KEEPALIVE < 0 or cls.AI_HTTP_MAX_KEEPALIVE > cls.AI_HTTP_MAX_CONNECTIONS:
+            raise ValueError(
+                f"AI_HTTP_MAX_KEEPALIVE는 0~AI_HTTP_MAX_CONNECTIONS 사이여야 합니다. "
+                f"현재 값: {cls.AI_HTTP_MAX_KEEPALIVE}"
+            )
+        if cls.AI_HTTP_KEEPALIVE_SECONDS < 0:
+            raise ValueError(
+                f"AI_HTTP_KEEPALIVE_SECONDS는 0 이상이어야 합니다. "
+                f"현재 값: {cls.AI_HTTP_KEEPALIVE_SECONDS}"
+            )
+        if cls.AI_HTTP_WARMUP_CONNECTIONS < 0 or cls.AI_HTTP_WARMUP_CONNECTIONS > cls.AI_HTTP_MAX_CONNECTIONS:
+            raise ValueError(
+                f"AI_HTTP_WARMUP_CONNECTIONS는 0~AI_HTTP_MAX_CONNECTIONS 사이여야 합니다. "
+                f"현재 값: {cls.AI_HTTP_WARMUP_CONNECTIONS}"
+            )
+
+        # 응답 기록/재생 설정 검증
+        if cls.AI_REPLAY_MODE not in ("", "record", "replay"):
+            raise ValueError(
+                f"AI_REPLAY_MODE는 빈 값, record, replay 중 하나여야 합니다. "
+                f"현재 값: {cls.AI_REPLAY_MODE}"
+            )
+
         # Temperature 검증 (0~1)
         if cls.OPENAI_TEMPERATURE < 0 or cls.OPENAI_TEMPERATURE > 1:
             raise ValueError(
@@ -114,6 +271,97 @@ Response: sensitive_fragile"""
                 f"현재 값: {cls.OPENAI_TEMPERATURE}"
             )
 
+        # 응답 형식 검증
+        if cls.AI_OUTPUT_MODE not in ("text", "json_schema", "code"):
+            raise ValueError(
+                f"AI_OUTPUT_MODE는 text, json_schema, code 중 하나여야 합니다. "
+                f"현재 값: {cls.AI_OUTPUT_MODE}"
+            )
+
+        # 요청 한도 설정 검증
+        if cls.AI_MAX_CONCURRENCY < 1 or cls.AI_MAX_CONCURRENCY > 256:
+            raise ValueError(
+                f"AI_MAX_CONCURRENCY는 1~256 사이여야 합니다. "
+                f"현재 값: {cls.AI_MAX_CONCURRENCY}"
+            )
+        for name in ("AI_RATE_LIMIT_RPM", "AI_RATE_LIMIT_TPM"):
+            value = getattr(cls, name)
+            if value < 0:
+                raise ValueError(f"{name}는 0 이상이어야 합니다. 현재 값: {value}")
+        if cls.AI_ADMISSION_QUEUE_SIZE < 0:
+            raise ValueError(
+                f"AI_ADMISSION_QUEUE_SIZE는 0 이상이어야 합니다. "
+                f"현재 값: {cls.AI_ADMISSION_QUEUE_SIZE}"
+            )
+
+        # 서킷 브레이커 설정 검증
+        if cls.AI_BREAKER_MIN_CALLS < 1 or cls.AI_BREAKER_MIN_CALLS > cls.AI_BREAKER_WINDOW_SIZE:
+            raise ValueError(
+                f"AI_BREAKER_MIN_CALLS는 1~AI_BREAKER_WINDOW_SIZE 사이여야 합니다. "
+                f"현재 값: {cls.AI_BREAKER_MIN_CALLS}"
+            )
+        for name in ("AI_BREAKER_FAILURE_RATE", "AI_BREAKER_SLOW_CALL_RATE"):
+            value = getattr(cls, name)
+            if value <= 0 or value > 1:
+                raise ValueError(f"{name}는 0 초과 1 이하여야 합니다. 현재 값: {value}")
+
+        # 배치 설정 검증
+        if cls.AI_BATCH_MAX_SIZE < 1 or cls.AI_BATCH_MAX_SIZE > 64:
+            raise ValueError(
+                f"AI_BATCH_MAX_SIZE는 1~64 사이여야 합니다. "
+                f"현재 값: {cls.AI_BATCH_MAX_SIZE}"
+            )
+        if cls.AI_BATCH_WINDOW_MS < 0 or cls.AI_BATCH_WINDOW_MS > 1000:
+            raise ValueError(
+                f"AI_BATCH_WINDOW_MS는 0~1000 사이여야 합니다. "
+                f"현재 값: {cls.AI_BATCH_WINDOW_MS}"
+            )
+
+        # 백그라운드 AI 분류 설정 검증
+        if cls.AI_BACKGROUND_WORKERS < 1 or cls.AI_BACKGROUND_WORKERS > 64:
+            raise ValueError(
+                f"AI_BACKGROUND_WORKERS는 1~64 사이여야 합니다. "
+                f"현재 값: {cls.AI_BACKGROUND_WORKERS}"
+            )
+        if cls.AI_BACKGROUND_MAX_ATTEMPTS < 1 or cls.AI_BACKGROUND_MAX_ATTEMPTS > 10:
+            raise ValueError(
+                f"AI_BACKGROUND_MAX_ATTEMPTS는 1~10 사이여야 합니다. "
+                f"현재 값: {cls.AI_BACKGROUND_MAX_ATTEMPTS}"
+            )
+        if cls.AI_BACKGROUND_ENABLED and not cls.ENABLE_FALLBACK:
+            raise ValueError("AI_BACKGROUND_ENABLED=true에는 ENABLE_FALLBACK=true가 필요합니다.")
+
+        # 로컬 분류 모델 설정 검증
+        if cls.AI_LOCAL_MODEL_THRESHOLD <= 0 or cls.AI_LOCAL_MODEL_THRESHOLD > 1:
+            raise ValueError(
+                f"AI_LOCAL_MODEL_THRESHOLD는 0 초과 1 이하여야 합니다. "
+                f"현재 값: {cls.AI_LOCAL_MODEL_THRESHOLD}"
+            )
+        if cls.AI_LOCAL_MODEL_MIN_SAMPLES < 1:
+            raise ValueError(
+                f"AI_LOCAL_MODEL_MIN_SAMPLES는 1 이상이어야 합니다. "
+                f"현재 값: {cls.AI_LOCAL_MODEL_MIN_SAMPLES}"
+            )
+        if cls.AI_LOCAL_MODEL_SHADOW_RATE < 0 or cls.AI_LOCAL_MODEL_SHADOW_RATE > 1:
+            raise ValueError(
+                f"AI_LOCAL_MODEL_SHADOW_RATE는 0~1 사이여야 합니다. "
+                f"현재 값: {cls.AI_LOCAL_MODEL_SHADOW_RATE}"
+            )
+
+        # 설문 스키마 파일 검증
+        if cls.SURVEY_SCHEMA_PATH and not os.path.isfile(cls.SURVEY_SCHEMA_PATH):
+            raise ValueError(
+                f"SURVEY_SCHEMA_PATH 파일이 없습니다. "
+                f"현재 값: {cls.SURVEY_SCHEMA_PATH}"
+            )
+
+        # 캐시 크기 검증
+        if cls.AI_CACHE_MAX_ENTRIES < 1:
+            raise ValueError(
+                f"AI_CACHE_MAX_ENTRIES는 1 이상이어야 합니다. "
+                f"현재 값: {cls.AI_CACHE_MAX_ENTRIES}"
+            )
+
         # Max Tokens 검증 (10~200)
         if cls.OPENAI_MAX_TOKENS < 10 or cls.OPENAI_MAX_TOKENS > 200:
             raise ValueError(
@@ -133,11 +381,38 @@ Response: sensitive_fragile"""
             "model": cls.OPENAI_MODEL,
             "max_tokens": cls.OPENAI_MAX_TOKENS,
             "temperature": cls.OPENAI_TEMPERATURE,
+            "output_mode": cls.AI_OUTPUT_MODE,
             "timeout_seconds": cls.AI_TIMEOUT_SECONDS,
             "max_retries": cls.AI_MAX_RETRIES,
             "retry_delay": cls.AI_RETRY_DELAY,
+            "retry_max_delay": cls.AI_RETRY_MAX_DELAY,
+            "retry_budget_seconds": cls.AI_RETRY_BUDGET_SECONDS,
+            "retry_budget_ratio": cls.AI_RETRY_BUDGET_RATIO,
+            "retry_budget_min_per_second": cls.AI_RETRY_BUDGET_MIN_PER_SECOND,
+            "latency_budget_seconds": cls.AI_LATENCY_BUDGET_SECONDS,
+            "http_max_connections": cls.AI_HTTP_MAX_CONNECTIONS,
+            "http_max_keepalive": cls.AI_HTTP_MAX_KEEPALIVE,
+            "http_keepalive_seconds": cls.AI_HTTP_KEEPALIVE_SECONDS,
+            "http_warmup_connections": cls.AI_HTTP_WARMUP_CONNECTIONS,
+            "replay_mode": cls.AI_REPLAY_MODE or None,
+            "max_concurrency": cls.AI_MAX_CONCURRENCY,
+            "rate_limit_rpm": cls.AI_RATE_LIMIT_RPM,
+            "rate_limit_tpm": cls.AI_RATE_LIMIT_TPM,
+            "admission_queue_size": cls.AI_ADMISSION_QUEUE_SIZE,
+            "breaker_enabled": cls.AI_BREAKER_ENABLED,
+            "batch_enabled": cls.AI_BATCH_ENABLED,
+            "batch_window_ms": cls.AI_BATCH_WINDOW_MS,
+            "batch_max_size": cls.AI_BATCH_MAX_SIZE,
+            "background_enabled": cls.AI_BACKGROUND_ENABLED,
+            "background_workers": cls.AI_BACKGROUND_WORKERS,
+            "background_queue_size": cls.AI_BACKGROUND_QUEUE_SIZE,
+            "local_model_enabled": cls.AI_LOCAL_MODEL_ENABLED,
+            "local_model_threshold": cls.AI_LOCAL_MODEL_THRESHOLD,
+            "survey_schema_path": cls.SURVEY_SCHEMA_PATH or "(기본)",
             "fallback_enabled": cls.ENABLE_FALLBACK,
             "log_fallback": cls.LOG_FALLBACK,
+            "cache_enabled": cls.AI_CACHE_ENABLED,
+            "cache_max_entries": cls.AI_CACHE_MAX_ENTRIES,
             "valid_result_types": cls.VALID_RESULT_TYPES
         }
 
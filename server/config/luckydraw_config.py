@@ -0,0 +1,52 @@
+"""
+경품추첨 서비스 설정
+
+추첨번호 할당 방식 등 경품추첨 관련 설정을 환경 변수로 관리합니다.
+"""
+
+import os
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+
+class LuckyDrawConfig:
+    """경품추첨 서비스 설정 클래스"""
+
+    # ===== 추첨번호 할당 설정 =====
+    # local: 프로세스 내 카운터 (단일 워커)
+    # sqlite: 같은 호스트의 워커들이 SQLite 파일을 통해 번호 블록을 임대
+    # postgres: 여러 호스트의 워커들이 PostgreSQL 카운터 테이블을 통해 번호 블록을 임대
+    # 주의: 워커 간에 공유되는 것은 추첨번호뿐입니다. 참가자/추첨 결과/추첨 샘플러는 워커마다
+    #       메모리(_storage)에 따로 있으므로 여러 워커로 실행하면 각 워커가 자기 참가자 중에서만 추첨합니다.
+    #       이벤트 자체(참가 + 추첨)는 단일 워커에서 실행하세요.
+    DRAW_NUMBER_ALLOCATOR: str = os.getenv("LUCKYDRAW_NUMBER_ALLOCATOR", "local").lower()
+
+    # 한 번에 임대하는 번호 블록 크기 (클수록 조정 비용↓, 워커 간 번호 공백↑)
+    DRAW_NUMBER_BLOCK_SIZE: int = int(os.getenv("LUCKYDRAW_NUMBER_BLOCK_SIZE", "32"))
+
+    # sqlite 코디네이터 DB 파일 경로
+    DRAW_NUMBER_SQLITE_PATH: str = os.getenv(
+        "LUCKYDRAW_NUMBER_SQLITE_PATH", "luckydraw_numbers.db"
+    )
+
+    @classmethod
+    def validate(cls) -> None:
+        """
+        설정값의 유효성을 검증합니다.
+
+        Raises:
+            ValueError: 설정값이 유효하지 않은 경우
+        """
+        if cls.DRAW_NUMBER_ALLOCATOR not in ("local", "sqlite", "postgres"):
+            raise ValueError(
+                f"LUCKYDRAW_NUMBER_ALLOCATOR는 local, sqlite, postgres 중 하나여야 합니다. "
+                f"현재 값: {cls.DRAW_NUMBER_ALLOCATOR}"
+            )
+
+        if cls.DRAW_NUMBER_BLOCK_SIZE < 1:
+            raise ValueError(
+                f"LUCKYDRAW_NUMBER_BLOCK_SIZE는 1 이상이어야 합니다. "
+                f"현재 값: {cls.DRAW_NUMBER_BLOCK_SIZE}"
+            )
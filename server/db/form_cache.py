@@ -0,0 +1,164 @@
+"""
+폼 조회 캐시
+
+share_url → 폼 데이터 조회 결과를 프로세스 메모리에 TTL 기반으로 캐시합니다.
+
+- 존재하지 않는 share_url도 짧은 TTL로 캐시 (negative caching)
+- api/forms.py에서 폼 생성/수정 시 명시적으로 무효화
+- 무효화는 프로세스 단위이므로, 다른 워커의 캐시는 TTL 만료로 갱신됩니다.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class FormCache:
+    """share_url 키 기반 TTL + LRU 폼 캐시"""
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        negative_ttl_seconds: float,
+        max_entries: int = 1024
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+
+        # {share_url: (expires_at, form 또는 None)}
+        self._entries: "OrderedDict[str, Tuple[float, Optional[Dict]]]" = OrderedDict()
+
+        # 통계
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get(self, share_url: str) -> Tuple[bool, Optional[Dict]]:
+        """
+        캐시 조회
+
+        Returns:
+            (hit 여부, 폼 데이터) - hit이면서 폼이 None이면 "없는 폼"으로 캐시된 것
+        """
+        entry = self._entries.get(share_url)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[share_url]
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(share_url)
+        if entry[1] is None:
+            self.negative_hits += 1
+        else:
+            self.hits += 1
+        return True, entry[1]
+
+    def put(self, share_url: str, form: Optional[Dict]) -> None:
+        """조회 결과 저장 (form이 None이면 negative TTL 적용)"""
+        if not self.enabled:
+            return
+
+        ttl = self.ttl_seconds if form is not None else self.negative_ttl_seconds
+        if ttl <= 0:
+            return
+
+        self._entries[share_url] = (time.monotonic() + ttl, form)
+        self._entries.move_to_end(share_url)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(
+        self,
+        share_url: Optional[str] = None,
+        form_id: Optional[str] = None
+    ) -> int:
+        """
+        캐시 무효화
+
+        Args:
+            share_url: 해당 share_url 항목 삭제
+            form_id: 해당 폼 ID를 가진 모든 항목 삭제 (share_url이 바뀐 경우 대비)
+
+        Returns:
+            삭제된 항목 수
+        """
+        keys = set()
+        if share_url and share_url in self._entries:
+            keys.add(share_url)
+        if form_id:
+            keys.update(
+                key for key, (_, form) in self._entries.items()
+                if form is not None and str(form.get("id")) == str(form_id)
+            )
+
+        for key in keys:
+            del self._entries[key]
+
+        if keys:
+            self.invalidations += len(keys)
+            logger.info(f"[폼 캐시 무효화] share_url={share_url}, form_id={form_id}, 삭제={len(keys)}")
+        return len(keys)
+
+    def clear(self) -> None:
+        """전체 캐시 삭제"""
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+
+    def stats(self) -> Dict:
+        """캐시 통계"""
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": round((self.hits + self.negative_hits) / lookups, 4) if lookups else 0.0
+        }
+
+
+# 전역 폼 캐시 인스턴스
+_form_cache: Optional[FormCache] = None
+
+
+def get_form_cache() -> FormCache:
+    """
+    폼 캐시 싱글톤
+
+    Returns:
+        FormCache 인스턴스
+    """
+    global _form_cache
+
+    if _form_cache is None:
+        from db.supabase_client import SupabaseConfig
+        _form_cache = FormCache(
+            ttl_seconds=SupabaseConfig.FORM_CACHE_TTL_SECONDS,
+            negative_ttl_seconds=SupabaseConfig.FORM_CACHE_NEGATIVE_TTL_SECONDS
+        )
+
+    return _form_cache
+
+
+def invalidate_form_cache(
+    share_url: Optional[str] = None,
+    form_id: Optional[str] = None
+) -> int:
+    """폼 생성/수정 시 호출하는 무효화 훅"""
+    return get_form_cache().invalidate(share_url=share_url, form_id=form_id)
+
+
+def get_form_cache_stats() -> Dict:
+    """폼 캐시 통계 조회"""
+    return get_form_cache().stats()
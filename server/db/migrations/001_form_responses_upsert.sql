@@ -0,0 +1,34 @@
+-- form_responses 단일 왕복 upsert 지원
+--
+-- 설문 분석(/api/survey/analyze)은 (form_id, member_id) 기준으로
+-- INSERT ... ON CONFLICT DO UPDATE 한 번에 응답을 저장합니다.
+-- PostgREST upsert(on_conflict=form_id,member_id)는 해당 컬럼 조합의
+-- UNIQUE 제약/인덱스가 있어야 동작합니다.
+--
+-- 실행: Supabase SQL Editor 또는 psql에서 1회 실행 (재실행해도 안전)
+
+BEGIN;
+
+-- 1) 기존 중복 응답 정리 (동시 제출로 생긴 중복 중 가장 최근 행만 유지)
+DELETE FROM form_responses fr
+USING (
+    SELECT id,
+           ROW_NUMBER() OVER (
+               PARTITION BY form_id, member_id
+               ORDER BY COALESCE(updated_at, submitted_at) DESC, submitted_at DESC
+           ) AS rn
+    FROM form_responses
+) ranked
+WHERE fr.id = ranked.id
+  AND ranked.rn > 1;
+
+-- 2) upsert 충돌 대상 UNIQUE 인덱스
+CREATE UNIQUE INDEX IF NOT EXISTS idx_form_response_unique
+    ON form_responses(form_id, member_id);
+
+-- 3) upsert 시 전송하지 않는 컬럼 기본값
+--    (재제출 시 submitted_at은 최초 제출 시각 유지, id는 신규 행에서만 생성)
+ALTER TABLE form_responses ALTER COLUMN id SET DEFAULT gen_random_uuid();
+ALTER TABLE form_responses ALTER COLUMN submitted_at SET DEFAULT NOW();
+
+COMMIT;
@@ -2,12 +2,21 @@
 Supabase 클라이언트 설정
 
 환경 변수를 통해 Supabase 연결을 관리합니다.
+
+모든 조회/저장은 비동기 PostgREST 클라이언트(supabase AsyncClient)로 수행하여
+HTTP 왕복 동안 이벤트 루프를 막지 않습니다. (같은 워커의 경품추첨 WebSocket 보호)
+HTTP 연결은 크기가 제한된 httpx 연결 풀에서 재사용됩니다.
 """
 
+import asyncio
 import os
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+import httpx
 from dotenv import load_dotenv
 
+from db.form_cache import get_form_cache
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -22,6 +31,18 @@ class SupabaseConfig:
     # 테이블 이름
     FORM_RESPONSES_TABLE: str = "form_responses"
 
+    # share_url → 폼 조회 캐시 TTL (초, 0이면 캐시 비활성화)
+    FORM_CACHE_TTL_SECONDS: float = float(os.getenv("FORM_CACHE_TTL_SECONDS", "300"))
+    # 존재하지 않는 share_url 캐시 TTL (초)
+    FORM_CACHE_NEGATIVE_TTL_SECONDS: float = float(
+        os.getenv("FORM_CACHE_NEGATIVE_TTL_SECONDS", "30")
+    )
+
+    # HTTP 연결 풀 크기 (동시 요청 상한, 초과 요청은 풀 대기)
+    SUPABASE_MAX_CONNECTIONS: int = int(os.getenv("SUPABASE_MAX_CONNECTIONS", "20"))
+    # 요청 타임아웃 (초)
+    SUPABASE_TIMEOUT_SECONDS: float = float(os.getenv("SUPABASE_TIMEOUT_SECONDS", "10"))
+
     @classmethod
     def validate_config(cls) -> bool:
         """설정 유효성 검증"""
@@ -29,6 +50,8 @@ class SupabaseConfig:
             raise ValueError("SUPABASE_URL environment variable is required")
         if not cls.SUPABASE_KEY:
             raise ValueError("SUPABASE_KEY environment variable is required")
+        if cls.SUPABASE_MAX_CONNECTIONS < 1:
+            raise ValueError("SUPABASE_MAX_CONNECTIONS must be >= 1")
         return True
 
 
@@ -43,14 +66,32 @@ class SupabaseClient:
         """클라이언트 초기화"""
         SupabaseConfig.validate_config()
 
-        # Supabase 클라이언트 초기화
-        from supabase import create_client
-        self.client = create_client(
+        # 연결 재사용을 위한 공유 HTTP 클라이언트 (크기 제한 연결 풀)
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=SupabaseConfig.SUPABASE_MAX_CONNECTIONS,
+                max_keepalive_connections=SupabaseConfig.SUPABASE_MAX_CONNECTIONS
+            ),
+            timeout=SupabaseConfig.SUPABASE_TIMEOUT_SECONDS
+        )
+
+        # 동시 요청 수 제한 (연결 풀 크기와 동일)
+        # 풀 대기열은 요청 배정 시 대기 요청 x 연결 수만큼 순회하므로,
+        # 대기는 세마포어에서 하고 풀에는 처리 가능한 요청만 넘긴다
+        self._slots = asyncio.Semaphore(SupabaseConfig.SUPABASE_MAX_CONNECTIONS)
+
+        # 비동기 Supabase 클라이언트 초기화
+        from supabase import AsyncClient, AsyncClientOptions
+        self.client = AsyncClient(
             SupabaseConfig.SUPABASE_URL,
-            SupabaseConfig.SUPABASE_KEY
+            SupabaseConfig.SUPABASE_KEY,
+            options=AsyncClientOptions(
+                httpx_client=self.http_client,
+                postgrest_client_timeout=SupabaseConfig.SUPABASE_TIMEOUT_SECONDS
+            )
         )
 
-    async def insert_form_response(
+    async def upsert_form_response(
         self,
         member_id: str,
         form_id: str,
@@ -58,7 +99,15 @@ class SupabaseClient:
         result: Dict[str, any]
     ) -> Dict:
         """
-        폼 응답 저장
+        폼 응답 저장 (없으면 생성, 있으면 수정)
+
+        (form_id, member_id) UNIQUE 인덱스를 충돌 대상으로
+        INSERT ... ON CONFLICT DO UPDATE 한 번으로 처리합니다.
+        조회 후 저장하는 방식과 달리 왕복이 1회이고, 중복 제출이 동시에
+        들어와도 행이 하나로 유지됩니다.
+        (필요 스키마: db/migrations/001_form_responses_upsert.sql)
+
+        재제출 시 submitted_at은 최초 제출 시각을 유지합니다.
 
         Args:
             member_id: 회원 ID
@@ -67,7 +116,7 @@ class SupabaseClient:
             result: AI 분류 결과
 
         Returns:
-            저장된 데이터 (Supabase 응답)
+            저장된 데이터 (Supabase 응답, id 포함)
         """
         # responses에 result 추가
         responses_with_result = {
@@ -79,19 +128,60 @@ class SupabaseClient:
             "member_id": member_id,
             "form_id": form_id,
             "responses": responses_with_result,
-            "submitted_at": self._get_current_timestamp()
+            "updated_at": self._get_current_timestamp()
         }
 
-        # 실제 Supabase insert 구현
-        response = self.client.table(
-            SupabaseConfig.FORM_RESPONSES_TABLE
-        ).insert(data).execute()
+        response = await self._execute(
+            self.client.table(
+                SupabaseConfig.FORM_RESPONSES_TABLE
+            ).upsert(data, on_conflict="form_id,member_id")
+        )
 
         return response.data[0] if response.data else data
 
-    def get_form_by_share_url(self, share_url: str) -> Optional[Dict]:
+    async def update_form_response_result(
+        self,
+        member_id: str,
+        form_id: str,
+        responses: Dict[str, str],
+        result: Dict[str, any],
+        job_id: str
+    ) -> bool:
+        """
+        백그라운드 분류 결과로 저장된 결과 갱신
+
+        저장된 결과의 job_id가 일치하는 행만 수정하므로, 그 사이 회원이 다시 제출하여
+        새 응답이 저장되었다면 이전 응답의 분류 결과로 덮어쓰지 않습니다.
+
+        Args:
+            member_id: 회원 ID
+            form_id: 폼 ID
+            responses: 설문 응답 데이터 (작업 생성 시점)
+            result: 새 분류 결과
+            job_id: 작업 생성 시 결과에 기록한 작업 ID
+
+        Returns:
+            갱신 여부 (False면 재제출 등으로 대상 행이 바뀜)
+        """
+        data = {
+            "responses": {**responses, "result": result},
+            "updated_at": self._get_current_timestamp()
+        }
+
+        response = await self._execute(
+            self.client.table(
+                SupabaseConfig.FORM_RESPONSES_TABLE
+            ).update(data)
+            .eq("member_id", member_id)
+            .eq("form_id", form_id)
+            .eq("responses->result->>job_id", job_id)
+        )
+
+        return bool(response.data)
+
+    async def get_form_by_share_url(self, share_url: str) -> Optional[Dict]:
         """
-        공유 URL로 폼 조회
+        공유 URL로 폼 조회 (TTL 캐시 적용)
 
         Args:
             share_url: 공유 URL (예: "test/2")
@@ -99,8 +189,17 @@ class SupabaseClient:
         Returns:
             폼 데이터 (id, share_url 등)
         """
-        response = self.client.table("forms").select("*").eq("share_url", share_url).execute()
-        return response.data[0] if response.data else None
+        form_cache = get_form_cache()
+        hit, form = form_cache.get(share_url)
+        if hit:
+            return form
+
+        response = await self._execute(
+            self.client.table("forms").select("*").eq("share_url", share_url)
+        )
+        form = response.data[0] if response.data else None
+        form_cache.put(share_url, form)
+        return form
 
     async def get_form_response(
         self,
@@ -118,48 +217,51 @@ class SupabaseClient:
             폼 응답 데이터 (없으면 None)
         """
         # 실제 Supabase select 구현
-        response = self.client.table(
-            SupabaseConfig.FORM_RESPONSES_TABLE
-        ).select("*").eq("member_id", member_id).eq("form_id", form_id).execute()
+        response = await self._execute(
+            self.client.table(
+                SupabaseConfig.FORM_RESPONSES_TABLE
+            ).select("*").eq("member_id", member_id).eq("form_id", form_id)
+        )
 
         return response.data[0] if response.data else None
 
-    async def update_form_response(
+    async def list_ai_labeled_responses(
         self,
-        member_id: str,
         form_id: str,
-        responses: Dict[str, str],
-        result: Dict[str, any]
-    ) -> Dict:
+        offset: int,
+        limit: int
+    ) -> List[Dict]:
         """
-        폼 응답 수정
+        AI 분류 결과가 저장된 폼 응답 조회 (로컬 분류 모델 학습용)
 
         Args:
-            member_id: 회원 ID
             form_id: 폼 ID
-            responses: 설문 응답 데이터
-            result: AI 분류 결과
+            offset: 시작 위치 (id 순)
+            limit: 최대 행 수
 
         Returns:
-            수정된 데이터 (Supabase 응답)
+            응답 행 목록 (id, responses)
         """
-        # responses에 result 추가
-        responses_with_result = {
-            **responses,
-            "result": result
-        }
+        response = await self._execute(
+            self.client.table(
+                SupabaseConfig.FORM_RESPONSES_TABLE
+            ).select("id,responses")
+            .eq("form_id", form_id)
+            .eq("responses->result->>source", "ai")
+            .order("id")
+            .range(offset, offset + limit - 1)
+        )
 
-        data = {
-            "responses": responses_with_result,
-            "updated_at": self._get_current_timestamp()
-        }
+        return response.data or []
 
-        # 실제 Supabase update 구현
-        response = self.client.table(
-            SupabaseConfig.FORM_RESPONSES_TABLE
-        ).update(data).eq("member_id", member_id).eq("form_id", form_id).execute()
+    async def _execute(self, query):
+        """동시 요청 수 제한 안에서 PostgREST 쿼리 실행"""
+        async with self._slots:
+            return await query.execute()
 
-        return response.data[0] if response.data else data
+    async def aclose(self) -> None:
+        """HTTP 연결 풀 종료"""
+        await self.http_client.aclose()
 
     def _get_current_timestamp(self) -> str:
         """현재 시간 ISO 8601 포맷으로 반환"""
@@ -184,3 +286,14 @@ def get_supabase_client() -> SupabaseClient:
         _supabase_client = SupabaseClient()
 
     return _supabase_client
+
+
+async def close_supabase_client() -> None:
+    """
+    Supabase 클라이언트 연결 풀 종료 (서버 종료 시 호출)
+    """
+    global _supabase_client
+
+    if _supabase_client is not None:
+        await _supabase_client.aclose()
+        _supabase_client = None
@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 import uvicorn
 from fastapi.middleware.cors import CORSMiddleware
@@ -10,13 +12,37 @@ from api import (
     luckydraw_router,
     events_router,
     forms_router,
-    admins_router
+    admins_router,
+    metrics_router
 )
+from db.supabase_client import close_supabase_client
+from services.background_classifier import get_background_classifier
+from services.fallback_table import get_fallback_table
+from services.openai_http import close_openai_http_client, warm_up_openai
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 수명 주기: 시작 시 사전 계산 데이터 로드/OpenAI 사전 연결/백그라운드 작업자 시작, 종료 시 정리"""
+    get_fallback_table()
+    await warm_up_openai()
+    background = get_background_classifier()
+    if background is not None:
+        background.start()
+
+    yield
+
+    if background is not None:
+        await background.stop()
+    await close_openai_http_client()
+    await close_supabase_client()
+
 
 app = FastAPI(
     title="Event Manager",
     description="Event Manager Application API",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -66,6 +92,7 @@ app.include_router(luckydraw_router)   # 경품추첨
 app.include_router(events_router)      # 이벤트 관리
 app.include_router(forms_router)       # 폼 관리
 app.include_router(admins_router)      # 관리자 관리
+app.include_router(metrics_router)     # Prometheus 지표
 
 
 @app.get("/")
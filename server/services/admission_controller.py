@@ -0,0 +1,282 @@
+"""
+OpenAI 호출 승인 제어 (admission control)
+
+모든 OpenAI 요청은 보내기 전에 승인을 받습니다.
+- 동시 요청 수 제한 (세마포어)
+- 분당 요청 수(RPM) / 분당 토큰 수(TPM) 토큰 버킷
+- 대기열 상한: 넘치면 바로 거절
+- 기한(deadline) 인지 거절: 기한 안에 승인될 수 없는 요청은 기다리지 않고 바로 거절
+  (도착 시 앞선 대기 요청까지 고려한 예상 대기 시간으로 판단)
+
+거절된 호출자는 AI 호출 없이 Fallback을 사용합니다. 공급자 한도를 넘는 요청을 보내
+RateLimitError로 버려지는 대신, 한도 안에서 처리량을 유지하는 것이 목적입니다.
+
+승인은 도착 순서(FIFO)로 진행되며, 응답의 실제 토큰 사용량으로 TPM 버킷을 정산합니다.
+공급자가 429를 반환하면 pause()로 Retry-After 동안 승인을 멈춥니다.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 토큰 버킷 버스트 크기 (몇 초 분량의 한도를 한 번에 허용할지)
+# 공급자는 분당 한도를 초 단위로 나눠 적용하기도 하므로 1초 분량으로 제한
+BUCKET_BURST_SECONDS = 1.0
+
+REJECT_QUEUE_FULL = "queue_full"
+REJECT_DEADLINE = "deadline"
+
+
+class AdmissionRejected(Exception):
+    """승인 거절 (호출자는 Fallback 사용)"""
+
+    def __init__(self, reason: str, message: str):
+        super().__init__(message)
+        self.reason = reason
+
+
+class TokenBucket:
+    """분당 한도를 초당 속도로 채우는 토큰 버킷 (잔량이 음수면 초과 사용분을 먼저 갚음)"""
+
+    def __init__(self, per_minute: float, clock: Callable[[], float] = time.monotonic):
+        self.rate = per_minute / 60.0
+        self.capacity = max(1.0, self.rate * BUCKET_BURST_SECONDS)
+        self.tokens = self.capacity
+        self._clock = clock
+        self._updated_at = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def time_until(self, amount: float) -> float:
+        """amount만큼 꺼낼 수 있을 때까지 남은 시간 (초, 0이면 즉시 가능)"""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def time_until_backlog(self, amount: float) -> float:
+        """앞선 대기분을 포함한 amount를 모두 꺼낼 수 있을 때까지의 예상 시간 (초)"""
+        self._refill()
+        return max(0.0, (amount - self.tokens) / self.rate)
+
+    def take(self, amount: float) -> None:
+        """토큰 사용 (time_until(amount) == 0 확인 후 호출)"""
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+    def adjust(self, delta: float) -> None:
+        """사용량 정산 (양수면 추가 차감, 음수면 반환)"""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - delta)
+
+
+class AdmissionController:
+    """동시성 + RPM/TPM 한도 + 기한 인지 대기열"""
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int = 16,
+        requests_per_minute: float = 0,
+        tokens_per_minute: float = 0,
+        max_queue: int = 200,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            name: 이름 (로그/통계 표시용)
+            max_concurrency: 동시 요청 수 상한
+            requests_per_minute: 분당 요청 수 한도 (0이면 제한 없음)
+            tokens_per_minute: 분당 토큰 수 한도 (0이면 제한 없음)
+            max_queue: 승인 대기 요청 수 상한 (초과 시 즉시 거절)
+            clock: 시간 함수 (기한과 같은 기준, 기본 time.monotonic)
+        """
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self._clock = clock
+
+        self._rpm = TokenBucket(requests_per_minute, clock) if requests_per_minute > 0 else None
+        self._tpm = TokenBucket(tokens_per_minute, clock) if tokens_per_minute > 0 else None
+        self._slots = asyncio.Semaphore(max_concurrency)
+        # 한 번에 한 대기자만 한도를 확인하여 도착 순서대로 승인
+        self._turn = asyncio.Lock()
+        self._paused_until = 0.0
+
+        self.waiting = 0
+        self._waiting_tokens = 0
+        self.in_flight = 0
+        self._counters = {
+            "admitted": 0,
+            "rejected_queue_full": 0,
+            "rejected_deadline": 0,
+            "rate_limited": 0,       # 공급자 429로 승인을 멈춘 횟수
+        }
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._estimated_tokens = 0
+        self._actual_tokens = 0
+
+    def _reject(self, reason: str, message: str) -> AdmissionRejected:
+        self._counters[f"rejected_{reason}"] += 1
+        logger.warning(f"[{self.name}] 승인 거절 ({reason}): {message}")
+        return AdmissionRejected(reason, message)
+
+    def _required_wait(self, tokens: float) -> float:
+        """한도상 승인까지 남은 시간 (초)"""
+        wait = max(0.0, self._paused_until - self._clock())
+        if self._rpm is not None:
+            wait = max(wait, self._rpm.time_until(1))
+        if self._tpm is not None:
+            wait = max(wait, self._tpm.time_until(tokens))
+        return wait
+
+    def _projected_wait(self, tokens: float) -> float:
+        """앞선 대기 요청이 모두 승인된 뒤 이 요청이 승인될 때까지의 예상 시간 (초)"""
+        wait = max(0.0, self._paused_until - self._clock())
+        if self._rpm is not None:
+            wait = max(wait, self._rpm.time_until_backlog(self.waiting + 1))
+        if self._tpm is not None:
+            wait = max(wait, self._tpm.time_until_backlog(self._waiting_tokens + tokens))
+        return wait
+
+    async def _wait(self, awaitable, deadline: Optional[float], what: str) -> None:
+        """기한 안에서 대기 (기한 초과 시 거절)"""
+        if deadline is None:
+            await awaitable
+            return
+        try:
+            await asyncio.wait_for(awaitable, max(0.0, deadline - self._clock()))
+        except asyncio.TimeoutError:
+            raise self._reject(REJECT_DEADLINE, f"기한 안에 {what} 획득 실패")
+
+    async def _acquire(self, tokens: float, deadline: Optional[float]) -> None:
+        await self._wait(self._turn.acquire(), deadline, "승인 순서")
+        try:
+            await self._wait(self._slots.acquire(), deadline, "동시 요청 슬롯")
+
+            # RPM/TPM 한도 대기 (기한 안에 채워지지 않으면 기다리지 않고 거절)
+            try:
+                while True:
+                    wait = self._required_wait(tokens)
+                    if wait <= 0:
+                        break
+                    if deadline is not None and self._clock() + wait > deadline:
+                        raise self._reject(
+                            REJECT_DEADLINE, f"요청 한도 회복까지 {wait:.2f}초 필요 (기한 초과)"
+                        )
+                    await asyncio.sleep(wait)
+            except BaseException:
+                self._slots.release()
+                raise
+
+            if self._rpm is not None:
+                self._rpm.take(1)
+            if self._tpm is not None:
+                self._tpm.take(tokens)
+        finally:
+            self._turn.release()
+
+    @asynccontextmanager
+    async def admit(
+        self,
+        estimated_tokens: int,
+        deadline: Optional[float] = None
+    ) -> AsyncIterator["AdmissionTicket"]:
+        """
+        요청 승인 (async with 블록 동안 동시 요청 슬롯 점유)
+
+        Args:
+            estimated_tokens: 요청의 예상 토큰 수 (프롬프트 + max_tokens)
+            deadline: 승인 기한 (clock 기준 절대 시각, None이면 기한 없음)
+
+        Raises:
+            AdmissionRejected: 대기열이 가득 찼거나 기한 안에 승인될 수 없음
+        """
+        if self.waiting >= self.max_queue:
+            raise self._reject(REJECT_QUEUE_FULL, f"승인 대기 {self.waiting}건 (상한 {self.max_queue})")
+
+        if deadline is not None:
+            projected = self._projected_wait(estimated_tokens)
+            if self._clock() + projected > deadline:
+                raise self._reject(
+                    REJECT_DEADLINE,
+                    f"앞선 대기 {self.waiting}건, 예상 승인 대기 {projected:.2f}초 (기한 초과)"
+                )
+
+        start = self._clock()
+        self.waiting += 1
+        self._waiting_tokens += estimated_tokens
+        try:
+            await self._acquire(estimated_tokens, deadline)
+        finally:
+            self.waiting -= 1
+            self._waiting_tokens -= estimated_tokens
+
+        wait = self._clock() - start
+        self._counters["admitted"] += 1
+        self._wait_total += wait
+        self._wait_max = max(self._wait_max, wait)
+        self._estimated_tokens += estimated_tokens
+
+        ticket = AdmissionTicket(self, estimated_tokens)
+        self.in_flight += 1
+        try:
+            yield ticket
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+
+    def settle(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """응답의 실제 토큰 사용량으로 TPM 버킷 정산"""
+        self._actual_tokens += actual_tokens
+        if self._tpm is not None:
+            self._tpm.adjust(actual_tokens - estimated_tokens)
+
+    def pause(self, seconds: float) -> None:
+        """공급자 429 응답 시 seconds 동안 새 승인 중단"""
+        self._counters["rate_limited"] += 1
+        self._paused_until = max(self._paused_until, self._clock() + seconds)
+        logger.warning(f"[{self.name}] 공급자 요청 한도 초과, {seconds:.1f}초 동안 승인 중단")
+
+    def stats(self) -> Dict:
+        """승인 통계"""
+        admitted = self._counters["admitted"]
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "max_queue": self.max_queue,
+            **self._counters,
+            "avg_wait_ms": round(self._wait_total / admitted * 1000, 2) if admitted else 0.0,
+            "max_wait_ms": round(self._wait_max * 1000, 2),
+            "rpm_available": round(self._rpm.tokens, 1) if self._rpm is not None else None,
+            "tpm_available": round(self._tpm.tokens, 1) if self._tpm is not None else None,
+            "estimated_tokens": self._estimated_tokens,
+            "actual_tokens": self._actual_tokens,
+            "paused_seconds": round(max(0.0, self._paused_until - self._clock()), 2),
+        }
+
+
+class AdmissionTicket:
+    """승인된 요청 (응답 후 실제 토큰 사용량 정산용)"""
+
+    def __init__(self, controller: AdmissionController, estimated_tokens: int):
+        self._controller = controller
+        self.estimated_tokens = estimated_tokens
+        self._settled = False
+
+    def settle(self, actual_tokens: Optional[int]) -> None:
+        """실제 토큰 사용량 기록 (사용량을 모르면 예상치 유지)"""
+        if self._settled or actual_tokens is None:
+            return
+        self._settled = True
+        self._controller.settle(self.estimated_tokens, actual_tokens)
@@ -2,166 +2,213 @@
 AI 피부 타입 분류 서비스
 
 OpenAI GPT를 사용하여 설문 응답을 분석하고 8가지 피부 타입 중 하나로 분류합니다.
+
+질문/답변 문구는 설문 스키마(services/survey_schema.py)에서 가져옵니다.
+
+모든 OpenAI 요청은 승인 제어(services/admission_controller.py)를 거칩니다.
+동시 요청 수와 분당 요청/토큰 한도 안에서만 요청을 보내고, 기한 안에 승인될 수 없는
+요청은 AdmissionRejected로 거절하여 호출자가 Fallback을 사용하게 합니다.
+
+응답 형식(AI_OUTPUT_MODE)은 services/ai_output.py를 따릅니다. json_schema/code 모드는
+결과 타입 밖의 응답을 생성하지 못하게 하여 유효하지 않은 응답 재시도를 없앱니다.
+
+재시도는 재시도 정책(services/retry_policy.py)을 따릅니다. (지수 백오프 + full jitter,
+Retry-After, 요청당/프로세스 재시도 예산) OpenAI 클라이언트 자체 재시도는 끕니다.
+
+OpenAI 요청 지연 시간/토큰 사용량, AI 분류 결과(실패 원인별), 유효하지 않은 응답 수와 재시도 횟수는
+분류 지표(services/classification_metrics.py)에 기록합니다.
 """
 
 import asyncio
 import logging
-from typing import Dict, Optional, Tuple
+import time
+from typing import Any, Dict, List, Optional, Tuple
 from openai import AsyncOpenAI
-from openai import APIError, APITimeoutError, RateLimitError
+from openai import APIError, APIStatusError, APITimeoutError, RateLimitError
 
 from config.ai_config import AIConfig
+from services.admission_controller import AdmissionController, AdmissionRejected
+from services.ai_output import OutputFormat
+from services.classification_metrics import (
+    ERROR_ADMISSION_REJECTED,
+    ERROR_API,
+    ERROR_INVALID_RESPONSE,
+    ERROR_RATE_LIMIT,
+    ERROR_TIMEOUT,
+    ERROR_UNEXPECTED,
+    get_classification_metrics,
+)
+from services.openai_http import get_openai_http_client
+from services.retry_policy import RetryBudget, RetryPolicy
+from services.survey_schema import SurveySchema, get_default_schema
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
 
+# 일괄 분류 요청 시 시스템 프롬프트에 덧붙이는 지시문
+BATCH_INSTRUCTION = """
+
+BATCH MODE:
+- The user message contains several numbered surveys. Classify each survey independently.
+- Return ONLY a JSON array of type keys, one per survey, in the same order.
+- Example for 3 surveys: ["office_thirst", "city_routine", "minimal_routine"]"""
+
+
+# 예상 토큰 수 계산용 문자/토큰 비율 (실제 사용량으로 정산되므로 보수적인 근사치)
+CHARS_PER_TOKEN = 2
+
+# 429 응답에 Retry-After가 없을 때 승인을 멈추는 시간 (초)
+DEFAULT_RATE_LIMIT_PAUSE_SECONDS = 1.0
+
+# 재시도할 수 있는 4xx 상태 코드 (요청 타임아웃, 충돌, 사용량 초과)
+RETRYABLE_CLIENT_STATUS = {408, 409, 429}
+
+
+def retry_after_header(error: Exception) -> Optional[float]:
+    """응답의 Retry-After(초) / retry-after-ms 헤더 값 (없으면 None)"""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except ValueError:
+        pass
+    return None
+
+
+def retry_after_seconds(error: RateLimitError) -> float:
+    """429 응답의 Retry-After(초) / retry-after-ms 헤더 값"""
+    retry_after = retry_after_header(error)
+    return DEFAULT_RATE_LIMIT_PAUSE_SECONDS if retry_after is None else retry_after
+
+
+def error_class_of(error: Exception) -> str:
+    """예외의 실패 원인 분류 (_classify_once와 같은 기준)"""
+    if isinstance(error, APITimeoutError):
+        return ERROR_TIMEOUT
+    if isinstance(error, RateLimitError):
+        return ERROR_RATE_LIMIT
+    if isinstance(error, APIError):
+        return ERROR_API
+    return ERROR_UNEXPECTED
+
+
+def is_retryable(error_class: str, error: Optional[Exception]) -> bool:
+    """
+    재시도해서 나아질 수 있는 실패인지
+
+    타임아웃, 유효하지 않은 응답, 사용량 초과, 연결 실패, 5xx는 재시도하고
+    요청 자체가 잘못된 4xx(인증, 잘못된 요청 등)와 예상치 못한 오류는 재시도하지 않습니다.
+    """
+    if error_class in (ERROR_TIMEOUT, ERROR_INVALID_RESPONSE, ERROR_RATE_LIMIT):
+        return True
+    if error_class != ERROR_API:
+        return False
+    if isinstance(error, APIStatusError):
+        return error.status_code >= 500 or error.status_code in RETRYABLE_CLIENT_STATUS
+    return True
+
+
 class AIClassifier:
     """AI 기반 피부 타입 분류기"""
 
     def __init__(self):
         """AI 분류기 초기화"""
+        # 재시도는 retry_policy가 전담 (클라이언트 기본 재시도 2회와 겹치면 요청이 최대 9배로 늘어남)
+        # 연결은 공유 연결 풀 사용 (services/openai_http.py, 서버 시작 시 사전 연결)
         self.client = AsyncOpenAI(
             api_key=AIConfig.OPENAI_API_KEY,
-            timeout=AIConfig.AI_TIMEOUT_SECONDS
+            timeout=AIConfig.AI_TIMEOUT_SECONDS,
+            max_retries=0,
+            http_client=get_openai_http_client()
         )
         self.model = AIConfig.OPENAI_MODEL
-        self.max_retries = AIConfig.AI_MAX_RETRIES
-        self.retry_delay = AIConfig.AI_RETRY_DELAY
+        self.retry_policy = get_retry_policy()
+        self.max_retries = self.retry_policy.max_retries
         self.valid_types = set(AIConfig.VALID_RESULT_TYPES)
+        self.output = OutputFormat(AIConfig.AI_OUTPUT_MODE, AIConfig.VALID_RESULT_TYPES)
+
+    async def _create_completion(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        deadline: Optional[float] = None,
+        **options: Any
+    ):
+        """
+        승인 제어를 거쳐 Chat Completions API를 호출합니다.
+
+        Args:
+            messages: 요청 메시지
+            max_tokens: 응답 최대 토큰 수
+            deadline: 승인 기한 (time.monotonic 기준, None이면 기한 없음)
+            options: 응답 형식 옵션 (response_format, logit_bias)
+
+        Raises:
+            AdmissionRejected: 기한 안에 승인될 수 없거나 승인 대기열이 가득 참
+        """
+        admission = get_admission_controller()
+        estimated_tokens = (
+            sum(len(message["content"]) for message in messages) // CHARS_PER_TOKEN + max_tokens
+        )
+
+        async with admission.admit(estimated_tokens, deadline) as ticket:
+            start = time.monotonic()
+            try:
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=AIConfig.OPENAI_TEMPERATURE,
+                    timeout=AIConfig.AI_TIMEOUT_SECONDS,
+                    **options
+                )
+            except RateLimitError as e:
+                admission.pause(retry_after_seconds(e))
+                raise
+            finally:
+                # 실패한 요청 포함 (타임아웃 설정 근거)
+                get_classification_metrics().openai_request_latency.observe(
+                    time.monotonic() - start
+                )
+
+            ticket.settle(response.usage.total_tokens if response.usage else None)
+            if response.usage:
+                get_classification_metrics().record_usage(
+                    response.usage.prompt_tokens, response.usage.completion_tokens
+                )
+            return response
+
+    def _format_answers(
+        self,
+        answers: Dict[str, str],
+        schema: Optional[SurveySchema] = None
+    ) -> List[str]:
+        """
+        설문 응답을 "- 질문: 답변" 형식의 줄 목록으로 변환합니다.
+
+        입력 순서와 무관하게 설문 스키마의 질문 순서를 따릅니다.
+        """
+        return (schema or get_default_schema()).format_answers(answers)
 
-    def _build_user_prompt(self, answers: Dict[str, str]) -> str:
+    def _build_user_prompt(
+        self,
+        answers: Dict[str, str],
+        schema: Optional[SurveySchema] = None
+    ) -> str:
         """
         설문 응답을 AI가 이해할 수 있는 프롬프트로 변환합니다.
 
         Args:
             answers: 설문 응답 딕셔너리 {question_id: answer_id}
+            schema: 설문 스키마 (None이면 기본 스키마)
 
         Returns:
             str: 구조화된 프롬프트
         """
-        # 질문-답변 매핑
-        question_mapping = {
-            "100": {
-                "question": "성별",
-                "answers": {
-                    "gender_male": "남성",
-                    "gender_female": "여성"
-                }
-            },
-            "101": {
-                "question": "연령대",
-                "answers": {
-                    "age_10s": "10대",
-                    "age_20s": "20대",
-                    "age_30s": "30대",
-                    "age_40s": "40대",
-                    "age_50p": "50대 이상"
-                }
-            },
-            "1": {
-                "question": "세안 후 피부 상태",
-                "answers": {
-                    "q1a1": "매우 건조하고 당긴다",
-                    "q1a2": "약간 건조하다",
-                    "q1a3": "편안하다",
-                    "q1a4": "살짝 유분이 있다",
-                    "q1a5": "유분이 많다"
-                }
-            },
-            "2": {
-                "question": "오후 얼굴 유분 상태",
-                "answers": {
-                    "q2a1": "여전히 건조하다",
-                    "q2a2": "코 주변만 살짝 유분",
-                    "q2a3": "T존 위주로 유분",
-                    "q2a4": "얼굴 전체적으로 유분"
-                }
-            },
-            "3": {
-                "question": "피부 붉어짐/따가움",
-                "answers": {
-                    "q3a1": "매우 자주",
-                    "q3a2": "자주",
-                    "q3a3": "가끔",
-                    "q3a4": "거의 없음"
-                }
-            },
-            "4": {
-                "question": "환절기/온도 변화 영향",
-                "answers": {
-                    "q4a1": "항상 크게 영향",
-                    "q4a2": "자주 영향",
-                    "q4a3": "가끔 변화",
-                    "q4a4": "거의 없음"
-                }
-            },
-            "5": {
-                "question": "미세먼지/공기오염 민감도",
-                "answers": {
-                    "q5a1": "바로 반응",
-                    "q5a2": "자주 민감",
-                    "q5a3": "가끔 민감",
-                    "q5a4": "거의 없음"
-                }
-            },
-            "6": {
-                "question": "새 스킨케어 제품 반응",
-                "answers": {
-                    "q6a1": "거의 항상 반응",
-                    "q6a2": "종종 반응",
-                    "q6a3": "가끔 반응",
-                    "q6a4": "거의 없음"
-                }
-            },
-            "7": {
-                "question": "주 활동 환경",
-                "answers": {
-                    "q7a1": "사무실/학교 등 실내",
-                    "q7a2": "카페/코워킹 등 다양한 공간",
-                    "q7a3": "외근/야외 활동 많음",
-                    "q7a4": "운동 시설/헬스장"
-                }
-            },
-            "8": {
-                "question": "머무는 공간 환경",
-                "answers": {
-                    "q8a1": "건조한 냉난방",
-                    "q8a2": "환기 어려운 밀폐",
-                    "q8a3": "온도 변화 큰 환경",
-                    "q8a4": "다양한 공간 이동"
-                }
-            },
-            "9": {
-                "question": "피부 관리 루틴",
-                "answers": {
-                    "q9a1": "거의 관리 안함",
-                    "q9a2": "토너/크림 정도",
-                    "q9a3": "여러 단계 꾸준히",
-                    "q9a4": "매우 적극적"
-                }
-            },
-            "10": {
-                "question": "외출 시 스킨케어 휴대",
-                "answers": {
-                    "q10a1": "거의 휴대 안함",
-                    "q10a2": "가끔 들고 다님",
-                    "q10a3": "미스트 꼭 챙김",
-                    "q10a4": "여러 제품 세트로"
-                }
-            }
-        }
-
-        # 응답을 읽기 쉬운 형식으로 변환
-        formatted_answers = []
-        for q_id, answer_id in answers.items():
-            q_key = str(q_id).replace("q", "")
-            if q_key in question_mapping:
-                q_data = question_mapping[q_key]
-                answer_text = q_data["answers"].get(answer_id, "알 수 없음")
-                formatted_answers.append(
-                    f"- {q_data['question']}: {answer_text}"
-                )
+        formatted_answers = self._format_answers(answers, schema)
 
         prompt = "다음은 사용자의 피부 진단 설문 응답입니다:\n\n"
         prompt += "\n".join(formatted_answers)
@@ -169,6 +216,178 @@ class AIClassifier:
 
         return prompt
 
+    def _build_batch_prompt(
+        self,
+        answers_list: List[Dict[str, str]],
+        schemas: Optional[List[Optional[SurveySchema]]] = None
+    ) -> str:
+        """
+        여러 설문 응답을 번호를 매긴 하나의 프롬프트로 변환합니다.
+
+        Args:
+            answers_list: 설문 응답 딕셔너리 목록
+            schemas: 설문별 스키마 목록 (None이면 모두 기본 스키마)
+
+        Returns:
+            str: 일괄 분류용 프롬프트
+        """
+        schemas = schemas or [None] * len(answers_list)
+        sections = [
+            f"### 설문 {i}\n" + "\n".join(self._format_answers(answers, schema))
+            for i, (answers, schema) in enumerate(zip(answers_list, schemas), start=1)
+        ]
+
+        prompt = f"다음은 {len(answers_list)}명의 피부 진단 설문 응답입니다:\n\n"
+        prompt += "\n\n".join(sections)
+        prompt += (
+            f"\n\n각 설문에 가장 적합한 피부 타입 하나씩, "
+            f"총 {len(answers_list)}개를 JSON 배열로 순서대로 답해주세요."
+        )
+
+        return prompt
+
+    def _parse_batch_response(self, response_text: str, count: int) -> List[Optional[str]]:
+        """
+        일괄 분류 응답(text: JSON 배열, json_schema: {"types": [...]}, code: 숫자 코드열)을
+        설문별 결과 타입으로 변환합니다.
+
+        Args:
+            response_text: AI 응답 텍스트
+            count: 요청한 설문 수
+
+        Returns:
+            설문별 결과 타입 목록 (항목별 검증 실패 시 None)
+
+        Raises:
+            ValueError: JSON 배열이 아니거나 항목 수가 다른 경우
+        """
+        labels = self.output.decode_batch(response_text, count)
+        results = [
+            self._validate_response(label) if isinstance(label, str) else None
+            for label in labels
+        ]
+        metrics = get_classification_metrics()
+        for result in results:
+            metrics.record_response(result is not None)
+        return results
+
+    async def classify_batch(
+        self,
+        answers_list: List[Dict[str, str]],
+        deadline: Optional[float] = None,
+        schemas: Optional[List[Optional[SurveySchema]]] = None
+    ) -> List[Tuple[Optional[str], Optional[str]]]:
+        """
+        여러 설문 응답을 한 번의 API 호출로 분류합니다.
+
+        일괄 요청이 장애(타임아웃/5xx/429)로 실패하면 재시도 정책에 따라 일괄 요청 그대로 재시도하고,
+        응답 해석 실패 등으로 일부 항목이 유효하지 않으면 해당 설문만 재시도 예산을 1개씩 사용하여
+        개별 분류(재시도 정책 포함)로 다시 보냅니다. (일괄 요청 1건이 N건의 요청으로 늘어나지 않도록)
+
+        Args:
+            answers_list: 설문 응답 딕셔너리 목록
+            deadline: 승인 기한 (time.monotonic 기준, None이면 기한 없음)
+            schemas: 설문별 스키마 목록 (None이면 모두 기본 스키마)
+
+        Returns:
+            설문별 (result_type, error_message) 목록 (입력 순서와 동일)
+
+        Raises:
+            AdmissionRejected: 일괄 요청이 승인되지 않음
+        """
+        schemas = schemas or [None] * len(answers_list)
+        if len(answers_list) == 1:
+            return [await self.classify(answers_list[0], deadline=deadline, schema=schemas[0])]
+
+        # 일괄 요청 1건 = 재시도 예산 적립 1회 (개별 재전송은 예산을 사용)
+        started_at = self.retry_policy.start()
+        labels: List[Optional[str]] = [None] * len(answers_list)
+        error_class, error_msg = ERROR_INVALID_RESPONSE, "유효하지 않은 AI 일괄 분류 응답"
+        give_up = False
+        retries = 0
+        while True:
+            try:
+                logger.info(f"AI 일괄 분류 시작: {len(answers_list)}건 (시도: {retries + 1})")
+
+                response = await self._create_completion(
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": self.output.system_prompt(AIConfig.SYSTEM_PROMPT, BATCH_INSTRUCTION)
+                        },
+                        {"role": "user", "content": self._build_batch_prompt(answers_list, schemas)}
+                    ],
+                    deadline=deadline,
+                    **self.output.request_options(
+                        max(
+                            AIConfig.OPENAI_MAX_TOKENS,
+                            AIConfig.AI_BATCH_TOKENS_PER_ITEM * len(answers_list)
+                        ),
+                        count=len(answers_list)
+                    )
+                )
+
+                result_text = response.choices[0].message.content
+                labels = self._parse_batch_response(result_text, len(answers_list))
+                logger.info(
+                    f"AI 일괄 분류 완료: {sum(1 for label in labels if label)}/{len(labels)}건 성공"
+                )
+                break
+
+            except AdmissionRejected:
+                raise
+
+            except Exception as e:
+                error_class, error_msg = error_class_of(e), f"AI 일괄 분류 실패: {str(e)}"
+                if not is_retryable(error_class, e):
+                    # 응답 해석 실패, 잘못된 요청 등: 실패 항목을 개별 분류로 다시 보냄
+                    logger.error(f"{error_msg} (개별 분류로 전환)")
+                    break
+
+                # 장애(타임아웃/5xx/429)는 일괄 요청 그대로 재시도하고, 포기하면 개별로 나누지 않음
+                delay = self.retry_policy.next_delay(
+                    retries, started_at, deadline, retry_after=retry_after_header(e)
+                )
+                if delay is None:
+                    logger.error(f"{error_msg} (재시도 포기)")
+                    give_up = True
+                    break
+                logger.info(f"{error_msg} ({delay:.2f}초 후 일괄 재시도)")
+                await asyncio.sleep(delay)
+                retries += 1
+
+        # 실패 항목은 재시도 예산 1개씩 사용하여 개별 분류 (예산이 없으면 실패로 확정)
+        metrics = get_classification_metrics()
+        results: List[Tuple[Optional[str], Optional[str]]] = [
+            (label, None) for label in labels
+        ]
+        retry_indexes = []
+        for i, label in enumerate(labels):
+            if label:
+                metrics.record_ai_result(None, retries)
+            elif give_up or not self.retry_policy.allow_resend():
+                metrics.record_ai_result(error_class, retries)
+                results[i] = (None, error_msg)
+            else:
+                retry_indexes.append(i)
+
+        retried = await asyncio.gather(
+            *(
+                self._classify_with_retries(answers_list[i], started_at, deadline, schemas[i])
+                for i in retry_indexes
+            ),
+            return_exceptions=True
+        )
+        for i, result in zip(retry_indexes, retried):
+            if isinstance(result, AdmissionRejected):
+                metrics.record_ai_skipped(ERROR_ADMISSION_REJECTED)
+                result = (None, f"AI 호출 승인 거절: {result}")
+            elif isinstance(result, BaseException):
+                # 승인 거절 외의 예외(취소 등)는 호출자에게 그대로 전달
+                raise result
+            results[i] = result
+        return results
+
     def _validate_response(self, response_text: str) -> Optional[str]:
         """
         AI 응답이 유효한 결과 타입인지 검증합니다.
@@ -200,101 +419,227 @@ class AIClassifier:
     async def classify(
         self,
         answers: Dict[str, str],
-        retry_count: int = 0
+        deadline: Optional[float] = None,
+        schema: Optional[SurveySchema] = None
     ) -> Tuple[Optional[str], Optional[str]]:
         """
         설문 응답을 분석하여 피부 타입을 분류합니다.
 
+        실패하면 재시도 정책이 허용하는 동안 대기 후 다시 시도합니다.
+
         Args:
             answers: 설문 응답 딕셔너리
-            retry_count: 현재 재시도 횟수
+            deadline: 승인 기한 (time.monotonic 기준, None이면 기한 없음, 재시도도 기한 안에서만)
+            schema: 설문 스키마 (None이면 기본 스키마)
 
         Returns:
             Tuple[result_type, error_message]:
                 - result_type: 분류 결과 (성공 시)
                 - error_message: 에러 메시지 (실패 시)
+
+        Raises:
+            AdmissionRejected: 요청이 승인되지 않음 (AI 호출 없이 Fallback 사용)
         """
-        try:
-            # 프롬프트 생성
-            user_prompt = self._build_user_prompt(answers)
+        started_at = self.retry_policy.start()
+        return await self._classify_with_retries(answers, started_at, deadline, schema)
 
-            logger.info(f"AI 분류 시작 (시도: {retry_count + 1}/{self.max_retries + 1})")
-            logger.info(f"[DEBUG] 입력 answers: {answers}")
-            logger.info(f"[DEBUG] 생성된 user_prompt:\n{user_prompt}")
+    async def _classify_with_retries(
+        self,
+        answers: Dict[str, str],
+        started_at: float,
+        deadline: Optional[float] = None,
+        schema: Optional[SurveySchema] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        분류 시도 + 재시도 정책에 따른 재시도 (요청 시작 기록은 호출자가 함)
+
+        Args:
+            started_at: 요청 시작 시각 (retry_policy.start 반환값)
+        """
+        user_prompt = self._build_user_prompt(answers, schema)
+        logger.info(f"[DEBUG] 입력 answers: {answers}")
+        logger.info(f"[DEBUG] 생성된 user_prompt:\n{user_prompt}")
+
+        retries = 0
+        while True:
+            result_type, error_msg, error_class, error = await self._classify_once(
+                user_prompt, retries, deadline
+            )
+            if result_type or not is_retryable(error_class, error):
+                break
+
+            delay = self.retry_policy.next_delay(
+                retries, started_at, deadline,
+                retry_after=retry_after_header(error) if error is not None else None
+            )
+            if delay is None:
+                break
+            logger.info(f"{delay:.2f}초 후 재시도...")
+            await asyncio.sleep(delay)
+            retries += 1
+
+        get_classification_metrics().record_ai_result(error_class, retries)
+        return result_type, error_msg
+
+    async def _classify_once(
+        self,
+        user_prompt: str,
+        retries: int,
+        deadline: Optional[float]
+    ) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[Exception]]:
+        """
+        분류 1회 시도
+
+        Returns:
+            Tuple[result_type, error_message, error_class, error]:
+                - error_class: 실패 원인 (성공 시 None)
+                - error: 실패 원인 예외 (유효하지 않은 응답/성공 시 None)
+        """
+        try:
+            logger.info(f"AI 분류 시작 (시도: {retries + 1}/{self.max_retries + 1})")
 
             # OpenAI API 호출
-            response = await self.client.chat.completions.create(
-                model=self.model,
+            response = await self._create_completion(
                 messages=[
-                    {"role": "system", "content": AIConfig.SYSTEM_PROMPT},
+                    {"role": "system", "content": self.output.system_prompt(AIConfig.SYSTEM_PROMPT)},
                     {"role": "user", "content": user_prompt}
                 ],
-                max_tokens=AIConfig.OPENAI_MAX_TOKENS,
-                temperature=AIConfig.OPENAI_TEMPERATURE,
-                timeout=AIConfig.AI_TIMEOUT_SECONDS
+                deadline=deadline,
+                **self.output.request_options(AIConfig.OPENAI_MAX_TOKENS)
             )
 
             # 응답 추출
-            result_text = response.choices[0].message.content
+            result_text = response.choices[0].message.content or ""
             logger.info(f"[DEBUG] AI raw response: '{result_text}'")
 
-            # 응답 검증
-            result_type = self._validate_response(result_text)
+            # 응답 형식 해석 후 검증
+            candidate = self.output.decode(result_text)
+            result_type = self._validate_response(candidate) if candidate else None
+            get_classification_metrics().record_response(result_type is not None)
 
             if result_type:
                 logger.info(f"AI 분류 성공: {result_type}")
-                return result_type, None
-            else:
-                error_msg = f"유효하지 않은 AI 응답: {result_text}"
-                logger.error(error_msg)
+                return result_type, None, None, None
 
-                # 재시도 가능하면 재시도
-                if retry_count < self.max_retries:
-                    logger.info(f"{self.retry_delay}초 후 재시도...")
-                    await asyncio.sleep(self.retry_delay)
-                    return await self.classify(answers, retry_count + 1)
-                else:
-                    return None, error_msg
+            error_msg = f"유효하지 않은 AI 응답: {result_text}"
+            logger.error(error_msg)
+            return None, error_msg, ERROR_INVALID_RESPONSE, None
+
+        except AdmissionRejected:
+            raise
 
         except APITimeoutError as e:
             error_msg = f"AI API 타임아웃: {str(e)}"
             logger.error(error_msg)
-
-            # 재시도
-            if retry_count < self.max_retries:
-                logger.info(f"{self.retry_delay}초 후 재시도...")
-                await asyncio.sleep(self.retry_delay)
-                return await self.classify(answers, retry_count + 1)
-            else:
-                return None, error_msg
+            return None, error_msg, ERROR_TIMEOUT, e
 
         except RateLimitError as e:
             error_msg = f"AI API 사용량 초과: {str(e)}"
             logger.error(error_msg)
-
-            # Rate limit은 재시도해도 소용없으므로 즉시 반환
-            return None, error_msg
+            return None, error_msg, ERROR_RATE_LIMIT, e
 
         except APIError as e:
             error_msg = f"AI API 오류: {str(e)}"
             logger.error(error_msg)
-
-            # 재시도
-            if retry_count < self.max_retries:
-                logger.info(f"{self.retry_delay}초 후 재시도...")
-                await asyncio.sleep(self.retry_delay)
-                return await self.classify(answers, retry_count + 1)
-            else:
-                return None, error_msg
+            return None, error_msg, ERROR_API, e
 
         except Exception as e:
             error_msg = f"예상치 못한 오류: {str(e)}"
             logger.error(error_msg, exc_info=True)
-            return None, error_msg
+            return None, error_msg, ERROR_UNEXPECTED, e
+
+
+class ClassificationBatcher:
+    """
+    AI 분류 마이크로 배칭
+
+    대기 중인 분류 요청을 최대 window_ms 동안 모아 하나의 API 요청으로 보내고,
+    결과를 각 호출자에게 돌려줍니다. max_size만큼 모이면 즉시 전송합니다.
+    """
+
+    def __init__(self, classifier: AIClassifier, window_ms: float, max_size: int):
+        self.classifier = classifier
+        self.window = window_ms / 1000
+        self.max_size = max_size
+        self._pending: List[
+            Tuple[Dict[str, str], Optional[SurveySchema], Optional[float], asyncio.Future]
+        ] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks = set()
+
+    async def submit(
+        self,
+        answers: Dict[str, str],
+        deadline: Optional[float] = None,
+        schema: Optional[SurveySchema] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        분류 요청을 다음 배치에 추가하고 결과를 기다립니다.
+
+        배치의 승인 기한은 포함된 요청 중 가장 늦은 기한입니다. (기한 없는 요청이 있으면 없음)
+
+        Returns:
+            Tuple[result_type, error_message]
+
+        Raises:
+            AdmissionRejected: 배치 요청이 승인되지 않음
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((answers, schema, deadline, future))
+
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """대기 중인 요청을 하나의 배치로 전송"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(
+        self,
+        batch: List[Tuple[Dict[str, str], Optional[SurveySchema], Optional[float], asyncio.Future]]
+    ) -> None:
+        deadlines = [deadline for _, _, deadline, _ in batch]
+        deadline = None if None in deadlines else max(deadlines)
+        try:
+            results = await self.classifier.classify_batch(
+                [answers for answers, _, _, _ in batch],
+                deadline=deadline,
+                schemas=[schema for _, schema, _, _ in batch]
+            )
+        except AdmissionRejected as e:
+            for _, _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except Exception as e:
+            results = [(None, f"예상치 못한 오류: {str(e)}")] * len(batch)
+
+        for (_, _, _, future), result in zip(batch, results):
+            # 호출자가 이미 취소한 경우 무시
+            if not future.done():
+                future.set_result(result)
 
 
 # 싱글톤 인스턴스 (전역 사용)
 _classifier_instance = None
+_batcher_instance = None
+_admission_instance = None
+_retry_policy_instance = None
 
 
 def get_classifier() -> AIClassifier:
@@ -310,16 +655,98 @@ def get_classifier() -> AIClassifier:
     return _classifier_instance
 
 
+def get_batcher() -> ClassificationBatcher:
+    """
+    AI 분류 마이크로 배처 싱글톤 인스턴스를 반환합니다.
+
+    Returns:
+        ClassificationBatcher: 배처 인스턴스
+    """
+    global _batcher_instance
+    if _batcher_instance is None:
+        _batcher_instance = ClassificationBatcher(
+            get_classifier(),
+            window_ms=AIConfig.AI_BATCH_WINDOW_MS,
+            max_size=AIConfig.AI_BATCH_MAX_SIZE
+        )
+    return _batcher_instance
+
+
+def get_admission_controller() -> AdmissionController:
+    """
+    OpenAI 호출 승인 제어 싱글톤 인스턴스를 반환합니다.
+
+    Returns:
+        AdmissionController: 승인 제어 인스턴스
+    """
+    global _admission_instance
+    if _admission_instance is None:
+        _admission_instance = AdmissionController(
+            "OpenAI",
+            max_concurrency=AIConfig.AI_MAX_CONCURRENCY,
+            requests_per_minute=AIConfig.AI_RATE_LIMIT_RPM,
+            tokens_per_minute=AIConfig.AI_RATE_LIMIT_TPM,
+            max_queue=AIConfig.AI_ADMISSION_QUEUE_SIZE
+        )
+    return _admission_instance
+
+
+def get_admission_stats() -> Dict:
+    """OpenAI 호출 승인 통계"""
+    return get_admission_controller().stats()
+
+
+def get_retry_policy() -> RetryPolicy:
+    """
+    AI 분류 재시도 정책 싱글톤 인스턴스를 반환합니다.
+
+    Returns:
+        RetryPolicy: 재시도 정책 (프로세스 재시도 예산 공유)
+    """
+    global _retry_policy_instance
+    if _retry_policy_instance is None:
+        _retry_policy_instance = RetryPolicy(
+            max_retries=AIConfig.AI_MAX_RETRIES,
+            base_delay=AIConfig.AI_RETRY_DELAY,
+            max_delay=AIConfig.AI_RETRY_MAX_DELAY,
+            request_budget_seconds=AIConfig.AI_RETRY_BUDGET_SECONDS,
+            budget=RetryBudget(
+                AIConfig.AI_RETRY_BUDGET_RATIO,
+                AIConfig.AI_RETRY_BUDGET_MIN_PER_SECOND
+            )
+        )
+    return _retry_policy_instance
+
+
+def get_retry_stats() -> Dict:
+    """AI 분류 재시도 통계"""
+    return get_retry_policy().stats()
+
+
 # 편의 함수
-async def classify_skin_type(answers: Dict[str, str]) -> Tuple[Optional[str], Optional[str]]:
+async def classify_skin_type(
+    answers: Dict[str, str],
+    deadline: Optional[float] = None,
+    schema: Optional[SurveySchema] = None
+) -> Tuple[Optional[str], Optional[str]]:
     """
     설문 응답을 분석하여 피부 타입을 분류합니다.
 
+    AI_BATCH_ENABLED이면 짧은 시간 동안 모인 요청과 함께 일괄 분류합니다.
+
     Args:
         answers: 설문 응답 딕셔너리
+        deadline: 승인 기한 (time.monotonic 기준, None이면 기한 없음)
+        schema: 설문 스키마 (None이면 기본 스키마)
 
     Returns:
         Tuple[result_type, error_message]
+
+    Raises:
+        AdmissionRejected: 요청이 승인되지 않음 (AI 호출 없이 Fallback 사용)
     """
+    if AIConfig.AI_BATCH_ENABLED:
+        return await get_batcher().submit(answers, deadline, schema)
+
     classifier = get_classifier()
-    return await classifier.classify(answers)
+    return await classifier.classify(answers, deadline=deadline, schema=schema)
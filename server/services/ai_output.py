@@ -0,0 +1,172 @@
+"""
+AI 분류 응답 형식 (AI_OUTPUT_MODE)
+
+- text: 결과 타입 키를 자유 텍스트로 받고 부분 문자열로 추출 (기존 방식)
+  모델이 설명을 덧붙이거나 키를 바꿔 쓰면 유효하지 않은 응답으로 재시도
+- json_schema: Structured Outputs(response_format=json_schema, strict)로
+  {"type": "<결과 타입>"} 형식을 강제 (결과 타입은 enum)
+- code: 결과 타입을 숫자 코드 한 글자(1~8)로 받음
+  logit_bias로 숫자 토큰만 생성하게 하고 max_tokens=1 (일괄 분류는 설문 수만큼)
+
+json_schema/code는 모델이 결과 타입 밖의 값을 생성할 수 없으므로
+유효하지 않은 응답 재시도가 사라지고, code는 응답 토큰도 설문당 1개로 줄어듭니다.
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+OUTPUT_MODE_TEXT = "text"
+OUTPUT_MODE_JSON_SCHEMA = "json_schema"
+OUTPUT_MODE_CODE = "code"
+OUTPUT_MODES = (OUTPUT_MODE_TEXT, OUTPUT_MODE_JSON_SCHEMA, OUTPUT_MODE_CODE)
+
+# 숫자 한 글자 토큰 ID ("0" = 15 ... "9" = 24, cl100k_base/o200k_base 공통)
+DIGIT_TOKEN_BASE = 15
+# logit_bias 최댓값 (해당 토큰만 생성)
+FORCE_TOKEN_BIAS = 100
+
+JSON_INSTRUCTION = """
+
+OUTPUT FORMAT:
+- Respond with a JSON object {"type": "<type key>"}."""
+
+JSON_BATCH_INSTRUCTION = """
+
+BATCH MODE:
+- The user message contains several numbered surveys. Classify each survey independently.
+- Respond with a JSON object {"types": [...]} holding one type key per survey, in the same order."""
+
+CODE_INSTRUCTION = """
+
+OUTPUT FORMAT:
+- Respond with ONLY the number of the type (1-8) from the list above. Codes:
+{codes}"""
+
+CODE_BATCH_INSTRUCTION = """
+
+BATCH MODE:
+- The user message contains several numbered surveys. Classify each survey independently.
+- Respond with ONLY one type number (1-8) per survey, in the same order, with no separators.
+- Example for 3 surveys: 157"""
+
+_DIGITS = re.compile(r"[1-9]")
+
+
+class OutputFormat:
+    """응답 형식별 요청 옵션/프롬프트/응답 해석"""
+
+    def __init__(self, mode: str, valid_types: List[str]):
+        """
+        Args:
+            mode: text | json_schema | code
+            valid_types: 결과 타입 목록 (code 모드의 코드 = 목록 순서 + 1)
+        """
+        if mode not in OUTPUT_MODES:
+            raise ValueError(f"지원하지 않는 AI 응답 형식: {mode}")
+        if mode == OUTPUT_MODE_CODE and len(valid_types) > 9:
+            raise ValueError("code 응답 형식은 결과 타입 9개까지만 지원합니다.")
+        self.mode = mode
+        self.valid_types = list(valid_types)
+
+    def system_prompt(self, base: str, batch_instruction: str = "") -> str:
+        """
+        응답 형식 지시문을 덧붙인 시스템 프롬프트
+
+        Args:
+            base: 기본 시스템 프롬프트
+            batch_instruction: text 모드 일괄 분류 지시문 (빈 값이면 단일 분류)
+        """
+        batch = bool(batch_instruction)
+        if self.mode == OUTPUT_MODE_JSON_SCHEMA:
+            return base + (JSON_BATCH_INSTRUCTION if batch else JSON_INSTRUCTION)
+        if self.mode == OUTPUT_MODE_CODE:
+            codes = "\n".join(
+                f"  {code}: {result_type}"
+                for code, result_type in enumerate(self.valid_types, start=1)
+            )
+            prompt = base + CODE_INSTRUCTION.format(codes=codes)
+            return prompt + CODE_BATCH_INSTRUCTION if batch else prompt
+        return base + batch_instruction
+
+    def request_options(self, max_tokens: int, count: int = 1) -> Dict[str, Any]:
+        """
+        Chat Completions 요청 옵션
+
+        Args:
+            max_tokens: text/json_schema 모드 응답 최대 토큰 수
+            count: 설문 수 (code 모드 max_tokens)
+
+        Returns:
+            {"max_tokens": ..., "response_format"/"logit_bias": ...}
+        """
+        if self.mode == OUTPUT_MODE_JSON_SCHEMA:
+            enum = {"type": "string", "enum": self.valid_types}
+            if count == 1:
+                name, properties = "skin_type", {"type": enum}
+            else:
+                name, properties = "skin_types", {"types": {"type": "array", "items": enum}}
+            return {
+                "max_tokens": max_tokens,
+                "response_format": {
+                    "type": "json_schema",
+                    "json_schema": {
+                        "name": name,
+                        "strict": True,
+                        "schema": {
+                            "type": "object",
+                            "properties": properties,
+                            "required": list(properties),
+                            "additionalProperties": False,
+                        },
+                    },
+                },
+            }
+        if self.mode == OUTPUT_MODE_CODE:
+            return {
+                "max_tokens": count,
+                "logit_bias": {
+                    str(DIGIT_TOKEN_BASE + code): FORCE_TOKEN_BIAS
+                    for code in range(1, len(self.valid_types) + 1)
+                },
+            }
+        return {"max_tokens": max_tokens}
+
+    def decode(self, response_text: str) -> Optional[str]:
+        """
+        단일 분류 응답 → 결과 타입 후보 (text 모드는 원문 그대로, 해석 실패 시 None)
+        """
+        if self.mode == OUTPUT_MODE_JSON_SCHEMA:
+            try:
+                value = json.loads(response_text).get("type")
+            except (ValueError, AttributeError):
+                return None
+            return value if isinstance(value, str) else None
+        if self.mode == OUTPUT_MODE_CODE:
+            codes = _DIGITS.findall(response_text)
+            return self._from_code(codes[0]) if len(codes) == 1 else None
+        return response_text
+
+    def decode_batch(self, response_text: str, count: int) -> List[Any]:
+        """
+        일괄 분류 응답 → 설문별 결과 타입 후보 목록
+
+        Raises:
+            ValueError: 형식이 맞지 않거나 항목 수가 다른 경우
+        """
+        if self.mode == OUTPUT_MODE_JSON_SCHEMA:
+            labels = json.loads(response_text).get("types")
+        elif self.mode == OUTPUT_MODE_CODE:
+            labels = [self._from_code(code) for code in _DIGITS.findall(response_text)]
+        else:
+            # 코드 블록(```json ... ```) 등 배열 앞뒤의 텍스트는 무시
+            labels = json.loads(
+                response_text[response_text.find("["):response_text.rfind("]") + 1]
+            )
+        if not isinstance(labels, list) or len(labels) != count:
+            raise ValueError(f"일괄 응답 항목 수 불일치: 요청 {count}개, 응답 {response_text!r}")
+        return labels
+
+    def _from_code(self, code: str) -> Optional[str]:
+        index = int(code) - 1
+        return self.valid_types[index] if index < len(self.valid_types) else None
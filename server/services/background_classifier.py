@@ -0,0 +1,338 @@
+"""
+백그라운드 AI 분류 작업자
+
+백그라운드 AI 분류 모드(AI_BACKGROUND_ENABLED)에서 설문 분석 API는 응답과 Fallback 결과를
+저장한 뒤 바로 응답하고, 여기서 AI 분류 작업을 큐에 넣습니다.
+작업자 N개가 큐에서 작업을 꺼내 AI 분류(캐시/진행 중 호출 공유/서킷 브레이커 경유)를 수행하고,
+결과를 form_responses에 다시 기록합니다. /api/result는 갱신된 결과를 그대로 반환합니다.
+
+결과의 ai_status:
+- pending: AI 분류 대기/진행 중 (Fallback 결과 표시)
+- done: AI 결과로 갱신됨
+- failed: 재시도 후에도 AI 분류 실패 (Fallback 결과로 확정)
+- skipped: 대기 작업이 많아 AI 분류를 생략 (Fallback 결과로 확정)
+
+AI 호출 또는 결과 기록이 실패하면 지수 대기 후 재시도합니다.
+재시도 대기 중인 작업은 큐에 있지 않으므로 작업자를 점유하지 않습니다.
+"""
+
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+from config.ai_config import AIConfig
+from services.classifier import start_ai_classification
+from services.survey_schema import SurveySchema
+
+logger = logging.getLogger(__name__)
+
+AI_STATUS_PENDING = "pending"
+AI_STATUS_DONE = "done"
+AI_STATUS_FAILED = "failed"
+AI_STATUS_SKIPPED = "skipped"
+
+# 재시도 대기 시간 상한 (초)
+MAX_RETRY_DELAY_SECONDS = 60.0
+
+
+def new_job_id() -> str:
+    """작업 ID (저장된 결과와 작업을 연결하는 키)"""
+    return uuid.uuid4().hex
+
+
+@dataclass
+class ClassificationJob:
+    """백그라운드 AI 분류 작업"""
+    job_id: str
+    member_id: str
+    form_id: str
+    answers: Dict[str, str]
+    fallback_result: Dict           # 저장된 Fallback 결과 (AI 최종 실패 시 기반)
+    schema: Optional[SurveySchema] = field(default=None, repr=False)
+    attempts: int = 0
+    queued_at: float = field(default=0.0, repr=False)
+
+
+class BackgroundClassifier:
+    """
+    asyncio 큐 + 작업자 태스크 기반 백그라운드 AI 분류기
+
+    이벤트 루프 안에서만 사용합니다. (start/stop은 서버 lifespan에서 호출)
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        queue_size: int = 1000,
+        max_attempts: int = 4,
+        retry_delay: float = 5.0
+    ):
+        """
+        Args:
+            workers: 작업자 수 (동시 AI 분류 수)
+            queue_size: 대기 작업 상한 (재시도 대기 포함)
+            max_attempts: 작업당 최대 시도 횟수
+            retry_delay: 첫 재시도 대기 시간 (초, 시도마다 2배)
+        """
+        self.workers = workers
+        self.queue_size = queue_size
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._retry_timers: Set[asyncio.TimerHandle] = set()
+        self._processing = 0
+        self._stopping = False
+        self._dropped_retries = 0
+
+        self._counters = {
+            "submitted": 0,     # 큐에 넣은 작업 수
+            "skipped": 0,       # 대기 작업 상한 초과로 생략한 작업 수
+            "completed": 0,     # AI 결과로 갱신한 작업 수
+            "failed": 0,        # 최대 시도 후 실패로 확정한 작업 수
+            "superseded": 0,    # 재제출로 대상 행이 바뀌어 기록하지 않은 작업 수
+            "retries": 0,       # 예약한 재시도 수
+        }
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._dequeued = 0
+
+    # ===== 수명 주기 =====
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        """작업자 태스크 시작 (이미 실행 중이면 무시)"""
+        if self.running:
+            return
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        self._tasks = [
+            asyncio.create_task(self._worker(i), name=f"ai-background-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info(f"[백그라운드 AI 분류] 작업자 {self.workers}개 시작")
+
+    async def stop(self, drain_seconds: float = 5.0) -> None:
+        """
+        작업자 종료
+
+        큐에 남은 작업은 drain_seconds 동안 처리를 기다린 뒤 버립니다.
+        버려진 작업의 결과는 Fallback(ai_status=pending)으로 남습니다.
+        """
+        if not self.running:
+            return
+
+        # 종료 중에는 재시도를 예약하지 않음 (drain 중 실패한 작업도 버림으로 집계)
+        self._stopping = True
+        self._dropped_retries = len(self._retry_timers)
+        for timer in self._retry_timers:
+            timer.cancel()
+        self._retry_timers.clear()
+
+        try:
+            await asyncio.wait_for(self._queue.join(), drain_seconds)
+        except asyncio.TimeoutError:
+            pass
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._stopping = False
+
+        dropped = self._queue.qsize() + self._dropped_retries
+        if dropped:
+            logger.warning(f"[백그라운드 AI 분류] 종료로 미처리 작업 {dropped}건 버림")
+        logger.info("[백그라운드 AI 분류] 작업자 종료")
+
+    # ===== 작업 등록 =====
+
+    def pending_jobs(self) -> int:
+        """처리 대기 작업 수 (큐 + 재시도 대기 + 처리 중)"""
+        queued = self._queue.qsize() if self._queue is not None else 0
+        return queued + len(self._retry_timers) + self._processing
+
+    def accepting(self) -> bool:
+        """새 작업을 받을 수 있는지 (대기 작업 상한 미만)"""
+        return self.pending_jobs() < self.queue_size
+
+    def record_skipped(self) -> None:
+        """대기 작업 상한 초과로 AI 분류를 생략한 제출 기록"""
+        self._counters["skipped"] += 1
+
+    def submit(self, job: ClassificationJob) -> None:
+        """
+        작업 등록 (작업자가 없으면 시작)
+
+        응답/Fallback 결과가 저장된 뒤 호출해야 결과 갱신 대상 행이 존재합니다.
+        상한 확인은 저장 전에 accepting()으로 합니다.
+        """
+        self.start()
+        self._counters["submitted"] += 1
+        self._enqueue(job)
+
+    def _enqueue(self, job: ClassificationJob) -> None:
+        job.queued_at = asyncio.get_running_loop().time()
+        self._queue.put_nowait(job)
+
+    def _schedule_retry(self, job: ClassificationJob, reason: str) -> None:
+        """지수 대기 후 작업 재등록 (종료 중이면 버림)"""
+        if self._stopping:
+            self._dropped_retries += 1
+            logger.info(f"[백그라운드 AI 분류] 종료 중이라 재시도 생략 | job_id={job.job_id} | {reason}")
+            return
+        delay = min(self.retry_delay * (2 ** (job.attempts - 1)), MAX_RETRY_DELAY_SECONDS)
+        self._counters["retries"] += 1
+        logger.info(
+            f"[백그라운드 AI 분류] {delay:.1f}초 후 재시도 "
+            f"({job.attempts}/{self.max_attempts}) | job_id={job.job_id} | {reason}"
+        )
+
+        def requeue():
+            self._retry_timers.discard(timer)
+            self._enqueue(job)
+
+        timer = asyncio.get_running_loop().call_later(delay, requeue)
+        self._retry_timers.add(timer)
+
+    # ===== 작업 처리 =====
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            job = await self._queue.get()
+            wait = asyncio.get_running_loop().time() - job.queued_at
+            self._dequeued += 1
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+
+            self._processing += 1
+            try:
+                await self._process(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(
+                    f"[백그라운드 AI 분류] 작업 처리 에러: {e} | job_id={job.job_id}",
+                    exc_info=True
+                )
+            finally:
+                self._processing -= 1
+                self._queue.task_done()
+
+    async def _process(self, job: ClassificationJob) -> None:
+        job.attempts += 1
+        ai_result, ai_error = await start_ai_classification(job.answers, schema=job.schema)
+
+        if ai_result:
+            result = {
+                "type": ai_result,
+                "source": "ai",
+                "ai_error": None,
+                "classified_at": datetime.now().isoformat(),
+                "ai_status": AI_STATUS_DONE,
+                "job_id": job.job_id,
+            }
+        elif job.attempts < self.max_attempts:
+            self._schedule_retry(job, f"AI 분류 실패: {ai_error}")
+            return
+        else:
+            result = {
+                **job.fallback_result,
+                "ai_error": ai_error,
+                "ai_status": AI_STATUS_FAILED,
+                "job_id": job.job_id,
+            }
+
+        await self._write_result(job, result)
+
+    async def _write_result(self, job: ClassificationJob, result: Dict) -> None:
+        from db.supabase_client import get_supabase_client
+
+        try:
+            updated = await get_supabase_client().update_form_response_result(
+                member_id=job.member_id,
+                form_id=job.form_id,
+                responses=job.answers,
+                result=result,
+                job_id=job.job_id
+            )
+        except Exception as e:
+            if job.attempts < self.max_attempts:
+                self._schedule_retry(job, f"결과 저장 실패: {e}")
+                return
+            raise
+
+        if not updated:
+            self._counters["superseded"] += 1
+            logger.info(f"[백그라운드 AI 분류] 재제출된 응답이라 결과 갱신 생략 | job_id={job.job_id}")
+        elif result["ai_status"] == AI_STATUS_DONE:
+            self._counters["completed"] += 1
+            logger.info(
+                f"[백그라운드 AI 분류] AI 결과 갱신: {result['type']} "
+                f"(Fallback: {job.fallback_result.get('type')}) | job_id={job.job_id}"
+            )
+        else:
+            self._counters["failed"] += 1
+            logger.warning(
+                f"[백그라운드 AI 분류] AI 분류 최종 실패, Fallback 결과 확정 | "
+                f"job_id={job.job_id} | {result['ai_error']}"
+            )
+
+    # ===== 통계 =====
+
+    def stats(self) -> Dict:
+        """큐 깊이와 처리 통계"""
+        return {
+            "running": self.running,
+            "workers": self.workers,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "retry_scheduled": len(self._retry_timers),
+            "processing": self._processing,
+            "dropped_retries": self._dropped_retries,
+            "pending_jobs": self.pending_jobs(),
+            "queue_size": self.queue_size,
+            **self._counters,
+            "avg_queue_wait_ms": (
+                round(self._wait_total / self._dequeued * 1000, 2) if self._dequeued else 0.0
+            ),
+            "max_queue_wait_ms": round(self._wait_max * 1000, 2),
+        }
+
+
+# 전역 백그라운드 분류기 인스턴스
+_background_classifier: Optional[BackgroundClassifier] = None
+
+
+def get_background_classifier() -> Optional[BackgroundClassifier]:
+    """
+    백그라운드 AI 분류기 싱글톤
+
+    Returns:
+        BackgroundClassifier (AI_BACKGROUND_ENABLED=false이면 None)
+    """
+    global _background_classifier
+    if not AIConfig.AI_BACKGROUND_ENABLED:
+        return None
+    if _background_classifier is None:
+        _background_classifier = BackgroundClassifier(
+            workers=AIConfig.AI_BACKGROUND_WORKERS,
+            queue_size=AIConfig.AI_BACKGROUND_QUEUE_SIZE,
+            max_attempts=AIConfig.AI_BACKGROUND_MAX_ATTEMPTS,
+            retry_delay=AIConfig.AI_BACKGROUND_RETRY_DELAY_SECONDS
+        )
+    return _background_classifier
+
+
+def get_background_classifier_stats() -> Dict:
+    """백그라운드 AI 분류 통계 (비활성화 시 enabled=False)"""
+    background = get_background_classifier()
+    if background is None:
+        return {"enabled": False}
+    return {"enabled": True, **background.stats()}
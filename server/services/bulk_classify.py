@@ -0,0 +1,406 @@
+"""
+설문 덤프 일괄 분류 (오프라인 CLI)
+
+행사 후 받은 종이/키오스크 설문 덤프(CSV 또는 NDJSON)를 스트리밍으로 읽어 분류하고
+결과를 청크 단위로 출력 파일에 이어 씁니다. 입력 전체를 메모리에 올리지 않으므로
+행 수와 무관하게 일정한 메모리로 동작합니다.
+
+- 기본(Fallback): 청크(CHUNK_ROWS행)를 NumPy 일괄 분류(services/fallback_batch.py)로 분류
+  폼 전용 스키마(--schema)는 행별 fallback_classify(사전 계산 테이블/점수 계산)로 분류
+- --ai: 행마다 classify_with_fallback (분류 캐시 → 로컬 모델 → AI → Fallback)
+  동시 분류 수는 --concurrency로 제한하고, 응답 시간 예산 없이 AI 결과를 기다림
+  청크 두 개를 겹쳐 처리하므로 중단 시 최대 2청크(2 x AI_CHUNK_ROWS행)를 다시 분류
+- 체크포인트: 청크를 쓰고 fsync한 뒤 (처리한 행 수, 출력 파일 크기)를 <출력 파일>.checkpoint에
+  원자적으로 기록합니다. 중단 후 같은 명령을 다시 실행하면 출력 파일을 체크포인트 크기로 자르고
+  (마지막 청크가 일부만 쓰였을 수 있음) 처리한 행을 건너뛰어 이어서 분류합니다.
+
+입력 형식 (확장자로 판별, --input-format으로 지정 가능):
+- CSV: 문항 ID 열("1" 또는 "q1")에 선택지 ID("q1a2"), 선택적으로 ID 열(--id-column)
+- NDJSON: {"1": "q1a2", ...} 또는 form_responses 행({"id", "responses": {...}})
+출력 행: row(입력 행 번호, 1부터), id, result_type, source (CSV는 .csv 확장자, 그 외 NDJSON)
+
+사용법 (server 디렉토리에서):
+    python -m services.bulk_classify dump.csv results.csv
+    python -m services.bulk_classify dump.ndjson results.ndjson --ai --concurrency 16
+    python -m services.bulk_classify dump.csv results.csv --restart   # 체크포인트 무시, 처음부터
+"""
+
+import argparse
+import asyncio
+import csv
+import io
+import json
+import logging
+import os
+import sys
+import time
+from collections import Counter
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from config.ai_config import AIConfig
+from services.survey_schema import (
+    SurveySchema,
+    get_default_schema,
+    load_schema,
+    normalize_question_id,
+)
+
+logger = logging.getLogger(__name__)
+
+# 청크당 행 수 (체크포인트 간격, AI는 중단 시 다시 호출하는 양을 줄이도록 작게)
+CHUNK_ROWS = 5000
+AI_CHUNK_ROWS = 100
+
+# 출력 컬럼
+OUTPUT_FIELDS = ["row", "id", "result_type", "source"]
+
+# 체크포인트 파일 포맷 버전
+CHECKPOINT_VERSION = 1
+
+
+def detect_format(path: str, explicit: Optional[str] = None) -> str:
+    """파일 형식 판별 (csv | ndjson)"""
+    if explicit:
+        return explicit
+    return "csv" if path.lower().endswith(".csv") else "ndjson"
+
+
+def iter_input_rows(
+    path: str,
+    input_format: str,
+    schema: SurveySchema,
+    id_column: str = "id"
+) -> Iterator[Tuple[Any, Dict[str, str]]]:
+    """
+    입력 파일을 한 행씩 (행 ID, 설문 응답)으로 변환
+
+    응답은 스키마 문항만 남기고 문항 ID를 정규화합니다. ("q1" → "1", 빈 값은 미응답)
+
+    Raises:
+        ValueError: NDJSON 행이 JSON 객체가 아닌 경우
+    """
+    question_keys = set(schema.question_keys)
+
+    def answers_of(values: Dict) -> Dict[str, str]:
+        answers = {}
+        for q_id, answer in values.items():
+            key = normalize_question_id(q_id)
+            if key in question_keys and answer:
+                answers[key] = answer
+        return answers
+
+    # 내보내기 CSV의 UTF-8 BOM 제거
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        if input_format == "csv":
+            for row in csv.DictReader(f):
+                yield row.get(id_column) or "", answers_of(row)
+            return
+
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"{path}:{line_number} JSON 형식 오류: {e}") from e
+            if not isinstance(row, dict):
+                raise ValueError(f"{path}:{line_number} JSON 객체가 아닙니다")
+            responses = row.get("responses", row)
+            if isinstance(responses, str):
+                responses = json.loads(responses)
+            yield row.get(id_column, ""), answers_of(responses)
+
+
+def classify_chunk_fallback(
+    answers_list: List[Dict[str, str]],
+    schema: SurveySchema
+) -> List[Tuple[Optional[str], str]]:
+    """Fallback 청크 분류 (기본 스키마는 NumPy 일괄 분류)"""
+    if schema is get_default_schema():
+        from services.fallback_batch import fallback_classify_batch
+
+        return [(result_type, "fallback") for result_type in fallback_classify_batch(answers_list)]
+
+    from services.fallback_classifier import fallback_classify
+
+    return [(fallback_classify(answers, schema), "fallback") for answers in answers_list]
+
+
+async def classify_chunk_ai(
+    answers_list: List[Dict[str, str]],
+    schema: SurveySchema,
+    semaphore: asyncio.Semaphore
+) -> List[Tuple[Optional[str], str]]:
+    """AI 청크 분류 (동시 분류 수 제한, 입력 순서 유지)"""
+    from services.classifier import classify_with_fallback
+
+    async def one(answers: Dict[str, str]) -> Tuple[Optional[str], str]:
+        async with semaphore:
+            # 오프라인 분류는 AI 결과를 끝까지 기다림 (응답 시간 예산 초과 시 Fallback 반환 안 함)
+            result_type, source, _ = await classify_with_fallback(answers, schema, latency_budget=0)
+        return result_type, source
+
+    return await asyncio.gather(*(one(answers) for answers in answers_list))
+
+
+class ResultWriter:
+    """결과 파일 이어 쓰기 (바이트 단위 위치를 체크포인트에 기록)"""
+
+    def __init__(self, path: str, output_format: str, offset: int):
+        """
+        Args:
+            offset: 이어 쓸 위치 (체크포인트의 출력 파일 크기, 0이면 새로 작성)
+        """
+        self.output_format = output_format
+        if offset == 0:
+            self._file = open(path, "wb")
+            if output_format == "csv":
+                # 엑셀 호환을 위해 UTF-8 BOM (services/export_stream.py와 동일)
+                self._write_rows([], header=True)
+        else:
+            # 체크포인트 이후 일부만 쓰인 청크 제거
+            os.truncate(path, offset)
+            self._file = open(path, "ab")
+
+    def _write_rows(self, rows: List[Dict], header: bool = False) -> None:
+        if self.output_format == "csv":
+            buffer = io.StringIO()
+            if header:
+                buffer.write("\ufeff")
+            writer = csv.DictWriter(buffer, fieldnames=OUTPUT_FIELDS)
+            if header:
+                writer.writeheader()
+            writer.writerows(rows)
+            text = buffer.getvalue()
+        else:
+            text = "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+        self._file.write(text.encode("utf-8"))
+
+    def write_chunk(self, rows: List[Dict]) -> int:
+        """
+        청크 기록 후 디스크 동기화
+
+        Returns:
+            현재 출력 파일 크기 (체크포인트에 기록할 위치)
+        """
+        self._write_rows(rows)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def load_checkpoint(path: str) -> Optional[Dict]:
+    """체크포인트 로드 (없으면 None)"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_checkpoint(path: str, checkpoint: Dict) -> None:
+    """체크포인트 원자적 기록 (임시 파일 작성 후 교체)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+async def bulk_classify(
+    input_path: str,
+    output_path: str,
+    use_ai: bool = False,
+    concurrency: Optional[int] = None,
+    chunk_rows: Optional[int] = None,
+    input_format: Optional[str] = None,
+    output_format: Optional[str] = None,
+    id_column: str = "id",
+    schema: Optional[SurveySchema] = None,
+    restart: bool = False,
+    max_rows: Optional[int] = None
+) -> Dict:
+    """
+    설문 덤프 일괄 분류 (체크포인트가 있으면 이어서 분류)
+
+    Args:
+        use_ai: AI 분류 사용 (False면 Fallback만)
+        concurrency: AI 동시 분류 수 (None이면 AI_MAX_CONCURRENCY)
+        chunk_rows: 청크당 행 수 (None이면 CHUNK_ROWS / AI는 AI_CHUNK_ROWS)
+        schema: 설문 스키마 (None이면 기본 스키마)
+        restart: 체크포인트를 무시하고 처음부터 분류
+        max_rows: 이번 실행에서 분류할 최대 행 수 (None이면 끝까지, 남은 행은 다음 실행에서 이어서)
+
+    Returns:
+        {"rows", "resumed_from", "new_rows", "elapsed_seconds", "rows_per_second", "sources", "done"}
+
+    Raises:
+        ValueError: 체크포인트가 다른 입력/모드로 만들어졌거나, 체크포인트 없이 출력 파일이 이미 있는 경우
+    """
+    schema = schema or get_default_schema()
+    input_format = detect_format(input_path, input_format)
+    output_format = detect_format(output_path, output_format)
+    chunk_rows = chunk_rows or (AI_CHUNK_ROWS if use_ai else CHUNK_ROWS)
+    checkpoint_path = f"{output_path}.checkpoint"
+    identity = {
+        "version": CHECKPOINT_VERSION,
+        "input": os.path.abspath(input_path),
+        "mode": "ai" if use_ai else "fallback",
+        "output_format": output_format,
+        "schema": schema.fingerprint,
+    }
+
+    checkpoint = None if restart else load_checkpoint(checkpoint_path)
+    if checkpoint is not None:
+        mismatched = [key for key, value in identity.items() if checkpoint.get(key) != value]
+        if mismatched:
+            raise ValueError(
+                f"체크포인트({checkpoint_path})가 다른 설정으로 만들어졌습니다: {', '.join(mismatched)}. "
+                f"--restart로 처음부터 분류하세요."
+            )
+    elif not restart and os.path.exists(output_path):
+        raise ValueError(f"출력 파일이 이미 있습니다: {output_path} (--restart로 덮어쓰기)")
+
+    checkpoint = checkpoint or {**identity, "rows": 0, "output_bytes": 0, "sources": {}, "done": False}
+    resumed_from = checkpoint["rows"]
+    sources = Counter(checkpoint["sources"])
+    summary = {"rows": resumed_from, "resumed_from": resumed_from, "new_rows": 0}
+    if checkpoint["done"]:
+        return {**summary, "elapsed_seconds": 0.0, "rows_per_second": 0.0, "sources": dict(sources), "done": True}
+
+    if use_ai:
+        from services.openai_http import close_openai_http_client, warm_up_openai
+
+        semaphore = asyncio.Semaphore(concurrency or AIConfig.AI_MAX_CONCURRENCY)
+        await warm_up_openai()
+
+    start = time.perf_counter()
+    remaining = islice(iter_input_rows(input_path, input_format, schema, id_column), resumed_from, None)
+    rows = remaining if max_rows is None else islice(remaining, max_rows)
+    writer = ResultWriter(output_path, output_format, checkpoint["output_bytes"])
+    row_number = resumed_from
+
+    def commit_chunk(
+        chunk: List[Tuple[Any, Dict[str, str]]],
+        results: List[Tuple[Optional[str], str]]
+    ) -> None:
+        """청크 결과 기록 + 체크포인트 갱신"""
+        nonlocal row_number
+        output_rows = []
+        for (row_id, _), (result_type, source) in zip(chunk, results):
+            row_number += 1
+            sources[source] += 1
+            output_rows.append({
+                "row": row_number,
+                "id": row_id,
+                "result_type": result_type or "",
+                "source": source,
+            })
+        checkpoint["output_bytes"] = writer.write_chunk(output_rows)
+        checkpoint["rows"] = row_number
+        checkpoint["sources"] = dict(sources)
+        save_checkpoint(checkpoint_path, checkpoint)
+        logger.info(f"[일괄 분류] {row_number}행 완료")
+
+    pending = None
+    try:
+        while True:
+            chunk = list(islice(rows, chunk_rows))
+            if not chunk:
+                break
+            answers_list = [answers for _, answers in chunk]
+            if not use_ai:
+                commit_chunk(chunk, classify_chunk_fallback(answers_list, schema))
+                continue
+
+            # 다음 청크를 먼저 시작한 뒤 이전 청크를 기록 (청크 경계에서 동시 분류 슬롯이 비지 않도록,
+            # 세마포어는 대기 순서대로 획득하므로 이전 청크의 행이 먼저 분류됨)
+            task = asyncio.ensure_future(classify_chunk_ai(answers_list, schema, semaphore))
+            if pending is not None:
+                commit_chunk(pending[0], await pending[1])
+            pending = (chunk, task)
+
+        if pending is not None:
+            commit_chunk(pending[0], await pending[1])
+            pending = None
+
+        # max_rows로 멈췄으면 남은 행이 있는지 한 행 더 읽어 확인 (islice는 max_rows 다음 행을 읽지 않음)
+        checkpoint["done"] = max_rows is None or next(remaining, None) is None
+        save_checkpoint(checkpoint_path, checkpoint)
+    finally:
+        if pending is not None:
+            pending[1].cancel()
+        writer.close()
+        if use_ai:
+            await close_openai_http_client()
+
+    elapsed = time.perf_counter() - start
+    new_rows = checkpoint["rows"] - resumed_from
+    return {
+        **summary,
+        "rows": checkpoint["rows"],
+        "new_rows": new_rows,
+        "elapsed_seconds": round(elapsed, 3),
+        "rows_per_second": round(new_rows / elapsed, 1) if elapsed > 0 else 0.0,
+        "sources": dict(sources),
+        "done": checkpoint["done"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="설문 덤프(CSV/NDJSON) 일괄 분류")
+    parser.add_argument("input", help="입력 파일 (CSV 또는 NDJSON)")
+    parser.add_argument("output", help="결과 파일 (.csv면 CSV, 그 외 NDJSON)")
+    parser.add_argument("--ai", action="store_true", help="AI 분류 사용 (기본: Fallback만)")
+    parser.add_argument("--concurrency", type=int, help="AI 동시 분류 수 (기본: AI_MAX_CONCURRENCY)")
+    parser.add_argument("--chunk-rows", type=int, help=f"체크포인트 간격 행 수 (기본: {CHUNK_ROWS}, AI {AI_CHUNK_ROWS})")
+    parser.add_argument("--input-format", choices=["csv", "ndjson"], help="입력 형식 (기본: 확장자로 판별)")
+    parser.add_argument("--output-format", choices=["csv", "ndjson"], help="출력 형식 (기본: 확장자로 판별)")
+    parser.add_argument("--id-column", default="id", help="행 ID 열/키 이름")
+    parser.add_argument("--schema", help="설문 스키마 파일 (기본: 기본 스키마)")
+    parser.add_argument("--max-rows", type=int, help="이번 실행에서 분류할 최대 행 수 (나머지는 다음 실행에서)")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 처음부터 분류")
+    args = parser.parse_args()
+
+    if args.ai and not AIConfig.OPENAI_API_KEY:
+        print("❌ --ai에는 OPENAI_API_KEY가 필요합니다")
+        sys.exit(1)
+
+    try:
+        summary = asyncio.run(bulk_classify(
+            args.input,
+            args.output,
+            use_ai=args.ai,
+            concurrency=args.concurrency,
+            chunk_rows=args.chunk_rows,
+            input_format=args.input_format,
+            output_format=args.output_format,
+            id_column=args.id_column,
+            schema=load_schema(args.schema) if args.schema else None,
+            restart=args.restart,
+            max_rows=args.max_rows
+        ))
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print("중단됨: 같은 명령을 다시 실행하면 마지막 체크포인트부터 이어서 분류합니다")
+        sys.exit(130)
+
+    if summary["resumed_from"]:
+        print(f"체크포인트에서 이어서 분류: {summary['resumed_from']}행 건너뜀")
+    print(
+        f"분류 완료: {summary['new_rows']}행 ({summary['elapsed_seconds']}s, "
+        f"초당 {summary['rows_per_second']}행) / 누적 {summary['rows']}행 / 출처 {summary['sources']}"
+    )
+    if not summary["done"]:
+        print("남은 행이 있습니다: 같은 명령을 다시 실행하면 이어서 분류합니다")
+
+
+if __name__ == "__main__":
+    main()
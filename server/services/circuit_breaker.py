@@ -0,0 +1,196 @@
+"""
+서킷 브레이커
+
+외부 서비스(OpenAI)가 불안정할 때 매 요청이 타임아웃/재시도 경로를 모두 거치며
+부하와 지연을 키우지 않도록, 최근 호출의 실패율/느린 호출 비율을 보고 호출을 차단합니다.
+
+상태:
+- closed: 정상. 최근 window_size개 호출 중 실패율 또는 느린 호출 비율이 기준을 넘으면 open
+- open: 호출 차단 (호출자는 즉시 대체 경로 사용). open_seconds 후 half_open
+- half_open: 시험 호출을 half_open_calls개까지 허용. 모두 성공하면 closed, 하나라도 실패하면 open
+"""
+
+import logging
+import time
+from collections import deque
+from datetime import datetime
+from typing import Callable, Deque, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# 상태 조회 시 함께 보여줄 최근 전환 기록 수
+TRANSITION_HISTORY_SIZE = 20
+
+
+class CircuitBreaker:
+    """실패율/느린 호출 비율 기반 서킷 브레이커"""
+
+    def __init__(
+        self,
+        name: str,
+        window_size: int = 20,
+        min_calls: int = 10,
+        failure_rate_threshold: float = 0.5,
+        slow_call_seconds: float = 5.0,
+        slow_call_rate_threshold: float = 0.8,
+        open_seconds: float = 30.0,
+        half_open_calls: int = 2,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            name: 브레이커 이름 (로그/상태 표시용)
+            window_size: 실패율 계산에 쓰는 최근 호출 수
+            min_calls: 실패율을 판단하기 위한 최소 호출 수
+            failure_rate_threshold: open 전환 실패율 (0~1)
+            slow_call_seconds: 느린 호출 기준 시간 (초)
+            slow_call_rate_threshold: open 전환 느린 호출 비율 (0~1)
+            open_seconds: open 유지 시간 (이후 half_open)
+            half_open_calls: half_open에서 허용하는 시험 호출 수
+            clock: 시간 함수 (테스트용)
+        """
+        self.name = name
+        self.window_size = window_size
+        self.min_calls = min_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        self._clock = clock
+
+        self.state = STATE_CLOSED
+        # 최근 호출 결과: (실패 여부, 느린 호출 여부)
+        self._window: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._probes_started = 0
+        self._probes_succeeded = 0
+
+        self.rejected_calls = 0
+        self.transitions: Deque[Dict] = deque(maxlen=TRANSITION_HISTORY_SIZE)
+        self.transition_counts: Dict[str, int] = {}
+
+    # ===== 상태 전환 =====
+
+    def _transition(self, new_state: str, reason: str) -> None:
+        old_state = self.state
+        self.state = new_state
+        key = f"{old_state}->{new_state}"
+        self.transition_counts[key] = self.transition_counts.get(key, 0) + 1
+        self.transitions.append({
+            "from": old_state,
+            "to": new_state,
+            "reason": reason,
+            "at": datetime.now().isoformat(),
+        })
+
+        if new_state == STATE_OPEN:
+            self._opened_at = self._clock()
+            logger.warning(f"[{self.name}] 서킷 브레이커 OPEN: {reason}")
+        elif new_state == STATE_HALF_OPEN:
+            self._probes_started = 0
+            self._probes_succeeded = 0
+            logger.info(f"[{self.name}] 서킷 브레이커 HALF_OPEN: {reason}")
+        else:
+            self._window.clear()
+            logger.info(f"[{self.name}] 서킷 브레이커 CLOSED: {reason}")
+
+    def _rates(self) -> Tuple[float, float]:
+        """최근 호출의 (실패율, 느린 호출 비율)"""
+        if not self._window:
+            return 0.0, 0.0
+        failures = sum(1 for failed, _ in self._window if failed)
+        slow = sum(1 for _, is_slow in self._window if is_slow)
+        return failures / len(self._window), slow / len(self._window)
+
+    # ===== 공개 API =====
+
+    def allow_request(self) -> bool:
+        """
+        호출 허용 여부 (허용된 half_open 호출은 시험 호출로 집계)
+
+        Returns:
+            True면 호출 진행, False면 대체 경로 사용
+        """
+        if self.state == STATE_OPEN:
+            if self._clock() - self._opened_at >= self.open_seconds:
+                self._transition(STATE_HALF_OPEN, f"{self.open_seconds}초 경과, 시험 호출 시작")
+            else:
+                self.rejected_calls += 1
+                return False
+
+        if self.state == STATE_HALF_OPEN:
+            if self._probes_started >= self.half_open_calls:
+                self.rejected_calls += 1
+                return False
+            self._probes_started += 1
+
+        return True
+
+    def release(self) -> None:
+        """허용받았지만 호출하지 않은 요청 반환 (half_open 시험 호출 수 복구)"""
+        if self.state == STATE_HALF_OPEN and self._probes_started > self._probes_succeeded:
+            self._probes_started -= 1
+
+    def record(self, success: bool, duration: float) -> None:
+        """
+        호출 결과 기록
+
+        Args:
+            success: 호출 성공 여부
+            duration: 호출 소요 시간 (초)
+        """
+        slow = duration >= self.slow_call_seconds
+
+        if self.state == STATE_HALF_OPEN:
+            if not success or slow:
+                reason = "실패" if not success else f"느린 응답 {duration:.1f}초"
+                self._transition(STATE_OPEN, f"시험 호출 {reason}")
+                return
+            self._probes_succeeded += 1
+            if self._probes_succeeded >= self.half_open_calls:
+                self._transition(STATE_CLOSED, f"시험 호출 {self._probes_succeeded}건 성공")
+            return
+
+        if self.state == STATE_OPEN:
+            # open 이전에 시작된 호출의 결과는 무시
+            return
+
+        self._window.append((not success, slow))
+        if len(self._window) < self.min_calls:
+            return
+
+        failure_rate, slow_rate = self._rates()
+        if failure_rate >= self.failure_rate_threshold:
+            self._transition(
+                STATE_OPEN,
+                f"실패율 {failure_rate:.0%} (최근 {len(self._window)}건)"
+            )
+        elif slow_rate >= self.slow_call_rate_threshold:
+            self._transition(
+                STATE_OPEN,
+                f"느린 호출 비율 {slow_rate:.0%} (기준 {self.slow_call_seconds}초, 최근 {len(self._window)}건)"
+            )
+
+    def status(self) -> Dict:
+        """브레이커 상태"""
+        failure_rate, slow_rate = self._rates()
+        status = {
+            "name": self.name,
+            "state": self.state,
+            "window_calls": len(self._window),
+            "failure_rate": round(failure_rate, 4),
+            "slow_call_rate": round(slow_rate, 4),
+            "rejected_calls": self.rejected_calls,
+            "transition_counts": dict(self.transition_counts),
+            "recent_transitions": list(self.transitions),
+        }
+        if self.state == STATE_OPEN:
+            status["retry_in_seconds"] = round(
+                max(0.0, self.open_seconds - (self._clock() - self._opened_at)), 1
+            )
+        return status
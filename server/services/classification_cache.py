@@ -0,0 +1,236 @@
+"""
+AI 분류 결과 캐시
+
+설문 응답 공간은 유한하고(성별 2 x 연령대 5 x 문항 10개의 4~5지선다),
+temperature 0에서 같은 프롬프트는 같은 결과를 반환하므로
+AI 분류 결과를 정규화된 응답 키 기준으로 재사용합니다.
+
+- canonical_key: 응답을 프롬프트와 1:1 대응하는 짧은 문자열 키로 변환
+- ClassificationCache: 프로세스 내 LRU + SQLite 영속 저장소 (재시작 후에도 유지)
+
+캐시 버전은 SYSTEM_PROMPT, OPENAI_MODEL, 기본 설문 스키마의 질문-답변 매핑의 해시이며,
+프롬프트나 모델이 바뀌면 이전 버전 항목은 조회되지 않고 시작 시 정리됩니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from config.ai_config import AIConfig
+from services.survey_schema import SurveySchema, get_default_schema
+
+logger = logging.getLogger(__name__)
+
+
+def canonical_key(answers: Dict[str, str], schema: Optional[SurveySchema] = None) -> str:
+    """
+    설문 응답을 정규화된 캐시 키로 변환
+
+    질문 순서는 설문 스키마 기준으로 고정되고, 입력 순서와 "q1"/"1" 같은
+    질문 ID 표기 차이, 프롬프트에 쓰이지 않는 항목은 키에 영향을 주지 않습니다.
+    (AIClassifier._build_user_prompt와 같은 정규화이므로 키가 같으면 프롬프트도 같음)
+    폼 전용 스키마의 키에는 스키마 지문을 붙여 기본 스키마의 키와 구분합니다.
+
+    Args:
+        answers: 설문 응답 딕셔너리 {question_id: answer_id}
+        schema: 설문 스키마 (None이면 기본 스키마)
+
+    Returns:
+        질문당 1글자 키 (예: "22111111233", 폼 전용 스키마는 "지문:22111111233")
+    """
+    default = get_default_schema()
+    if schema is None or schema is default:
+        return default.canonical_key(answers)
+    return f"{schema.fingerprint}:{schema.canonical_key(answers)}"
+
+
+def compute_cache_version() -> str:
+    """프롬프트/모델/질문 매핑 기준 캐시 버전 해시"""
+    source = json.dumps(
+        {
+            "model": AIConfig.OPENAI_MODEL,
+            "system_prompt": AIConfig.SYSTEM_PROMPT,
+            "question_mapping": get_default_schema().question_mapping,
+        },
+        ensure_ascii=False,
+        sort_keys=True
+    )
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()[:16]
+
+
+class ClassificationCache:
+    """
+    분류 결과 캐시 (LRU + SQLite 영속 저장소)
+
+    메모리 LRU에 없으면 SQLite를 조회하고, 저장은 양쪽에 모두 합니다.
+    SQLite 접근은 스레드에서 실행되어 이벤트 루프를 막지 않습니다.
+    """
+
+    def __init__(self, max_entries: int, db_path: Optional[str], version: str):
+        """
+        Args:
+            max_entries: 메모리 LRU 최대 항목 수
+            db_path: SQLite 파일 경로 (None이면 메모리 전용)
+            version: 캐시 버전 (다른 버전의 항목은 사용하지 않음)
+        """
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self.version = version
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+        self.stores = 0
+
+        if db_path:
+            self._init_store()
+
+    # ===== SQLite 저장소 (블로킹 I/O, 스레드에서 호출됨) =====
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+
+    def _init_store(self) -> None:
+        """테이블 생성, 이전 버전 정리 후 최근 항목을 메모리에 적재"""
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS classification_cache ("
+                "version TEXT NOT NULL, answer_key TEXT NOT NULL, "
+                "result_type TEXT NOT NULL, updated_at REAL NOT NULL, "
+                "PRIMARY KEY (version, answer_key))"
+            )
+            removed = conn.execute(
+                "DELETE FROM classification_cache WHERE version != ?",
+                (self.version,)
+            ).rowcount
+            rows = conn.execute(
+                "SELECT answer_key, result_type FROM classification_cache "
+                "WHERE version = ? ORDER BY updated_at DESC LIMIT ?",
+                (self.version, self.max_entries)
+            ).fetchall()
+
+        # 최근 항목이 LRU의 끝(가장 최근 사용)에 오도록 역순 삽입
+        for answer_key, result_type in reversed(rows):
+            self._entries[answer_key] = result_type
+
+        if removed:
+            logger.info(f"분류 캐시 이전 버전 항목 정리: {removed}개")
+        logger.info(f"분류 캐시 적재: {len(rows)}개 (version={self.version})")
+
+    def _load(self, answer_key: str) -> Optional[str]:
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT result_type FROM classification_cache "
+                "WHERE version = ? AND answer_key = ?",
+                (self.version, answer_key)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _save(self, answer_key: str, result_type: str) -> None:
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT INTO classification_cache "
+                "(version, answer_key, result_type, updated_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(version, answer_key) DO UPDATE SET "
+                "result_type = excluded.result_type, updated_at = excluded.updated_at",
+                (self.version, answer_key, result_type, time.time())
+            )
+
+    # ===== 메모리 LRU =====
+
+    def _remember(self, answer_key: str, result_type: str) -> None:
+        self._entries[answer_key] = result_type
+        self._entries.move_to_end(answer_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    # ===== 공개 API =====
+
+    async def get(self, answer_key: str) -> Optional[str]:
+        """
+        캐시된 분류 결과 조회
+
+        Returns:
+            결과 타입 (없으면 None)
+        """
+        result_type = self._entries.get(answer_key)
+        if result_type is not None:
+            self._entries.move_to_end(answer_key)
+            self.hits += 1
+            return result_type
+
+        if self.db_path:
+            result_type = await asyncio.to_thread(self._load, answer_key)
+            if result_type is not None:
+                self._remember(answer_key, result_type)
+                self.hits += 1
+                self.persistent_hits += 1
+                return result_type
+
+        self.misses += 1
+        return None
+
+    async def put(self, answer_key: str, result_type: str) -> None:
+        """분류 결과 저장"""
+        self._remember(answer_key, result_type)
+        self.stores += 1
+        if self.db_path:
+            try:
+                await asyncio.to_thread(self._save, answer_key, result_type)
+            except sqlite3.Error as e:
+                # 영속 저장 실패는 분류 결과에 영향 없음 (메모리 캐시는 유지)
+                logger.warning(f"분류 캐시 저장 실패: {e}")
+
+    def stats(self) -> Dict:
+        """캐시 통계"""
+        lookups = self.hits + self.misses
+        return {
+            "version": self.version,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "persistent": bool(self.db_path),
+            "hits": self.hits,
+            "persistent_hits": self.persistent_hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# 싱글톤 인스턴스 (전역 사용)
+_classification_cache: Optional[ClassificationCache] = None
+
+
+def get_classification_cache() -> Optional[ClassificationCache]:
+    """
+    분류 캐시 싱글톤 인스턴스를 반환합니다.
+
+    Returns:
+        ClassificationCache (AI_CACHE_ENABLED=false이면 None)
+    """
+    global _classification_cache
+    if not AIConfig.AI_CACHE_ENABLED:
+        return None
+    if _classification_cache is None:
+        _classification_cache = ClassificationCache(
+            max_entries=AIConfig.AI_CACHE_MAX_ENTRIES,
+            db_path=AIConfig.AI_CACHE_DB_PATH or None,
+            version=compute_cache_version()
+        )
+    return _classification_cache
+
+
+def get_classification_cache_stats() -> Dict:
+    """분류 캐시 통계 (비활성화 시 enabled=False)"""
+    cache = get_classification_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
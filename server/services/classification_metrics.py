@@ -0,0 +1,191 @@
+"""
+분류 지표 (카운터 + 지연 시간 히스토그램)
+
+OpenAI 할당량/타임아웃을 실제 데이터로 정할 수 있도록 프로세스 내에서 다음을 집계합니다.
+
+- 분류 결과 출처별 요청 수 (ai / local / fallback / none)
+- AI 분류 성공 수, 실패 원인별 수
+- 지연 시간 히스토그램: AI 분류(재시도 포함), OpenAI 요청 1회, Fallback 분류, 전체 분류
+- AI 분류 요청당 재시도 횟수 히스토그램
+- OpenAI 응답 토큰 사용량, 유효하지 않은 응답 비율 (AI_OUTPUT_MODE 비교용)
+
+모든 기록은 이벤트 루프 스레드에서 정수 덧셈으로만 이루어지므로 락을 쓰지 않습니다.
+(await 지점이 없어 기록 도중 다른 코루틴이 끼어들 수 없음)
+히스토그램은 고정 구간이라 메모리가 요청 수와 무관하게 일정합니다.
+"""
+
+from bisect import bisect_left
+from typing import Dict, Optional, Sequence, Tuple
+
+# AI 실패 원인
+ERROR_TIMEOUT = "timeout"                        # OpenAI 요청 타임아웃
+ERROR_RATE_LIMIT = "rate_limit"                  # 429 사용량 초과
+ERROR_API = "api_error"                          # 그 밖의 OpenAI API 오류 (5xx, 연결 실패 등)
+ERROR_INVALID_RESPONSE = "invalid_response"      # 결과 타입이 아닌 응답
+ERROR_UNEXPECTED = "unexpected"                  # 예상치 못한 예외
+ERROR_ADMISSION_REJECTED = "admission_rejected"  # 승인 제어 거절 (호출 안 함)
+ERROR_BREAKER_OPEN = "breaker_open"              # 서킷 브레이커 열림 (호출 안 함)
+
+# 히스토그램 구간 상한 (초 / 회)
+AI_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 7.5, 10.0, 15.0, 20.0, 30.0, 60.0)
+FALLBACK_LATENCY_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.005, 0.01)
+CLASSIFICATION_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05) + AI_LATENCY_BUCKETS
+RETRY_BUCKETS = (0, 1, 2, 3, 4, 5)
+
+
+class Histogram:
+    """고정 구간 히스토그램 (Prometheus histogram과 같은 le 구간)"""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        # 마지막 칸은 +Inf 구간
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """값 기록 (value 이상인 첫 구간에 집계)"""
+        self._counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> Tuple[Tuple[float, int], ...]:
+        """(구간 상한, 누적 개수) 목록 (마지막은 +Inf)"""
+        result = []
+        total = 0
+        for upper, count in zip(self.buckets + (float("inf"),), self._counts):
+            total += count
+            result.append((upper, total))
+        return tuple(result)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """분위수 근사값 (해당 구간 상한, 관측값이 없으면 None)"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        for upper, total in self.cumulative():
+            if total >= rank:
+                return upper
+        return float("inf")
+
+    def snapshot(self) -> Dict:
+        """요약 (JSON 통계용, +Inf 구간 상한은 문자열)"""
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "avg": round(self.sum / self.count, 6) if self.count else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": {
+                ("+Inf" if upper == float("inf") else str(upper)): total
+                for upper, total in self.cumulative()
+            },
+        }
+
+
+class ClassificationMetrics:
+    """분류 지표 모음"""
+
+    def __init__(self):
+        self.classifications: Dict[str, int] = {
+            "ai": 0, "local": 0, "fallback": 0, "none": 0
+        }
+        self.ai_success = 0
+        self.ai_failures: Dict[str, int] = {}
+        self.ai_latency = Histogram(AI_LATENCY_BUCKETS)
+        self.openai_request_latency = Histogram(AI_LATENCY_BUCKETS)
+        self.fallback_latency = Histogram(FALLBACK_LATENCY_BUCKETS)
+        self.classification_latency = Histogram(CLASSIFICATION_LATENCY_BUCKETS)
+        self.ai_retries = Histogram(RETRY_BUCKETS)
+        # OpenAI 응답 토큰 사용량 (usage가 있는 응답 기준)
+        self.usage_responses = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        # 검증한 결과 타입 수 (일괄 분류는 설문별) / 그중 유효하지 않은 응답 수
+        self.validated_responses = 0
+        self.invalid_responses = 0
+
+    def record_classification(self, source: str, duration: float) -> None:
+        """분류 요청 1건 (최종 출처, 전체 소요 시간)"""
+        self.classifications[source] = self.classifications.get(source, 0) + 1
+        self.classification_latency.observe(duration)
+
+    def record_ai_result(self, error_class: Optional[str], retries: int = 0) -> None:
+        """AI 분류 1건의 결과 (error_class가 None이면 성공) 및 재시도 횟수"""
+        if error_class is None:
+            self.ai_success += 1
+        else:
+            self.ai_failures[error_class] = self.ai_failures.get(error_class, 0) + 1
+        self.ai_retries.observe(retries)
+
+    def record_usage(self, prompt_tokens: int, completion_tokens: int) -> None:
+        """OpenAI 응답 1건의 토큰 사용량"""
+        self.usage_responses += 1
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+
+    def record_response(self, valid: bool) -> None:
+        """AI 응답 검증 결과 (설문 1건)"""
+        self.validated_responses += 1
+        if not valid:
+            self.invalid_responses += 1
+
+    def record_ai_skipped(self, error_class: str) -> None:
+        """OpenAI를 호출하지 않은 AI 분류 실패 (브레이커 열림, 승인 거절)"""
+        self.ai_failures[error_class] = self.ai_failures.get(error_class, 0) + 1
+
+    def stats(self) -> Dict:
+        """통계 (기존 get_classification_stats 키 포함)"""
+        return {
+            "ai_success": self.ai_success,
+            "ai_failure": sum(self.ai_failures.values()),
+            "fallback_used": self.classifications["fallback"],
+            "total_failures": self.classifications["none"],
+            "ai_failure_by_class": dict(self.ai_failures),
+            "classifications": dict(self.classifications),
+            "latency_seconds": {
+                "ai_call": self.ai_latency.snapshot(),
+                "openai_request": self.openai_request_latency.snapshot(),
+                "fallback": self.fallback_latency.snapshot(),
+                "classification": self.classification_latency.snapshot(),
+            },
+            "ai_retries": self.ai_retries.snapshot(),
+            "tokens": {
+                "responses": self.usage_responses,
+                "prompt_total": self.prompt_tokens,
+                "completion_total": self.completion_tokens,
+                "avg_prompt_per_response": (
+                    round(self.prompt_tokens / self.usage_responses, 2)
+                    if self.usage_responses else None
+                ),
+                "avg_completion_per_response": (
+                    round(self.completion_tokens / self.usage_responses, 2)
+                    if self.usage_responses else None
+                ),
+            },
+            "responses": {
+                "validated": self.validated_responses,
+                "invalid": self.invalid_responses,
+                "invalid_rate": (
+                    round(self.invalid_responses / self.validated_responses, 4)
+                    if self.validated_responses else 0.0
+                ),
+            },
+        }
+
+
+_metrics: Optional[ClassificationMetrics] = None
+
+
+def get_classification_metrics() -> ClassificationMetrics:
+    """
+    분류 지표 싱글톤
+
+    Returns:
+        ClassificationMetrics
+    """
+    global _metrics
+    if _metrics is None:
+        _metrics = ClassificationMetrics()
+    return _metrics
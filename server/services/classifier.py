@@ -1,65 +1,232 @@
 """
 통합 피부 타입 분류 시스템
 
-AI 우선 시도 → Fallback 대체 → 로깅
+분류 캐시 조회 → 로컬 모델 (확신하는 응답만) → AI 시도 (동일 응답 동시 요청은 호출 공유)
+→ Fallback 대체 → 로깅
+
+AI 응답이 응답 시간 예산(AI_LATENCY_BUDGET_SECONDS) 안에 오지 않으면
+Fallback 결과를 즉시 반환하고, 늦게 도착한 AI 결과는 분류 캐시에만 기록합니다.
+AI 실패/지연이 이어지면 서킷 브레이커가 열려 AI 호출 없이 바로 Fallback을 사용합니다.
+OpenAI 요청 한도 때문에 예산 안에 보낼 수 없는 요청은 승인 제어가 거절하여 바로 Fallback을 사용합니다.
+
+백그라운드 AI 분류 모드(AI_BACKGROUND_ENABLED)에서는 classify_fallback_first로
+즉시 응답하고, AI 분류는 services/background_classifier.py의 작업자가 수행합니다.
+
+출처별 분류 수, AI 실패 원인, 단계별 지연 시간은 분류 지표(services/classification_metrics.py)에
+기록하며 get_classification_stats로 조회합니다.
 """
 
+import asyncio
 import logging
-from typing import Dict, Tuple, Optional
+import time
+from typing import TYPE_CHECKING, Dict, Tuple, Optional
 
+from services.admission_controller import AdmissionRejected
 from services.ai_classifier import classify_skin_type
+from services.classification_cache import canonical_key, get_classification_cache
+from services.classification_metrics import (
+    ERROR_ADMISSION_REJECTED,
+    ERROR_BREAKER_OPEN,
+    get_classification_metrics,
+)
 from services.fallback_classifier import fallback_classify
+from services.circuit_breaker import CircuitBreaker
+from services.single_flight import SingleFlight
+from services.survey_schema import SurveySchema, get_default_schema
 from config.ai_config import AIConfig
 
+if TYPE_CHECKING:
+    from services.local_classifier import LocalClassifier
+
 logger = logging.getLogger(__name__)
 
+# 정규화된 응답 키가 같은 진행 중 AI 분류 공유
+_ai_flight = SingleFlight("AI 분류")
 
-async def classify_with_fallback(
-    answers: Dict[str, str]
-) -> Tuple[Optional[str], str, Optional[str]]:
+# AI 호출 서킷 브레이커 (get_ai_circuit_breaker로 접근)
+_ai_breaker: Optional[CircuitBreaker] = None
+
+
+def get_ai_circuit_breaker() -> Optional[CircuitBreaker]:
     """
-    AI 분류 시도 후 실패 시 Fallback 사용
+    AI 호출 서킷 브레이커 싱글톤
+
+    Returns:
+        CircuitBreaker (AI_BREAKER_ENABLED=false이면 None)
+    """
+    global _ai_breaker
+    if not AIConfig.AI_BREAKER_ENABLED:
+        return None
+    if _ai_breaker is None:
+        _ai_breaker = CircuitBreaker(
+            "OpenAI",
+            window_size=AIConfig.AI_BREAKER_WINDOW_SIZE,
+            min_calls=AIConfig.AI_BREAKER_MIN_CALLS,
+            failure_rate_threshold=AIConfig.AI_BREAKER_FAILURE_RATE,
+            slow_call_seconds=AIConfig.AI_BREAKER_SLOW_CALL_SECONDS,
+            slow_call_rate_threshold=AIConfig.AI_BREAKER_SLOW_CALL_RATE,
+            open_seconds=AIConfig.AI_BREAKER_OPEN_SECONDS,
+            half_open_calls=AIConfig.AI_BREAKER_HALF_OPEN_CALLS
+        )
+    return _ai_breaker
+
+
+# 응답 시간 예산 통계
+_budget_stats = {
+    "budget_exceeded": 0,   # 예산 초과로 Fallback 결과를 반환한 요청 수
+    "late_ai_results": 0,   # 예산 초과 후 도착하여 캐시에 기록된 AI 결과 수
+}
+
+
+def _record_late_ai_result(ai_call: asyncio.Future) -> None:
+    """예산 초과 후 완료된 AI 분류 결과 로깅 (캐시 기록은 _classify_ai에서 수행)"""
+    if ai_call.cancelled() or ai_call.exception() is not None:
+        return
+
+    ai_result, ai_error = ai_call.result()
+    if ai_result:
+        _budget_stats["late_ai_results"] += 1
+        logger.info(f"[LATE AI] 예산 초과 후 AI 분류 도착 (캐시 기록): {ai_result}")
+    else:
+        logger.warning(f"[LATE AI] 예산 초과 후 AI 분류 실패: {ai_error}")
+
+
+async def _classify_ai(
+    answers: Dict[str, str],
+    answer_key: str,
+    deadline: Optional[float] = None,
+    schema: Optional[SurveySchema] = None
+) -> Tuple[Optional[str], Optional[str]]:
+    """AI 분류 후 성공 결과를 캐시에 저장 (같은 키의 동시 요청은 1회만 실행)"""
+    breaker = get_ai_circuit_breaker()
+    metrics = get_classification_metrics()
+    if breaker is not None and not breaker.allow_request():
+        metrics.record_ai_skipped(ERROR_BREAKER_OPEN)
+        return None, "AI 서킷 브레이커 열림: AI 호출 생략"
+
+    start = time.monotonic()
+    try:
+        ai_result, ai_error = await classify_skin_type(answers, deadline, schema)
+    except AdmissionRejected as e:
+        # 호출하지 않았으므로 브레이커 실패로 집계하지 않음
+        if breaker is not None:
+            breaker.release()
+        metrics.record_ai_skipped(ERROR_ADMISSION_REJECTED)
+        return None, f"AI 호출 승인 거절: {e}"
+    except asyncio.CancelledError:
+        # 취소된 호출은 결과를 알 수 없으므로 half_open 시험 호출 수만 복구
+        if breaker is not None:
+            breaker.release()
+        raise
+    except BaseException:
+        if breaker is not None:
+            breaker.record(success=False, duration=time.monotonic() - start)
+        raise
+    duration = time.monotonic() - start
+    metrics.ai_latency.observe(duration)
+    if breaker is not None:
+        breaker.record(success=ai_result is not None, duration=duration)
+
+    cache = get_classification_cache()
+    if ai_result and cache is not None:
+        await cache.put(answer_key, ai_result)
+
+    return ai_result, ai_error
+
+
+async def lookup_cached_ai_result(
+    answers: Dict[str, str],
+    schema: Optional[SurveySchema] = None
+) -> Optional[str]:
+    """같은 응답 조합의 AI 분류 캐시 조회 (캐시 비활성화/미스 시 None)"""
+    cache = get_classification_cache()
+    if cache is None:
+        return None
+    answer_key = canonical_key(answers, schema)
+    cached_result = await cache.get(answer_key)
+    if cached_result:
+        logger.info(f"[CACHE HIT] AI 분류 캐시 사용: {cached_result} | key={answer_key}")
+    return cached_result
+
+
+def start_ai_classification(
+    answers: Dict[str, str],
+    deadline: Optional[float] = None,
+    schema: Optional[SurveySchema] = None
+) -> asyncio.Future:
+    """
+    AI 분류 시작 (같은 응답의 진행 중 호출이 있으면 결과 공유)
 
     Args:
         answers: 설문 응답 딕셔너리
+        deadline: OpenAI 요청 승인 기한 (time.monotonic 기준, None이면 기한 없음)
+        schema: 설문 스키마 (None이면 기본 스키마)
 
     Returns:
-        Tuple[result_type, source, error_message]
-        - result_type: 분류 결과 (8가지 중 하나), 완전 실패 시 None
-        - source: "ai" | "fallback" | "none"
-        - error_message: AI 실패 시 에러 메시지 (성공 시 None)
+        (result_type, error_message)를 결과로 갖는 Future
     """
-    # 1단계: AI 분류 시도
-    logger.info("=== 통합 분류 시작 ===")
-    logger.info("AI 분류 시도 중...")
+    answer_key = canonical_key(answers, schema)
+    return asyncio.ensure_future(
+        _ai_flight.run(answer_key, lambda: _classify_ai(answers, answer_key, deadline, schema))
+    )
 
-    ai_result, ai_error = await classify_skin_type(answers)
 
-    if ai_result:
-        # AI 성공
-        logger.info(f"[SUCCESS] AI 분류 성공: {ai_result}")
-        return ai_result, "ai", None
+def _classify_local(
+    answers: Dict[str, str],
+    schema: Optional[SurveySchema] = None,
+    compare_uncertain: bool = True
+) -> Tuple[Optional[str], Optional[Tuple["LocalClassifier", str]]]:
+    """
+    로컬 모델 분류 (기본 스키마 설문만)
 
-    # 2단계: AI 실패 로깅
-    logger.warning(f"[FAIL] AI 분류 실패: {ai_error}")
+    Args:
+        compare_uncertain: 확신하지 못한 예측을 호출자가 AI 결과와 비교하는지
+
+    Returns:
+        (확신하면 결과 타입, 확신하지 못하면 AI 결과와 비교할 (로컬 분류기, 예측))
+    """
+    # 학습 CLI(python -m services.local_classifier)와의 순환 import 방지를 위해 지연 import
+    from services.local_classifier import get_local_classifier
+
+    local = get_local_classifier()
+    default = get_default_schema()
+    if local is None or (schema is not None and schema is not default):
+        return None, None
+
+    local_result, confident = local.predict(answers, default, compare_uncertain)
+    if not confident:
+        return None, (local, local_result)
 
-    # 3단계: Fallback 활성화 확인
+    logger.info(f"[LOCAL] 로컬 모델 분류 (AI 호출 생략): {local_result}")
+    if local.should_shadow():
+        # 일치율 측정용 AI 분류 (응답을 기다리지 않음)
+        local.compare(local_result, start_ai_classification(answers, schema=schema), shadow=True)
+    return local_result, None
+
+
+def _classify_fallback(
+    answers: Dict[str, str],
+    ai_error: Optional[str],
+    schema: Optional[SurveySchema] = None
+) -> Tuple[Optional[str], str, Optional[str]]:
+    """Fallback 분류 (AI 결과를 쓰지 못한 경우)"""
     if not AIConfig.ENABLE_FALLBACK:
         # Fallback 비활성화 상태
         logger.error("[ERROR] Fallback이 비활성화되어 있어 분류 불가")
         return None, "none", ai_error
 
-    # 4단계: Fallback 실행
     logger.info("Fallback 분류 시도 중...")
 
     try:
-        fallback_result = fallback_classify(answers)
+        start = time.perf_counter()
+        fallback_result = fallback_classify(answers, schema)
+        get_classification_metrics().fallback_latency.observe(time.perf_counter() - start)
 
         # Fallback 성공
         logger.info(f"[SUCCESS] Fallback 분류 성공: {fallback_result}")
 
         # Fallback 사용 로깅
-        if AIConfig.LOG_FALLBACK:
+        if AIConfig.LOG_FALLBACK and ai_error:
             logger.warning(
                 f"[FALLBACK USED] "
                 f"AI 실패 원인: {ai_error} | "
@@ -72,26 +239,162 @@ async def classify_with_fallback(
         # Fallback도 실패
         fallback_error = f"Fallback 실패: {str(e)}"
         logger.error(f"[ERROR] {fallback_error}")
-        return None, "none", f"{ai_error} | {fallback_error}"
+        error = f"{ai_error} | {fallback_error}" if ai_error else fallback_error
+        return None, "none", error
+
+
+async def classify_with_fallback(
+    answers: Dict[str, str],
+    schema: Optional[SurveySchema] = None,
+    latency_budget: Optional[float] = None
+) -> Tuple[Optional[str], str, Optional[str]]:
+    """
+    AI 분류 시도 후 실패 시 Fallback 사용
 
+    Args:
+        answers: 설문 응답 딕셔너리
+        schema: 설문 스키마 (None이면 기본 스키마, 폼별 스키마는 get_form_schema)
+        latency_budget: 응답 시간 예산 (초, None이면 AI_LATENCY_BUDGET_SECONDS, 0이면 AI 결과를 기다림)
 
-def get_classification_stats() -> Dict[str, int]:
+    Returns:
+        Tuple[result_type, source, error_message]
+        - result_type: 분류 결과 (8가지 중 하나), 완전 실패 시 None
+        - source: "ai" | "local" | "fallback" | "none"
+        - error_message: AI 실패 시 에러 메시지 (성공 시 None)
     """
-    분류 통계 조회 (향후 확장)
+    start = time.monotonic()
+    result = await _classify_with_fallback(answers, schema, latency_budget)
+    get_classification_metrics().record_classification(result[1], time.monotonic() - start)
+    return result
+
+
+async def _classify_with_fallback(
+    answers: Dict[str, str],
+    schema: Optional[SurveySchema] = None,
+    latency_budget: Optional[float] = None
+) -> Tuple[Optional[str], str, Optional[str]]:
+    """classify_with_fallback 본체 (지표 기록 제외)"""
+    logger.info("=== 통합 분류 시작 ===")
+
+    # 0단계: 같은 응답 조합의 AI 분류 결과 재사용
+    cached_result = await lookup_cached_ai_result(answers, schema)
+    if cached_result:
+        return cached_result, "ai", None
+
+    # 0.5단계: 로컬 모델이 확신하는 응답은 AI 호출 없이 분류
+    local_result, uncertain = _classify_local(answers, schema)
+    if local_result:
+        return local_result, "local", None
+
+    # 1단계: AI 분류 시도 (같은 응답의 진행 중 호출이 있으면 결과 공유)
+    logger.info("AI 분류 시도 중...")
+
+    budget = AIConfig.AI_LATENCY_BUDGET_SECONDS if latency_budget is None else latency_budget
+    use_budget = budget > 0 and AIConfig.ENABLE_FALLBACK
+
+    # 예산 안에 보낼 수 없는 OpenAI 요청은 승인 단계에서 거절 (대기 없이 Fallback)
+    ai_call = start_ai_classification(
+        answers, deadline=time.monotonic() + budget if use_budget else None, schema=schema
+    )
+    if uncertain is not None:
+        # 로컬 모델이 확신하지 못한 응답의 예측과 AI 결과 비교
+        local, local_prediction = uncertain
+        local.compare(local_prediction, ai_call, shadow=False)
+
+    if use_budget:
+        # 예산 안에 AI가 답하지 않으면 Fallback으로 응답 (AI 호출은 계속 진행)
+        try:
+            ai_result, ai_error = await asyncio.wait_for(asyncio.shield(ai_call), budget)
+        except asyncio.TimeoutError:
+            _budget_stats["budget_exceeded"] += 1
+            ai_call.add_done_callback(_record_late_ai_result)
+            ai_result, ai_error = None, f"AI 응답 지연: 응답 시간 예산 {budget}초 초과"
+    else:
+        ai_result, ai_error = await ai_call
+
+    if ai_result:
+        # AI 성공
+        logger.info(f"[SUCCESS] AI 분류 성공: {ai_result}")
+        return ai_result, "ai", None
+
+    # 2단계: AI 실패 로깅
+    logger.warning(f"[FAIL] AI 분류 실패: {ai_error}")
+
+    # 3단계: Fallback 실행
+    return _classify_fallback(answers, ai_error, schema)
+
+
+async def classify_fallback_first(
+    answers: Dict[str, str],
+    schema: Optional[SurveySchema] = None
+) -> Tuple[Optional[str], str, Optional[str]]:
+    """
+    AI 호출 없이 즉시 분류 (백그라운드 AI 분류 모드)
+
+    캐시된 AI 결과나 확신하는 로컬 모델 결과가 있으면 그대로 사용하고,
+    없으면 Fallback 결과를 반환합니다.
+    AI 분류는 호출자가 백그라운드 작업으로 따로 요청합니다.
 
     Returns:
-        {
-            "ai_success": 150,
-            "ai_failure": 10,
-            "fallback_used": 10,
-            "total_failures": 0
-        }
+        Tuple[result_type, source, error_message] (classify_with_fallback과 동일)
     """
-    # TODO: 데이터베이스에서 통계 조회
-    # 현재는 placeholder 반환
+    start = time.monotonic()
+    result = await _classify_fallback_first(answers, schema)
+    get_classification_metrics().record_classification(result[1], time.monotonic() - start)
+    return result
+
+
+async def _classify_fallback_first(
+    answers: Dict[str, str],
+    schema: Optional[SurveySchema] = None
+) -> Tuple[Optional[str], str, Optional[str]]:
+    """classify_fallback_first 본체 (지표 기록 제외)"""
+    cached_result = await lookup_cached_ai_result(answers, schema)
+    if cached_result:
+        return cached_result, "ai", None
+    # AI 분류는 백그라운드 작업이 하므로 확신하지 못한 예측은 비교하지 않음
+    local_result, _ = _classify_local(answers, schema, compare_uncertain=False)
+    if local_result:
+        return local_result, "local", None
+    return _classify_fallback(answers, None, schema)
+
+
+def get_single_flight_stats() -> Dict:
+    """진행 중 AI 분류 공유 통계 (saved_calls = 절약한 AI 호출 수)"""
+    return _ai_flight.stats()
+
+
+def get_circuit_breaker_status() -> Dict:
+    """AI 서킷 브레이커 상태 (비활성화 시 enabled=False)"""
+    breaker = get_ai_circuit_breaker()
+    if breaker is None:
+        return {"enabled": False}
+    return {"enabled": True, **breaker.status()}
+
+
+def get_latency_budget_stats() -> Dict:
+    """응답 시간 예산 통계"""
     return {
-        "ai_success": 0,
-        "ai_failure": 0,
-        "fallback_used": 0,
-        "total_failures": 0
+        "budget_seconds": AIConfig.AI_LATENCY_BUDGET_SECONDS,
+        **_budget_stats,
     }
+
+
+def get_classification_stats() -> Dict:
+    """
+    분류 통계 조회 (프로세스 시작 이후 누적)
+
+    Returns:
+        {
+            "ai_success": 150,                # OpenAI 분류 성공 수
+            "ai_failure": 10,                 # AI 분류 실패 수 (호출 생략 포함)
+            "fallback_used": 10,              # Fallback 결과로 응답한 분류 요청 수
+            "total_failures": 0,              # AI/Fallback 모두 실패한 분류 요청 수
+            "ai_failure_by_class": {"timeout": 6, "breaker_open": 4},
+            "classifications": {"ai": 150, "local": 0, "fallback": 10, "none": 0},
+            "latency_seconds": {"ai_call": {...}, "openai_request": {...},
+                                "fallback": {...}, "classification": {...}},
+            "ai_retries": {...}               # AI 분류 요청당 재시도 횟수
+        }
+    """
+    return get_classification_metrics().stats()
@@ -0,0 +1,216 @@
+"""
+추첨번호 할당기
+
+이벤트별 추첨번호를 발급합니다.
+
+- LocalDrawNumberAllocator: 프로세스 내 카운터 (기본값, 단일 워커)
+- BlockLeaseDrawNumberAllocator: 공유 코디네이터에서 연속된 번호 블록을 임대한 뒤
+  워커 내부에서 조정 없이 번호를 발급합니다. 코디네이터 왕복은 블록당 1회이므로
+  여러 워커/코어로 등록을 분산해도 번호는 유일하고 대부분 연속적입니다.
+
+코디네이터:
+- SQLiteBlockCoordinator: 같은 호스트의 워커들이 공유하는 SQLite 파일
+- PostgresBlockCoordinator: 여러 호스트가 공유하는 PostgreSQL 카운터 테이블
+
+워커 간에 공유되는 것은 추첨번호뿐입니다. 참가자/추첨 결과/추첨 샘플러는 여전히
+LuckyDrawService의 워커별 메모리에 있으므로 여러 워커에서 추첨하면 각 워커가
+자기 참가자 중에서만 뽑습니다. (이벤트 자체는 단일 워커 전제)
+"""
+
+import asyncio
+import contextlib
+import logging
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple, Union
+
+from config.luckydraw_config import LuckyDrawConfig
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# 코디네이터 (번호 블록 임대)
+# ============================================================
+
+class BlockCoordinator(ABC):
+    """번호 블록 임대 코디네이터 인터페이스 (블로킹 I/O, 스레드에서 호출됨)"""
+
+    @abstractmethod
+    def lease_block(self, event_id: str, size: int) -> int:
+        """
+        이벤트의 다음 번호 블록 임대
+
+        Args:
+            event_id: 이벤트 ID
+            size: 블록 크기
+
+        Returns:
+            블록 시작 번호 (블록은 [start, start + size) 구간)
+        """
+
+
+class SQLiteBlockCoordinator(BlockCoordinator):
+    """SQLite 파일 기반 코디네이터 (같은 호스트의 워커 간 공유)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        with contextlib.closing(self._connect()) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS luckydraw_number_counters ("
+                "event_id TEXT PRIMARY KEY, next_number INTEGER NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # 자동 커밋 모드 (호출자가 contextlib.closing으로 연결을 닫음)
+        return sqlite3.connect(self.path, timeout=10, isolation_level=None)
+
+    def lease_block(self, event_id: str, size: int) -> int:
+        # 단일 UPSERT ... RETURNING 문으로 원자적으로 카운터를 size만큼 전진
+        with self._lock, contextlib.closing(self._connect()) as conn:
+            row = conn.execute(
+                "INSERT INTO luckydraw_number_counters (event_id, next_number) "
+                "VALUES (?, 1 + ?) "
+                "ON CONFLICT(event_id) DO UPDATE SET next_number = next_number + ? "
+                "RETURNING next_number",
+                (event_id, size, size)
+            ).fetchone()
+        return row[0] - size
+
+
+class PostgresBlockCoordinator(BlockCoordinator):
+    """PostgreSQL 카운터 테이블 기반 코디네이터 (여러 호스트 간 공유)"""
+
+    def __init__(self):
+        from sqlalchemy import text
+        from db.connection import get_engine
+
+        self._text = text
+        self._engine = get_engine()
+        with self._engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE IF NOT EXISTS luckydraw_number_counters ("
+                "event_id TEXT PRIMARY KEY, next_number BIGINT NOT NULL)"
+            ))
+
+    def lease_block(self, event_id: str, size: int) -> int:
+        sql = self._text(
+            """
+            INSERT INTO luckydraw_number_counters (event_id, next_number)
+            VALUES (:event_id, 1 + :size)
+            ON CONFLICT (event_id)
+            DO UPDATE SET next_number = luckydraw_number_counters.next_number + :size
+            RETURNING next_number;
+            """
+        )
+        with self._engine.begin() as conn:
+            row = conn.execute(sql, {"event_id": event_id, "size": size}).fetchone()
+        return int(row[0]) - size
+
+
+# ============================================================
+# 할당기
+# ============================================================
+
+class LocalDrawNumberAllocator:
+    """프로세스 내 카운터 기반 할당기 (단일 워커 전용)"""
+
+    def __init__(self):
+        self._next_numbers: Dict[str, int] = {}
+
+    async def allocate(self, event_id: str) -> int:
+        """다음 추첨번호 발급"""
+        number = self._next_numbers.get(event_id, 1)
+        self._next_numbers[event_id] = number + 1
+        return number
+
+    def reset(self, event_id: str) -> None:
+        """번호를 1부터 다시 발급"""
+        self._next_numbers.pop(event_id, None)
+
+
+class BlockLeaseDrawNumberAllocator:
+    """
+    블록 임대 기반 할당기 (여러 워커 공용)
+
+    워커는 임대한 블록 안에서 로컬로 번호를 발급하고,
+    블록이 소진되었을 때만 코디네이터를 호출합니다.
+    """
+
+    def __init__(self, coordinator: BlockCoordinator, block_size: int):
+        self.coordinator = coordinator
+        self.block_size = block_size
+        # 이벤트별 임대 블록: {event_id: (next_number, end_exclusive)}
+        self._blocks: Dict[str, Tuple[int, int]] = {}
+        # 이벤트별 Lock (블록 임대 중 중복 임대 방지)
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def allocate(self, event_id: str) -> int:
+        """다음 추첨번호 발급 (블록 소진 시에만 코디네이터 호출)"""
+        block = self._blocks.get(event_id)
+        if block is None or block[0] >= block[1]:
+            lock = self._locks.setdefault(event_id, asyncio.Lock())
+            async with lock:
+                block = self._blocks.get(event_id)
+                if block is None or block[0] >= block[1]:
+                    start = await asyncio.to_thread(
+                        self.coordinator.lease_block, event_id, self.block_size
+                    )
+                    block = (start, start + self.block_size)
+                    logger.info(
+                        f"[번호 블록 임대] event_id={event_id}, "
+                        f"range={block[0]}~{block[1] - 1}"
+                    )
+
+        number, end = block
+        self._blocks[event_id] = (number + 1, end)
+        return number
+
+    def reset(self, event_id: str) -> None:
+        """
+        남은 임대 블록 폐기
+
+        다른 워커가 아직 이전 블록을 보유하고 있을 수 있으므로 공유 카운터는
+        되돌리지 않습니다. 리셋 후에도 번호는 이어서 발급되어 유일성이 유지됩니다.
+        """
+        self._blocks.pop(event_id, None)
+
+
+# ============================================================
+# 팩토리
+# ============================================================
+
+DrawNumberAllocator = Union[LocalDrawNumberAllocator, BlockLeaseDrawNumberAllocator]
+
+_allocator_instance: Optional[DrawNumberAllocator] = None
+
+
+def get_draw_number_allocator() -> DrawNumberAllocator:
+    """
+    설정(LUCKYDRAW_NUMBER_ALLOCATOR)에 맞는 추첨번호 할당기 싱글톤 반환
+
+    Returns:
+        LocalDrawNumberAllocator 또는 BlockLeaseDrawNumberAllocator
+    """
+    global _allocator_instance
+    if _allocator_instance is None:
+        LuckyDrawConfig.validate()
+        mode = LuckyDrawConfig.DRAW_NUMBER_ALLOCATOR
+
+        if mode == "sqlite":
+            coordinator = SQLiteBlockCoordinator(LuckyDrawConfig.DRAW_NUMBER_SQLITE_PATH)
+        elif mode == "postgres":
+            coordinator = PostgresBlockCoordinator()
+        else:
+            coordinator = None
+
+        if coordinator is None:
+            _allocator_instance = LocalDrawNumberAllocator()
+        else:
+            _allocator_instance = BlockLeaseDrawNumberAllocator(
+                coordinator, LuckyDrawConfig.DRAW_NUMBER_BLOCK_SIZE
+            )
+        logger.info(f"[추첨번호 할당기] mode={mode}")
+    return _allocator_instance
@@ -0,0 +1,181 @@
+"""
+추첨번호 샘플러
+
+연속적인(dense) 추첨번호 범위에서 아직 당첨되지 않은 참가자를 균등 추첨합니다.
+
+- 등록/당첨 여부는 비트셋(bytearray)으로 관리
+- 추첨 가능 번호는 Fenwick 트리(Binary Indexed Tree)로 카운트하여
+  k번째 추첨 가능 번호를 O(log n)에 찾음
+- 당첨 이력 리셋은 당첨자 수(w)에만 비례하는 O(w log n) (참가자 수와 무관)
+
+매 추첨마다 참가자 목록을 새로 만들어 random.sample 하던 방식과 달리
+추첨 1회 비용이 참가자 수에 거의 영향을 받지 않습니다.
+"""
+
+import random
+from array import array
+from typing import List
+
+
+class DrawNumberSampler:
+    """
+    당첨 제외 균등 추첨기 (Fenwick 트리 + 비트셋)
+
+    번호 범위는 등록된 최대 번호에 맞춰 2배씩 자동 확장됩니다.
+    블록 임대 할당기처럼 번호 사이에 공백이 있어도 동작합니다 (공백은 추첨 불가 처리).
+    """
+
+    def __init__(self, initial_capacity: int = 1024):
+        capacity = 1
+        while capacity < initial_capacity:
+            capacity <<= 1
+
+        self._capacity = capacity
+        # Fenwick 트리 (1-based, 인덱스 = 추첨번호)
+        self._tree = array("i", bytes(4 * (capacity + 1)))
+        # 비트셋: 등록 여부 / 당첨 여부
+        self._registered = bytearray(capacity // 8 + 1)
+        self._won = bytearray(capacity // 8 + 1)
+        # 당첨 번호 목록 (리셋 시 당첨자 수만큼만 되돌리기 위함)
+        self._won_numbers: List[int] = []
+        # 현재 추첨 가능한 번호 수
+        self.eligible_count = 0
+
+    # ============================================================
+    # 내부 유틸리티
+    # ============================================================
+
+    @staticmethod
+    def _test(bits: bytearray, number: int) -> bool:
+        return bool(bits[number >> 3] & (1 << (number & 7)))
+
+    @staticmethod
+    def _set(bits: bytearray, number: int) -> None:
+        bits[number >> 3] |= 1 << (number & 7)
+
+    @staticmethod
+    def _clear(bits: bytearray, number: int) -> None:
+        bits[number >> 3] &= ~(1 << (number & 7)) & 0xFF
+
+    def _update(self, number: int, delta: int) -> None:
+        """Fenwick 트리 점 갱신 (O(log n))"""
+        tree = self._tree
+        capacity = self._capacity
+        while number <= capacity:
+            tree[number] += delta
+            number += number & -number
+        self.eligible_count += delta
+
+    def _find_kth(self, k: int) -> int:
+        """k번째(1-based) 추첨 가능 번호 탐색 (O(log n))"""
+        tree = self._tree
+        position = 0
+        step = self._capacity
+        while step:
+            next_position = position + step
+            if next_position <= self._capacity and tree[next_position] < k:
+                position = next_position
+                k -= tree[next_position]
+            step >>= 1
+        return position + 1
+
+    def _grow(self, number: int) -> None:
+        """
+        번호 범위를 number 이상으로 확장
+
+        용량이 2의 거듭제곱이므로 기존 노드의 구간은 그대로 유지되고,
+        새 최상위 노드(2n)만 전체 합(= 기존 최상위 노드 값)으로 채우면 됩니다.
+        """
+        while self._capacity < number:
+            old_capacity = self._capacity
+            new_capacity = old_capacity << 1
+            self._tree.extend(array("i", bytes(4 * old_capacity)))
+            self._tree[new_capacity] = self._tree[old_capacity]
+            extra = new_capacity // 8 + 1 - len(self._registered)
+            self._registered.extend(bytes(extra))
+            self._won.extend(bytes(extra))
+            self._capacity = new_capacity
+
+    # ============================================================
+    # 공개 메서드
+    # ============================================================
+
+    def add(self, number: int) -> None:
+        """
+        참가자 번호 등록
+
+        Args:
+            number: 추첨번호 (1 이상)
+        """
+        if number < 1:
+            raise ValueError(f"추첨번호는 1 이상이어야 합니다: {number}")
+        if number > self._capacity:
+            self._grow(number)
+        if self._test(self._registered, number):
+            return
+
+        self._set(self._registered, number)
+        if not self._test(self._won, number):
+            self._update(number, 1)
+
+    def mark_won(self, number: int) -> None:
+        """
+        당첨 번호 기록 (이후 추첨에서 제외)
+
+        Args:
+            number: 당첨된 추첨번호
+        """
+        if number < 1:
+            return
+        if number > self._capacity:
+            self._grow(number)
+        if self._test(self._won, number):
+            return
+
+        self._set(self._won, number)
+        self._won_numbers.append(number)
+        if self._test(self._registered, number):
+            self._update(number, -1)
+
+    def sample(self, count: int, rng: random.Random = random) -> List[int]:
+        """
+        추첨 가능 번호 중 count개를 중복 없이 균등 추첨 (O(count · log n))
+
+        추첨 결과는 당첨으로 기록하지 않습니다. (결과 확정 시 mark_won 호출)
+
+        Args:
+            count: 추첨할 번호 수
+            rng: 난수 생성기
+
+        Returns:
+            추첨된 번호 목록
+
+        Raises:
+            ValueError: 추첨 가능 번호가 count보다 적은 경우
+        """
+        if count > self.eligible_count:
+            raise ValueError(
+                f"추첨 가능한 번호({self.eligible_count}개)가 "
+                f"요청한 수({count}개)보다 적습니다."
+            )
+
+        selected: List[int] = []
+        try:
+            for _ in range(count):
+                number = self._find_kth(rng.randrange(self.eligible_count) + 1)
+                # 중복 방지를 위해 임시로 제외
+                self._update(number, -1)
+                selected.append(number)
+        finally:
+            for number in selected:
+                self._update(number, 1)
+
+        return selected
+
+    def reset_winners(self) -> None:
+        """당첨 기록 초기화 (O(w log n), w = 당첨 번호 수)"""
+        for number in self._won_numbers:
+            self._clear(self._won, number)
+            if self._test(self._registered, number):
+                self._update(number, 1)
+        self._won_numbers = []
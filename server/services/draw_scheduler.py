@@ -0,0 +1,277 @@
+"""
+자동 추첨 스케줄러
+
+상품 대기열을 정해진 간격에 따라 대기(standby) → 추첨 시작(start) → 결과 발표(reveal)
+→ 추첨 완료(complete) 순서로 서버에서 직접 진행합니다.
+
+이벤트당 타이머 태스크 하나가 "다음 단계 실행 시각"까지 대기하며,
+일시정지/재개/건너뛰기 요청은 대기 중인 태스크를 깨워 일정을 다시 계산하게 합니다.
+(상품마다 sleep 태스크를 만들지 않습니다.)
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from .luckydraw_service import LuckyDrawService
+
+logger = logging.getLogger(__name__)
+
+
+# 단계 순서
+SCHEDULE_STEPS = ("standby", "start", "reveal", "complete")
+
+
+@dataclass
+class ScheduledPrize:
+    """자동 추첨 대상 상품"""
+    prize_name: str
+    prize_rank: int
+    prize_image: Optional[str] = None
+    draw_mode: str = "slot"
+    winner_count: int = 1
+
+
+@dataclass
+class ScheduleIntervals:
+    """단계 간 간격 (초)"""
+    standby_seconds: float = 5.0    # standby → start
+    reveal_seconds: float = 5.0     # start → reveal
+    complete_seconds: float = 8.0   # reveal → complete (main 애니메이션 시간)
+    next_seconds: float = 5.0       # complete → 다음 상품 standby
+
+    def after(self, step: str) -> float:
+        """step 실행 후 다음 단계까지의 대기 시간"""
+        return {
+            "standby": self.standby_seconds,
+            "start": self.reveal_seconds,
+            "reveal": self.complete_seconds,
+            "complete": self.next_seconds,
+        }[step]
+
+
+class DrawSchedule:
+    """
+    단일 이벤트의 자동 추첨 일정
+
+    상태: running → (paused ↔ running) → finished | cancelled | failed
+    """
+
+    def __init__(
+        self,
+        service: "LuckyDrawService",
+        event_id: str,
+        prizes: List[ScheduledPrize],
+        intervals: ScheduleIntervals
+    ):
+        self.service = service
+        self.event_id = event_id
+        self.prizes = prizes
+        self.intervals = intervals
+
+        self.state = "running"
+        self.prize_index = 0
+        self.step_index = 0            # 다음에 실행할 단계
+        self.last_error: Optional[str] = None
+        self.started_at = datetime.now().isoformat()
+
+        self._loop = asyncio.get_running_loop()
+        self._next_run_at = self._loop.time()
+        self._remaining: float = 0.0    # 일시정지 시점의 남은 대기 시간
+        self._fast_forward = False      # 현재 상품의 남은 단계를 대기 없이 진행
+        self._executing = False         # 단계 실행 중 여부
+        self._skip_requested = False    # 단계 실행 중 들어온 건너뛰기 요청
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_active(self) -> bool:
+        return self.state in ("running", "paused")
+
+    def start(self) -> None:
+        """타이머 태스크 시작"""
+        self._task = asyncio.create_task(self._run())
+
+    # ============================================================
+    # 제어
+    # ============================================================
+
+    def pause(self) -> None:
+        """일시정지 (남은 대기 시간 보존)"""
+        if self.state != "running":
+            raise ValueError("진행 중인 자동 추첨이 아닙니다.")
+        self._remaining = max(0.0, self._next_run_at - self._loop.time())
+        self.state = "paused"
+        self._wakeup.set()
+        logger.info(f"[자동 추첨 일시정지] event_id={self.event_id}")
+
+    def resume(self) -> None:
+        """재개 (보존된 남은 대기 시간부터 이어서 진행)"""
+        if self.state != "paused":
+            raise ValueError("일시정지된 자동 추첨이 아닙니다.")
+        self._next_run_at = self._loop.time() + self._remaining
+        self.state = "running"
+        self._wakeup.set()
+        logger.info(f"[자동 추첨 재개] event_id={self.event_id}")
+
+    def skip(self) -> None:
+        """
+        현재 상품 건너뛰기
+
+        - 추첨 시작 전(standby/start 대기): 상품을 건너뛰고 다음 상품으로 이동
+        - 추첨 시작 후(reveal/complete 대기): 이미 당첨번호가 정해졌으므로
+          남은 단계를 대기 없이 즉시 진행
+        """
+        if not self.is_active:
+            raise ValueError("진행 중인 자동 추첨이 없습니다.")
+
+        if self._executing:
+            # 실행 중인 단계가 끝난 뒤 적용
+            self._skip_requested = True
+            return
+        self._apply_skip()
+
+    def _apply_skip(self) -> None:
+        """건너뛰기 적용 (단계 실행 중이 아닐 때만 호출)"""
+        if self.prize_index >= len(self.prizes):
+            return
+
+        if SCHEDULE_STEPS[self.step_index] in ("standby", "start"):
+            logger.info(
+                f"[자동 추첨 건너뛰기] event_id={self.event_id}, "
+                f"prize_name={self.prizes[self.prize_index].prize_name}"
+            )
+            self.prize_index += 1
+            self.step_index = 0
+        else:
+            self._fast_forward = True
+
+        if self.state == "paused":
+            self._remaining = 0.0
+        else:
+            self._next_run_at = self._loop.time()
+        self._wakeup.set()
+
+    def cancel(self) -> None:
+        """자동 추첨 중단"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+        if self.is_active:
+            self.state = "cancelled"
+            logger.info(f"[자동 추첨 중단] event_id={self.event_id}")
+
+    def status(self) -> Dict:
+        """현재 진행 상태"""
+        if self.state == "running":
+            next_run_in = max(0.0, self._next_run_at - self._loop.time())
+        elif self.state == "paused":
+            next_run_in = self._remaining
+        else:
+            next_run_in = None
+
+        current = (
+            self.prizes[self.prize_index]
+            if self.prize_index < len(self.prizes) else None
+        )
+        return {
+            "state": self.state,
+            "prize_index": self.prize_index,
+            "prize_total": len(self.prizes),
+            "current_prize": current.prize_name if current else None,
+            "next_step": SCHEDULE_STEPS[self.step_index] if current else None,
+            "next_run_in": next_run_in,
+            "last_error": self.last_error,
+            "started_at": self.started_at
+        }
+
+    # ============================================================
+    # 타이머 루프
+    # ============================================================
+
+    async def _run(self) -> None:
+        """이벤트당 단일 타이머 태스크"""
+        try:
+            while self.prize_index < len(self.prizes):
+                self._wakeup.clear()
+
+                if self.state == "paused":
+                    await self._wakeup.wait()
+                    continue
+
+                delay = self._next_run_at - self._loop.time()
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                        continue  # 제어 요청 → 일정 재계산
+                    except asyncio.TimeoutError:
+                        pass
+
+                step = SCHEDULE_STEPS[self.step_index]
+                self._executing = True
+                try:
+                    await self._execute(step, self.prizes[self.prize_index])
+                finally:
+                    self._executing = False
+
+                if step == "complete":
+                    self.prize_index += 1
+                    self.step_index = 0
+                    self._fast_forward = False
+                else:
+                    self.step_index += 1
+
+                wait_seconds = 0.0 if self._fast_forward else self.intervals.after(step)
+                self._next_run_at = self._loop.time() + wait_seconds
+                if self.state == "paused":
+                    # 단계 실행 중 일시정지됨: 다음 단계 대기 시간 전체를 보존
+                    self._remaining = wait_seconds
+
+                if self._skip_requested:
+                    self._skip_requested = False
+                    self._apply_skip()
+
+            self.state = "finished"
+            logger.info(f"[자동 추첨 종료] event_id={self.event_id}, 상품 {len(self.prizes)}개")
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.state = "failed"
+            self.last_error = str(e)
+            logger.error(f"[자동 추첨 실패] event_id={self.event_id}, error={e}")
+
+    async def _execute(self, step: str, prize: ScheduledPrize) -> None:
+        """단계 실행"""
+        logger.info(
+            f"[자동 추첨] event_id={self.event_id}, "
+            f"prize_name={prize.prize_name}, step={step}"
+        )
+        if step == "standby":
+            await self.service.standby_draw(
+                event_id=self.event_id,
+                prize_name=prize.prize_name,
+                prize_rank=prize.prize_rank,
+                prize_image=prize.prize_image,
+                draw_mode=prize.draw_mode,
+                winner_count=prize.winner_count
+            )
+        elif step == "start":
+            await self.service.start_draw_animation(
+                event_id=self.event_id,
+                prize_name=prize.prize_name,
+                prize_rank=prize.prize_rank,
+                prize_image=prize.prize_image,
+                draw_mode=prize.draw_mode,
+                winner_count=prize.winner_count
+            )
+        elif step == "reveal":
+            await self.service.reveal_winner(event_id=self.event_id)
+        else:
+            try:
+                await self.service.complete_draw(event_id=self.event_id)
+            except ValueError:
+                # main 페이지가 draw_complete로 이미 완료한 경우
+                logger.info(f"[자동 추첨] event_id={self.event_id}, 이미 완료된 추첨")
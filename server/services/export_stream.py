@@ -0,0 +1,111 @@
+"""
+스트리밍 내보내기 유틸리티
+
+행(dict) 이터레이터를 CSV / NDJSON 텍스트 청크로 변환합니다.
+전체 결과를 메모리에 만들지 않고 청크 단위로 직렬화하므로
+행 수와 무관하게 일정한 메모리로 동작합니다.
+
+StreamingResponse에 동기 이터레이터를 넘기면 Starlette가 스레드풀에서
+청크를 생성하므로, 직렬화 작업이 이벤트 루프(WebSocket 처리)를 막지 않습니다.
+"""
+
+import csv
+import io
+import json
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List
+
+# 청크당 행 수 (응답 버퍼 크기와 스레드 전환 횟수의 균형)
+EXPORT_CHUNK_ROWS = 1000
+
+# 지원 포맷: {format: media_type}
+EXPORT_MEDIA_TYPES: Dict[str, str] = {
+    "csv": "text/csv",  # Starlette가 charset=utf-8을 붙임
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _chunked(rows: Iterable[Dict], chunk_rows: int) -> Iterator[List[Dict]]:
+    """이터레이터를 chunk_rows 크기의 리스트로 분할"""
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, chunk_rows))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_csv_chunks(
+    fieldnames: List[str],
+    rows: Iterable[Dict],
+    chunk_rows: int = EXPORT_CHUNK_ROWS
+) -> Iterator[str]:
+    """
+    행 이터레이터를 CSV 텍스트 청크로 변환
+
+    첫 청크는 헤더 행입니다. 엑셀 호환을 위해 UTF-8 BOM을 붙입니다.
+
+    Args:
+        fieldnames: CSV 컬럼 순서
+        rows: 행 이터레이터
+        chunk_rows: 청크당 행 수
+
+    Yields:
+        CSV 텍스트 청크
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction="ignore")
+
+    buffer.write("\ufeff")
+    writer.writeheader()
+    yield buffer.getvalue()
+
+    for chunk in _chunked(rows, chunk_rows):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(chunk)
+        yield buffer.getvalue()
+
+
+def iter_ndjson_chunks(
+    rows: Iterable[Dict],
+    chunk_rows: int = EXPORT_CHUNK_ROWS
+) -> Iterator[str]:
+    """
+    행 이터레이터를 NDJSON 텍스트 청크로 변환 (한 줄에 JSON 객체 하나)
+
+    Args:
+        rows: 행 이터레이터
+        chunk_rows: 청크당 행 수
+
+    Yields:
+        NDJSON 텍스트 청크
+    """
+    for chunk in _chunked(rows, chunk_rows):
+        yield "".join(
+            json.dumps(row, ensure_ascii=False) + "\n"
+            for row in chunk
+        )
+
+
+def iter_export_chunks(
+    export_format: str,
+    fieldnames: List[str],
+    rows: Iterable[Dict]
+) -> Iterator[str]:
+    """
+    포맷에 맞는 청크 이터레이터 반환
+
+    Args:
+        export_format: "csv" | "ndjson"
+        fieldnames: CSV 컬럼 순서 (NDJSON에서는 무시)
+        rows: 행 이터레이터
+
+    Raises:
+        ValueError: 지원하지 않는 포맷
+    """
+    if export_format == "csv":
+        return iter_csv_chunks(fieldnames, rows)
+    if export_format == "ndjson":
+        return iter_ndjson_chunks(rows)
+    raise ValueError(f"지원하지 않는 내보내기 포맷입니다: {export_format}")
@@ -0,0 +1,142 @@
+"""
+Fallback 분류 일괄 처리 (NumPy 벡터 연산)
+
+저장된 form_responses 재분류나 통계 분석처럼 많은 응답을 한 번에 분류할 때 사용합니다.
+응답 목록을 정수 행렬(행 = 응답, 열 = 기본 스키마의 점수가 있는 문항, test2 설문은 Q1~Q10)로 변환한 뒤
+
+1. 문항별 가중치 테이블 조회의 합으로 점수 차원(기본 스키마의 dimensions)을 한 번에 계산하고
+   (calculate_scores와 동일, 가중치는 calculate_scores에서 측정)
+2. determine_result_type의 우선순위 규칙을 마스크 연산(np.select)으로 적용합니다.
+
+행렬 값: 0 = 미응답/알 수 없는 답변(점수 없음), 1~k = 선택지 순번 (예: "q2a3" → 3)
+"""
+
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from services.fallback_classifier import calculate_scores
+from services.fallback_table import RESULT_TYPES, TABLE_OPTIONS
+from services.survey_schema import get_default_schema
+
+# 점수 차원 (점수 행렬의 열 순서, 기본 스키마의 dimensions)
+SCORE_DIMENSIONS: List[str] = list(get_default_schema().dimensions)
+_DIM = {name: i for i, name in enumerate(SCORE_DIMENSIONS)}
+
+# 문항별 {선택지 ID: 행렬 값}
+_ANSWER_CODES: List[tuple] = [
+    (question_id, {option_id: i for i, option_id in enumerate(option_ids, start=1)})
+    for question_id, option_ids in TABLE_OPTIONS
+]
+
+
+def _build_weight_tables() -> List[np.ndarray]:
+    """문항별 가중치 테이블 (행 = 행렬 값, 열 = 점수 차원, 0행은 점수 없음)"""
+    tables = []
+    for question_id, option_ids in TABLE_OPTIONS:
+        table = np.zeros((len(option_ids) + 1, len(SCORE_DIMENSIONS)), dtype=np.int16)
+        for i, option_id in enumerate(option_ids, start=1):
+            scores = calculate_scores({question_id: option_id})
+            table[i] = [scores[name] for name in SCORE_DIMENSIONS]
+        tables.append(table)
+    return tables
+
+
+_WEIGHT_TABLES = _build_weight_tables()
+
+
+def encode_answer_matrix(answers_list: Sequence[Dict[str, str]]) -> np.ndarray:
+    """
+    응답 목록을 정수 행렬로 변환
+
+    Args:
+        answers_list: 설문 응답 딕셔너리 목록
+
+    Returns:
+        (응답 수, 문항 수) uint8 행렬
+    """
+    matrix = np.zeros((len(answers_list), len(_ANSWER_CODES)), dtype=np.uint8)
+    for column, (question_id, codes) in enumerate(_ANSWER_CODES):
+        matrix[:, column] = [
+            codes.get(answers.get(question_id), 0) for answers in answers_list
+        ]
+    return matrix
+
+
+def calculate_scores_batch(matrix: np.ndarray) -> np.ndarray:
+    """
+    점수 일괄 계산 (calculate_scores의 벡터화 버전)
+
+    Args:
+        matrix: encode_answer_matrix의 반환값 (응답 수, 문항 수)
+
+    Returns:
+        (응답 수, 점수 차원 수) int16 점수 행렬 (열 순서: SCORE_DIMENSIONS)
+    """
+    scores = np.zeros((matrix.shape[0], len(SCORE_DIMENSIONS)), dtype=np.int16)
+    for column, table in enumerate(_WEIGHT_TABLES):
+        scores += table[matrix[:, column]]
+    return scores
+
+
+def determine_result_types_batch(scores: np.ndarray) -> np.ndarray:
+    """
+    결과 타입 일괄 결정 (determine_result_type의 벡터화 버전)
+
+    np.select는 처음 참인 조건을 고르므로 조건 순서가 곧 우선순위입니다.
+
+    Args:
+        scores: calculate_scores_batch의 반환값
+
+    Returns:
+        결과 타입 인덱스 배열 (RESULT_TYPES 기준, uint8)
+    """
+    dry = scores[:, _DIM["dry"]]
+    oily = scores[:, _DIM["oily"]]
+    sensitive = scores[:, _DIM["sensitive"]]
+    indoor = scores[:, _DIM["indoor"]]
+    outdoor = scores[:, _DIM["outdoor"]]
+    active = scores[:, _DIM["active"]]
+    combination = scores[:, _DIM["combination"]]
+
+    rules = [
+        # 1순위: 매우 민감한 피부
+        (sensitive >= 9, "sensitive_fragile"),
+        # 2순위: 매우 활동적 + 지성
+        ((active >= 7) & (oily >= 2), "active_energetic"),
+        # 3순위: 활동적 + 지성
+        ((active >= 5) & (oily >= 1), "post_workout"),
+        # 4순위: 야외 + 민감
+        ((outdoor >= 2) & (sensitive >= 6), "urban_explorer"),
+        # 5순위: 실내 + 민감
+        ((indoor >= 3) & (sensitive >= 4), "screen_fatigue"),
+        # 6순위: 건조 + 실내
+        ((dry >= 5) & (indoor >= 2), "office_thirst"),
+        # 7순위: 야외 + (복합 또는 건조)
+        ((outdoor >= 2) & ((combination >= 1) | (dry >= 3)), "city_routine"),
+    ]
+    return np.select(
+        [condition for condition, _ in rules],
+        [RESULT_TYPES.index(result_type) for _, result_type in rules],
+        # 8순위: 기본 fallback
+        default=RESULT_TYPES.index("minimal_routine")
+    ).astype(np.uint8)
+
+
+def classify_matrix(matrix: np.ndarray) -> np.ndarray:
+    """정수 행렬 일괄 분류 (결과 타입 인덱스 배열 반환)"""
+    return determine_result_types_batch(calculate_scores_batch(matrix))
+
+
+def fallback_classify_batch(answers_list: Sequence[Dict[str, str]]) -> List[str]:
+    """
+    Fallback 일괄 분류 (fallback_classify의 일괄 처리 버전)
+
+    Args:
+        answers_list: 설문 응답 딕셔너리 목록
+
+    Returns:
+        결과 타입 키 목록 (입력 순서와 동일)
+    """
+    type_indexes = classify_matrix(encode_answer_matrix(answers_list))
+    return [RESULT_TYPES[i] for i in type_indexes]
@@ -2,21 +2,26 @@
 Fallback 피부 타입 분류 시스템
 
 AI 실패 시 기존 클라이언트 사이드 스코어링 로직 사용
-JavaScript 로직을 Python으로 포팅
+JavaScript 로직을 Python으로 포팅 (선택지별 점수는 설문 스키마 파일로 이동)
 """
 
-from typing import Dict
+from typing import Dict, Optional
 import logging
 
+from services.survey_schema import SurveySchema, get_default_schema
+
 logger = logging.getLogger(__name__)
 
 
-def calculate_scores(answers: Dict[str, str]) -> Dict[str, int]:
+def calculate_scores(answers: Dict[str, str], schema: Optional[SurveySchema] = None) -> Dict[str, int]:
     """
     설문 응답을 9가지 차원의 점수로 변환
 
+    문항/선택지별 점수는 설문 스키마(services/survey_schema.py)의 scores 테이블을 따릅니다.
+
     Args:
         answers: {question_id: answer_id} 딕셔너리
+        schema: 설문 스키마 (None이면 기본 스키마)
 
     Returns:
         {
@@ -31,126 +36,7 @@ def calculate_scores(answers: Dict[str, str]) -> Dict[str, int]:
             "combination": 0-10
         }
     """
-    scores = {
-        "dry": 0,
-        "oily": 0,
-        "sensitive": 0,
-        "normal": 0,
-        "indoor": 0,
-        "outdoor": 0,
-        "active": 0,
-        "minimal": 0,
-        "combination": 0
-    }
-
-    # Q1: 세안 후 피부 상태
-    q1 = answers.get("1", "")
-    if q1 == "q1a1":  # 매우 건조하고 당긴다
-        scores["dry"] += 3
-    elif q1 == "q1a2":  # 약간 건조하다
-        scores["dry"] += 2
-    elif q1 == "q1a3":  # 편안하다
-        scores["normal"] += 2
-    elif q1 == "q1a4":  # 살짝 유분이 있다
-        scores["oily"] += 1
-    elif q1 == "q1a5":  # 유분이 많다
-        scores["oily"] += 3
-
-    # Q2: 오후 얼굴 유분 상태
-    q2 = answers.get("2", "")
-    if q2 == "q2a1":  # 여전히 건조하다
-        scores["dry"] += 2
-    elif q2 == "q2a2":  # 코 주변만 살짝 유분
-        scores["combination"] += 2
-    elif q2 == "q2a3":  # T존 위주로 유분
-        scores["combination"] += 2
-        scores["oily"] += 1
-    elif q2 == "q2a4":  # 얼굴 전체적으로 유분
-        scores["oily"] += 2
-
-    # Q3: 피부 붉어짐/따가움
-    q3 = answers.get("3", "")
-    if q3 == "q3a1":  # 매우 자주
-        scores["sensitive"] += 3
-    elif q3 == "q3a2":  # 자주
-        scores["sensitive"] += 2
-    elif q3 == "q3a3":  # 가끔
-        scores["sensitive"] += 1
-    # q3a4 거의 없음 → 점수 없음
-
-    # Q4: 환절기/온도 변화 영향
-    q4 = answers.get("4", "")
-    if q4 == "q4a1":  # 항상 크게 영향
-        scores["sensitive"] += 2
-    elif q4 == "q4a2":  # 자주 영향
-        scores["sensitive"] += 1
-    # q4a3, q4a4 → 점수 없음
-
-    # Q5: 미세먼지/공기오염 민감도
-    q5 = answers.get("5", "")
-    if q5 == "q5a1":  # 바로 반응
-        scores["sensitive"] += 2
-    elif q5 == "q5a2":  # 자주 민감
-        scores["sensitive"] += 1
-    # q5a3, q5a4 → 점수 없음
-
-    # Q6: 새 스킨케어 제품 반응
-    q6 = answers.get("6", "")
-    if q6 == "q6a1":  # 거의 항상 반응
-        scores["sensitive"] += 2
-    elif q6 == "q6a2":  # 종종 반응
-        scores["sensitive"] += 1
-    # q6a3, q6a4 → 점수 없음
-
-    # Q7: 주 활동 환경
-    q7 = answers.get("7", "")
-    if q7 == "q7a1":  # 사무실/학교 등 실내
-        scores["indoor"] += 3
-    elif q7 == "q7a2":  # 카페/코워킹 등 다양한 공간
-        scores["indoor"] += 1
-        scores["outdoor"] += 1
-    elif q7 == "q7a3":  # 외근/야외 활동 많음
-        scores["outdoor"] += 3
-    elif q7 == "q7a4":  # 운동 시설/헬스장
-        scores["active"] += 3
-        scores["indoor"] += 1
-
-    # Q8: 머무는 공간 환경
-    q8 = answers.get("8", "")
-    if q8 == "q8a1":  # 건조한 냉난방
-        scores["indoor"] += 2
-        scores["dry"] += 1
-    elif q8 == "q8a2":  # 환기 어려운 밀폐
-        scores["indoor"] += 2
-    elif q8 == "q8a3":  # 온도 변화 큰 환경
-        scores["outdoor"] += 1
-        scores["sensitive"] += 1
-    elif q8 == "q8a4":  # 다양한 공간 이동
-        scores["active"] += 2
-
-    # Q9: 피부 관리 루틴
-    q9 = answers.get("9", "")
-    if q9 == "q9a1":  # 거의 관리 안함
-        scores["minimal"] += 3
-    elif q9 == "q9a2":  # 토너/크림 정도
-        scores["minimal"] += 1
-    elif q9 == "q9a3":  # 여러 단계 꾸준히
-        scores["active"] += 2
-    elif q9 == "q9a4":  # 매우 적극적
-        scores["active"] += 3
-
-    # Q10: 외출 시 스킨케어 휴대
-    q10 = answers.get("10", "")
-    if q10 == "q10a1":  # 거의 휴대 안함
-        scores["minimal"] += 2
-    elif q10 == "q10a2":  # 가끔 들고 다님
-        scores["minimal"] += 1
-    elif q10 == "q10a3":  # 미스트 꼭 챙김
-        scores["dry"] += 1
-    elif q10 == "q10a4":  # 여러 제품 세트로
-        scores["active"] += 2
-
-    return scores
+    return (schema or get_default_schema()).calculate_scores(answers)
 
 
 def determine_result_type(scores: Dict[str, int]) -> str:
@@ -205,20 +91,37 @@ def determine_result_type(scores: Dict[str, int]) -> str:
     return "minimal_routine"
 
 
-def fallback_classify(answers: Dict[str, str]) -> str:
+def fallback_classify(answers: Dict[str, str], schema: Optional[SurveySchema] = None) -> str:
     """
     Fallback 분류 (통합 함수)
 
+    사전 계산 테이블(services/fallback_table.py)이 있으면 배열 조회로 분류하고,
+    테이블 범위 밖 응답(미응답 등)이거나 테이블을 쓸 수 없으면 점수를 계산합니다.
+    테이블은 기본 스키마 기준이므로 폼 전용 스키마는 항상 점수를 계산합니다.
+
     Args:
         answers: 설문 응답 딕셔너리
+        schema: 설문 스키마 (None이면 기본 스키마)
 
     Returns:
         결과 타입 키
     """
     logger.info("Fallback 분류 시작")
 
+    # 사전 계산 테이블 조회 (순환 import 방지를 위해 지연 import)
+    from services.fallback_table import get_fallback_table
+
+    if schema is None:
+        schema = get_default_schema()
+    table = get_fallback_table() if schema is get_default_schema() else None
+    if table is not None:
+        result_type = table.lookup(answers)
+        if result_type is not None:
+            logger.info(f"Fallback 분류 완료 (테이블): {result_type}")
+            return result_type
+
     # 스코어 계산
-    scores = calculate_scores(answers)
+    scores = calculate_scores(answers, schema)
 
     # 결과 타입 결정
     result_type = determine_result_type(scores)
@@ -0,0 +1,282 @@
+"""
+Fallback 분류 결과 사전 계산 테이블
+
+기본 설문 스키마에서 점수가 있는 문항(test2 설문: Q1 5지선다, Q2~Q10 4지선다)의 전체 응답 조합
+(5 x 4^9 = 1,310,720가지)에 대한 결과 타입을 미리 계산해 두고,
+응답을 혼합 기수(mixed-radix) 인덱스로 변환해 배열 조회 한 번으로 분류합니다.
+
+- 테이블은 결과 타입 인덱스(1바이트)의 배열이며 zlib 압축 파일로 저장됩니다.
+- 파일 헤더의 지문(fingerprint)은 문항/선택지 구성, 문항별 점수 변화량(calculate_scores에서 측정)과
+  determine_result_type 소스의 해시입니다. 스코어링 로직이 바뀌어 지문이 다르면
+  테이블을 사용하지 않고 기존 계산 경로로 분류합니다. (재생성 필요 경고)
+- 미응답/알 수 없는 답변이 있는 요청은 테이블 범위 밖이므로 기존 계산 경로를 사용합니다.
+
+사용법 (server 디렉토리에서):
+    python -m services.fallback_table build    # 테이블 생성 + 전체 검증
+    python -m services.fallback_table verify   # 저장된 테이블 전체 검증
+"""
+
+import argparse
+import hashlib
+import inspect
+import itertools
+import json
+import logging
+import os
+import sys
+import time
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+from services.fallback_classifier import calculate_scores, determine_result_type
+from services.survey_schema import get_default_schema
+
+logger = logging.getLogger(__name__)
+
+# 테이블 파일 경로
+FALLBACK_TABLE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data", "fallback_table.bin"
+)
+
+# 테이블 파일 포맷 버전
+TABLE_FORMAT_VERSION = 1
+
+# 스코어링 대상 문항과 선택지 ID (기본 스키마의 점수가 있는 문항, 인덱스 계산 순서,
+# 마지막 문항이 최하위 자리)
+TABLE_OPTIONS: List[Tuple[str, Tuple[str, ...]]] = list(get_default_schema().scored_questions)
+
+# 스코어링 대상 문항과 선택지 수
+TABLE_QUESTIONS: List[tuple] = [
+    (question_id, len(option_ids)) for question_id, option_ids in TABLE_OPTIONS
+]
+
+# 결과 타입 (테이블 값 = 이 목록의 인덱스)
+RESULT_TYPES: List[str] = [
+    "office_thirst",
+    "city_routine",
+    "post_workout",
+    "minimal_routine",
+    "screen_fatigue",
+    "sensitive_fragile",
+    "urban_explorer",
+    "active_energetic",
+]
+
+
+def _build_strides() -> Dict[str, Dict[str, int]]:
+    """문항별 {선택지 ID: 선택지 순번 x 자릿값} 매핑"""
+    strides: Dict[str, Dict[str, int]] = {}
+    place = 1
+    for question_id, option_ids in reversed(TABLE_OPTIONS):
+        strides[question_id] = {
+            option_id: index * place for index, option_id in enumerate(option_ids)
+        }
+        place *= len(option_ids)
+    return strides
+
+
+_STRIDES = tuple(_build_strides().items())
+TABLE_SIZE = 1
+for _, _option_count in TABLE_QUESTIONS:
+    TABLE_SIZE *= _option_count
+
+
+def encode_answers(answers: Dict[str, str]) -> Optional[int]:
+    """
+    응답을 테이블 인덱스로 변환
+
+    Returns:
+        테이블 인덱스 (미응답/알 수 없는 답변이 있으면 None)
+    """
+    index = 0
+    get_answer = answers.get
+    for question_id, options in _STRIDES:
+        offset = options.get(get_answer(question_id))
+        if offset is None:
+            return None
+        index += offset
+    return index
+
+
+def iter_answer_space():
+    """전체 응답 조합을 테이블 인덱스 순서로 생성"""
+    question_options = [
+        [(question_id, option_id) for option_id in option_ids]
+        for question_id, option_ids in TABLE_OPTIONS
+    ]
+    for combination in itertools.product(*question_options):
+        yield dict(combination)
+
+
+def rules_fingerprint() -> str:
+    """
+    현재 스코어링 로직의 지문
+
+    calculate_scores는 문항별 점수를 더하는 구조이므로 문항/선택지별 변화량을
+    단일 응답으로 측정하고, determine_result_type은 소스 코드로 식별합니다.
+    """
+    deltas = {
+        question_id: {
+            option_id: calculate_scores({question_id: option_id})
+            for option_id in option_ids
+        }
+        for question_id, option_ids in TABLE_OPTIONS
+    }
+    source = json.dumps(
+        {
+            "format": TABLE_FORMAT_VERSION,
+            "questions": TABLE_QUESTIONS,
+            "result_types": RESULT_TYPES,
+            "deltas": deltas,
+            "determine_result_type": inspect.getsource(determine_result_type),
+        },
+        sort_keys=True
+    )
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()[:16]
+
+
+def _reference_classify(answers: Dict[str, str]) -> str:
+    """기존 계산 경로 (calculate_scores + determine_result_type)"""
+    return determine_result_type(calculate_scores(answers))
+
+
+class FallbackTable:
+    """사전 계산된 Fallback 분류 테이블"""
+
+    def __init__(self, values: bytes, fingerprint: str):
+        self.values = values
+        self.fingerprint = fingerprint
+
+    def lookup(self, answers: Dict[str, str]) -> Optional[str]:
+        """
+        테이블 조회
+
+        Returns:
+            결과 타입 (테이블 범위 밖 응답이면 None)
+        """
+        index = encode_answers(answers)
+        if index is None:
+            return None
+        return RESULT_TYPES[self.values[index]]
+
+    @classmethod
+    def build(cls) -> "FallbackTable":
+        """전체 응답 조합을 계산하여 테이블 생성"""
+        type_indexes = {result_type: i for i, result_type in enumerate(RESULT_TYPES)}
+        values = bytearray(TABLE_SIZE)
+        for index, answers in enumerate(iter_answer_space()):
+            values[index] = type_indexes[_reference_classify(answers)]
+        return cls(bytes(values), rules_fingerprint())
+
+    def save(self, path: str = FALLBACK_TABLE_PATH) -> None:
+        """헤더(JSON 한 줄) + zlib 압축 본문으로 저장"""
+        header = {
+            "format": TABLE_FORMAT_VERSION,
+            "fingerprint": self.fingerprint,
+            "size": len(self.values),
+        }
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            f.write(zlib.compress(self.values, 9))
+
+    @classmethod
+    def load(cls, path: str = FALLBACK_TABLE_PATH) -> "FallbackTable":
+        """
+        테이블 파일 로드
+
+        Raises:
+            ValueError: 파일 형식/크기가 올바르지 않은 경우
+        """
+        with open(path, "rb") as f:
+            header_line, body = f.read().split(b"\n", 1)
+        header = json.loads(header_line)
+        if header.get("format") != TABLE_FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 테이블 형식: {header.get('format')}")
+        values = zlib.decompress(body)
+        if len(values) != TABLE_SIZE or header.get("size") != TABLE_SIZE:
+            raise ValueError(f"테이블 크기 불일치: {len(values)} != {TABLE_SIZE}")
+        return cls(values, header["fingerprint"])
+
+    def verify(self) -> int:
+        """
+        전체 응답 조합에 대해 기존 계산 경로와 비교
+
+        Returns:
+            불일치 개수
+        """
+        mismatches = 0
+        for index, answers in enumerate(iter_answer_space()):
+            if RESULT_TYPES[self.values[index]] != _reference_classify(answers):
+                mismatches += 1
+        return mismatches
+
+
+# 싱글톤 인스턴스 (로드 실패/지문 불일치 시 False로 표시하여 재시도하지 않음)
+_fallback_table = None
+
+
+def get_fallback_table() -> Optional[FallbackTable]:
+    """
+    Fallback 테이블 싱글톤 인스턴스를 반환합니다.
+
+    Returns:
+        FallbackTable (파일이 없거나 현재 스코어링 로직과 맞지 않으면 None)
+    """
+    global _fallback_table
+    if _fallback_table is None:
+        _fallback_table = False
+        try:
+            start = time.perf_counter()
+            table = FallbackTable.load()
+            fingerprint = rules_fingerprint()
+            if table.fingerprint != fingerprint:
+                logger.warning(
+                    f"Fallback 테이블이 현재 스코어링 로직과 다릅니다 "
+                    f"(table={table.fingerprint}, rules={fingerprint}). "
+                    f"'python -m services.fallback_table build'로 재생성하세요. "
+                    f"기존 계산 경로를 사용합니다."
+                )
+            else:
+                _fallback_table = table
+                logger.info(
+                    f"Fallback 테이블 로드 완료: {TABLE_SIZE}개 조합 "
+                    f"({(time.perf_counter() - start) * 1000:.1f}ms)"
+                )
+        except (OSError, ValueError, zlib.error) as e:
+            logger.warning(f"Fallback 테이블 로드 실패, 기존 계산 경로 사용: {e}")
+    return _fallback_table or None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fallback 분류 테이블 생성/검증")
+    parser.add_argument("command", choices=["build", "verify"], help="build: 생성 후 검증, verify: 검증만")
+    parser.add_argument("--path", default=FALLBACK_TABLE_PATH, help="테이블 파일 경로")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        start = time.perf_counter()
+        table = FallbackTable.build()
+        table.save(args.path)
+        print(
+            f"테이블 생성: {TABLE_SIZE}개 조합, {os.path.getsize(args.path)} bytes "
+            f"(fingerprint={table.fingerprint}, {time.perf_counter() - start:.1f}s)"
+        )
+
+    start = time.perf_counter()
+    table = FallbackTable.load(args.path)
+    print(f"테이블 로드: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    fingerprint = rules_fingerprint()
+    if table.fingerprint != fingerprint:
+        print(f"❌ 지문 불일치: table={table.fingerprint}, rules={fingerprint}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    mismatches = table.verify()
+    print(f"전체 검증: {TABLE_SIZE}개 조합 중 불일치 {mismatches}개 ({time.perf_counter() - start:.1f}s)")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,550 @@
+"""
+로컬 분류 모델 (저장된 AI 분류 결과로 학습한 나이브 베이즈)
+
+form_responses에 저장된 AI 분류 결과(result.source=ai)는 그대로 학습 데이터입니다.
+문항별 선택지를 범주형 특징으로 하는 나이브 베이즈 모델을 오프라인으로 학습해 두고,
+분류 시 모델의 확신도(사후 확률)가 AI_LOCAL_MODEL_THRESHOLD 이상인 응답은
+로컬 모델 결과(source=local)로 답하고, 확신하지 못한 응답만 OpenAI로 분류합니다.
+
+- 특징: 기본 설문 스키마의 정규화 응답 키(canonical_key)의 문항별 글자 +
+  Fallback 스코어링 결과 (미응답/알 수 없는 답변은 특징에서 제외, 라플라스 평활화)
+  AI 결과는 SYSTEM_PROMPT의 점수 규칙을 대체로 따르므로, 문항별 독립 가정만으로는
+  표현되지 않는 규칙 결과를 특징으로 넣어 모델이 규칙 결과와 AI 결과의 관계를 학습하게 합니다.
+- 모델 파일(JSON)에는 학습 시 스키마/스코어링 규칙 지문을 기록하며, 현재와 다르면 사용하지 않습니다.
+- 학습 시 응답 키 단위로 나눈 검증 세트에서 확신도 기준별 AI 일치율/적용 비율을 보고합니다.
+  (같은 응답 키는 분류 캐시가 처리하므로, 처음 보는 응답 조합 기준으로 평가)
+- 운영 중 일치율: 로컬 결과 중 일부(AI_LOCAL_MODEL_SHADOW_RATE)는 AI 분류도 실행하여 비교하고,
+  확신하지 못해 AI로 분류한 응답도 로컬 예측과 비교합니다.
+
+사용법 (server 디렉토리에서):
+    python -m services.local_classifier train                      # Supabase의 AI 분류 결과로 학습
+    python -m services.local_classifier train --input rows.jsonl   # 내보낸 form_responses 행으로 학습
+    python -m services.local_classifier evaluate --input rows.jsonl
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import random
+import sys
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config.ai_config import AIConfig
+from services.fallback_classifier import calculate_scores, determine_result_type
+from services.survey_schema import SurveySchema, get_default_schema
+
+logger = logging.getLogger(__name__)
+
+# 모델 파일 경로 (AI_LOCAL_MODEL_PATH로 변경 가능)
+LOCAL_MODEL_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data", "local_model.json"
+)
+
+# 모델 파일 포맷 버전
+MODEL_FORMAT_VERSION = 1
+
+# 학습 보고에 포함하는 확신도 기준
+EVALUATION_THRESHOLDS = (0.5, 0.8, 0.9, 0.95, 0.99)
+
+# 응답 키 글자 (survey_schema의 선택지 순번 문자와 동일)
+_OPTION_CODES = "123456789abcdefghijklmnopqrstuvwxyz"
+
+# Fallback 스코어링 결과 특징 글자 (VALID_RESULT_TYPES 순번)
+_RULE_CODES = {
+    result_type: _OPTION_CODES[index]
+    for index, result_type in enumerate(AIConfig.VALID_RESULT_TYPES)
+}
+
+
+def feature_key(answers: Dict[str, str], schema: SurveySchema) -> str:
+    """모델 특징 키: 정규화 응답 키 + Fallback 스코어링 결과 글자"""
+    rule_type = determine_result_type(calculate_scores(answers, schema))
+    return schema.canonical_key(answers) + _RULE_CODES[rule_type]
+
+
+def model_fingerprint(schema: SurveySchema) -> str:
+    """특징 정의 지문 (설문 스키마 + Fallback 결과 결정 규칙)"""
+    from services.fallback_table import rules_fingerprint
+
+    return f"{schema.fingerprint}-{rules_fingerprint()}"
+
+
+class NaiveBayesModel:
+    """문항별 선택지 빈도 기반 범주형 나이브 베이즈 모델"""
+
+    def __init__(
+        self,
+        labels: List[str],
+        class_counts: Dict[str, int],
+        feature_counts: Dict[str, List[Dict[str, int]]],
+        option_counts: List[int],
+        schema_fingerprint: str,
+        alpha: float = 1.0,
+        evaluation: Optional[Dict] = None
+    ):
+        """
+        Args:
+            labels: 결과 타입 목록
+            class_counts: 결과 타입별 학습 샘플 수
+            feature_counts: 결과 타입별 [문항 위치별 {응답 글자: 빈도}]
+            option_counts: 특징 위치별 값 개수 (문항별 선택지 수 + 결과 타입 수)
+            schema_fingerprint: 학습 시 특징 정의 지문 (model_fingerprint)
+            alpha: 라플라스 평활화 계수
+            evaluation: 학습 시 검증 결과 (보고용)
+        """
+        self.labels = labels
+        self.class_counts = class_counts
+        self.feature_counts = feature_counts
+        self.option_counts = option_counts
+        self.schema_fingerprint = schema_fingerprint
+        self.alpha = alpha
+        self.evaluation = evaluation or {}
+        self.sample_count = sum(class_counts.values())
+        self._compile()
+
+    def _compile(self) -> None:
+        """로그 사전 확률 / 문항 위치별 {응답 글자: 결과 타입별 로그 우도} 사전 계산"""
+        total = self.sample_count + self.alpha * len(self.labels)
+        self._log_prior = [
+            math.log((self.class_counts.get(label, 0) + self.alpha) / total)
+            for label in self.labels
+        ]
+        self._log_likelihood: List[Dict[str, Tuple[float, ...]]] = []
+        for position, option_count in enumerate(self.option_counts):
+            counts = [self.feature_counts[label][position] for label in self.labels]
+            answered = [sum(c.values()) for c in counts]
+            self._log_likelihood.append({
+                code: tuple(
+                    math.log((c.get(code, 0) + self.alpha) / (n + self.alpha * option_count))
+                    for c, n in zip(counts, answered)
+                )
+                for code in _OPTION_CODES[:option_count]
+            })
+
+    def predict(self, answer_key: str) -> Tuple[str, float]:
+        """
+        응답 키 분류
+
+        Args:
+            answer_key: feature_key로 만든 특징 키
+
+        Returns:
+            (결과 타입, 확신도 = 사후 확률)
+        """
+        scores = list(self._log_prior)
+        for table, code in zip(self._log_likelihood, answer_key):
+            row = table.get(code)
+            if row is None:
+                continue
+            for i, value in enumerate(row):
+                scores[i] += value
+
+        best = max(range(len(scores)), key=scores.__getitem__)
+        top = scores[best]
+        confidence = 1.0 / sum(math.exp(score - top) for score in scores)
+        return self.labels[best], confidence
+
+    @classmethod
+    def fit(
+        cls,
+        samples: Iterable[Tuple[str, str]],
+        schema: SurveySchema,
+        alpha: float = 1.0
+    ) -> "NaiveBayesModel":
+        """
+        (특징 키, AI 결과 타입) 샘플로 학습
+
+        Args:
+            samples: (feature_key, result_type) 목록
+            schema: 특징 키를 만든 설문 스키마
+            alpha: 라플라스 평활화 계수
+        """
+        labels = list(AIConfig.VALID_RESULT_TYPES)
+        option_counts = [
+            len(schema.question_mapping[key]["answers"]) for key in schema.question_keys
+        ] + [len(labels)]
+        class_counts: Counter = Counter()
+        feature_counts = {label: [Counter() for _ in option_counts] for label in labels}
+        valid_codes = [set(_OPTION_CODES[:option_count]) for option_count in option_counts]
+        for answer_key, label in samples:
+            class_counts[label] += 1
+            # 미응답("-")/알 수 없는 답변("?")은 특징에서 제외
+            for position, code in enumerate(answer_key):
+                if code in valid_codes[position]:
+                    feature_counts[label][position][code] += 1
+        return cls(
+            labels=labels,
+            class_counts=dict(class_counts),
+            feature_counts={
+                label: [dict(counter) for counter in counters]
+                for label, counters in feature_counts.items()
+            },
+            option_counts=option_counts,
+            schema_fingerprint=model_fingerprint(schema),
+            alpha=alpha
+        )
+
+    def save(self, path: str) -> None:
+        """모델 파일(JSON) 저장"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "format": MODEL_FORMAT_VERSION,
+                    "schema_fingerprint": self.schema_fingerprint,
+                    "alpha": self.alpha,
+                    "labels": self.labels,
+                    "option_counts": self.option_counts,
+                    "class_counts": self.class_counts,
+                    "feature_counts": self.feature_counts,
+                    "evaluation": self.evaluation,
+                },
+                f,
+                ensure_ascii=False
+            )
+
+    @classmethod
+    def load(cls, path: str) -> "NaiveBayesModel":
+        """
+        모델 파일 로드
+
+        Raises:
+            ValueError: 파일 형식이 올바르지 않은 경우
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("format") != MODEL_FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 모델 형식: {data.get('format')}")
+        return cls(
+            labels=data["labels"],
+            class_counts=data["class_counts"],
+            feature_counts=data["feature_counts"],
+            option_counts=data["option_counts"],
+            schema_fingerprint=data["schema_fingerprint"],
+            alpha=data["alpha"],
+            evaluation=data.get("evaluation")
+        )
+
+
+# ===== 학습 데이터 =====
+
+def extract_samples(rows: Iterable[Dict], schema: SurveySchema) -> List[Tuple[str, str]]:
+    """
+    form_responses 행에서 AI 분류 결과가 있는 (특징 키, 결과 타입) 샘플 추출
+
+    Args:
+        rows: form_responses 행 ({"responses": {..., "result": {...}}})
+        schema: 특징 키를 만들 설문 스키마
+    """
+    valid_types = set(AIConfig.VALID_RESULT_TYPES)
+    samples = []
+    for row in rows:
+        responses = row.get("responses") or {}
+        if isinstance(responses, str):
+            responses = json.loads(responses)
+        result = responses.get("result") or {}
+        if result.get("source") != "ai" or result.get("type") not in valid_types:
+            continue
+        answers = {q_id: answer for q_id, answer in responses.items() if q_id != "result"}
+        samples.append((feature_key(answers, schema), result["type"]))
+    return samples
+
+
+def split_by_key(
+    samples: List[Tuple[str, str]],
+    holdout: float,
+    seed: int = 42
+) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    """특징 키 단위로 학습/검증 세트 분리 (같은 응답 조합은 한쪽에만)"""
+    keys = sorted({answer_key for answer_key, _ in samples})
+    random.Random(seed).shuffle(keys)
+    test_keys = set(keys[:int(len(keys) * holdout)])
+    train = [sample for sample in samples if sample[0] not in test_keys]
+    test = [sample for sample in samples if sample[0] in test_keys]
+    return train, test
+
+
+def evaluate(
+    model: NaiveBayesModel,
+    samples: List[Tuple[str, str]],
+    thresholds: Iterable[float] = EVALUATION_THRESHOLDS
+) -> Dict:
+    """
+    검증 샘플에서 AI 결과와의 일치율
+
+    Returns:
+        {"samples", "agreement", "thresholds": [{"threshold", "coverage", "agreement"}]}
+        - coverage: 확신도가 기준 이상이라 로컬로 처리되는 비율 (생략되는 AI 호출 비율)
+        - agreement: 그중 AI 결과와 일치하는 비율
+    """
+    predictions = [(model.predict(answer_key), label) for answer_key, label in samples]
+    report = {
+        "samples": len(samples),
+        "agreement": (
+            round(sum(1 for (pred, _), label in predictions if pred == label) / len(samples), 4)
+            if samples else None
+        ),
+        "thresholds": [],
+    }
+    for threshold in thresholds:
+        confident = [
+            (pred, label) for (pred, confidence), label in predictions if confidence >= threshold
+        ]
+        report["thresholds"].append({
+            "threshold": threshold,
+            "coverage": round(len(confident) / len(samples), 4) if samples else 0.0,
+            "agreement": (
+                round(sum(1 for pred, label in confident if pred == label) / len(confident), 4)
+                if confident else None
+            ),
+        })
+    return report
+
+
+# ===== 운영 =====
+
+class LocalClassifier:
+    """확신도 기준 로컬 분류 + AI 일치율/호출 생략 통계"""
+
+    def __init__(self, model: NaiveBayesModel, threshold: float, shadow_rate: float = 0.0):
+        """
+        Args:
+            model: 학습된 모델
+            threshold: 로컬 결과를 사용할 최소 확신도
+            shadow_rate: 로컬 결과 중 AI 분류도 실행하여 비교할 비율 (0~1)
+        """
+        self.model = model
+        self.threshold = threshold
+        self.shadow_rate = shadow_rate
+        self._pending = set()
+        self._counters = {
+            "served": 0,            # 로컬 결과로 응답 (AI 호출 생략)
+            "uncertain": 0,         # 확신하지 못해 AI로 분류
+            "uncertain_unverified": 0,  # 확신하지 못했지만 AI 결과와 비교하지 않음 (avoided_rate 제외)
+            "shadow_compared": 0,   # 로컬 결과와 비교한 AI 결과 (검증 호출)
+            "shadow_agreed": 0,
+            "uncertain_compared": 0,  # 확신하지 못한 예측과 비교한 AI 결과
+            "uncertain_agreed": 0,
+        }
+
+    def predict(
+        self,
+        answers: Dict[str, str],
+        schema: SurveySchema,
+        compare_uncertain: bool = True
+    ) -> Tuple[str, bool]:
+        """
+        설문 응답 분류
+
+        Args:
+            compare_uncertain: 확신하지 못한 예측을 AI 결과와 비교하는지
+                (False면 uncertain_unverified로 집계하여 avoided_rate에서 제외)
+
+        Returns:
+            (결과 타입, 확신도 기준 충족 여부) - 충족하면 served, 아니면 uncertain으로 집계
+        """
+        label, confidence = self.model.predict(feature_key(answers, schema))
+        confident = confidence >= self.threshold
+        if confident:
+            self._counters["served"] += 1
+        else:
+            self._counters["uncertain" if compare_uncertain else "uncertain_unverified"] += 1
+        return label, confident
+
+    def should_shadow(self) -> bool:
+        """이번 로컬 결과를 AI 결과와 비교할지 (shadow_rate 비율로 표본 추출)"""
+        return self.shadow_rate > 0 and random.random() < self.shadow_rate
+
+    def compare(self, local_label: str, ai_call: asyncio.Future, shadow: bool) -> None:
+        """AI 분류가 끝나면 로컬 예측과 비교하여 일치율 집계"""
+        kind = "shadow" if shadow else "uncertain"
+        self._pending.add(ai_call)
+
+        def record(future: asyncio.Future) -> None:
+            self._pending.discard(future)
+            if future.cancelled() or future.exception() is not None:
+                return
+            ai_result, _ = future.result()
+            if not ai_result:
+                return
+            self._counters[f"{kind}_compared"] += 1
+            if ai_result == local_label:
+                self._counters[f"{kind}_agreed"] += 1
+            elif shadow:
+                logger.info(f"[로컬 분류] AI 결과와 불일치: local={local_label}, ai={ai_result}")
+
+        ai_call.add_done_callback(record)
+
+    def stats(self) -> Dict:
+        """로컬 분류 통계 (avoided_rate = AI 결과와 비교 가능한 분류 중 생략한 AI 호출 비율)"""
+        counters = self._counters
+        decided = counters["served"] + counters["uncertain"]
+        return {
+            "samples": self.model.sample_count,
+            "threshold": self.threshold,
+            "shadow_rate": self.shadow_rate,
+            **counters,
+            "avoided_rate": round(counters["served"] / decided, 4) if decided else 0.0,
+            "shadow_agreement": (
+                round(counters["shadow_agreed"] / counters["shadow_compared"], 4)
+                if counters["shadow_compared"] else None
+            ),
+            "uncertain_agreement": (
+                round(counters["uncertain_agreed"] / counters["uncertain_compared"], 4)
+                if counters["uncertain_compared"] else None
+            ),
+            "trained_agreement": self.model.evaluation.get("selected", {}).get("agreement"),
+        }
+
+
+# 싱글톤 인스턴스 (로드 실패/사용 불가 시 False로 표시하여 재시도하지 않음)
+_local_classifier = None
+
+
+def get_local_classifier() -> Optional[LocalClassifier]:
+    """
+    로컬 분류기 싱글톤
+
+    Returns:
+        LocalClassifier (비활성화, 모델 파일 없음, 스키마 불일치, 샘플 부족이면 None)
+    """
+    global _local_classifier
+    if not AIConfig.AI_LOCAL_MODEL_ENABLED:
+        return None
+    if _local_classifier is None:
+        _local_classifier = False
+        path = AIConfig.AI_LOCAL_MODEL_PATH or LOCAL_MODEL_PATH
+        try:
+            model = NaiveBayesModel.load(path)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"[로컬 분류] 모델 로드 실패, AI로 분류합니다: {e}")
+            return None
+
+        fingerprint = model_fingerprint(get_default_schema())
+        if model.schema_fingerprint != fingerprint:
+            logger.warning(
+                f"[로컬 분류] 모델이 현재 설문 스키마/스코어링 규칙과 다릅니다 "
+                f"(model={model.schema_fingerprint}, schema={fingerprint}). "
+                f"'python -m services.local_classifier train'으로 다시 학습하세요."
+            )
+        elif model.sample_count < AIConfig.AI_LOCAL_MODEL_MIN_SAMPLES:
+            logger.warning(
+                f"[로컬 분류] 학습 샘플 부족 ({model.sample_count} < "
+                f"{AIConfig.AI_LOCAL_MODEL_MIN_SAMPLES}), 사용하지 않습니다."
+            )
+        else:
+            _local_classifier = LocalClassifier(
+                model,
+                threshold=AIConfig.AI_LOCAL_MODEL_THRESHOLD,
+                shadow_rate=AIConfig.AI_LOCAL_MODEL_SHADOW_RATE
+            )
+            logger.info(
+                f"[로컬 분류] 모델 로드 완료: 샘플 {model.sample_count}개, "
+                f"확신도 기준 {AIConfig.AI_LOCAL_MODEL_THRESHOLD}"
+            )
+    return _local_classifier or None
+
+
+def get_local_classifier_stats() -> Dict:
+    """로컬 분류 통계 (비활성화/사용 불가 시 enabled=False)"""
+    local = get_local_classifier()
+    if local is None:
+        return {"enabled": False}
+    return {"enabled": True, **local.stats()}
+
+
+# ===== 학습 CLI =====
+
+def load_rows(path: str) -> List[Dict]:
+    """내보낸 form_responses 행 파일 로드 (JSON Lines 또는 JSON 배열)"""
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    if text.lstrip().startswith("["):
+        return json.loads(text)
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+async def fetch_rows(share_url: str, page_size: int = 1000) -> List[Dict]:
+    """Supabase에서 폼의 AI 분류 결과가 저장된 응답 전체 조회"""
+    from db.supabase_client import close_supabase_client, get_supabase_client
+
+    client = get_supabase_client()
+    try:
+        form = await client.get_form_by_share_url(share_url)
+        if not form:
+            raise ValueError(f"폼을 찾을 수 없습니다: {share_url}")
+        rows: List[Dict] = []
+        while True:
+            page = await client.list_ai_labeled_responses(form["id"], len(rows), page_size)
+            rows.extend(page)
+            if len(page) < page_size:
+                return rows
+    finally:
+        await close_supabase_client()
+
+
+def _print_evaluation(report: Dict, threshold: float) -> None:
+    print(
+        f"검증: 처음 보는 응답 조합 {report['samples']}개, "
+        f"전체 AI 일치율 {report['agreement']}"
+    )
+    print("  확신도 기준 | 로컬 처리 비율 | AI 일치율")
+    for row in report["thresholds"]:
+        marker = " <- AI_LOCAL_MODEL_THRESHOLD" if row["threshold"] == threshold else ""
+        print(f"  {row['threshold']:>10} | {row['coverage']:>13} | {row['agreement']}{marker}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 분류 모델 학습/평가")
+    parser.add_argument("command", choices=["train", "evaluate"], help="train: 평가 후 저장, evaluate: 평가만")
+    parser.add_argument("--input", help="form_responses 행 파일 (JSON Lines/배열, 없으면 Supabase 조회)")
+    parser.add_argument("--share-url", default="test/2", help="학습할 폼의 공유 URL (Supabase 조회 시)")
+    parser.add_argument("--path", default=AIConfig.AI_LOCAL_MODEL_PATH or LOCAL_MODEL_PATH, help="모델 파일 경로")
+    parser.add_argument("--alpha", type=float, default=1.0, help="라플라스 평활화 계수")
+    parser.add_argument("--holdout", type=float, default=0.2, help="검증용 응답 키 비율")
+    parser.add_argument("--seed", type=int, default=42, help="검증 세트 분리 시드")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    rows = load_rows(args.input) if args.input else asyncio.run(fetch_rows(args.share_url))
+    schema = get_default_schema()
+    samples = extract_samples(rows, schema)
+    print(
+        f"학습 데이터: 행 {len(rows)}개 중 AI 결과 {len(samples)}개 "
+        f"(응답 조합 {len({key for key, _ in samples})}가지, {time.perf_counter() - start:.1f}s)"
+    )
+    if not samples:
+        print("❌ AI 분류 결과가 없습니다")
+        sys.exit(1)
+
+    train, test = split_by_key(samples, args.holdout, args.seed)
+    threshold = AIConfig.AI_LOCAL_MODEL_THRESHOLD
+    report = evaluate(
+        NaiveBayesModel.fit(train, schema, args.alpha),
+        test,
+        sorted(set(EVALUATION_THRESHOLDS) | {threshold})
+    )
+    report["selected"] = next(row for row in report["thresholds"] if row["threshold"] == threshold)
+    _print_evaluation(report, threshold)
+
+    if args.command == "evaluate":
+        return
+
+    model = NaiveBayesModel.fit(samples, schema, args.alpha)
+    model.evaluation = report
+    model.save(args.path)
+    print(f"모델 저장: {args.path} (샘플 {model.sample_count}개, 스키마 {model.schema_fingerprint})")
+    if model.sample_count < AIConfig.AI_LOCAL_MODEL_MIN_SAMPLES:
+        print(
+            f"⚠️ 샘플 {model.sample_count}개 < AI_LOCAL_MODEL_MIN_SAMPLES "
+            f"{AIConfig.AI_LOCAL_MODEL_MIN_SAMPLES}: 서버에서 사용하지 않습니다"
+        )
+
+
+if __name__ == "__main__":
+    main()
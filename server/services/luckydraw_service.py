@@ -4,17 +4,22 @@
 메모리 기반으로 참가자 추첨번호 할당 및 추첨 기능을 제공합니다.
 싱글톤 패턴으로 구현되어 서버 전체에서 하나의 인스턴스만 존재합니다.
 서버 재시작 시 모든 데이터가 초기화됩니다.
+
+참가자/추첨 결과는 프로세스 메모리에 있으므로 이벤트는 단일 워커 전제입니다.
+(LUCKYDRAW_NUMBER_ALLOCATOR=sqlite/postgres는 추첨번호만 워커 간에 공유)
 """
 
 import asyncio
 import logging
 import secrets
-import random
-from typing import Dict, Optional, List
+from typing import Dict, Iterator, Optional, List, Tuple
 from datetime import datetime
 from dataclasses import dataclass, field
 
 from .connection_manager import ConnectionManager, get_connection_manager
+from .draw_number_allocator import DrawNumberAllocator, get_draw_number_allocator
+from .draw_sampler import DrawNumberSampler
+from .draw_scheduler import DrawSchedule, ScheduledPrize, ScheduleIntervals
 
 logger = logging.getLogger(__name__)
 
@@ -68,9 +73,25 @@ class EventData:
     participants: Dict[str, Participant] = field(default_factory=dict)
     draws: List[DrawRecord] = field(default_factory=list)
     winners_info: List[WinnerInfo] = field(default_factory=list)  # 당첨자 개인정보
-    next_draw_number: int = 1
     pending_draw: Optional[PendingDraw] = None  # 결과 발표 대기 중인 추첨
     session_id: str = ""  # 이벤트 세션 ID (리셋 시 재생성)
+    version: int = 0  # 상태 버전 (변경 시마다 증가, 대시보드 캐시/long-poll 용)
+    sampler: DrawNumberSampler = field(default_factory=DrawNumberSampler)  # 당첨 제외 추첨기
+
+
+# 추첨 모드별 당첨자 수 제한: {draw_mode: (min, max)}
+DRAW_MODE_LIMITS: Dict[str, Tuple[int, int]] = {
+    "slot": (1, 1),      # 고정 1명
+    "card": (1, 5),      # 1~5명
+    "network": (1, 10)   # 1~10명
+}
+
+# 내보내기 데이터셋별 컬럼 순서
+EXPORT_FIELDS: Dict[str, List[str]] = {
+    "participants": ["draw_number", "created_at"],
+    "draws": ["prize_name", "prize_rank", "draw_number", "drawn_at"],
+    "winners": ["draw_number", "prize_name", "name", "phone", "submitted_at"],
+}
 
 
 # ============================================================
@@ -106,6 +127,18 @@ class LuckyDrawService:
         # ConnectionManager 참조 (지연 초기화)
         self._connection_manager: Optional[ConnectionManager] = None
 
+        # 추첨번호 할당기 참조 (지연 초기화)
+        self._draw_number_allocator: Optional[DrawNumberAllocator] = None
+
+        # 대시보드 스냅샷 캐시: {event_id: (version, snapshot)}
+        self._dashboard_cache: Dict[str, Tuple[int, Dict]] = {}
+
+        # 이벤트별 변경 알림 (long-poll 대기자 깨우기)
+        self._change_events: Dict[str, asyncio.Event] = {}
+
+        # 이벤트별 자동 추첨 스케줄
+        self._schedules: Dict[str, DrawSchedule] = {}
+
         self._initialized = True
         logger.info("[LuckyDrawService] 초기화 완료")
 
@@ -123,6 +156,13 @@ class LuckyDrawService:
             self._connection_manager = get_connection_manager()
         return self._connection_manager
 
+    @property
+    def draw_number_allocator(self) -> DrawNumberAllocator:
+        """추첨번호 할당기 인스턴스 (지연 초기화)"""
+        if self._draw_number_allocator is None:
+            self._draw_number_allocator = get_draw_number_allocator()
+        return self._draw_number_allocator
+
     def _get_lock(self, event_id: str) -> asyncio.Lock:
         """이벤트별 Lock 가져오기 (없으면 생성)"""
         if event_id not in self._locks:
@@ -138,6 +178,22 @@ class LuckyDrawService:
             logger.info(f"[이벤트 생성] event_id={event_id}, session_id={new_session_id[:8]}...")
         return self._storage[event_id]
 
+    def _mark_changed(self, event_id: str) -> None:
+        """이벤트 상태 버전 증가 및 대기 중인 long-poll 요청 깨우기"""
+        self._get_event_data(event_id).version += 1
+        change_event = self._change_events.pop(event_id, None)
+        if change_event:
+            change_event.set()
+
+    @staticmethod
+    def _validate_winner_count(draw_mode: str, winner_count: int) -> None:
+        """모드별 당첨자 수 제한 검증 (위반 시 ValueError)"""
+        min_count, max_count = DRAW_MODE_LIMITS.get(draw_mode, (1, 1))
+        if winner_count < min_count or winner_count > max_count:
+            raise ValueError(
+                f"{draw_mode} 모드에서는 {min_count}~{max_count}명만 추첨 가능합니다."
+            )
+
     @staticmethod
     def _generate_session_token() -> str:
         """세션 토큰 생성 (32바이트 URL-safe 랜덤 문자열)"""
@@ -189,8 +245,7 @@ class LuckyDrawService:
 
             # 신규 참가자 등록
             new_token = session_token or self._generate_session_token()
-            draw_number = event_data.next_draw_number
-            event_data.next_draw_number += 1
+            draw_number = await self.draw_number_allocator.allocate(event_id)
 
             participant = Participant(
                 draw_number=draw_number,
@@ -198,6 +253,8 @@ class LuckyDrawService:
                 session_token=new_token
             )
             event_data.participants[new_token] = participant
+            event_data.sampler.add(draw_number)
+            self._mark_changed(event_id)
 
             logger.info(
                 f"[신규 참가자] event_id={event_id}, "
@@ -378,16 +435,7 @@ class LuckyDrawService:
             {"success": True, "message": str}
         """
         # 모드별 당첨자 수 제한 검증
-        mode_limits = {
-            "slot": (1, 1),      # 고정 1명
-            "card": (1, 5),      # 1~5명
-            "network": (1, 10)   # 1~10명
-        }
-        min_count, max_count = mode_limits.get(draw_mode, (1, 1))
-        if winner_count < min_count or winner_count > max_count:
-            raise ValueError(
-                f"{draw_mode} 모드에서는 {min_count}~{max_count}명만 추첨 가능합니다."
-            )
+        self._validate_winner_count(draw_mode, winner_count)
 
         lock = self._get_lock(event_id)
         event_data = self._get_event_data(event_id)
@@ -397,30 +445,20 @@ class LuckyDrawService:
             if not event_data.participants:
                 raise ValueError("참가자가 없습니다. 추첨을 진행할 수 없습니다.")
 
-            # 이미 당첨된 번호 목록 (모든 추첨에서)
-            existing_winners = {
-                draw.draw_number
-                for draw in event_data.draws
-            }
-
-            # 추첨 가능한 번호 목록
-            available_numbers = [
-                p.draw_number
-                for p in event_data.participants.values()
-                if p.draw_number not in existing_winners
-            ]
+            # 추첨 가능 번호 수 (이미 당첨된 번호는 샘플러에서 제외됨)
+            available_count = event_data.sampler.eligible_count
 
-            if not available_numbers:
+            if not available_count:
                 raise ValueError("추첨 가능한 참가자가 없습니다. (모두 이미 당첨되었습니다)")
 
-            if len(available_numbers) < winner_count:
+            if available_count < winner_count:
                 raise ValueError(
-                    f"추첨 가능한 참가자({len(available_numbers)}명)가 "
+                    f"추첨 가능한 참가자({available_count}명)가 "
                     f"요청한 당첨자 수({winner_count}명)보다 적습니다."
                 )
 
-            # 랜덤 추첨 (winner_count명)
-            selected_numbers = random.sample(available_numbers, winner_count)
+            # 랜덤 추첨 (winner_count명, O(winner_count · log n))
+            selected_numbers = event_data.sampler.sample(winner_count)
             drawn_at = datetime.now().isoformat()
 
             # 결과를 pending_draw에 임시 저장 (아직 draws에 기록 안 함)
@@ -433,6 +471,7 @@ class LuckyDrawService:
                 draw_mode=draw_mode,
                 winner_count=winner_count
             )
+            self._mark_changed(event_id)
 
             logger.info(
                 f"[추첨 실행] event_id={event_id}, "
@@ -532,9 +571,11 @@ class LuckyDrawService:
                     drawn_at=pending.drawn_at
                 )
                 event_data.draws.append(record)
+                event_data.sampler.mark_won(winner)
 
             # pending_draw 초기화
             event_data.pending_draw = None
+            self._mark_changed(event_id)
 
             logger.info(
                 f"[추첨 완료] event_id={event_id}, "
@@ -587,6 +628,82 @@ class LuckyDrawService:
             for draw in event_data.draws
         ]
 
+    # ============================================================
+    # 자동 추첨 스케줄 관련 메서드
+    # ============================================================
+
+    def start_draw_schedule(
+        self,
+        event_id: str,
+        prizes: List[ScheduledPrize],
+        intervals: ScheduleIntervals
+    ) -> Dict:
+        """
+        자동 추첨 시작
+
+        상품 대기열을 standby → start → reveal → complete 순서로 지정된 간격에 따라
+        서버에서 진행합니다. 이벤트당 하나의 스케줄만 진행할 수 있습니다.
+
+        Args:
+            event_id: 이벤트 ID
+            prizes: 추첨할 상품 목록 (순서대로 진행)
+            intervals: 단계 간 간격
+
+        Returns:
+            스케줄 상태 (get_draw_schedule_status와 동일)
+        """
+        if not prizes:
+            raise ValueError("자동 추첨할 상품이 없습니다.")
+        for prize in prizes:
+            self._validate_winner_count(prize.draw_mode, prize.winner_count)
+
+        existing = self._schedules.get(event_id)
+        if existing and existing.is_active:
+            raise ValueError("이미 진행 중인 자동 추첨이 있습니다.")
+
+        schedule = DrawSchedule(self, event_id, prizes, intervals)
+        self._schedules[event_id] = schedule
+        schedule.start()
+
+        logger.info(f"[자동 추첨 시작] event_id={event_id}, 상품 {len(prizes)}개")
+        return schedule.status()
+
+    def _get_schedule(self, event_id: str) -> DrawSchedule:
+        """이벤트의 자동 추첨 스케줄 조회 (없으면 ValueError)"""
+        schedule = self._schedules.get(event_id)
+        if not schedule:
+            raise ValueError("자동 추첨 스케줄이 없습니다.")
+        return schedule
+
+    def pause_draw_schedule(self, event_id: str) -> Dict:
+        """자동 추첨 일시정지"""
+        schedule = self._get_schedule(event_id)
+        schedule.pause()
+        return schedule.status()
+
+    def resume_draw_schedule(self, event_id: str) -> Dict:
+        """자동 추첨 재개"""
+        schedule = self._get_schedule(event_id)
+        schedule.resume()
+        return schedule.status()
+
+    def skip_draw_schedule(self, event_id: str) -> Dict:
+        """자동 추첨 현재 상품 건너뛰기"""
+        schedule = self._get_schedule(event_id)
+        schedule.skip()
+        return schedule.status()
+
+    def cancel_draw_schedule(self, event_id: str) -> Dict:
+        """자동 추첨 중단"""
+        schedule = self._get_schedule(event_id)
+        schedule.cancel()
+        return schedule.status()
+
+    def get_draw_schedule_status(self, event_id: str) -> Optional[Dict]:
+        """자동 추첨 진행 상태 조회 (스케줄이 없으면 None)"""
+        schedule = self._schedules.get(event_id)
+        return schedule.status() if schedule else None
+
     # ============================================================
     # 당첨자 정보 관련 메서드
     # ============================================================
@@ -638,6 +755,7 @@ class LuckyDrawService:
                 submitted_at=datetime.now().isoformat()
             )
             event_data.winners_info.append(winner_info)
+            self._mark_changed(event_id)
 
             logger.info(
                 f"[당첨자 정보 제출] event_id={event_id}, "
@@ -726,13 +844,23 @@ class LuckyDrawService:
         lock = self._get_lock(event_id)
         event_data = self._get_event_data(event_id)
 
+        # 진행 중인 자동 추첨은 리셋 시 중단
+        schedule = self._schedules.get(event_id)
+        if schedule and schedule.is_active and (reset_participants or reset_draws):
+            schedule.cancel()
+
         async with lock:
             new_session_id = None
 
             if reset_participants:
                 event_data.participants = {}
-                event_data.next_draw_number = 1
+                self.draw_number_allocator.reset(event_id)
                 event_data.winners_info = []  # 당첨자 정보도 함께 삭제
+                event_data.sampler = DrawNumberSampler()
+                if not reset_draws:
+                    # 추첨 이력을 유지하면 기존 당첨 번호는 계속 제외
+                    for draw in event_data.draws:
+                        event_data.sampler.mark_won(draw.draw_number)
                 # 참가자 리셋 시 새 session_id 생성
                 new_session_id = secrets.token_urlsafe(16)
                 event_data.session_id = new_session_id
@@ -741,11 +869,15 @@ class LuckyDrawService:
             if reset_draws:
                 event_data.draws = []
                 event_data.pending_draw = None  # 대기 중인 추첨도 초기화
+                if not reset_participants:
+                    event_data.sampler.reset_winners()
                 logger.info(f"[리셋] event_id={event_id}, 추첨 이력 삭제")
 
             if not reset_participants and not reset_draws:
                 return {"message": "리셋할 항목이 없습니다."}
 
+            self._mark_changed(event_id)
+
             # 리셋 브로드캐스트 (새 session_id 포함)
             broadcast_data = {
                 "type": "event_reset",
@@ -768,6 +900,71 @@ class LuckyDrawService:
                 "event_session_id": event_data.session_id
             }
 
+    # ============================================================
+    # 내보내기 관련 메서드
+    # ============================================================
+
+    def iter_export_rows(
+        self,
+        event_id: str,
+        dataset: str
+    ) -> Tuple[List[str], Iterator[Dict]]:
+        """
+        내보내기용 행 이터레이터 생성
+
+        행 dict는 소비되는 시점에 하나씩 생성됩니다. 이터레이터는 스레드에서
+        소비될 수 있으므로, 호출 시점(이벤트 루프)에 원본 컨테이너의 참조만 고정합니다.
+        - draws / winners: append-only 리스트이고 리셋 시 새 리스트로 교체되므로 참조만 보관
+        - participants: dict는 순회 중 변경될 수 없으므로 Participant 참조 목록만 복사
+          (행당 포인터 1개, 정렬 없이 등록 순서로 출력)
+
+        Args:
+            event_id: 이벤트 ID
+            dataset: "participants" | "draws" | "winners"
+
+        Returns:
+            (컬럼 목록, 행 이터레이터)
+
+        Raises:
+            ValueError: 지원하지 않는 데이터셋
+        """
+        if dataset not in EXPORT_FIELDS:
+            raise ValueError(f"지원하지 않는 내보내기 데이터셋입니다: {dataset}")
+
+        event_data = self._get_event_data(event_id)
+
+        if dataset == "participants":
+            participants = list(event_data.participants.values())
+            rows = (
+                {"draw_number": p.draw_number, "created_at": p.created_at}
+                for p in participants
+            )
+        elif dataset == "draws":
+            draws = event_data.draws
+            rows = (
+                {
+                    "prize_name": draw.prize_name,
+                    "prize_rank": draw.prize_rank,
+                    "draw_number": draw.draw_number,
+                    "drawn_at": draw.drawn_at
+                }
+                for draw in draws
+            )
+        else:
+            winners_info = event_data.winners_info
+            rows = (
+                {
+                    "draw_number": w.draw_number,
+                    "prize_name": w.prize_name,
+                    "name": w.name,
+                    "phone": w.phone,  # Admin 전용 내보내기이므로 전체 번호
+                    "submitted_at": w.submitted_at
+                }
+                for w in winners_info
+            )
+
+        return EXPORT_FIELDS[dataset], rows
+
     # ============================================================
     # 상태 조회 메서드
     # ============================================================
@@ -794,6 +991,90 @@ class LuckyDrawService:
             "connection_count": self.connection_manager.get_connection_count(event_id)
         }
 
+    async def get_dashboard_snapshot(self, event_id: str) -> Dict:
+        """
+        관리자 대시보드 통합 스냅샷 조회
+
+        통계, 추첨 이력, 당첨자 정보, 대기 중인 추첨, 참가자 수를 한 번에 반환합니다.
+        스냅샷은 이벤트 상태 버전별로 캐시되며, 상태가 바뀐 뒤 첫 조회 시에만 다시 생성됩니다.
+        connection_count는 상태 버전과 무관하게 매번 최신 값으로 채웁니다.
+
+        대기 중인 추첨(pending_draw)은 결과 발표 전이므로 당첨번호를 포함하지 않습니다.
+
+        Args:
+            event_id: 이벤트 ID
+
+        Returns:
+            {
+                "version": int,
+                "participant_count": int,
+                "draw_count": int,
+                "connection_count": int,
+                "draws": List[Dict],
+                "winners": List[Dict],
+                "pending_draw": Optional[Dict],
+                "generated_at": str
+            }
+        """
+        event_data = self._get_event_data(event_id)
+
+        cached = self._dashboard_cache.get(event_id)
+        if cached and cached[0] == event_data.version:
+            snapshot = cached[1]
+        else:
+            pending = event_data.pending_draw
+            snapshot = {
+                "version": event_data.version,
+                "event_session_id": event_data.session_id,
+                "participant_count": len(event_data.participants),
+                "draw_count": len(event_data.draws),
+                "draws": await self.get_draw_history(event_id),
+                "winners": self.get_winners_info(event_id),
+                "pending_draw": {
+                    "prize_name": pending.prize_name,
+                    "prize_rank": pending.prize_rank,
+                    "prize_image": pending.prize_image,
+                    "draw_mode": pending.draw_mode,
+                    "winner_count": pending.winner_count,
+                    "drawn_at": pending.drawn_at
+                } if pending else None,
+                "generated_at": datetime.now().isoformat()
+            }
+            self._dashboard_cache[event_id] = (event_data.version, snapshot)
+
+        return {
+            **snapshot,
+            "connection_count": self.connection_manager.get_connection_count(event_id)
+        }
+
+    async def wait_for_change(
+        self,
+        event_id: str,
+        since_version: int,
+        timeout: float
+    ) -> bool:
+        """
+        이벤트 상태가 since_version에서 바뀔 때까지 대기 (long-poll)
+
+        Args:
+            event_id: 이벤트 ID
+            since_version: 클라이언트가 마지막으로 받은 스냅샷 버전
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            대기 중 상태가 변경되었으면 True, 타임아웃이면 False
+        """
+        event_data = self._get_event_data(event_id)
+        if event_data.version != since_version:
+            return True
+
+        change_event = self._change_events.setdefault(event_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(change_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
 
 # ============================================================
 # 싱글톤 접근자
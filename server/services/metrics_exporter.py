@@ -0,0 +1,199 @@
+"""
+Prometheus 지표 내보내기
+
+분류 지표(services/classification_metrics.py)와 분류 관련 구성 요소의 통계
+(폼 캐시, 분류 캐시, AI 호출 공유, 응답 시간 예산, 서킷 브레이커, 승인 제어, 재시도,
+백그라운드 AI 분류, 로컬 모델)를 Prometheus 텍스트 형식(0.0.4)으로 변환합니다.
+
+구성 요소 통계는 get_x_stats()의 숫자 값을 그대로 내보냅니다. (untyped)
+- {"hits": 3} → survey_form_cache_hits 3
+- {"transition_counts": {"closed->open": 1}} → survey_ai_circuit_breaker_transition_counts{key="closed->open"} 1
+- 문자열/목록 값은 생략 (서킷 브레이커 상태는 survey_ai_circuit_breaker_state{state="..."} 0/1)
+"""
+
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+from services.classification_metrics import (
+    ERROR_ADMISSION_REJECTED,
+    ERROR_API,
+    ERROR_BREAKER_OPEN,
+    ERROR_INVALID_RESPONSE,
+    ERROR_RATE_LIMIT,
+    ERROR_TIMEOUT,
+    ERROR_UNEXPECTED,
+    Histogram,
+    get_classification_metrics,
+)
+from services.circuit_breaker import STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN
+
+METRIC_PREFIX = "survey"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 발생 전에도 0으로 내보내는 AI 실패 원인 (rate() 계산용)
+AI_ERROR_CLASSES = (
+    ERROR_TIMEOUT,
+    ERROR_RATE_LIMIT,
+    ERROR_API,
+    ERROR_INVALID_RESPONSE,
+    ERROR_UNEXPECTED,
+    ERROR_ADMISSION_REJECTED,
+    ERROR_BREAKER_OPEN,
+)
+
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+
+
+def _metric_name(*parts: str) -> str:
+    return _INVALID_NAME_CHARS.sub("_", "_".join((METRIC_PREFIX,) + parts))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+def _sample(name: str, value: float, labels: Optional[Dict[str, str]] = None) -> str:
+    if labels:
+        label_text = ",".join(
+            f'{key}="{_escape_label(str(label))}"' for key, label in labels.items()
+        )
+        return f"{name}{{{label_text}}} {_format_value(value)}"
+    return f"{name} {_format_value(value)}"
+
+
+def _header(lines: List[str], name: str, metric_type: str, help_text: str) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {metric_type}")
+
+
+def _histogram(lines: List[str], name: str, help_text: str, histogram: Histogram) -> None:
+    _header(lines, name, "histogram", help_text)
+    for upper, total in histogram.cumulative():
+        lines.append(_sample(f"{name}_bucket", total, {"le": _format_value(upper)}))
+    lines.append(_sample(f"{name}_sum", histogram.sum))
+    lines.append(_sample(f"{name}_count", histogram.count))
+
+
+def _component_stats(lines: List[str], component: str, stats: Dict) -> None:
+    """구성 요소 통계의 숫자 값 (bool은 0/1, 한 단계 중첩 dict는 key 라벨)"""
+    for key, value in stats.items():
+        name = _metric_name(component, key)
+        if isinstance(value, bool):
+            value = int(value)
+        if isinstance(value, (int, float)):
+            lines.append(f"# TYPE {name} untyped")
+            lines.append(_sample(name, value))
+        elif isinstance(value, dict):
+            samples = [
+                _sample(name, int(item) if isinstance(item, bool) else item, {"key": item_key})
+                for item_key, item in value.items()
+                if isinstance(item, (int, float))
+            ]
+            if samples:
+                lines.append(f"# TYPE {name} untyped")
+                lines.extend(samples)
+
+
+def _components() -> List[Tuple[str, Callable[[], Dict]]]:
+    """(이름, 통계 함수) 목록 (헬스 체크와 같은 구성 요소)"""
+    from db.form_cache import get_form_cache_stats
+    from services.ai_classifier import get_admission_stats, get_retry_stats
+    from services.background_classifier import get_background_classifier_stats
+    from services.classification_cache import get_classification_cache_stats
+    from services.classifier import get_latency_budget_stats, get_single_flight_stats
+    from services.local_classifier import get_local_classifier_stats
+    from services.openai_http import get_openai_http_stats
+    from services.openai_replay import get_replay_stats
+
+    return [
+        ("form_cache", get_form_cache_stats),
+        ("classification_cache", get_classification_cache_stats),
+        ("ai_single_flight", get_single_flight_stats),
+        ("ai_latency_budget", get_latency_budget_stats),
+        ("ai_admission", get_admission_stats),
+        ("ai_retry", get_retry_stats),
+        ("ai_http", get_openai_http_stats),
+        ("ai_replay", get_replay_stats),
+        ("ai_background", get_background_classifier_stats),
+        ("ai_local_model", get_local_classifier_stats),
+    ]
+
+
+def render_prometheus() -> str:
+    """
+    Prometheus 텍스트 형식 지표
+
+    Returns:
+        /metrics 응답 본문
+    """
+    from services.classifier import get_circuit_breaker_status
+
+    metrics = get_classification_metrics()
+    lines: List[str] = []
+
+    name = _metric_name("classifications_total")
+    _header(lines, name, "counter", "Classification requests by result source")
+    for source, count in metrics.classifications.items():
+        lines.append(_sample(name, count, {"source": source}))
+
+    name = _metric_name("ai_success_total")
+    _header(lines, name, "counter", "Successful OpenAI classifications")
+    lines.append(_sample(name, metrics.ai_success))
+
+    name = _metric_name("ai_failures_total")
+    _header(lines, name, "counter", "Failed AI classifications by error class")
+    for error_class in sorted(set(AI_ERROR_CLASSES) | set(metrics.ai_failures)):
+        lines.append(_sample(name, metrics.ai_failures.get(error_class, 0), {"class": error_class}))
+
+    for metric, help_text, value in (
+        ("openai_prompt_tokens_total", "OpenAI prompt tokens", metrics.prompt_tokens),
+        ("openai_completion_tokens_total", "OpenAI completion tokens", metrics.completion_tokens),
+        ("openai_usage_responses_total", "OpenAI responses with token usage", metrics.usage_responses),
+        ("ai_validated_responses_total", "AI results validated (per survey)", metrics.validated_responses),
+        ("ai_invalid_responses_total", "AI results that were not a valid type", metrics.invalid_responses),
+    ):
+        name = _metric_name(metric)
+        _header(lines, name, "counter", help_text)
+        lines.append(_sample(name, value))
+
+    _histogram(
+        lines, _metric_name("ai_call_seconds"),
+        "AI classification latency including retries and admission wait", metrics.ai_latency
+    )
+    _histogram(
+        lines, _metric_name("openai_request_seconds"),
+        "Single OpenAI request latency", metrics.openai_request_latency
+    )
+    _histogram(
+        lines, _metric_name("fallback_seconds"),
+        "Fallback classification latency", metrics.fallback_latency
+    )
+    _histogram(
+        lines, _metric_name("classification_seconds"),
+        "End-to-end classification latency", metrics.classification_latency
+    )
+    _histogram(
+        lines, _metric_name("ai_retries"),
+        "Retries per AI classification", metrics.ai_retries
+    )
+
+    breaker = get_circuit_breaker_status()
+    if breaker["enabled"]:
+        name = _metric_name("ai_circuit_breaker_state")
+        _header(lines, name, "gauge", "AI circuit breaker state")
+        for state in (STATE_CLOSED, STATE_OPEN, STATE_HALF_OPEN):
+            lines.append(_sample(name, int(breaker["state"] == state), {"state": state}))
+    _component_stats(lines, "ai_circuit_breaker", breaker)
+
+    for component, stats_func in _components():
+        _component_stats(lines, component, stats_func())
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,202 @@
+"""
+OpenAI HTTP 연결 풀
+
+AI 분류기(AsyncOpenAI)가 사용할 공유 httpx 클라이언트를 명시적인 풀 설정으로 만듭니다.
+
+- 연결 풀 크기/유휴 연결 유지 시간: AI_HTTP_MAX_CONNECTIONS / AI_HTTP_MAX_KEEPALIVE /
+  AI_HTTP_KEEPALIVE_SECONDS (SDK 기본값은 유휴 연결을 5초 만에 닫아 한산할 때 매번 새로 연결)
+- 사전 연결: 서버 시작 시 AI_HTTP_WARMUP_CONNECTIONS개 연결을 미리 열어 두어
+  배포 직후 첫 설문들이 TCP/TLS 연결 비용을 내지 않게 함 (GET /models, API 키 확인 겸용)
+- 종료: 서버 종료 시 연결 풀을 닫음 (main.py lifespan)
+
+요청마다 httpcore trace 이벤트로 새 연결/TLS 핸드셰이크를 집계하여
+소켓 재사용 비율을 get_openai_http_stats로 보여줍니다.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+from openai import DefaultAsyncHttpxClient
+
+from config.ai_config import AIConfig
+from services.openai_replay import REPLAY_MODE_REPLAY, create_replay_transport
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionStats:
+    """연결 재사용 통계 (httpcore trace 이벤트 기반)"""
+
+    def __init__(self):
+        self.requests = 0
+        self.sent_requests = 0
+        self.reused_connections = 0
+        self.new_connections = 0
+        self.tls_handshakes = 0
+        self.warmed_connections = 0
+        self._connect_total = 0.0
+        self._connect_started: Dict[int, float] = {}
+
+    async def on_request(self, request: httpx.Request) -> None:
+        """요청 이벤트 훅: 요청 수 집계 + trace 콜백 연결"""
+        self.requests += 1
+        request_id = id(request)
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.started":
+                self._connect_started[request_id] = time.perf_counter()
+            elif event_name == "connection.connect_tcp.complete":
+                self.new_connections += 1
+            elif event_name == "connection.start_tls.complete":
+                self.tls_handshakes += 1
+            elif event_name.endswith("send_request_headers.started"):
+                # 연결 완료 후 요청 전송 시작 (새 연결이면 TCP + TLS 소요 시간 기록, 아니면 재사용)
+                self.sent_requests += 1
+                started = self._connect_started.pop(request_id, None)
+                if started is not None:
+                    self._connect_total += time.perf_counter() - started
+                else:
+                    self.reused_connections += 1
+            elif event_name.startswith("connection.") and event_name.endswith(".failed"):
+                self._connect_started.pop(request_id, None)
+
+        request.extensions["trace"] = trace
+
+    def stats(self) -> Dict:
+        """
+        재사용 통계
+
+        reuse_rate는 실제로 전송된 요청(send_request_headers 이벤트) 기준입니다.
+        연결 전에 실패한 요청과 재생 모드 응답(trace 이벤트 없음)은 제외됩니다.
+        """
+        return {
+            "requests": self.requests,
+            "sent_requests": self.sent_requests,
+            "new_connections": self.new_connections,
+            "reused_connections": self.reused_connections,
+            "reuse_rate": (
+                round(self.reused_connections / self.sent_requests, 4) if self.sent_requests else 0.0
+            ),
+            "tls_handshakes": self.tls_handshakes,
+            "avg_connect_ms": (
+                round(self._connect_total / self.new_connections * 1000, 2)
+                if self.new_connections else 0.0
+            ),
+            "warmed_connections": self.warmed_connections,
+        }
+
+
+_http_client: Optional[httpx.AsyncClient] = None
+_connection_stats = ConnectionStats()
+
+
+def get_openai_http_client() -> httpx.AsyncClient:
+    """
+    OpenAI 공유 HTTP 클라이언트 싱글톤
+
+    Returns:
+        httpx.AsyncClient (연결 풀 설정 + 재사용 통계 훅)
+    """
+    global _http_client
+    if _http_client is None:
+        limits = httpx.Limits(
+            max_connections=AIConfig.AI_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=AIConfig.AI_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=AIConfig.AI_HTTP_KEEPALIVE_SECONDS
+        )
+        _http_client = DefaultAsyncHttpxClient(
+            limits=limits,
+            # AI_REPLAY_MODE면 응답 기록/재생 전송 계층 (services/openai_replay.py)
+            transport=create_replay_transport(limits),
+            timeout=AIConfig.AI_TIMEOUT_SECONDS,
+            event_hooks={"request": [_connection_stats.on_request]}
+        )
+    return _http_client
+
+
+async def warm_up_openai(connections: Optional[int] = None) -> int:
+    """
+    OpenAI 연결 사전 생성 (서버 시작 시 호출)
+
+    GET /models를 동시에 connections개 보내 연결을 열고 풀에 유지합니다.
+    실패해도 예외를 던지지 않습니다. (첫 분류 요청이 연결을 새로 열 뿐)
+
+    Args:
+        connections: 열 연결 수 (None이면 AI_HTTP_WARMUP_CONNECTIONS)
+
+    Returns:
+        성공한 사전 연결 요청 수
+    """
+    connections = AIConfig.AI_HTTP_WARMUP_CONNECTIONS if connections is None else connections
+    if connections <= 0 or not AIConfig.OPENAI_API_KEY:
+        return 0
+    if AIConfig.AI_REPLAY_MODE == REPLAY_MODE_REPLAY:
+        # 재생 모드는 네트워크를 쓰지 않음
+        return 0
+
+    from services.ai_classifier import get_classifier
+
+    client = get_classifier().client
+    url = f"{str(client.base_url).rstrip('/')}/models"
+    headers = {"Authorization": f"Bearer {AIConfig.OPENAI_API_KEY}"}
+    http = get_openai_http_client()
+
+    async def open_connection() -> bool:
+        try:
+            response = await http.get(url, headers=headers)
+        except httpx.HTTPError as e:
+            logger.warning(f"[OpenAI 연결 풀] 사전 연결 실패: {type(e).__name__}: {e}")
+            return False
+        if response.status_code == 401:
+            logger.error("[OpenAI 연결 풀] 사전 연결 응답 401: OPENAI_API_KEY를 확인하세요")
+        return True
+
+    start = time.perf_counter()
+    try:
+        results = await asyncio.wait_for(
+            asyncio.gather(*(open_connection() for _ in range(connections))),
+            AIConfig.AI_TIMEOUT_SECONDS
+        )
+    except asyncio.TimeoutError:
+        logger.warning(f"[OpenAI 연결 풀] 사전 연결 시간 초과 ({AIConfig.AI_TIMEOUT_SECONDS}초)")
+        return 0
+
+    warmed = sum(results)
+    _connection_stats.warmed_connections += warmed
+    logger.info(
+        f"[OpenAI 연결 풀] 사전 연결 {warmed}/{connections}개 "
+        f"({(time.perf_counter() - start) * 1000:.0f}ms)"
+    )
+    return warmed
+
+
+async def close_openai_http_client() -> None:
+    """
+    OpenAI 연결 풀 종료 (서버 종료 시 호출)
+
+    닫힌 클라이언트를 계속 쓰지 않도록 AI 분류기/배처 싱글톤도 초기화합니다.
+    (다음 get_classifier 호출 시 새 연결 풀로 다시 생성)
+    """
+    global _http_client
+
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+    # ai_classifier가 이 모듈을 import하므로 지연 import
+    from services import ai_classifier
+    ai_classifier._classifier_instance = None
+    ai_classifier._batcher_instance = None
+
+
+def get_openai_http_stats() -> Dict:
+    """OpenAI 연결 풀 설정 및 재사용 통계"""
+    return {
+        "max_connections": AIConfig.AI_HTTP_MAX_CONNECTIONS,
+        "max_keepalive": AIConfig.AI_HTTP_MAX_KEEPALIVE,
+        "keepalive_seconds": AIConfig.AI_HTTP_KEEPALIVE_SECONDS,
+        **_connection_stats.stats(),
+    }
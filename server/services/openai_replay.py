@@ -0,0 +1,216 @@
+"""
+OpenAI 응답 기록/재생 (AI_REPLAY_MODE)
+
+CI나 외부망이 막힌 부하 테스트 장비에서도 AI 분류 경로 전체를 실행할 수 있도록
+OpenAI HTTP 응답을 요청 지문별로 파일(NDJSON)에 기록하고 재생하는 httpx 전송 계층입니다.
+AIClassifier가 쓰는 공유 HTTP 클라이언트(services/openai_http.py)에 연결되므로
+프롬프트 생성, 응답 형식 해석, 재시도, 메트릭 등 SDK 위쪽 코드는 그대로 실행됩니다.
+
+- 요청 지문: 메서드 + URL 경로 + 정규화한 JSON 본문(키 정렬)의 SHA-256
+  (호스트와 헤더는 제외하므로 실제 OpenAI에서 기록한 파일을 대역 서버 주소에서도 재생 가능)
+- record: 기록된 요청은 재생하고, 없는 요청만 실제로 보낸 뒤 성공 응답(2xx)을 파일에 추가
+  (오류 응답은 기록하지 않음, 다음 실행에서 다시 요청)
+- replay: 네트워크를 쓰지 않음. 기록에 없는 요청은 404(replay_miss)로 응답하여
+  AI 실패(재시도 없음) → Fallback으로 처리되고 misses에 집계됨
+
+마이크로 배칭(AI_BATCH_ENABLED)은 한 요청에 묶이는 설문 조합이 실행마다 달라지므로
+기록/재생 시에는 끄는 것을 권장합니다. (같은 조합으로 묶인 요청만 재생됨)
+
+사용법:
+    AI_REPLAY_MODE=record AI_REPLAY_PATH=recordings/openai.ndjson python main.py   # 기록
+    AI_REPLAY_MODE=replay AI_REPLAY_PATH=recordings/openai.ndjson python main.py   # 재생
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, Optional
+
+import httpx
+
+from config.ai_config import AIConfig
+
+logger = logging.getLogger(__name__)
+
+REPLAY_MODE_RECORD = "record"
+REPLAY_MODE_REPLAY = "replay"
+REPLAY_MODES = (REPLAY_MODE_RECORD, REPLAY_MODE_REPLAY)
+
+
+def request_fingerprint(method: str, path: str, body: bytes) -> str:
+    """
+    요청 지문
+
+    Args:
+        method: HTTP 메서드
+        path: URL 경로 (/v1/chat/completions)
+        body: 요청 본문 (JSON이면 키를 정렬하여 정규화)
+    """
+    try:
+        body = json.dumps(json.loads(body), sort_keys=True, ensure_ascii=False).encode("utf-8")
+    except ValueError:
+        pass
+    return hashlib.sha256(method.encode() + b" " + path.encode() + b"\n" + body).hexdigest()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """기록/재생 httpx 전송 계층"""
+
+    def __init__(
+        self,
+        mode: str,
+        path: str,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Args:
+            mode: record | replay
+            path: 기록 파일 경로 (NDJSON, 한 줄에 응답 하나)
+            transport: record 모드에서 실제 요청에 쓸 전송 계층 (None이면 httpx 기본)
+
+        Raises:
+            ValueError: 지원하지 않는 모드
+        """
+        if mode not in REPLAY_MODES:
+            raise ValueError(f"지원하지 않는 AI_REPLAY_MODE: {mode}")
+        self.mode = mode
+        self.path = path
+        self._transport = transport or httpx.AsyncHTTPTransport()
+        self._entries: Dict[str, Dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+        self.skipped_lines = 0
+        self._load()
+
+    def _load(self) -> None:
+        """
+        기록 파일 로드 (같은 지문이 여러 번 있으면 마지막 응답)
+
+        잘린 줄(기록 중 종료)이나 형식이 맞지 않는 줄은 경고 후 건너뛰고 skipped_lines에 집계합니다.
+        """
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                        self._entries[entry["fingerprint"]] = entry
+                    except (ValueError, KeyError, TypeError) as e:
+                        self.skipped_lines += 1
+                        logger.warning(
+                            f"[OpenAI 재생] 기록 파일 {line_number}번째 줄 건너뜀: "
+                            f"{type(e).__name__}: {e}"
+                        )
+        except FileNotFoundError:
+            if self.mode == REPLAY_MODE_REPLAY:
+                logger.warning(f"[OpenAI 재생] 기록 파일이 없습니다: {self.path}")
+            return
+        logger.info(f"[OpenAI 재생] {self.mode}: 기록 {len(self._entries)}개 로드 ({self.path})")
+
+    def _append(self, entry: Dict) -> None:
+        """응답 기록 추가 (한 줄 단위, await 없이 쓰므로 줄이 섞이지 않음)"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._entries[entry["fingerprint"]] = entry
+        self.recorded += 1
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        fingerprint = request_fingerprint(request.method, request.url.path, body)
+
+        entry = self._entries.get(fingerprint)
+        if entry is not None:
+            self.hits += 1
+            return httpx.Response(
+                entry["status"],
+                headers={"content-type": "application/json"},
+                content=json.dumps(entry["response"]).encode("utf-8"),
+                request=request
+            )
+
+        if self.mode == REPLAY_MODE_REPLAY:
+            self.misses += 1
+            logger.warning(
+                f"[OpenAI 재생] 기록에 없는 요청: {request.method} {request.url.path} ({fingerprint[:12]})"
+            )
+            return httpx.Response(
+                404,
+                json={"error": {
+                    "message": f"No recorded response for request {fingerprint}",
+                    "type": "invalid_request_error",
+                    "code": "replay_miss",
+                }},
+                request=request
+            )
+
+        self.misses += 1
+        response = await self._transport.handle_async_request(request)
+        if 200 <= response.status_code < 300:
+            content = await response.aread()
+            try:
+                recorded = json.loads(content)
+            except ValueError:
+                recorded = None
+            if recorded is not None:
+                self._append({
+                    "fingerprint": fingerprint,
+                    "method": request.method,
+                    "path": request.url.path,
+                    "status": response.status_code,
+                    "response": recorded,
+                })
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    def stats(self) -> Dict:
+        """기록/재생 통계"""
+        requests = self.hits + self.misses
+        return {
+            "enabled": True,
+            "mode": self.mode,
+            "path": self.path,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "recorded": self.recorded,
+            "skipped_lines": self.skipped_lines,
+            "hit_rate": round(self.hits / requests, 4) if requests else 0.0,
+        }
+
+
+# 현재 공유 HTTP 클라이언트의 전송 계층 (openai_http.get_openai_http_client가 생성)
+_replay_transport: Optional[ReplayTransport] = None
+
+
+def create_replay_transport(limits: httpx.Limits) -> Optional[ReplayTransport]:
+    """
+    AI_REPLAY_MODE에 맞는 전송 계층 생성 (비활성화면 None)
+
+    Args:
+        limits: record 모드에서 실제 요청에 쓸 연결 풀 설정
+    """
+    global _replay_transport
+    if not AIConfig.AI_REPLAY_MODE:
+        _replay_transport = None
+        return None
+    _replay_transport = ReplayTransport(
+        AIConfig.AI_REPLAY_MODE,
+        AIConfig.AI_REPLAY_PATH,
+        httpx.AsyncHTTPTransport(limits=limits)
+    )
+    return _replay_transport
+
+
+def get_replay_stats() -> Dict:
+    """기록/재생 통계 (비활성화면 {"enabled": False})"""
+    if _replay_transport is None:
+        return {"enabled": False}
+    return _replay_transport.stats()
@@ -0,0 +1,202 @@
+"""
+재시도 정책
+
+OpenAI 장애 시 모든 요청이 같은 간격으로 동시에 재시도하여 부하를 키우지 않도록
+재시도 여부와 대기 시간을 정합니다.
+
+- 대기 시간: 0 ~ min(max_delay, base_delay * 2^재시도 횟수) 사이 무작위 (capped exponential + full jitter)
+- Retry-After: 서버가 알려준 대기 시간이 더 길면 그만큼 대기
+- 요청당 예산: 최대 재시도 횟수, 첫 시도부터의 시간 예산, 요청 기한(승인 기한)을 넘기는 재시도는 하지 않음
+- 프로세스 예산(RetryBudget): 재시도 수를 요청 수 * ratio + 초당 min_per_second회로 제한
+  (정상 시에는 거의 모든 재시도를 허용하고, 장애 시에는 재시도로 늘어나는 요청을 (1 + ratio)배로 억제)
+"""
+
+import random
+import time
+from typing import Callable, Dict, Optional
+
+# 프로세스 재시도 예산을 모아둘 수 있는 시간 (초당 최소 재시도 수 기준)
+RETRY_BUDGET_WINDOW_SECONDS = 10
+
+
+class RetryBudget:
+    """
+    프로세스 재시도 예산 (토큰 버킷)
+
+    요청마다 ratio개, 시간당 초당 min_per_second개의 토큰이 쌓이고 재시도마다 1개를 씁니다.
+    """
+
+    def __init__(
+        self,
+        ratio: float,
+        min_per_second: float,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            ratio: 요청 1건당 허용 재시도 수
+            min_per_second: 요청 수와 무관하게 허용하는 초당 재시도 수
+            clock: 시간 함수 (테스트용)
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = max(1.0, min_per_second * RETRY_BUDGET_WINDOW_SECONDS)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated_at = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.min_per_second
+        )
+        self._updated_at = now
+
+    def deposit(self) -> None:
+        """요청 1건 기록"""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """재시도 1회 (예산이 없으면 False)"""
+        self._refill()
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    @property
+    def available(self) -> float:
+        """남은 재시도 수"""
+        self._refill()
+        return self._tokens
+
+
+class RetryPolicy:
+    """재시도 여부/대기 시간 결정"""
+
+    def __init__(
+        self,
+        max_retries: int,
+        base_delay: float,
+        max_delay: float,
+        request_budget_seconds: float,
+        budget: Optional[RetryBudget] = None,
+        rng: Callable[[], float] = random.random,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_retries: 요청당 최대 재시도 횟수
+            base_delay: 첫 재시도 대기 상한 (초)
+            max_delay: 재시도 대기 상한 (초, Retry-After 제외)
+            request_budget_seconds: 요청당 재시도 시간 예산 (첫 시도 시작 기준, 초)
+            budget: 프로세스 재시도 예산 (None이면 제한 없음)
+            rng: [0, 1) 난수 함수 (테스트용)
+            clock: 시간 함수 (테스트용)
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.request_budget_seconds = request_budget_seconds
+        self.budget = budget
+        self._rng = rng
+        self._clock = clock
+        self._counters = {
+            "requests": 0,
+            "retries": 0,
+            "retry_after_used": 0,          # Retry-After로 대기 시간을 늘린 재시도 수
+            "gave_up_max_retries": 0,       # 최대 재시도 횟수 도달
+            "gave_up_request_budget": 0,    # 요청 시간 예산/기한 초과
+            "gave_up_retry_budget": 0,      # 프로세스 재시도 예산 소진
+        }
+        self._delay_total = 0.0
+
+    def start(self) -> float:
+        """
+        요청 시작 기록
+
+        Returns:
+            요청 시작 시각 (next_delay의 started_at)
+        """
+        self._counters["requests"] += 1
+        if self.budget is not None:
+            self.budget.deposit()
+        return self._clock()
+
+    def backoff(self, retries: int) -> float:
+        """재시도 대기 시간 (full jitter, Retry-After 제외)"""
+        return self._rng() * min(self.max_delay, self.base_delay * (2 ** retries))
+
+    def next_delay(
+        self,
+        retries: int,
+        started_at: float,
+        deadline: Optional[float] = None,
+        retry_after: Optional[float] = None
+    ) -> Optional[float]:
+        """
+        다음 재시도 대기 시간
+
+        Args:
+            retries: 지금까지의 재시도 횟수
+            started_at: 요청 시작 시각 (start 반환값)
+            deadline: 요청 기한 (clock 기준, None이면 없음)
+            retry_after: 서버가 알려준 대기 시간 (초, 없으면 None)
+
+        Returns:
+            대기 시간 (초), 재시도하지 않으면 None
+        """
+        if retries >= self.max_retries:
+            self._counters["gave_up_max_retries"] += 1
+            return None
+
+        delay = self.backoff(retries)
+        if retry_after is not None and retry_after > delay:
+            delay = retry_after
+            self._counters["retry_after_used"] += 1
+
+        limit = started_at + self.request_budget_seconds
+        if deadline is not None:
+            limit = min(limit, deadline)
+        if self._clock() + delay >= limit:
+            self._counters["gave_up_request_budget"] += 1
+            return None
+
+        if self.budget is not None and not self.budget.withdraw():
+            self._counters["gave_up_retry_budget"] += 1
+            return None
+
+        self._counters["retries"] += 1
+        self._delay_total += delay
+        return delay
+
+    def allow_resend(self) -> bool:
+        """
+        일괄 요청에서 실패한 항목 1건을 개별 요청으로 다시 보낼지 (대기 없는 재시도 1회)
+
+        Returns:
+            프로세스 재시도 예산이 남아 있으면 True (예산 1개 사용)
+        """
+        if self.budget is not None and not self.budget.withdraw():
+            self._counters["gave_up_retry_budget"] += 1
+            return False
+        self._counters["retries"] += 1
+        return True
+
+    def stats(self) -> Dict:
+        """재시도 통계"""
+        requests = self._counters["requests"]
+        retries = self._counters["retries"]
+        return {
+            "max_retries": self.max_retries,
+            "base_delay": self.base_delay,
+            "max_delay": self.max_delay,
+            **self._counters,
+            # OpenAI 요청 수 / 분류 요청 수 (재시도로 늘어난 배수)
+            "amplification": round((requests + retries) / requests, 4) if requests else 1.0,
+            "avg_delay_seconds": round(self._delay_total / retries, 3) if retries else 0.0,
+            "budget_available": (
+                round(self.budget.available, 2) if self.budget is not None else None
+            ),
+        }
@@ -0,0 +1,65 @@
+"""
+진행 중 작업 공유 (single-flight)
+
+같은 키의 작업이 이미 실행 중이면 새로 실행하지 않고 그 결과를 함께 기다립니다.
+설문 분류에서는 정규화된 응답 키(canonical_key)가 같은 동시 요청
+(프론트엔드 중복 탭/재시도, 인기 응답 조합)이 AI 호출 한 번을 공유합니다.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    키별 진행 중 작업 공유
+
+    작업은 별도 태스크로 실행되므로 먼저 요청한 호출자가 취소되어도
+    함께 기다리는 다른 호출자에게는 영향이 없습니다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        # 실제 실행 횟수 / 진행 중 작업을 공유한 횟수 (= 절약한 호출 수)
+        self.executions = 0
+        self.shared = 0
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        키에 대한 작업 실행 (진행 중이면 결과 공유)
+
+        Args:
+            key: 작업 식별 키
+            func: 작업 코루틴을 만드는 함수 (진행 중 작업이 없을 때만 호출)
+
+        Returns:
+            작업 결과 (예외도 모든 호출자에게 전달)
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(func())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.shared += 1
+            logger.info(f"[{self.name}] 진행 중 작업 공유: key={key}")
+
+        # 호출자 취소가 공유 작업을 취소하지 않도록 보호
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict:
+        """공유 통계"""
+        total = self.executions + self.shared
+        return {
+            "executions": self.executions,
+            "saved_calls": self.shared,
+            "in_flight": len(self._in_flight),
+            "saved_rate": round(self.shared / total, 4) if total else 0.0,
+        }
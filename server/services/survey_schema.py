@@ -0,0 +1,289 @@
+"""
+설문 스키마 (컴파일된 문항/선택지/점수 테이블)
+
+AI 프롬프트 생성, 분류 캐시 키, Fallback 점수 계산이 같은 문항 정의를 사용하도록
+폼 필드(FORM_DATA.md 포맷의 fields) 또는 스키마 파일을 한 번 컴파일해 두고
+요청마다 조회만 합니다.
+
+분류에 쓰는 필드는 FORM_DATA.md의 multiple_choice 필드에 다음 속성을 더한 형식입니다.
+    {
+      "id": "q1",                      # 응답 키는 id에서 "q"를 뺀 값 ("1"), answer_key로 지정 가능
+      "label": "세안 후 피부 상태",      # 프롬프트에 쓰는 질문 (prompt_label로 따로 지정 가능)
+      "options": ["매우 건조하고 당긴다", ...],
+      "option_ids": ["q1a1", ...],     # 응답 값 (없으면 "q{응답 키}a{순번}")
+      "scores": [{"dry": 3}, ...]      # 선택지별 점수 (선택)
+    }
+폼의 fields에 option_ids/scores가 있으면 그 폼 전용 스키마를 컴파일하여
+(폼 ID, 수정 시각) 단위로 캐시하고, 없으면 기본 스키마 파일(test2 설문)을 사용합니다.
+결과 타입 결정 규칙(determine_result_type)과 SYSTEM_PROMPT는 스키마와 별개입니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.ai_config import AIConfig
+
+logger = logging.getLogger(__name__)
+
+# 기본 스키마 파일 (test2 설문)
+DEFAULT_SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data", "surveys", "test2.json"
+)
+
+# 점수 차원 (스키마 파일에 dimensions가 없을 때)
+DEFAULT_DIMENSIONS: Tuple[str, ...] = (
+    "dry", "oily", "sensitive", "normal", "indoor",
+    "outdoor", "active", "minimal", "combination",
+)
+
+# 폼별 컴파일 스키마 캐시 크기
+FORM_SCHEMA_CACHE_SIZE = 64
+
+# 캐시 키 문자: 미응답 / 선택지에 없는 답변 (프롬프트에는 "알 수 없음"으로 표시)
+_MISSING = "-"
+_UNKNOWN = "?"
+_UNKNOWN_ANSWER_TEXT = "알 수 없음"
+
+# 선택지 순번별 캐시 키 문자 (1~9, 10번째부터 a, b, ...): 문항당 최대 선택지 수를 정함
+_OPTION_CODES = "123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def normalize_question_id(question_id: Any) -> str:
+    """응답 키 정규화 ("q1" → "1")"""
+    return str(question_id).replace("q", "")
+
+
+class SurveySchema:
+    """컴파일된 설문 스키마 (불변, 요청 간 공유)"""
+
+    def __init__(self, version: str, fields: List[Dict], dimensions: Tuple[str, ...] = DEFAULT_DIMENSIONS):
+        """
+        Args:
+            version: 스키마 버전 (로그/통계 표시용)
+            fields: 분류용 필드 목록 (order 순으로 정렬됨)
+            dimensions: 점수 차원
+        """
+        self.version = version
+        self.dimensions = tuple(dimensions)
+
+        mapping: Dict[str, Dict] = {}
+        lines: Dict[str, Dict[str, str]] = {}
+        unknown_lines: Dict[str, str] = {}
+        codes: Dict[str, Dict[str, str]] = {}
+        weights: Dict[str, Dict[str, Tuple[Tuple[str, int], ...]]] = {}
+
+        for field in sorted(fields, key=lambda f: f.get("order", 0)):
+            options = field.get("options") or []
+            if not options:
+                continue
+            key = str(field.get("answer_key") or normalize_question_id(field["id"]))
+            label = field.get("prompt_label") or field["label"]
+            option_ids = field.get("option_ids") or [
+                f"q{key}a{i}" for i in range(1, len(options) + 1)
+            ]
+            if len(option_ids) != len(options):
+                raise ValueError(f"문항 {key}: options와 option_ids 개수가 다릅니다")
+            if len(options) > len(_OPTION_CODES):
+                raise ValueError(
+                    f"문항 {key}: 선택지는 최대 {len(_OPTION_CODES)}개까지 지원합니다 ({len(options)}개)"
+                )
+            scores = field.get("scores") or [{}] * len(options)
+            if len(scores) != len(options):
+                raise ValueError(f"문항 {key}: options와 scores 개수가 다릅니다")
+
+            mapping[key] = {"question": label, "answers": dict(zip(option_ids, options))}
+            lines[key] = {
+                option_id: f"- {label}: {text}" for option_id, text in zip(option_ids, options)
+            }
+            unknown_lines[key] = f"- {label}: {_UNKNOWN_ANSWER_TEXT}"
+            codes[key] = {
+                option_id: _OPTION_CODES[index]
+                for index, option_id in enumerate(option_ids)
+            }
+            weights[key] = {
+                option_id: tuple(
+                    (dimension, int(points)) for dimension, points in option_scores.items()
+                    if points
+                )
+                for option_id, option_scores in zip(option_ids, scores)
+            }
+            unknown_dimensions = {
+                dimension for option_scores in scores for dimension in option_scores
+            } - set(self.dimensions)
+            if unknown_dimensions:
+                raise ValueError(f"문항 {key}: 정의되지 않은 점수 차원 {sorted(unknown_dimensions)}")
+
+        if not mapping:
+            raise ValueError("분류에 사용할 선택형 문항이 없습니다")
+
+        self.question_keys: Tuple[str, ...] = tuple(mapping)
+        self.question_mapping = mapping
+        # 점수가 있는 문항과 선택지 ID (Fallback 테이블/일괄 처리의 문항 순서)
+        self.scored_questions: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(
+            (key, tuple(options)) for key, options in weights.items() if any(options.values())
+        )
+        self._lines = lines
+        self._unknown_lines = unknown_lines
+        self._codes = codes
+        self._weights = tuple(weights.items())
+        self.fingerprint = hashlib.sha256(
+            json.dumps(
+                {"mapping": mapping, "weights": weights, "dimensions": self.dimensions},
+                ensure_ascii=False,
+                sort_keys=True
+            ).encode("utf-8")
+        ).hexdigest()[:16]
+
+    @staticmethod
+    def _normalize(answers: Dict[str, str]) -> Dict[str, str]:
+        return {normalize_question_id(q_id): answer_id for q_id, answer_id in answers.items()}
+
+    def format_answers(self, answers: Dict[str, str]) -> List[str]:
+        """
+        설문 응답을 "- 질문: 답변" 형식의 줄 목록으로 변환
+
+        입력 순서와 무관하게 스키마의 문항 순서를 따르며, 미응답 문항은 생략합니다.
+        """
+        normalized = self._normalize(answers)
+        return [
+            self._lines[key].get(normalized[key], self._unknown_lines[key])
+            for key in self.question_keys
+            if key in normalized
+        ]
+
+    def canonical_key(self, answers: Dict[str, str]) -> str:
+        """
+        설문 응답의 정규화 키 (문항당 1글자, 키가 같으면 프롬프트도 같음)
+
+        Returns:
+            예: "22111111233" (미응답 "-", 선택지에 없는 답변 "?")
+        """
+        normalized = self._normalize(answers)
+        return "".join(
+            self._codes[key].get(normalized[key], _UNKNOWN) if key in normalized else _MISSING
+            for key in self.question_keys
+        )
+
+    def calculate_scores(self, answers: Dict[str, str]) -> Dict[str, int]:
+        """
+        선택지별 점수 테이블 조회의 합으로 점수 계산
+
+        Args:
+            answers: {question_id: answer_id} 딕셔너리 (응답 키 그대로 조회)
+
+        Returns:
+            {점수 차원: 점수}
+        """
+        scores = dict.fromkeys(self.dimensions, 0)
+        get_answer = answers.get
+        for key, options in self._weights:
+            for dimension, points in options.get(get_answer(key), ()):
+                scores[dimension] += points
+        return scores
+
+
+def compile_schema(data: Dict, version: Optional[str] = None) -> SurveySchema:
+    """
+    스키마 JSON(또는 FORM_DATA 포맷 폼 데이터) 컴파일
+
+    Args:
+        data: {"version", "dimensions"?, "fields": [...]} 또는 필드 목록
+        version: 버전 (지정하지 않으면 data의 version)
+    """
+    if isinstance(data, list):
+        data = {"fields": data}
+    return SurveySchema(
+        version=version or str(data.get("version", "unversioned")),
+        fields=data.get("fields") or [],
+        dimensions=tuple(data.get("dimensions") or DEFAULT_DIMENSIONS)
+    )
+
+
+def load_schema(path: str) -> SurveySchema:
+    """스키마 파일 로드 및 컴파일"""
+    with open(path, encoding="utf-8") as f:
+        return compile_schema(json.load(f))
+
+
+def _classification_fields(fields: Any) -> Optional[List[Dict]]:
+    """폼 fields 중 분류 속성(option_ids/scores)이 있는 필드 목록 (없으면 None)"""
+    if isinstance(fields, str):
+        try:
+            fields = json.loads(fields)
+        except ValueError:
+            return None
+    if isinstance(fields, dict):
+        fields = fields.get("fields")
+    if not isinstance(fields, list):
+        return None
+    if not any(
+        isinstance(field, dict) and ("option_ids" in field or "scores" in field)
+        for field in fields
+    ):
+        return None
+    return fields
+
+
+# 기본 스키마 / 폼별 스키마 캐시
+_default_schema: Optional[SurveySchema] = None
+_form_schemas: "OrderedDict[Tuple[str, str], SurveySchema]" = OrderedDict()
+
+
+def get_default_schema() -> SurveySchema:
+    """
+    기본 설문 스키마 싱글톤 (SURVEY_SCHEMA_PATH, 미설정 시 test2 설문)
+
+    Returns:
+        SurveySchema
+    """
+    global _default_schema
+    if _default_schema is None:
+        path = AIConfig.SURVEY_SCHEMA_PATH or DEFAULT_SCHEMA_PATH
+        _default_schema = load_schema(path)
+        logger.info(
+            f"[설문 스키마] 기본 스키마 로드: {_default_schema.version} "
+            f"({len(_default_schema.question_keys)}문항, fingerprint={_default_schema.fingerprint})"
+        )
+    return _default_schema
+
+
+def get_form_schema(form: Optional[Dict]) -> SurveySchema:
+    """
+    폼에 맞는 설문 스키마
+
+    폼의 fields에 분류 속성이 있으면 폼 전용 스키마를 (폼 ID, 수정 시각) 단위로
+    컴파일하여 캐시하고, 없거나 컴파일할 수 없으면 기본 스키마를 반환합니다.
+    폼이 수정되면(updated_at 변경) 새 버전으로 다시 컴파일합니다.
+
+    Args:
+        form: forms 테이블 행 (id, fields, updated_at)
+    """
+    if not form:
+        return get_default_schema()
+    fields = _classification_fields(form.get("fields"))
+    if fields is None:
+        return get_default_schema()
+
+    cache_key = (str(form.get("id")), str(form.get("updated_at") or form.get("form_version") or ""))
+    schema = _form_schemas.get(cache_key)
+    if schema is not None:
+        _form_schemas.move_to_end(cache_key)
+        return schema
+
+    try:
+        schema = compile_schema(fields, version=f"form:{cache_key[0]}@{cache_key[1]}")
+    except (KeyError, TypeError, ValueError) as e:
+        # 같은 폼 버전은 다시 컴파일하지 않도록 기본 스키마를 캐시
+        logger.error(f"[설문 스키마] 폼 스키마 컴파일 실패, 기본 스키마 사용 | form_id={cache_key[0]} | {e}")
+        schema = get_default_schema()
+    else:
+        logger.info(f"[설문 스키마] 폼 스키마 컴파일: {schema.version} ({len(schema.question_keys)}문항)")
+
+    _form_schemas[cache_key] = schema
+    if len(_form_schemas) > FORM_SCHEMA_CACHE_SIZE:
+        _form_schemas.popitem(last=False)
+    return schema
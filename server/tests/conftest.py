@@ -0,0 +1,10 @@
+"""
+pytest 공통 설정
+
+server 디렉토리를 import 경로에 추가합니다. (services, config 패키지 import)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,156 @@
+"""
+OpenAI 호출 승인 제어 벤치마크
+
+분당 요청 한도(--provider-rpm)를 초 단위로 적용하는 OpenAI 대역 서버에 한도보다 빠른 속도로
+분류 요청을 보내고, 승인 제어 미사용(한도 없음)과 사용(AI_RATE_LIMIT_RPM = 공급자 한도)을 비교합니다.
+
+- unlimited: 한도를 넘는 요청이 그대로 전송되어 429로 버려지고 Fallback 사용
+- admission: 한도 안에서만 전송, 예산 안에 보낼 수 없는 요청은 전송 없이 Fallback 사용
+
+분류 캐시와 서킷 브레이커는 비활성화하여 승인 제어의 효과만 측정합니다.
+OpenAI SDK 내부 재시도는 끄고(max_retries=0) 429 응답을 그대로 집계합니다.
+
+사용법:
+    python admission_bench.py --rate 30 --duration 5 --provider-rpm 600 --budget 4
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import time
+from collections import Counter
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ai_batch_bench import random_survey, summarize  # noqa: E402
+from fake_openai_server import start_fake_openai  # noqa: E402
+
+
+async def run_mode(classifier, surveys: List[Dict[str, str]], rate: float) -> Dict:
+    """초당 rate개 속도로 classify_with_fallback 호출"""
+    times_ms: List[float] = []
+    sources: Counter = Counter()
+
+    async def one(answers):
+        start = time.perf_counter()
+        _, source, _ = await classifier.classify_with_fallback(answers)
+        times_ms.append((time.perf_counter() - start) * 1000)
+        sources[source] += 1
+
+    start = time.perf_counter()
+    tasks = []
+    for i, answers in enumerate(surveys):
+        delay = start + i / rate - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(one(answers)))
+    await asyncio.gather(*tasks)
+    return {**summarize(times_ms), "sources": dict(sources)}
+
+
+async def bench(args) -> Dict:
+    server, state, base_url = start_fake_openai(
+        latency_ms=args.latency_ms, rpm_limit=args.provider_rpm
+    )
+    os.environ["OPENAI_BASE_URL"] = base_url
+
+    from config.ai_config import AIConfig
+    from services import ai_classifier, classifier
+
+    AIConfig.OPENAI_API_KEY = "fake-key"
+    AIConfig.AI_BATCH_ENABLED = False
+    AIConfig.AI_CACHE_ENABLED = False
+    AIConfig.AI_BREAKER_ENABLED = False
+    AIConfig.AI_MAX_RETRIES = 0
+    AIConfig.AI_LATENCY_BUDGET_SECONDS = args.budget
+
+    rng = random.Random(args.seed)
+    surveys = [random_survey(rng) for _ in range(int(args.rate * args.duration))]
+
+    results = {}
+    modes = (
+        ("unlimited", {"AI_MAX_CONCURRENCY": 256, "AI_RATE_LIMIT_RPM": 0, "AI_RATE_LIMIT_TPM": 0}),
+        ("admission", {"AI_MAX_CONCURRENCY": args.concurrency, "AI_RATE_LIMIT_RPM": args.provider_rpm,
+                       "AI_RATE_LIMIT_TPM": 0}),
+    )
+    for label, overrides in modes:
+        for name, value in overrides.items():
+            setattr(AIConfig, name, value)
+        ai_classifier._classifier_instance = None
+        ai_classifier._admission_instance = None
+        ai_classifier.get_classifier().client = ai_classifier.get_classifier().client.with_options(
+            max_retries=0
+        )
+
+        before = (state.request_count, state.rate_limited_count)
+        results[label] = await run_mode(classifier, surveys, args.rate)
+        # 늦게 끝나는 AI 호출 대기
+        await asyncio.sleep(args.latency_ms / 1000 + 0.5)
+        results[label]["upstream_ok"] = state.request_count - before[0]
+        results[label]["upstream_429"] = state.rate_limited_count - before[1]
+        results[label]["admission"] = ai_classifier.get_admission_stats()
+        # 다음 모드가 같은 초 창에서 시작하지 않도록 대기
+        await asyncio.sleep(1.1)
+
+    server.shutdown()
+    return results
+
+
+def print_report(args, results: Dict) -> None:
+    """결과 출력"""
+    print("=" * 60)
+    print("OpenAI 호출 승인 제어 벤치마크 (classify_with_fallback)")
+    print("=" * 60)
+    print(
+        f"  요청: 초당 {args.rate}건 x {args.duration}s / 공급자 한도: {args.provider_rpm} RPM / "
+        f"대역 서버 지연: {args.latency_ms}ms / 예산: {args.budget}s"
+    )
+    for label in ("unlimited", "admission"):
+        r = results[label]
+        admission = r["admission"]
+        print("-" * 60)
+        print(f"[{label}]")
+        print(
+            f"  평균: {r['avg_ms']:.1f}ms / p50: {r['p50_ms']:.1f}ms / "
+            f"p95: {r['p95_ms']:.1f}ms / 최대: {r['max_ms']:.1f}ms"
+        )
+        print(f"  결과 출처: {r['sources']}")
+        print(f"  업스트림 성공: {r['upstream_ok']} / 429 거절: {r['upstream_429']}")
+        print(
+            f"  승인: {admission['admitted']} / 기한 거절: {admission['rejected_deadline']} / "
+            f"대기열 거절: {admission['rejected_queue_full']} / 평균 승인 대기: {admission['avg_wait_ms']:.1f}ms"
+        )
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI 호출 승인 제어 벤치마크")
+    parser.add_argument("--rate", type=float, default=30, help="초당 요청 수")
+    parser.add_argument("--duration", type=float, default=5, help="요청 발생 시간 (초)")
+    parser.add_argument("--provider-rpm", type=int, default=600, help="대역 서버 분당 요청 한도")
+    parser.add_argument("--latency-ms", type=float, default=300.0, help="OpenAI 대역 서버 지연 (ms)")
+    parser.add_argument("--budget", type=float, default=4.0, help="응답 시간 예산 (초)")
+    parser.add_argument("--concurrency", type=int, default=16, help="승인 제어 동시 요청 수")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--output", help="결과 저장 파일 (JSON)")
+    args = parser.parse_args()
+
+    # 요청별 분류/429 에러 로그 숨김
+    logging.disable(logging.CRITICAL)
+
+    results = asyncio.run(bench(args))
+    print_report(args, results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
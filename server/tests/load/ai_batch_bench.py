@@ -0,0 +1,169 @@
+"""
+AI 분류 마이크로 배칭 벤치마크
+
+로컬 OpenAI 대역 서버(fake_openai_server.py)를 대상으로 초당 일정 개수의 분류 요청을 보내
+개별 요청(single)과 마이크로 배칭(batch)의 지연 시간, 처리량, 업스트림 요청 수를 비교합니다.
+분류 캐시는 비활성화하여 모든 요청이 AI 호출을 거치도록 합니다.
+
+사용법:
+    python ai_batch_bench.py --rate 50 --duration 5 --latency-ms 300 --max-concurrency 8
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, SERVER_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_openai_server import start_fake_openai  # noqa: E402
+
+QUESTION_OPTIONS = [("100", ["gender_male", "gender_female"]),
+                    ("101", ["age_10s", "age_20s", "age_30s", "age_40s", "age_50p"])] + [
+    (str(q), [f"q{q}a{i}" for i in range(1, (5 if q == 1 else 4) + 1)]) for q in range(1, 11)
+]
+
+
+def random_survey(rng: random.Random) -> Dict[str, str]:
+    """무작위 설문 응답"""
+    return {question_id: rng.choice(options) for question_id, options in QUESTION_OPTIONS}
+
+
+def summarize(times_ms: List[float]) -> Dict:
+    """응답 시간 통계"""
+    ordered = sorted(times_ms)
+    return {
+        "avg_ms": statistics.mean(ordered),
+        "p50_ms": ordered[int(len(ordered) * 0.50)],
+        "p95_ms": ordered[int(len(ordered) * 0.95)],
+        "max_ms": ordered[-1],
+    }
+
+
+async def run_mode(ai_classifier, surveys: List[Dict[str, str]], rate: float) -> Dict:
+    """초당 rate개 속도로 분류 요청을 보내고 결과 수집"""
+    times_ms: List[float] = []
+    labels: List[str] = [None] * len(surveys)
+    errors = 0
+
+    async def one(i: int):
+        nonlocal errors
+        start = time.perf_counter()
+        result_type, _ = await ai_classifier.classify_skin_type(surveys[i])
+        times_ms.append((time.perf_counter() - start) * 1000)
+        labels[i] = result_type
+        if not result_type:
+            errors += 1
+
+    start = time.perf_counter()
+    tasks = []
+    for i in range(len(surveys)):
+        # 도착 시각까지 대기 (일정 속도로 요청 발생)
+        delay = start + i / rate - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(one(i)))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+
+    return {
+        **summarize(times_ms),
+        "throughput_rps": len(surveys) / elapsed,
+        "errors": errors,
+        "labels": labels,
+    }
+
+
+async def bench(args) -> Dict:
+    server, state, base_url = start_fake_openai(
+        latency_ms=args.latency_ms, max_concurrency=args.max_concurrency
+    )
+    os.environ["OPENAI_BASE_URL"] = base_url
+
+    from config.ai_config import AIConfig
+    from services import ai_classifier
+
+    AIConfig.OPENAI_API_KEY = "fake-key"
+    AIConfig.AI_BATCH_WINDOW_MS = args.window_ms
+    AIConfig.AI_BATCH_MAX_SIZE = args.max_batch
+
+    rng = random.Random(args.seed)
+    surveys = [random_survey(rng) for _ in range(int(args.rate * args.duration))]
+
+    results = {}
+    for label, batch_enabled in (("single", False), ("batch", True)):
+        AIConfig.AI_BATCH_ENABLED = batch_enabled
+        ai_classifier._classifier_instance = None
+        ai_classifier._batcher_instance = None
+
+        before = (state.request_count, state.prompt_chars)
+        results[label] = await run_mode(ai_classifier, surveys, args.rate)
+        results[label]["upstream_requests"] = state.request_count - before[0]
+        results[label]["prompt_chars"] = state.prompt_chars - before[1]
+
+    results["label_mismatches"] = sum(
+        1 for a, b in zip(results["single"].pop("labels"), results["batch"].pop("labels")) if a != b
+    )
+    server.shutdown()
+    return results
+
+
+def print_report(args, results: Dict) -> None:
+    """결과 출력"""
+    print("=" * 60)
+    print("AI 분류 마이크로 배칭 벤치마크")
+    print("=" * 60)
+    print(
+        f"  요청: 초당 {args.rate}건 x {args.duration}s / 대역 서버 지연: {args.latency_ms}ms / "
+        f"동시 처리 제한: {args.max_concurrency or '없음'}"
+    )
+    print(f"  배치: 대기 {args.window_ms}ms / 최대 {args.max_batch}건")
+    for label in ("single", "batch"):
+        r = results[label]
+        print("-" * 60)
+        print(f"[{label}]")
+        print(
+            f"  평균: {r['avg_ms']:.1f}ms / p50: {r['p50_ms']:.1f}ms / "
+            f"p95: {r['p95_ms']:.1f}ms / 최대: {r['max_ms']:.1f}ms"
+        )
+        print(f"  처리량: {r['throughput_rps']:.1f} req/s / 실패: {r['errors']}")
+        print(f"  업스트림 요청 수: {r['upstream_requests']} / 프롬프트 문자 수: {r['prompt_chars']:,}")
+    print("-" * 60)
+    print(f"  single/batch 결과 불일치: {results['label_mismatches']}건")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AI 분류 마이크로 배칭 벤치마크")
+    parser.add_argument("--rate", type=float, default=50, help="초당 요청 수")
+    parser.add_argument("--duration", type=float, default=5, help="요청 발생 시간 (초)")
+    parser.add_argument("--latency-ms", type=float, default=300.0, help="OpenAI 대역 서버 지연 (ms)")
+    parser.add_argument("--max-concurrency", type=int, default=8, help="대역 서버 동시 처리 제한 (0: 무제한)")
+    parser.add_argument("--window-ms", type=float, default=20.0, help="배치 대기 시간 (ms)")
+    parser.add_argument("--max-batch", type=int, default=16, help="배치 최대 크기")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--output", help="결과 저장 파일 (JSON)")
+    args = parser.parse_args()
+
+    # 요청별 분류 로그 숨김
+    logging.disable(logging.WARNING)
+
+    results = asyncio.run(bench(args))
+    print_report(args, results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+백그라운드 AI 분류 벤치마크
+
+/api/survey/analyze 응답 시간을 동기 AI 분류(AI 결과까지 대기)와
+백그라운드 AI 분류(AI_BACKGROUND_ENABLED, Fallback 결과로 즉시 응답)로 비교합니다.
+백그라운드 모드에서는 작업이 모두 끝난 뒤 저장된 결과가 AI 결과(ai_status=done)로
+갱신되었는지, 재제출된 응답이 이전 작업의 결과로 덮어써지지 않는지 확인합니다.
+
+Supabase/OpenAI는 로컬 대역 서버(fake_supabase_server.py, fake_openai_server.py)로 대체합니다.
+
+사용법:
+    python background_ai_bench.py --requests 100 --latency-ms 1500 --workers 8
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import time
+import uuid
+from collections import Counter
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ai_batch_bench import random_survey, summarize  # noqa: E402
+from fake_openai_server import start_fake_openai  # noqa: E402
+from fake_supabase_server import start_fake_supabase  # noqa: E402
+from form_cache_bench import load_survey_analyzer  # noqa: E402
+
+
+async def run_mode(survey_analyzer, surveys: List[Dict[str, str]]) -> Dict:
+    """동시 분석 요청의 응답 시간과 응답 ai_status 수집"""
+    times_ms: List[float] = []
+    statuses: Counter = Counter()
+    member_ids: List[str] = []
+
+    async def one(answers):
+        member_id = str(uuid.uuid4())
+        member_ids.append(member_id)
+        request = survey_analyzer.SurveyRequest(
+            member_id=member_id, share_url="test/2", responses=answers
+        )
+        start = time.perf_counter()
+        response = await survey_analyzer.analyze_survey(request)
+        times_ms.append((time.perf_counter() - start) * 1000)
+        statuses[response.data.get("ai_status") or response.data["source"]] += 1
+
+    await asyncio.gather(*(one(answers) for answers in surveys))
+    return {**summarize(times_ms), "response_status": dict(statuses), "member_ids": member_ids}
+
+
+async def wait_idle(background, timeout: float) -> float:
+    """백그라운드 작업이 모두 끝날 때까지 대기 (소요 시간 반환)"""
+    start = time.perf_counter()
+    while background.pending_jobs() and time.perf_counter() - start < timeout:
+        await asyncio.sleep(0.05)
+    return time.perf_counter() - start
+
+
+async def bench(args) -> Dict:
+    supabase_server, supabase_state, supabase_url = start_fake_supabase(latency_ms=args.db_latency_ms)
+    openai_server, openai_state, openai_url = start_fake_openai(latency_ms=args.latency_ms)
+    os.environ["SUPABASE_URL"] = supabase_url
+    os.environ["SUPABASE_KEY"] = "fake-key"
+    os.environ["OPENAI_BASE_URL"] = openai_url
+
+    from config.ai_config import AIConfig
+    from db.supabase_client import SupabaseConfig
+    from services import background_classifier, classification_cache
+
+    SupabaseConfig.SUPABASE_URL = supabase_url
+    SupabaseConfig.SUPABASE_KEY = "fake-key"
+    AIConfig.OPENAI_API_KEY = "fake-key"
+    AIConfig.AI_BATCH_ENABLED = False
+    AIConfig.AI_LATENCY_BUDGET_SECONDS = 0
+    AIConfig.AI_BACKGROUND_WORKERS = args.workers
+    survey_analyzer = load_survey_analyzer()
+
+    rng = random.Random(args.seed)
+    results = {}
+    for label, background_enabled in (("sync", False), ("background", True)):
+        AIConfig.AI_BACKGROUND_ENABLED = background_enabled
+        # 모드마다 빈 분류 캐시로 시작 (메모리 전용)
+        AIConfig.AI_CACHE_DB_PATH = ""
+        classification_cache._classification_cache = None
+        background_classifier._background_classifier = None
+
+        surveys = [random_survey(rng) for _ in range(args.requests)]
+        results[label] = await run_mode(survey_analyzer, surveys)
+
+        if background_enabled:
+            background = background_classifier.get_background_classifier()
+
+            # 작업 처리 중 재제출: 이전 작업의 결과가 새 응답을 덮어쓰면 안 됨
+            resubmit_id = results[label]["member_ids"][0]
+            resubmitted = random_survey(rng)
+            await survey_analyzer.analyze_survey(survey_analyzer.SurveyRequest(
+                member_id=resubmit_id, share_url="test/2", responses=resubmitted
+            ))
+
+            results[label]["drain_seconds"] = await wait_idle(background, args.timeout)
+            stored = [
+                row["responses"]
+                for (member_id, _), row in supabase_state.responses.items()
+                if member_id in set(results[label]["member_ids"])
+            ]
+            results[label]["stored_status"] = dict(Counter(
+                r["result"].get("ai_status") for r in stored
+            ))
+            resubmit_row = next(
+                row["responses"] for (member_id, _), row in supabase_state.responses.items()
+                if member_id == resubmit_id
+            )
+            results[label]["resubmit_kept"] = all(
+                resubmit_row.get(k) == v for k, v in resubmitted.items()
+            )
+            results[label]["background_stats"] = background.stats()
+            await background.stop()
+        results[label].pop("member_ids")
+
+    supabase_server.shutdown()
+    openai_server.shutdown()
+    return results
+
+
+def print_report(args, results: Dict) -> None:
+    """결과 출력"""
+    print("=" * 60)
+    print("백그라운드 AI 분류 벤치마크 (/api/survey/analyze)")
+    print("=" * 60)
+    print(
+        f"  동시 요청: {args.requests} / OpenAI 대역 서버 지연: {args.latency_ms}ms / "
+        f"Supabase 대역 서버 지연: {args.db_latency_ms}ms"
+    )
+    for label in ("sync", "background"):
+        r = results[label]
+        print("-" * 60)
+        print(f"[{label}]")
+        print(
+            f"  평균: {r['avg_ms']:.1f}ms / p50: {r['p50_ms']:.1f}ms / "
+            f"p95: {r['p95_ms']:.1f}ms / 최대: {r['max_ms']:.1f}ms"
+        )
+        print(f"  응답 상태: {r['response_status']}")
+        if "background_stats" in r:
+            stats = r["background_stats"]
+            print(f"  작업 완료까지: {r['drain_seconds']:.2f}s (작업자 {stats['workers']}개)")
+            print(f"  저장된 결과 상태: {r['stored_status']}")
+            print(
+                f"  완료: {stats['completed']} / 실패: {stats['failed']} / "
+                f"재제출로 생략: {stats['superseded']} / 재시도: {stats['retries']}"
+            )
+            print(
+                f"  큐 대기 평균: {stats['avg_queue_wait_ms']:.1f}ms / "
+                f"최대: {stats['max_queue_wait_ms']:.1f}ms"
+            )
+            print(f"  재제출 응답 유지: {'예' if r['resubmit_kept'] else '아니오'}")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="백그라운드 AI 분류 벤치마크")
+    parser.add_argument("--requests", type=int, default=100, help="동시 요청 수")
+    parser.add_argument("--latency-ms", type=float, default=1500.0, help="OpenAI 대역 서버 지연 (ms)")
+    parser.add_argument("--db-latency-ms", type=float, default=20.0, help="Supabase 대역 서버 지연 (ms)")
+    parser.add_argument("--workers", type=int, default=8, help="백그라운드 작업자 수")
+    parser.add_argument("--timeout", type=float, default=120.0, help="작업 완료 대기 상한 (초)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--output", help="결과 저장 파일 (JSON)")
+    args = parser.parse_args()
+
+    # 요청별 분류 로그 숨김
+    logging.disable(logging.WARNING)
+
+    results = asyncio.run(bench(args))
+    print_report(args, results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+설문 덤프 일괄 분류 벤치마크 (services/bulk_classify.py)
+
+무작위 설문 덤프(CSV / NDJSON)를 만들어 일괄 분류 처리량(초당 행 수)을 측정하고,
+중간에 끊긴 실행(--max-rows로 절반만 분류 + 마지막 청크가 일부만 쓰인 상태 흉내)을
+이어서 분류한 결과가 한 번에 분류한 결과와 같은지 확인합니다.
+
+--ai-rows를 지정하면 OpenAI 대역 서버를 상대로 AI 경로(--concurrency 동시 분류)의 처리량도 측정합니다.
+
+사용법:
+    python bulk_classify_bench.py --rows 200000
+    python bulk_classify_bench.py --rows 200000 --ai-rows 2000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+from typing import Dict
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ai_batch_bench import random_survey  # noqa: E402
+from fake_openai_server import start_fake_openai  # noqa: E402
+
+FORMATS = ("csv", "ndjson")
+
+
+def write_dump(path: str, dump_format: str, rows: int, seed: int) -> None:
+    """무작위 설문 덤프 작성 (CSV는 "q1" 열, NDJSON은 form_responses 행 형식)"""
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        if dump_format == "csv":
+            writer = None
+            for i in range(rows):
+                answers = {f"q{q_id}": answer for q_id, answer in random_survey(rng).items()}
+                if writer is None:
+                    writer = csv.DictWriter(f, fieldnames=["id", *answers])
+                    writer.writeheader()
+                writer.writerow({"id": f"r{i}", **answers})
+        else:
+            for i in range(rows):
+                f.write(json.dumps({"id": f"r{i}", "responses": random_survey(rng)}) + "\n")
+
+
+async def bench(args, workdir: str) -> Dict:
+    from services.bulk_classify import bulk_classify
+
+    results = {}
+    for dump_format in FORMATS:
+        dump_path = os.path.join(workdir, f"dump.{dump_format}")
+        write_dump(dump_path, dump_format, args.rows, args.seed)
+
+        # 한 번에 분류
+        full_path = os.path.join(workdir, f"full.{dump_format}")
+        full = await bulk_classify(dump_path, full_path, restart=True)
+
+        # 절반에서 중단 → 쓰다 만 청크 흉내 → 이어서 분류
+        resumed_path = os.path.join(workdir, f"resumed.{dump_format}")
+        await bulk_classify(dump_path, resumed_path, restart=True, max_rows=args.rows // 2)
+        with open(resumed_path, "ab") as f:
+            f.write(b'{"row": 0, "partial')
+        resumed = await bulk_classify(dump_path, resumed_path)
+
+        with open(full_path, "rb") as a, open(resumed_path, "rb") as b:
+            identical = a.read() == b.read()
+        results[dump_format] = {
+            "full": full,
+            "resumed": resumed,
+            "resume_identical": identical,
+        }
+
+    if args.ai_rows:
+        server, state, base_url = start_fake_openai(latency_ms=args.latency_ms)
+        os.environ["OPENAI_BASE_URL"] = base_url
+
+        from config.ai_config import AIConfig
+
+        AIConfig.OPENAI_API_KEY = "fake-key"
+        AIConfig.AI_CACHE_ENABLED = False
+        AIConfig.AI_BREAKER_ENABLED = False
+        AIConfig.AI_MAX_CONCURRENCY = 256
+
+        dump_path = os.path.join(workdir, "ai_dump.ndjson")
+        write_dump(dump_path, "ndjson", args.ai_rows, args.seed + 1)
+        results["ai"] = await bulk_classify(
+            dump_path, os.path.join(workdir, "ai.ndjson"),
+            use_ai=True, concurrency=args.concurrency, restart=True
+        )
+        results["ai"]["upstream_requests"] = state.request_count
+        server.shutdown()
+
+    return results
+
+
+def print_report(args, results: Dict) -> None:
+    """결과 출력"""
+    print("=" * 60)
+    print("설문 덤프 일괄 분류 벤치마크")
+    print("=" * 60)
+    for dump_format in FORMATS:
+        r = results[dump_format]
+        print(f"[{dump_format}] {args.rows}행")
+        print(
+            f"  Fallback: {r['full']['elapsed_seconds']}s / 초당 {r['full']['rows_per_second']:,.0f}행"
+        )
+        print(
+            f"  이어서 분류: {r['resumed']['resumed_from']}행 건너뜀, {r['resumed']['new_rows']}행 분류 / "
+            f"한 번에 분류한 결과와 {'동일 ✅' if r['resume_identical'] else '다름 ❌'}"
+        )
+    if "ai" in results:
+        r = results["ai"]
+        print("-" * 60)
+        print(f"[ai] {args.ai_rows}행 / 동시 {args.concurrency} / 대역 서버 지연 {args.latency_ms}ms")
+        print(
+            f"  {r['elapsed_seconds']}s / 초당 {r['rows_per_second']:,.0f}행 / 출처 {r['sources']} / "
+            f"업스트림 요청 {r['upstream_requests']}"
+        )
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="설문 덤프 일괄 분류 벤치마크")
+    parser.add_argument("--rows", type=int, default=200000, help="Fallback 덤프 행 수")
+    parser.add_argument("--ai-rows", type=int, default=0, help="AI 경로 덤프 행 수 (0이면 측정 안 함)")
+    parser.add_argument("--concurrency", type=int, default=64, help="AI 동시 분류 수")
+    parser.add_argument("--latency-ms", type=float, default=300.0, help="OpenAI 대역 서버 지연 (ms)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--output", help="결과 저장 파일 (JSON)")
+    args = parser.parse_args()
+
+    # 요청별 분류 로그 숨김
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        results = asyncio.run(bench(args, workdir))
+    print_report(args, results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+추첨 샘플러 벤치마크
+
+100만 명 규모에서 기존 방식(매 추첨마다 추첨 가능 목록 생성 + random.sample)과
+DrawNumberSampler(Fenwick 트리 + 비트셋)의 등록/추첨/리셋 시간과 메모리를 비교합니다.
+
+사용법:
+    python draw_sampler_bench.py --participants 1000000 --draws 100
+    python draw_sampler_bench.py --participants 1000000 --output results/sampler.json
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import random
+import statistics
+import time
+import tracemalloc
+from typing import Dict, List
+
+# services/__init__.py를 거치지 않고 샘플러 모듈만 직접 로드 (FastAPI 의존성 회피)
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+spec = importlib.util.spec_from_file_location(
+    "draw_sampler",
+    os.path.join(SERVER_DIR, "services", "draw_sampler.py")
+)
+draw_sampler = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(draw_sampler)
+DrawNumberSampler = draw_sampler.DrawNumberSampler
+
+
+# ============================================================
+# 벤치마크
+# ============================================================
+
+def bench_baseline(participants: int, draws: int, winners_per_draw: int) -> Dict:
+    """기존 방식: 매 추첨마다 당첨자 set + 추첨 가능 list 생성 후 random.sample"""
+    numbers = list(range(1, participants + 1))
+    won: List[int] = []
+    draw_times_ms: List[float] = []
+
+    tracemalloc.start()
+    for _ in range(draws):
+        start = time.perf_counter()
+        existing_winners = set(won)
+        available = [n for n in numbers if n not in existing_winners]
+        won.extend(random.sample(available, winners_per_draw))
+        draw_times_ms.append((time.perf_counter() - start) * 1000)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "draw_avg_ms": statistics.mean(draw_times_ms),
+        "draw_max_ms": max(draw_times_ms),
+        "draw_peak_mb": peak / 1024 / 1024,
+    }
+
+
+def bench_sampler(participants: int, draws: int, winners_per_draw: int) -> Dict:
+    """DrawNumberSampler: 등록 O(log n), 추첨 O(k log n), 리셋 O(w log n)"""
+    start = time.perf_counter()
+    sampler = DrawNumberSampler()
+    for number in range(1, participants + 1):
+        sampler.add(number)
+    register_s = time.perf_counter() - start
+    structure_mb = (
+        sampler._tree.itemsize * len(sampler._tree)
+        + len(sampler._registered) + len(sampler._won)
+    ) / 1024 / 1024
+
+    tracemalloc.start()
+
+    draw_times_ms: List[float] = []
+    for _ in range(draws):
+        start = time.perf_counter()
+        for number in sampler.sample(winners_per_draw):
+            sampler.mark_won(number)
+        draw_times_ms.append((time.perf_counter() - start) * 1000)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    sampler.reset_winners()
+    reset_ms = (time.perf_counter() - start) * 1000
+
+    return {
+        "register_total_s": register_s,
+        "register_per_op_us": register_s / participants * 1_000_000,
+        "structure_mb": structure_mb,
+        "draw_avg_ms": statistics.mean(draw_times_ms),
+        "draw_max_ms": max(draw_times_ms),
+        "draw_peak_mb": peak / 1024 / 1024,
+        "reset_ms": reset_ms,
+    }
+
+
+def print_report(args, baseline: Dict, sampler: Dict) -> None:
+    """결과 출력"""
+    print("=" * 60)
+    print("추첨 샘플러 벤치마크 결과")
+    print("=" * 60)
+    print(f"  참가자 수: {args.participants:,}")
+    print(f"  추첨 횟수: {args.draws} (회당 {args.winners}명)")
+    print("-" * 60)
+    print("[기존 방식] list 생성 + random.sample")
+    print(f"  추첨 평균: {baseline['draw_avg_ms']:.2f}ms / 최대: {baseline['draw_max_ms']:.2f}ms")
+    print(f"  추첨 중 최대 메모리: {baseline['draw_peak_mb']:.1f}MB")
+    print("-" * 60)
+    print("[DrawNumberSampler] Fenwick 트리 + 비트셋")
+    print(
+        f"  등록: 총 {sampler['register_total_s']:.2f}s "
+        f"({sampler['register_per_op_us']:.2f}µs/건)"
+    )
+    print(f"  자료구조 메모리: {sampler['structure_mb']:.1f}MB")
+    print(f"  추첨 평균: {sampler['draw_avg_ms']:.3f}ms / 최대: {sampler['draw_max_ms']:.3f}ms")
+    print(f"  추첨 중 추가 메모리: {sampler['draw_peak_mb']:.3f}MB")
+    print(f"  당첨 이력 리셋: {sampler['reset_ms']:.3f}ms")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="추첨 샘플러 벤치마크")
+    parser.add_argument("--participants", type=int, default=1_000_000, help="참가자 수")
+    parser.add_argument("--draws", type=int, default=100, help="추첨 횟수")
+    parser.add_argument("--winners", type=int, default=1, help="추첨당 당첨자 수")
+    parser.add_argument(
+        "--baseline-draws", type=int, default=10,
+        help="기존 방식 추첨 횟수 (느리므로 별도 지정)"
+    )
+    parser.add_argument("--output", help="결과 저장 파일 (JSON)")
+
+    args = parser.parse_args()
+
+    print("기존 방식 측정 중...")
+    baseline = bench_baseline(args.participants, args.baseline_draws, args.winners)
+    print("DrawNumberSampler 측정 중...")
+    sampler = bench_sampler(args.participants, args.draws, args.winners)
+
+    print_report(args, baseline, sampler)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {"args": vars(args), "baseline": baseline, "sampler": sampler},
+                f, indent=2, ensure_ascii=False
+            )
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
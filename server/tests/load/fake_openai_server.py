@@ -0,0 +1,357 @@
+"""
+OpenAI Chat Completions 대역 서버
+
+부하 테스트/벤치마크에서 실제 OpenAI API 대신 사용하는 로컬 HTTP 서버입니다.
+POST /v1/chat/completions와 GET /v1/models(연결 사전 생성용)를 지원하며,
+요청마다 지정한 지연 시간을 적용합니다.
+
+- 단일 분류 요청: 결과 타입 키 하나를 반환
+- 일괄 분류 요청("### 설문 N" 섹션 포함): 결과 타입 키의 JSON 배열을 반환
+- 결과 타입은 설문 내용의 해시로 정해지므로 같은 응답에는 항상 같은 결과를 반환
+  (start_fake_openai의 label_fn으로 설문 응답 줄 → 결과 타입 규칙을 바꿀 수 있음)
+- --max-concurrency로 동시 처리 수를 제한하여 업스트림 처리량 한계를 흉내 낼 수 있음
+- --rpm-limit으로 분당 요청 한도를 초 단위로 적용 (초과 시 429 + Retry-After)
+- 응답 형식 옵션 흉내: response_format(json_schema)이면 {"type"}/{"types"} JSON,
+  logit_bias가 있으면 결과 타입 번호(1~8) 문자열을 반환
+- --chatty-rate 비율의 자유 텍스트 단일 분류 응답에 설명을 덧붙임 (절반은 결과 타입 키를 바꿔 써서 유효하지 않음)
+- --fail-rate 비율의 요청에 --fail-status(기본 503) 오류를 지연 없이 반환 (장애 흉내)
+- --connect-latency-ms로 새 연결마다 지연을 적용 (TCP/TLS 연결 비용 흉내, 연결 재사용 시에는 없음)
+- --latency-jitter-ms: 요청마다 평균이 이 값인 지수 분포 추가 지연 (꼬리 지연 흉내)
+- --hang-rate 비율의 요청은 --hang-seconds 동안 응답하지 않음 (클라이언트 타임아웃 흉내)
+- --seed를 지정하면 오류/지연/응답 변형이 같은 난수열을 따름 (요청 순서가 같으면 같은 결과)
+
+사용법:
+    python fake_openai_server.py --port 18080 --latency-ms 300
+    # 서버 설정: OPENAI_BASE_URL=http://127.0.0.1:18080/v1 OPENAI_API_KEY=fake-key
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List, Optional, Tuple
+
+RESULT_TYPES = [
+    "office_thirst", "city_routine", "post_workout", "minimal_routine",
+    "screen_fatigue", "sensitive_fragile", "urban_explorer", "active_energetic",
+]
+
+_SECTION_PATTERN = re.compile(r"^### 설문 \d+\n", re.MULTILINE)
+
+
+class FakeOpenAIState:
+    """대역 서버 상태 (스레드 안전)"""
+
+    def __init__(
+        self,
+        latency_ms: float,
+        max_concurrency: int = 0,
+        rpm_limit: int = 0,
+        label_fn: Optional[Callable[[str], str]] = None,
+        fail_rate: float = 0.0,
+        fail_status: int = 503,
+        chatty_rate: float = 0.0,
+        connect_latency_ms: float = 0.0,
+        latency_jitter_ms: float = 0.0,
+        hang_rate: float = 0.0,
+        hang_seconds: float = 60.0,
+        seed: Optional[int] = None
+    ):
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.hang_rate = hang_rate
+        self.hang_seconds = hang_seconds
+        self.hung_count = 0
+        self.rng = random.Random(seed)
+        self.connect_latency_ms = connect_latency_ms
+        self.connection_count = 0
+        self.chatty_rate = chatty_rate
+        self.rpm_limit = rpm_limit
+        self.label_fn = label_fn or label_for
+        # 실행 중 바꿀 수 있음 (장애 시작/복구)
+        self.fail_rate = fail_rate
+        self.fail_status = fail_status
+        self.request_count = 0
+        self.rate_limited_count = 0
+        self.failed_count = 0
+        # 리스트를 넣으면 모든 요청의 도착 시각(time.monotonic) 기록
+        self.arrivals: Optional[List[float]] = None
+        self._window_second = 0
+        self._window_count = 0
+        self.item_count = 0
+        self.prompt_chars = 0
+        self.lock = threading.Lock()
+        # 0이면 동시 처리 수 제한 없음
+        self.slots = threading.Semaphore(max_concurrency) if max_concurrency > 0 else None
+
+    def over_rate_limit(self) -> bool:
+        """분당 한도를 초 단위(rpm_limit / 60)로 적용했을 때 이번 요청이 한도를 넘는지"""
+        if self.rpm_limit <= 0:
+            return False
+        with self.lock:
+            second = int(time.time())
+            if second != self._window_second:
+                self._window_second, self._window_count = second, 0
+            self._window_count += 1
+            if self._window_count > max(1, self.rpm_limit // 60):
+                self.rate_limited_count += 1
+                return True
+            return False
+
+    def should_fail(self) -> bool:
+        """이번 요청에 장애 오류를 반환할지 (도착 시각도 기록)"""
+        with self.lock:
+            if self.arrivals is not None:
+                self.arrivals.append(time.monotonic())
+            if self.fail_rate > 0 and self.rng.random() < self.fail_rate:
+                self.failed_count += 1
+                return True
+            return False
+
+    def response_delay(self) -> float:
+        """이번 요청의 응답 지연 (초, 지터와 무응답 포함)"""
+        with self.lock:
+            if self.hang_rate > 0 and self.rng.random() < self.hang_rate:
+                self.hung_count += 1
+                return self.hang_seconds
+            jitter = self.rng.expovariate(1 / self.latency_jitter_ms) if self.latency_jitter_ms > 0 else 0.0
+        return (self.latency_ms + jitter) / 1000
+
+
+def label_for(text: str) -> str:
+    """설문 응답 줄("- 질문: 답변")로 결정되는 결과 타입 (단일/일괄 요청에서 동일)"""
+    answer_lines = [line for line in text.splitlines() if line.startswith("- ")]
+    digest = hashlib.sha256("\n".join(answer_lines).encode("utf-8")).digest()
+    return RESULT_TYPES[digest[0] % len(RESULT_TYPES)]
+
+
+def chatty_answer(label: str, rng: Optional[random.Random] = None) -> str:
+    """설명을 덧붙인 자유 텍스트 응답 (절반은 결과 타입 키를 바꿔 써서 추출 불가)"""
+    if (rng or random).random() < 0.5:
+        return f"Response: {label}"
+    return f"Based on the answers, the best fit is the {label.replace('_', ' ').title()} type."
+
+
+def answer_for(
+    user_content: str,
+    label_fn: Callable[[str], str] = label_for,
+    request: Optional[dict] = None,
+    chatty_rate: float = 0.0,
+    rng: Optional[random.Random] = None
+) -> Tuple[str, int]:
+    """
+    사용자 메시지에 대한 응답 텍스트와 설문 수
+
+    Args:
+        request: 요청 본문 (response_format/logit_bias 응답 형식 흉내)
+        chatty_rate: 자유 텍스트 단일 분류 응답에 설명을 덧붙일 비율
+        rng: 응답 변형에 쓸 난수 생성기 (None이면 random 모듈)
+
+    Returns:
+        (응답 텍스트, 설문 수)
+    """
+    request = request or {}
+    sections: List[str] = _SECTION_PATTERN.split(user_content)[1:]
+    batch = bool(sections)
+    labels = [label_fn(section) for section in sections] if batch else [label_fn(user_content)]
+
+    if (request.get("response_format") or {}).get("type") == "json_schema":
+        body = {"types": labels} if batch else {"type": labels[0]}
+        return json.dumps(body), len(labels)
+    if request.get("logit_bias"):
+        return "".join(str(RESULT_TYPES.index(label) + 1) for label in labels), len(labels)
+    if batch:
+        return json.dumps(labels), len(labels)
+    rng = rng or random
+    if chatty_rate > 0 and rng.random() < chatty_rate:
+        return chatty_answer(labels[0], rng), 1
+    return labels[0], 1
+
+
+class FakeOpenAIServer(ThreadingHTTPServer):
+    """동시 연결이 많아도 연결을 거절하지 않도록 listen 대기열을 늘린 서버 (기본값 5)"""
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+def make_handler(state: FakeOpenAIState):
+    """상태를 공유하는 요청 핸들러 클래스 생성"""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def setup(self):
+            super().setup()
+            # 새 연결 (keep-alive 연결의 이후 요청은 이 단계를 거치지 않음)
+            with state.lock:
+                state.connection_count += 1
+            if state.connect_latency_ms > 0:
+                time.sleep(state.connect_latency_ms / 1000)
+
+        def _send(self, status: int, body, headers=None) -> None:
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            if not self.path.endswith("/models"):
+                self._send(404, {"error": {"message": f"unknown path: {self.path}"}})
+                return
+            self._send(200, {"object": "list", "data": [
+                {"id": "gpt-4o-mini", "object": "model", "created": 0, "owned_by": "fake"},
+            ]})
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(length) or b"{}")
+            if not self.path.endswith("/chat/completions"):
+                self._send(404, {"error": {"message": f"unknown path: {self.path}"}})
+                return
+
+            messages = body.get("messages", [])
+            user_content = next(
+                (m["content"] for m in reversed(messages) if m.get("role") == "user"), ""
+            )
+            prompt_chars = sum(len(m.get("content", "")) for m in messages)
+            content, items = answer_for(
+                user_content, state.label_fn, body, state.chatty_rate, state.rng
+            )
+
+            if state.should_fail():
+                self._send(state.fail_status, {"error": {
+                    "message": "The server is temporarily unavailable",
+                    "type": "server_error",
+                    "code": None,
+                }}, headers={"retry-after": "1"} if state.fail_status == 429 else None)
+                return
+
+            if state.over_rate_limit():
+                self._send(429, {"error": {
+                    "message": "Rate limit reached for requests",
+                    "type": "requests",
+                    "code": "rate_limit_exceeded",
+                }}, headers={"retry-after": "1"})
+                return
+
+            if state.slots:
+                state.slots.acquire()
+            try:
+                time.sleep(state.response_delay())
+            finally:
+                if state.slots:
+                    state.slots.release()
+
+            with state.lock:
+                state.request_count += 1
+                state.item_count += items
+                state.prompt_chars += prompt_chars
+
+            # 숫자 코드는 글자당 1토큰, 그 외는 3글자당 1토큰으로 근사
+            completion_tokens = len(content) if body.get("logit_bias") else len(content) // 3 + 1
+            self._send(200, {
+                "id": f"chatcmpl-{uuid.uuid4().hex}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body.get("model", "fake"),
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }],
+                "usage": {
+                    "prompt_tokens": prompt_chars // 2,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_chars // 2 + completion_tokens,
+                },
+            })
+
+    return Handler
+
+
+def start_fake_openai(
+    port: int = 0,
+    latency_ms: float = 300.0,
+    max_concurrency: int = 0,
+    rpm_limit: int = 0,
+    label_fn: Optional[Callable[[str], str]] = None,
+    fail_rate: float = 0.0,
+    fail_status: int = 503,
+    chatty_rate: float = 0.0,
+    connect_latency_ms: float = 0.0,
+    latency_jitter_ms: float = 0.0,
+    hang_rate: float = 0.0,
+    hang_seconds: float = 60.0,
+    seed: Optional[int] = None
+):
+    """
+    백그라운드 스레드에서 대역 서버 시작
+
+    Args:
+        label_fn: 설문 텍스트("- 질문: 답변" 줄 포함) → 결과 타입 (None이면 해시 기반)
+        fail_rate: 오류를 반환할 요청 비율 (0~1, state.fail_rate로 실행 중 변경 가능)
+        fail_status: 오류 응답 상태 코드
+        chatty_rate: 자유 텍스트 단일 분류 응답에 설명을 덧붙일 비율 (0~1)
+        connect_latency_ms: 새 연결마다 적용할 지연 시간 (ms)
+        latency_jitter_ms: 요청마다 더할 지수 분포 지연의 평균 (ms)
+        hang_rate: 응답하지 않을 요청 비율 (0~1, hang_seconds 후 응답)
+        seed: 오류/지연/응답 변형 난수 시드 (None이면 매번 다름)
+
+    Returns:
+        (server, state, base_url)  # base_url은 OPENAI_BASE_URL 형식 (/v1 포함)
+    """
+    state = FakeOpenAIState(
+        latency_ms, max_concurrency, rpm_limit, label_fn, fail_rate, fail_status, chatty_rate,
+        connect_latency_ms, latency_jitter_ms, hang_rate, hang_seconds, seed
+    )
+    server = FakeOpenAIServer(("127.0.0.1", port), make_handler(state))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    return server, state, base_url
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI Chat Completions 대역 서버")
+    parser.add_argument("--port", type=int, default=18080, help="포트")
+    parser.add_argument("--latency-ms", type=float, default=300.0, help="요청당 지연 시간 (ms)")
+    parser.add_argument("--max-concurrency", type=int, default=0, help="동시 처리 수 제한 (0: 무제한)")
+    parser.add_argument("--rpm-limit", type=int, default=0, help="분당 요청 한도 (0: 무제한)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="오류 응답 비율 (0~1)")
+    parser.add_argument("--fail-status", type=int, default=503, help="오류 응답 상태 코드")
+    parser.add_argument("--chatty-rate", type=float, default=0.0, help="설명을 덧붙인 텍스트 응답 비율 (0~1)")
+    parser.add_argument("--connect-latency-ms", type=float, default=0.0, help="새 연결당 지연 시간 (ms)")
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0, help="요청당 추가 지연 평균 (ms, 지수 분포)")
+    parser.add_argument("--hang-rate", type=float, default=0.0, help="응답하지 않는 요청 비율 (0~1)")
+    parser.add_argument("--hang-seconds", type=float, default=60.0, help="응답하지 않는 요청의 대기 시간 (초)")
+    parser.add_argument("--seed", type=int, help="오류/지연/응답 변형 난수 시드")
+    args = parser.parse_args()
+
+    server, _, base_url = start_fake_openai(
+        args.port, args.latency_ms, args.max_concurrency, args.rpm_limit,
+        fail_rate=args.fail_rate, fail_status=args.fail_status, chatty_rate=args.chatty_rate,
+        connect_latency_ms=args.connect_latency_ms, latency_jitter_ms=args.latency_jitter_ms,
+        hang_rate=args.hang_rate, hang_seconds=args.hang_seconds, seed=args.seed
+    )
+    print(f"OpenAI 대역 서버 실행 중: {base_url} (지연 {args.latency_ms}ms)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
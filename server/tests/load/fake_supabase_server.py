@@ -0,0 +1,179 @@
+"""
+Supabase(PostgREST) 대역 서버
+
+부하 테스트/벤치마크에서 실제 Supabase 대신 사용하는 로컬 HTTP 서버입니다.
+설문 분석 파이프라인이 사용하는 최소한의 REST 경로만 흉내 내며,
+모든 요청에 지정한 지연 시간(네트워크 왕복 시간)을 적용합니다.
+
+지원 경로:
+- GET   /rest/v1/forms?share_url=eq.{share_url}
+- GET   /rest/v1/form_responses?member_id=eq.{id}&form_id=eq.{id}
+- POST  /rest/v1/form_responses[?on_conflict=form_id,member_id]  (insert / upsert)
+- PATCH /rest/v1/form_responses?member_id=eq.{id}&form_id=eq.{id}[&responses->result->>job_id=eq.{id}]
+
+사용법:
+    python fake_supabase_server.py --port 54321 --latency-ms 30
+    # 서버 설정: SUPABASE_URL=http://127.0.0.1:54321 SUPABASE_KEY=fake-key
+"""
+
+import argparse
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Tuple
+from urllib.parse import parse_qs, urlparse
+
+# 기본으로 등록되는 폼 (share_url → form)
+DEFAULT_FORMS = {
+    "test/2": {
+        "id": "00000000-0000-0000-0000-000000000002",
+        "share_url": "test/2",
+        "title": "테스트 2 설문",
+        "fields": [],
+    }
+}
+
+
+class FakeSupabaseState:
+    """대역 서버 데이터 (스레드 안전)"""
+
+    def __init__(self, latency_ms: float):
+        self.latency_ms = latency_ms
+        self.forms: Dict[str, Dict] = dict(DEFAULT_FORMS)
+        self.responses: Dict[Tuple[str, str], Dict] = {}
+        self.request_count = 0
+        self.lock = threading.Lock()
+
+
+def _eq_filters(query: str) -> Dict[str, str]:
+    """PostgREST 'col=eq.value' 필터 추출"""
+    return {
+        key: values[0][3:]
+        for key, values in parse_qs(query).items()
+        if values and values[0].startswith("eq.")
+    }
+
+
+def _json_path_value(row: Dict, column: str):
+    """PostgREST JSON 경로 컬럼("responses->result->>job_id")의 값"""
+    value = row
+    for part in column.replace("->>", "->").split("->"):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return None if value is None else str(value)
+
+
+def make_handler(state: FakeSupabaseState):
+    """상태를 공유하는 요청 핸들러 클래스 생성"""
+
+    class Handler(BaseHTTPRequestHandler):
+        # keep-alive 지원 (실제 Supabase와 같이 연결 재사용 가능)
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status: int, body) -> None:
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def _read_json(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            return json.loads(self.rfile.read(length) or b"null")
+
+        def _begin(self) -> Tuple[str, Dict[str, str]]:
+            with state.lock:
+                state.request_count += 1
+            time.sleep(state.latency_ms / 1000)
+            parsed = urlparse(self.path)
+            return parsed.path, _eq_filters(parsed.query)
+
+        def do_GET(self):
+            path, filters = self._begin()
+            if path == "/rest/v1/forms":
+                form = state.forms.get(filters.get("share_url", ""))
+                self._send(200, [form] if form else [])
+            elif path == "/rest/v1/form_responses":
+                key = (filters.get("member_id", ""), filters.get("form_id", ""))
+                row = state.responses.get(key)
+                self._send(200, [row] if row else [])
+            else:
+                self._send(404, {"message": f"unknown path: {path}"})
+
+        def do_POST(self):
+            path, _ = self._begin()
+            data = self._read_json()
+            if path == "/rest/v1/form_responses":
+                key = (data["member_id"], data["form_id"])
+                upsert = "merge-duplicates" in (self.headers.get("Prefer") or "")
+                with state.lock:
+                    row = state.responses.get(key)
+                    if row and upsert:
+                        # ON CONFLICT DO UPDATE: 전송된 컬럼만 갱신 (id, submitted_at 유지)
+                        row.update(data)
+                    else:
+                        row = {
+                            "id": str(uuid.uuid4()),
+                            "submitted_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                            **data,
+                        }
+                        state.responses[key] = row
+                self._send(201, [row])
+            else:
+                self._send(404, {"message": f"unknown path: {path}"})
+
+        def do_PATCH(self):
+            path, filters = self._begin()
+            data = self._read_json()
+            key = (filters.get("member_id", ""), filters.get("form_id", ""))
+            json_filters = {k: v for k, v in filters.items() if "->" in k}
+            with state.lock:
+                row = state.responses.get(key)
+                if row and any(_json_path_value(row, k) != v for k, v in json_filters.items()):
+                    row = None
+                if row:
+                    row.update(data)
+            self._send(200, [row] if row else [])
+
+    return Handler
+
+
+def start_fake_supabase(port: int = 0, latency_ms: float = 30.0):
+    """
+    백그라운드 스레드에서 대역 서버 시작
+
+    Returns:
+        (server, state, base_url)
+    """
+    state = FakeSupabaseState(latency_ms)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(state))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    return server, state, base_url
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Supabase(PostgREST) 대역 서버")
+    parser.add_argument("--port", type=int, default=54321, help="포트")
+    parser.add_argument("--latency-ms", type=float, default=30.0, help="요청당 지연 시간 (ms)")
+    args = parser.parse_args()
+
+    server, _, base_url = start_fake_supabase(args.port, args.latency_ms)
+    print(f"Supabase 대역 서버 실행 중: {base_url} (지연 {args.latency_ms}ms)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Fallback 일괄 분류 검증/벤치마크
+
+services/fallback_batch.py(NumPy 벡터 연산)가 건별 분류와 같은 결과를 내는지 확인하고
+대량 응답 분류 시간을 건별 처리와 비교합니다.
+
+검증:
+- 미응답이 없는 전체 응답 조합(1,310,720가지): 사전 계산 테이블과 비교
+- 미응답/알 수 없는 답변이 섞인 무작위 응답: calculate_scores + determine_result_type과 비교
+
+불일치가 있으면 종료 코드 1을 반환합니다.
+
+사용법:
+    python fallback_batch_bench.py --rows 1000000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict
+
+import numpy as np
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, SERVER_DIR)
+
+from services.fallback_batch import (  # noqa: E402
+    classify_matrix,
+    fallback_classify_batch,
+)
+from services.fallback_classifier import calculate_scores, determine_result_type  # noqa: E402
+from services.fallback_table import TABLE_OPTIONS, TABLE_QUESTIONS, TABLE_SIZE, FallbackTable  # noqa: E402
+
+
+def full_space_matrix() -> np.ndarray:
+    """미응답 없는 전체 응답 조합 행렬 (테이블 인덱스 순서)"""
+    radices = [option_count for _, option_count in TABLE_QUESTIONS]
+    index = np.arange(TABLE_SIZE)
+    columns = []
+    for radix in reversed(radices):
+        columns.append(index % radix + 1)
+        index //= radix
+    return np.stack(columns[::-1], axis=1).astype(np.uint8)
+
+
+def random_answers(count: int, rng: np.random.Generator):
+    """미응답(약 10%)/알 수 없는 답변이 섞인 무작위 응답 dict 목록"""
+    answers_list = []
+    for _ in range(count):
+        answers = {}
+        for question_id, option_ids in TABLE_OPTIONS:
+            pick = rng.integers(0, len(option_ids) + 2)
+            if pick == 0:
+                continue
+            answers[question_id] = option_ids[pick - 1] if pick <= len(option_ids) else "unknown"
+        answers_list.append(answers)
+    return answers_list
+
+
+def bench(args) -> Dict:
+    rng = np.random.default_rng(args.seed)
+    results = {}
+
+    # 검증 1: 전체 응답 조합 vs 사전 계산 테이블
+    table = FallbackTable.load()
+    expected = np.frombuffer(table.values, dtype=np.uint8)
+    start = time.perf_counter()
+    actual = classify_matrix(full_space_matrix())
+    results["full_space_s"] = time.perf_counter() - start
+    results["full_space_mismatches"] = int(np.count_nonzero(actual != expected))
+
+    # 검증 2: 미응답 포함 무작위 응답 vs 기존 계산 경로
+    samples = random_answers(args.samples, rng)
+    reference = [determine_result_type(calculate_scores(a)) for a in samples]
+    results["sample_mismatches"] = sum(
+        1 for got, want in zip(fallback_classify_batch(samples), reference) if got != want
+    )
+
+    # 대량 분류 시간: 행렬 → 결과 (저장된 응답을 행렬로 읽어 온 경우)
+    columns = [rng.integers(0, option_count + 1, args.rows) for _, option_count in TABLE_QUESTIONS]
+    matrix = np.stack(columns, axis=1).astype(np.uint8)
+    start = time.perf_counter()
+    classify_matrix(matrix)
+    results["matrix_s"] = time.perf_counter() - start
+
+    # dict 목록 → 결과 (변환 포함) vs 건별 처리
+    dict_rows = min(args.rows, args.dict_rows)
+    answers_list = random_answers(dict_rows, rng)
+    start = time.perf_counter()
+    fallback_classify_batch(answers_list)
+    results["batch_dict_s"] = time.perf_counter() - start
+    start = time.perf_counter()
+    for answers in answers_list:
+        determine_result_type(calculate_scores(answers))
+    results["loop_dict_s"] = time.perf_counter() - start
+    results["dict_rows"] = dict_rows
+    return results
+
+
+def print_report(args, results: Dict) -> bool:
+    """결과 출력, 통과 여부 반환"""
+    passed = results["full_space_mismatches"] == 0 and results["sample_mismatches"] == 0
+
+    print("=" * 60)
+    print("Fallback 일괄 분류 검증/벤치마크")
+    print("=" * 60)
+    print(
+        f"  전체 응답 조합 {TABLE_SIZE:,}개 vs 테이블: 불일치 {results['full_space_mismatches']}개 "
+        f"({results['full_space_s']:.2f}s)"
+    )
+    print(f"  미응답 포함 무작위 {args.samples:,}개 vs 건별 계산: 불일치 {results['sample_mismatches']}개")
+    print("-" * 60)
+    print(f"  행렬 일괄 분류: {args.rows:,}건 {results['matrix_s']:.3f}s")
+    print(
+        f"  dict {results['dict_rows']:,}건: 일괄(변환 포함) {results['batch_dict_s']:.3f}s / "
+        f"건별 {results['loop_dict_s']:.3f}s"
+    )
+    print("=" * 60)
+    print("✅ PASS" if passed else "❌ FAIL")
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fallback 일괄 분류 검증/벤치마크")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="행렬 일괄 분류 행 수")
+    parser.add_argument("--dict-rows", type=int, default=200_000, help="dict 목록 비교 건수")
+    parser.add_argument("--samples", type=int, default=20_000, help="미응답 포함 검증 표본 수")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--output", help="결과 저장 파일 (JSON)")
+    args = parser.parse_args()
+
+    results = bench(args)
+    passed = print_report(args, results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"결과 저장: {args.output}")
+
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
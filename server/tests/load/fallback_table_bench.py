@@ -0,0 +1,116 @@
+"""
+Fallback 분류 테이블 검증/벤치마크
+
+저장된 사전 계산 테이블(services/data/fallback_table.bin)이
+calculate_scores + determine_result_type과 전체 응답 조합에서 같은 결과를 내는지 확인하고,
+테이블 로드 시간과 요청당 분류 시간을 기존 계산 경로와 비교합니다.
+
+불일치가 있거나 지문이 현재 스코어링 로직과 다르면 종료 코드 1을 반환합니다.
+
+사용법:
+    python fallback_table_bench.py
+    python fallback_table_bench.py --skip-verify --iterations 500000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Dict, List
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, SERVER_DIR)
+
+from services.fallback_classifier import calculate_scores, determine_result_type  # noqa: E402
+from services.fallback_table import (  # noqa: E402
+    TABLE_SIZE,
+    FallbackTable,
+    iter_answer_space,
+    rules_fingerprint,
+)
+
+
+def sample_answers(count: int, seed: int) -> List[Dict[str, str]]:
+    """전체 응답 공간에서 균등 표본 추출"""
+    rng = random.Random(seed)
+    picks = set(rng.randrange(TABLE_SIZE) for _ in range(count))
+    return [answers for index, answers in enumerate(iter_answer_space()) if index in picks]
+
+
+def time_per_call_us(func, samples: List[Dict[str, str]], iterations: int) -> float:
+    """함수의 호출당 평균 시간 (µs)"""
+    start = time.perf_counter()
+    for i in range(iterations):
+        func(samples[i % len(samples)])
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def bench(args) -> Dict:
+    start = time.perf_counter()
+    table = FallbackTable.load()
+    load_ms = (time.perf_counter() - start) * 1000
+
+    results = {
+        "table_size": TABLE_SIZE,
+        "load_ms": load_ms,
+        "fingerprint_ok": table.fingerprint == rules_fingerprint(),
+    }
+
+    if not args.skip_verify:
+        start = time.perf_counter()
+        results["mismatches"] = table.verify()
+        results["verify_s"] = time.perf_counter() - start
+
+    samples = sample_answers(args.samples, args.seed)
+    results["reference_us"] = time_per_call_us(
+        lambda answers: determine_result_type(calculate_scores(answers)),
+        samples, args.iterations
+    )
+    results["table_us"] = time_per_call_us(table.lookup, samples, args.iterations)
+    return results
+
+
+def print_report(results: Dict) -> bool:
+    """결과 출력, 통과 여부 반환"""
+    passed = results["fingerprint_ok"] and results.get("mismatches", 0) == 0
+
+    print("=" * 60)
+    print("Fallback 분류 테이블 검증/벤치마크")
+    print("=" * 60)
+    print(f"  조합 수: {results['table_size']:,}")
+    print(f"  테이블 로드: {results['load_ms']:.1f}ms")
+    print(f"  지문 일치: {results['fingerprint_ok']}")
+    if "mismatches" in results:
+        print(f"  전체 검증: 불일치 {results['mismatches']}개 ({results['verify_s']:.1f}s)")
+    print("-" * 60)
+    print(f"  기존 계산 (calculate_scores + determine_result_type): {results['reference_us']:.2f}µs/건")
+    print(f"  테이블 조회: {results['table_us']:.2f}µs/건")
+    print("=" * 60)
+    print("✅ PASS" if passed else "❌ FAIL")
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fallback 분류 테이블 검증/벤치마크")
+    parser.add_argument("--skip-verify", action="store_true", help="전체 조합 검증 생략")
+    parser.add_argument("--samples", type=int, default=1000, help="시간 측정용 응답 표본 수")
+    parser.add_argument("--iterations", type=int, default=200000, help="시간 측정 반복 횟수")
+    parser.add_argument("--seed", type=int, default=42, help="표본 추출 시드")
+    parser.add_argument("--output", help="결과 저장 파일 (JSON)")
+    args = parser.parse_args()
+
+    results = bench(args)
+    passed = print_report(results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"결과 저장: {args.output}")
+
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+폼 캐시 벤치마크
+
+/api/survey/analyze 처리 시간을 폼 캐시(share_url → form) 사용/미사용으로 비교합니다.
+Supabase는 로컬 대역 서버(fake_supabase_server.py)로 대체하며,
+AI 호출은 측정 대상에서 제외하기 위해 Fallback 분류로 대체합니다.
+
+사용법:
+    python form_cache_bench.py --requests 200 --latency-ms 30
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+import uuid
+from typing import Dict, List
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, SERVER_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_supabase_server import start_fake_supabase  # noqa: E402
+
+SAMPLE_RESPONSES = {
+    "100": "gender_female", "101": "age_20s",
+    "1": "q1a1", "2": "q2a1", "3": "q3a1", "4": "q4a1", "5": "q5a1",
+    "6": "q6a1", "7": "q7a1", "8": "q8a2", "9": "q9a3", "10": "q10a3",
+}
+
+
+def load_survey_analyzer():
+    """api/__init__.py(DB 연결 필요)를 거치지 않고 survey_analyzer 모듈만 로드"""
+    spec = importlib.util.spec_from_file_location(
+        "api.survey_analyzer",
+        os.path.join(SERVER_DIR, "api", "survey_analyzer.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+async def run_requests(survey_analyzer, count: int) -> List[float]:
+    """analyze_survey를 순차 호출하여 요청별 처리 시간(ms) 측정"""
+    times_ms: List[float] = []
+    for _ in range(count):
+        request = survey_analyzer.SurveyRequest(
+            member_id=str(uuid.uuid4()),
+            share_url="test/2",
+            responses=SAMPLE_RESPONSES
+        )
+        start = time.perf_counter()
+        await survey_analyzer.analyze_survey(request)
+        times_ms.append((time.perf_counter() - start) * 1000)
+    return times_ms
+
+
+def summarize(times_ms: List[float]) -> Dict:
+    """응답 시간 통계"""
+    ordered = sorted(times_ms)
+    return {
+        "avg_ms": statistics.mean(ordered),
+        "p50_ms": ordered[int(len(ordered) * 0.50)],
+        "p95_ms": ordered[int(len(ordered) * 0.95)],
+        "max_ms": ordered[-1],
+    }
+
+
+async def bench(args) -> Dict:
+    server, state, base_url = start_fake_supabase(latency_ms=args.latency_ms)
+    os.environ["SUPABASE_URL"] = base_url
+    os.environ["SUPABASE_KEY"] = "fake-key"
+
+    survey_analyzer = load_survey_analyzer()
+    from db import form_cache as form_cache_module
+    from services.fallback_classifier import fallback_classify
+    from db.supabase_client import SupabaseConfig
+
+    SupabaseConfig.SUPABASE_URL = base_url
+    SupabaseConfig.SUPABASE_KEY = "fake-key"
+
+    async def classify_fallback_only(answers, schema=None):
+        return fallback_classify(answers, schema), "fallback", None
+
+    survey_analyzer.classify_with_fallback = classify_fallback_only
+
+    results = {}
+
+    for label, ttl in (("no_cache", 0), ("cache", 300)):
+        form_cache = form_cache_module.FormCache(ttl_seconds=ttl, negative_ttl_seconds=ttl)
+        form_cache_module._form_cache = form_cache
+        upstream_before = state.request_count
+        times_ms = await run_requests(survey_analyzer, args.requests)
+        results[label] = {
+            **summarize(times_ms),
+            "upstream_requests": state.request_count - upstream_before,
+            "cache_stats": form_cache.stats(),
+        }
+
+    server.shutdown()
+    return results
+
+
+def print_report(args, results: Dict) -> None:
+    """결과 출력"""
+    print("=" * 60)
+    print("폼 캐시 벤치마크 결과 (/api/survey/analyze)")
+    print("=" * 60)
+    print(f"  요청 수: {args.requests} / 대역 서버 지연: {args.latency_ms}ms")
+    for label in ("no_cache", "cache"):
+        r = results[label]
+        print("-" * 60)
+        print(f"[{label}]")
+        print(
+            f"  평균: {r['avg_ms']:.1f}ms / p50: {r['p50_ms']:.1f}ms / "
+            f"p95: {r['p95_ms']:.1f}ms / 최대: {r['max_ms']:.1f}ms"
+        )
+        print(f"  Supabase 요청 수: {r['upstream_requests']}")
+        print(f"  캐시 통계: {r['cache_stats']}")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="폼 캐시 벤치마크")
+    parser.add_argument("--requests", type=int, default=200, help="요청 수")
+    parser.add_argument("--latency-ms", type=float, default=30.0, help="Supabase 대역 서버 지연 (ms)")
+    parser.add_argument("--output", help="결과 저장 파일 (JSON)")
+    args = parser.parse_args()
+
+    # 요청별 분류/저장 로그 숨김
+    logging.disable(logging.WARNING)
+
+    results = asyncio.run(bench(args))
+    print_report(args, results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+AI 응답 시간 예산 벤치마크
+
+느린 OpenAI(로컬 대역 서버)를 상대로 classify_with_fallback의 응답 시간을
+응답 시간 예산 미사용(budget 0)과 사용(--budget)으로 비교합니다.
+예산 사용 시 늦게 도착한 AI 결과가 분류 캐시에 기록되는지도 확인합니다.
+
+사용법:
+    python latency_budget_bench.py --requests 50 --latency-ms 3000 --budget 1.0
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import time
+from collections import Counter
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ai_batch_bench import random_survey, summarize  # noqa: E402
+from fake_openai_server import start_fake_openai  # noqa: E402
+
+
+async def run_mode(classifier, surveys: List[Dict[str, str]]) -> Dict:
+    """동시 요청의 분류 시간과 결과 출처 수집"""
+    times_ms: List[float] = []
+    sources: Counter = Counter()
+
+    async def one(answers):
+        start = time.perf_counter()
+        _, source, _ = await classifier.classify_with_fallback(answers)
+        times_ms.append((time.perf_counter() - start) * 1000)
+        sources[source] += 1
+
+    await asyncio.gather(*(one(answers) for answers in surveys))
+    ordered = sorted(times_ms)
+    return {
+        **summarize(times_ms),
+        "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+        "sources": dict(sources),
+    }
+
+
+async def bench(args) -> Dict:
+    server, state, base_url = start_fake_openai(latency_ms=args.latency_ms)
+    os.environ["OPENAI_BASE_URL"] = base_url
+
+    from config.ai_config import AIConfig
+    from services import ai_classifier, classification_cache, classifier
+
+    AIConfig.OPENAI_API_KEY = "fake-key"
+    AIConfig.AI_BATCH_ENABLED = False
+    AIConfig.AI_CACHE_DB_PATH = ""
+
+    rng = random.Random(args.seed)
+    results = {}
+    for label, budget in (("no_budget", 0.0), ("budget", args.budget)):
+        AIConfig.AI_LATENCY_BUDGET_SECONDS = budget
+        ai_classifier._classifier_instance = None
+        classification_cache._classification_cache = None
+        classifier._budget_stats.update(budget_exceeded=0, late_ai_results=0)
+
+        surveys = [random_survey(rng) for _ in range(args.requests)]
+        results[label] = await run_mode(classifier, surveys)
+
+        # 늦게 도착하는 AI 결과 대기 후 캐시 기록 확인
+        await asyncio.sleep(args.latency_ms / 1000 + 0.5)
+        results[label]["budget_stats"] = classifier.get_latency_budget_stats()
+        results[label]["cached_after"] = classification_cache.get_classification_cache().stats()["size"]
+
+    server.shutdown()
+    return results
+
+
+def print_report(args, results: Dict) -> None:
+    """결과 출력"""
+    print("=" * 60)
+    print("AI 응답 시간 예산 벤치마크 (classify_with_fallback)")
+    print("=" * 60)
+    print(f"  동시 요청: {args.requests} / OpenAI 대역 서버 지연: {args.latency_ms}ms")
+    for label in ("no_budget", "budget"):
+        r = results[label]
+        print("-" * 60)
+        print(f"[{label}] 예산: {r['budget_stats']['budget_seconds']}s")
+        print(
+            f"  평균: {r['avg_ms']:.1f}ms / p50: {r['p50_ms']:.1f}ms / "
+            f"p99: {r['p99_ms']:.1f}ms / 최대: {r['max_ms']:.1f}ms"
+        )
+        print(f"  결과 출처: {r['sources']}")
+        print(
+            f"  예산 초과: {r['budget_stats']['budget_exceeded']} / "
+            f"늦은 AI 결과 기록: {r['budget_stats']['late_ai_results']} / "
+            f"캐시 항목: {r['cached_after']}"
+        )
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AI 응답 시간 예산 벤치마크")
+    parser.add_argument("--requests", type=int, default=50, help="동시 요청 수")
+    parser.add_argument("--latency-ms", type=float, default=3000.0, help="OpenAI 대역 서버 지연 (ms)")
+    parser.add_argument("--budget", type=float, default=1.0, help="응답 시간 예산 (초)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--output", help="결과 저장 파일 (JSON)")
+    args = parser.parse_args()
+
+    # 요청별 분류 로그 숨김
+    logging.disable(logging.WARNING)
+
+    results = asyncio.run(bench(args))
+    print_report(args, results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
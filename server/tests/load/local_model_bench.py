@@ -0,0 +1,230 @@
+"""
+로컬 분류 모델 벤치마크
+
+저장된 AI 분류 결과 대신 "AI 결과"를 흉내 낸 라벨(Fallback 스코어링 규칙 결과에
+--label-noise 비율만큼 응답별로 고정된 무작위 결과를 섞은 것)로 로컬 모델을 학습하고,
+
+1. 검증 세트(처음 보는 응답 조합)에서 확신도 기준별 AI 일치율/로컬 처리 비율을 보고하고
+2. 같은 라벨을 반환하는 OpenAI 대역 서버를 상대로 classify_with_fallback을 실행하여
+   AI만 사용할 때와 로컬 모델을 사용할 때의 업스트림 호출 수, 응답 시간, AI 일치율을 비교합니다.
+
+분류 캐시와 서킷 브레이커는 비활성화하여 로컬 모델의 효과만 측정합니다.
+
+사용법:
+    python local_model_bench.py --train 20000 --requests 300 --threshold 0.95
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ai_batch_bench import random_survey, summarize  # noqa: E402
+from fake_openai_server import RESULT_TYPES, start_fake_openai  # noqa: E402
+
+
+def make_labeler(noise: float):
+    """
+    설문 응답 → 흉내 낸 AI 결과 / 프롬프트 텍스트 → 같은 결과 함수 생성
+
+    노이즈는 응답 내용의 해시로 정하므로 같은 응답에는 항상 같은 결과를 반환합니다.
+    """
+    from services.fallback_classifier import determine_result_type
+    from services.survey_schema import get_default_schema
+
+    schema = get_default_schema()
+    line_answers = {
+        f"- {question['question']}: {text}": (key, answer_id)
+        for key, question in schema.question_mapping.items()
+        for answer_id, text in question["answers"].items()
+    }
+
+    def label_answers(answers: Dict[str, str]) -> str:
+        digest = hashlib.sha256(schema.canonical_key(answers).encode("utf-8")).digest()
+        if digest[0] / 256 < noise:
+            return RESULT_TYPES[digest[1] % len(RESULT_TYPES)]
+        return determine_result_type(schema.calculate_scores(answers))
+
+    def label_prompt(text: str) -> str:
+        answers = dict(
+            line_answers[line] for line in text.splitlines() if line in line_answers
+        )
+        return label_answers(answers)
+
+    return label_answers, label_prompt
+
+
+async def run_mode(classifier, surveys: List[Dict[str, str]], label_answers) -> Dict:
+    """동시 classify_with_fallback 호출"""
+    times_ms: List[float] = []
+    sources: Counter = Counter()
+    agreed = 0
+
+    async def one(answers):
+        nonlocal agreed
+        start = time.perf_counter()
+        result_type, source, _ = await classifier.classify_with_fallback(answers)
+        times_ms.append((time.perf_counter() - start) * 1000)
+        sources[source] += 1
+        agreed += result_type == label_answers(answers)
+
+    await asyncio.gather(*(one(answers) for answers in surveys))
+    return {
+        **summarize(times_ms),
+        "sources": dict(sources),
+        "ai_agreement": round(agreed / len(surveys), 4),
+    }
+
+
+async def bench(args, label_answers, label_prompt, model_path: str) -> Dict:
+    server, state, base_url = start_fake_openai(latency_ms=args.latency_ms, label_fn=label_prompt)
+    os.environ["OPENAI_BASE_URL"] = base_url
+
+    from config.ai_config import AIConfig
+    from services import classifier, local_classifier
+
+    AIConfig.OPENAI_API_KEY = "fake-key"
+    AIConfig.AI_BATCH_ENABLED = False
+    AIConfig.AI_CACHE_ENABLED = False
+    AIConfig.AI_BREAKER_ENABLED = False
+    AIConfig.AI_MAX_CONCURRENCY = 256
+    AIConfig.AI_LATENCY_BUDGET_SECONDS = 0
+    AIConfig.AI_LOCAL_MODEL_PATH = model_path
+    AIConfig.AI_LOCAL_MODEL_THRESHOLD = args.threshold
+    AIConfig.AI_LOCAL_MODEL_SHADOW_RATE = args.shadow_rate
+    AIConfig.AI_LOCAL_MODEL_MIN_SAMPLES = 1
+
+    rng = random.Random(args.seed + 1)
+    surveys = [random_survey(rng) for _ in range(args.requests)]
+
+    results = {}
+    for label, enabled in (("ai_only", False), ("local_model", True)):
+        AIConfig.AI_LOCAL_MODEL_ENABLED = enabled
+        local_classifier._local_classifier = None
+        before = state.request_count
+        results[label] = await run_mode(classifier, surveys, label_answers)
+        # 응답을 기다리지 않는 검증 호출 완료 대기
+        await asyncio.sleep(args.latency_ms / 1000 + 0.5)
+        results[label]["upstream_calls"] = state.request_count - before
+        results[label]["local_model"] = local_classifier.get_local_classifier_stats()
+
+    server.shutdown()
+    return results
+
+
+def train(args, label_answers, model_path: str) -> Dict:
+    """흉내 낸 AI 결과로 학습 + 검증 (python -m services.local_classifier train과 같은 절차)"""
+    from services.local_classifier import (
+        EVALUATION_THRESHOLDS,
+        NaiveBayesModel,
+        evaluate,
+        extract_samples,
+        feature_key,
+        split_by_key,
+    )
+    from services.survey_schema import get_default_schema
+
+    rng = random.Random(args.seed)
+    rows = []
+    for _ in range(args.train):
+        answers = random_survey(rng)
+        result = {"source": "ai", "type": label_answers(answers)}
+        rows.append({"responses": {**answers, "result": result}})
+
+    schema = get_default_schema()
+    samples = extract_samples(rows, schema)
+    start = time.perf_counter()
+    train_samples, test_samples = split_by_key(samples, 0.2, args.seed)
+    report = evaluate(
+        NaiveBayesModel.fit(train_samples, schema),
+        test_samples,
+        sorted(set(EVALUATION_THRESHOLDS) | {args.threshold})
+    )
+    model = NaiveBayesModel.fit(samples, schema)
+    model.save(model_path)
+    report["fit_seconds"] = round(time.perf_counter() - start, 3)
+
+    keys = [feature_key(random_survey(rng), schema) for _ in range(10000)]
+    start = time.perf_counter()
+    for key in keys:
+        model.predict(key)
+    report["predict_us"] = round((time.perf_counter() - start) / len(keys) * 1e6, 2)
+    return report
+
+
+def print_report(args, report: Dict, results: Dict) -> None:
+    """결과 출력"""
+    print("=" * 60)
+    print("로컬 분류 모델 벤치마크")
+    print("=" * 60)
+    print(
+        f"  학습 응답: {args.train} (AI 결과 노이즈 {args.label_noise:.0%}) / "
+        f"학습+검증 {report['fit_seconds']}s / 예측 {report['predict_us']}µs/건"
+    )
+    print(f"  검증 (처음 보는 응답 조합 {report['samples']}개): 전체 AI 일치율 {report['agreement']}")
+    print("  확신도 기준 | 로컬 처리 비율 | AI 일치율")
+    for row in report["thresholds"]:
+        marker = " <- 사용" if row["threshold"] == args.threshold else ""
+        print(f"  {row['threshold']:>10} | {row['coverage']:>13} | {row['agreement']}{marker}")
+    print("-" * 60)
+    print(f"  동시 요청: {args.requests} / OpenAI 대역 서버 지연: {args.latency_ms}ms")
+    for label in ("ai_only", "local_model"):
+        r = results[label]
+        print("-" * 60)
+        print(f"[{label}]")
+        print(
+            f"  평균: {r['avg_ms']:.1f}ms / p50: {r['p50_ms']:.1f}ms / "
+            f"p95: {r['p95_ms']:.1f}ms / 최대: {r['max_ms']:.1f}ms"
+        )
+        print(f"  결과 출처: {r['sources']} / 업스트림 호출: {r['upstream_calls']}")
+        print(f"  AI 결과와 일치: {r['ai_agreement']:.1%}")
+        stats = r["local_model"]
+        if stats["enabled"]:
+            print(
+                f"  AI 호출 생략 비율: {stats['avoided_rate']:.1%} / "
+                f"검증 호출 일치율: {stats['shadow_agreement']} ({stats['shadow_compared']}건) / "
+                f"미확신 예측 일치율: {stats['uncertain_agreement']}"
+            )
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 분류 모델 벤치마크")
+    parser.add_argument("--train", type=int, default=20000, help="학습용 AI 결과 수")
+    parser.add_argument("--label-noise", type=float, default=0.1, help="스코어링 규칙과 다른 AI 결과 비율")
+    parser.add_argument("--requests", type=int, default=300, help="동시 분류 요청 수")
+    parser.add_argument("--latency-ms", type=float, default=800.0, help="OpenAI 대역 서버 지연 (ms)")
+    parser.add_argument("--threshold", type=float, default=0.95, help="로컬 결과 사용 확신도 기준")
+    parser.add_argument("--shadow-rate", type=float, default=0.1, help="로컬 결과 검증 호출 비율")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--output", help="결과 저장 파일 (JSON)")
+    args = parser.parse_args()
+
+    # 요청별 분류 로그 숨김
+    logging.disable(logging.WARNING)
+
+    label_answers, label_prompt = make_labeler(args.label_noise)
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = os.path.join(tmp, "local_model.json")
+        report = train(args, label_answers, model_path)
+        results = asyncio.run(bench(args, label_answers, label_prompt, model_path))
+    print_report(args, report, results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"evaluation": report, **results}, f, indent=2, ensure_ascii=False)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
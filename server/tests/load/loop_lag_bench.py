@@ -0,0 +1,184 @@
+"""
+이벤트 루프 지연(loop lag) 테스트
+
+/api/survey/analyze 동시 요청이 처리되는 동안 이벤트 루프가 막히지 않는지 확인합니다.
+Supabase 호출이 루프를 막으면 같은 워커의 WebSocket(경품추첨) 등 다른 작업이 함께 멈추므로,
+주기적으로 깨어나는 측정 태스크의 지연(예정 시각 대비 실제 깨어난 시각 차이)을 기록합니다.
+
+- idle: 요청 없이 측정한 기준 지연
+- load: 동시 요청 처리 중 측정한 지연
+
+Supabase는 로컬 대역 서버(fake_supabase_server.py), AI 호출은 Fallback 분류로 대체합니다.
+load 구간의 최대 지연이 기준(--max-lag-ms)을 넘으면 종료 코드 1을 반환합니다.
+
+사용법:
+    python loop_lag_bench.py --concurrency 200 --latency-ms 30
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+import uuid
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_supabase_server import start_fake_supabase  # noqa: E402
+from form_cache_bench import SAMPLE_RESPONSES, load_survey_analyzer  # noqa: E402
+
+
+async def probe_loop_lag(stop: asyncio.Event, interval_ms: float) -> List[float]:
+    """interval_ms마다 깨어나며 예정 시각 대비 지연(ms) 기록"""
+    interval = interval_ms / 1000
+    lags_ms: List[float] = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags_ms.append(max(0.0, (time.perf_counter() - start - interval) * 1000))
+    return lags_ms
+
+
+def summarize_lag(lags_ms: List[float]) -> Dict:
+    """지연 통계"""
+    ordered = sorted(lags_ms)
+    return {
+        "samples": len(ordered),
+        "avg_ms": statistics.mean(ordered),
+        "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+        "max_ms": ordered[-1],
+    }
+
+
+async def run_concurrent(survey_analyzer, concurrency: int) -> Dict:
+    """analyze_survey를 동시에 호출하고 처리 시간 측정"""
+
+    async def one():
+        request = survey_analyzer.SurveyRequest(
+            member_id=str(uuid.uuid4()),
+            share_url="test/2",
+            responses=SAMPLE_RESPONSES
+        )
+        await survey_analyzer.analyze_survey(request)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(one() for _ in range(concurrency)), return_exceptions=True)
+    elapsed = time.perf_counter() - start
+    errors = [r for r in results if isinstance(r, Exception)]
+    return {
+        "elapsed_s": elapsed,
+        "errors": len(errors),
+        "first_error": repr(errors[0]) if errors else None,
+    }
+
+
+async def measure(interval_ms: float, work=None, idle_seconds: float = 1.0):
+    """측정 태스크를 띄운 채 work(없으면 idle_seconds 대기) 실행"""
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_loop_lag(stop, interval_ms))
+    outcome = await work if work is not None else await asyncio.sleep(idle_seconds)
+    stop.set()
+    return summarize_lag(await probe), outcome
+
+
+async def bench(args) -> Dict:
+    server, state, base_url = start_fake_supabase(latency_ms=args.latency_ms)
+    os.environ["SUPABASE_URL"] = base_url
+    os.environ["SUPABASE_KEY"] = "fake-key"
+
+    survey_analyzer = load_survey_analyzer()
+    from db import form_cache as form_cache_module
+    from db.supabase_client import SupabaseConfig, close_supabase_client
+    from services.fallback_classifier import fallback_classify
+
+    SupabaseConfig.SUPABASE_URL = base_url
+    SupabaseConfig.SUPABASE_KEY = "fake-key"
+
+    async def classify_fallback_only(answers, schema=None):
+        return fallback_classify(answers, schema), "fallback", None
+
+    survey_analyzer.classify_with_fallback = classify_fallback_only
+
+    # 폼 조회도 매 요청 Supabase를 거치도록 캐시 비활성화
+    form_cache_module._form_cache = form_cache_module.FormCache(ttl_seconds=0, negative_ttl_seconds=0)
+
+    # 클라이언트 초기화/첫 연결 비용은 측정에서 제외
+    await run_concurrent(survey_analyzer, 1)
+
+    idle_lag, _ = await measure(args.interval_ms)
+    upstream_before = state.request_count
+    load_lag, outcome = await measure(
+        args.interval_ms, run_concurrent(survey_analyzer, args.concurrency)
+    )
+
+    await close_supabase_client()
+    server.shutdown()
+
+    return {
+        "idle": idle_lag,
+        "load": load_lag,
+        "requests": {**outcome, "upstream_requests": state.request_count - upstream_before},
+        "max_connections": SupabaseConfig.SUPABASE_MAX_CONNECTIONS,
+    }
+
+
+def print_report(args, results: Dict) -> bool:
+    """결과 출력, 통과 여부 반환"""
+    requests = results["requests"]
+    passed = results["load"]["max_ms"] <= args.max_lag_ms and requests["errors"] == 0
+
+    print("=" * 60)
+    print("이벤트 루프 지연 테스트 (/api/survey/analyze)")
+    print("=" * 60)
+    print(
+        f"  동시 요청: {args.concurrency} / 대역 서버 지연: {args.latency_ms}ms / "
+        f"연결 풀: {results['max_connections']}"
+    )
+    print(
+        f"  처리 시간: {requests['elapsed_s']:.2f}s / 에러: {requests['errors']} / "
+        f"Supabase 요청 수: {requests['upstream_requests']}"
+    )
+    if requests["first_error"]:
+        print(f"  첫 에러: {requests['first_error']}")
+    for label in ("idle", "load"):
+        lag = results[label]
+        print("-" * 60)
+        print(f"[{label}] 측정 {lag['samples']}회 (주기 {args.interval_ms}ms)")
+        print(
+            f"  루프 지연 평균: {lag['avg_ms']:.2f}ms / p99: {lag['p99_ms']:.2f}ms / "
+            f"최대: {lag['max_ms']:.2f}ms"
+        )
+    print("=" * 60)
+    print(f"{'✅ PASS' if passed else '❌ FAIL'} (load 최대 지연 기준: {args.max_lag_ms}ms)")
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="이벤트 루프 지연 테스트")
+    parser.add_argument("--concurrency", type=int, default=200, help="동시 요청 수")
+    parser.add_argument("--latency-ms", type=float, default=30.0, help="Supabase 대역 서버 지연 (ms)")
+    parser.add_argument("--interval-ms", type=float, default=5.0, help="루프 지연 측정 주기 (ms)")
+    parser.add_argument("--max-lag-ms", type=float, default=50.0, help="허용 최대 루프 지연 (ms)")
+    parser.add_argument("--output", help="결과 저장 파일 (JSON)")
+    args = parser.parse_args()
+
+    # 요청별 분류/저장 로그 숨김
+    logging.disable(logging.WARNING)
+
+    results = asyncio.run(bench(args))
+    passed = print_report(args, results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"결과 저장: {args.output}")
+
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
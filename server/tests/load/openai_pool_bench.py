@@ -0,0 +1,170 @@
+"""
+OpenAI 연결 풀 벤치마크
+
+새 연결마다 지연(--connect-latency-ms, TCP/TLS 연결 비용 흉내)을 적용하는 OpenAI 대역 서버에
+요청이 뜸한 트래픽(--rounds회, 라운드마다 --concurrency건 동시 요청, 라운드 사이 --gap-seconds 휴지)을 보내
+SDK 기본 연결 설정과 공유 연결 풀(services/openai_http.py)의 새 연결 수와 응답 시간을 비교합니다.
+
+- sdk_default: AsyncOpenAI 기본 httpx 클라이언트 (유휴 연결 5초 후 종료, 사전 연결 없음, 기존 동작)
+- pooled: 공유 연결 풀 (AI_HTTP_KEEPALIVE_SECONDS 동안 유휴 연결 유지, 시작 시 사전 연결)
+
+첫 라운드는 배포 직후 첫 설문, 이후 라운드는 한산한 시간대의 설문에 해당합니다.
+분류 캐시, 서킷 브레이커, 응답 시간 예산은 비활성화합니다.
+
+사용법:
+    python openai_pool_bench.py --rounds 4 --gap-seconds 6 --connect-latency-ms 150
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ai_batch_bench import random_survey, summarize  # noqa: E402
+from fake_openai_server import start_fake_openai  # noqa: E402
+
+MODES = ("sdk_default", "pooled")
+
+
+async def run_rounds(classifier, rounds: List[List[Dict[str, str]]], gap_seconds: float) -> Dict:
+    """라운드별 동시 classify_with_fallback 호출 (라운드 사이 휴지)"""
+    first_ms: List[float] = []
+    later_ms: List[float] = []
+
+    async def one(answers, times_ms):
+        start = time.perf_counter()
+        await classifier.classify_with_fallback(answers)
+        times_ms.append((time.perf_counter() - start) * 1000)
+
+    for index, surveys in enumerate(rounds):
+        if index:
+            await asyncio.sleep(gap_seconds)
+        times_ms = first_ms if index == 0 else later_ms
+        await asyncio.gather(*(one(answers, times_ms) for answers in surveys))
+
+    return {
+        "first_round": summarize(first_ms),
+        "later_rounds": summarize(later_ms) if later_ms else None,
+    }
+
+
+async def bench(args) -> Dict:
+    server, state, base_url = start_fake_openai(
+        latency_ms=args.latency_ms, connect_latency_ms=args.connect_latency_ms
+    )
+    os.environ["OPENAI_BASE_URL"] = base_url
+
+    from openai import AsyncOpenAI
+
+    from config.ai_config import AIConfig
+    from services import ai_classifier, classifier, openai_http
+
+    AIConfig.OPENAI_API_KEY = "fake-key"
+    AIConfig.AI_BATCH_ENABLED = False
+    AIConfig.AI_CACHE_ENABLED = False
+    AIConfig.AI_BREAKER_ENABLED = False
+    AIConfig.AI_LATENCY_BUDGET_SECONDS = 0
+    AIConfig.AI_HTTP_WARMUP_CONNECTIONS = args.concurrency
+
+    rng = random.Random(args.seed)
+    rounds = [
+        [random_survey(rng) for _ in range(args.concurrency)] for _ in range(args.rounds)
+    ]
+
+    results = {}
+    for mode in MODES:
+        await openai_http.close_openai_http_client()
+        openai_http._connection_stats = openai_http.ConnectionStats()
+
+        connections_before = state.connection_count
+        start = time.perf_counter()
+        if mode == "sdk_default":
+            ai = ai_classifier.get_classifier()
+            ai.client = AsyncOpenAI(
+                api_key=AIConfig.OPENAI_API_KEY,
+                timeout=AIConfig.AI_TIMEOUT_SECONDS,
+                max_retries=0
+            )
+            warmup_ms = 0.0
+        else:
+            await openai_http.warm_up_openai()
+            warmup_ms = (time.perf_counter() - start) * 1000
+
+        connections_warm = state.connection_count
+        results[mode] = await run_rounds(classifier, rounds, args.gap_seconds)
+        results[mode]["warmup_ms"] = round(warmup_ms, 1)
+        results[mode]["warmup_connections"] = connections_warm - connections_before
+        results[mode]["new_connections"] = state.connection_count - connections_warm
+        results[mode]["requests"] = args.rounds * args.concurrency
+        if mode == "pooled":
+            results[mode]["pool"] = openai_http.get_openai_http_stats()
+
+    await openai_http.close_openai_http_client()
+    server.shutdown()
+    return results
+
+
+def print_report(args, results: Dict) -> None:
+    """결과 출력"""
+    print("=" * 60)
+    print("OpenAI 연결 풀 벤치마크 (classify_with_fallback)")
+    print("=" * 60)
+    print(
+        f"  라운드: {args.rounds}회 x 동시 {args.concurrency}건 / 라운드 간격: {args.gap_seconds}s / "
+        f"새 연결 지연: {args.connect_latency_ms}ms / 대역 서버 지연: {args.latency_ms}ms"
+    )
+    for mode in MODES:
+        r = results[mode]
+        print("-" * 60)
+        print(f"[{mode}]")
+        if r["warmup_connections"]:
+            print(f"  사전 연결: {r['warmup_connections']}개 ({r['warmup_ms']:.1f}ms, 서버 시작 시)")
+        for key, label in (("first_round", "첫 라운드"), ("later_rounds", "이후 라운드")):
+            s = r[key]
+            if s:
+                print(
+                    f"  {label}: 평균 {s['avg_ms']:.1f}ms / p50 {s['p50_ms']:.1f}ms / "
+                    f"최대 {s['max_ms']:.1f}ms"
+                )
+        print(f"  분류 요청 중 새 연결: {r['new_connections']} / 요청 {r['requests']}")
+        if "pool" in r:
+            pool = r["pool"]
+            print(
+                f"  연결 재사용 비율: {pool['reuse_rate']:.1%} "
+                f"(전송된 요청 {pool['sent_requests']}, 새 연결 {pool['new_connections']}, 사전 연결 요청 포함)"
+            )
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI 연결 풀 벤치마크")
+    parser.add_argument("--rounds", type=int, default=4, help="라운드 수")
+    parser.add_argument("--concurrency", type=int, default=4, help="라운드당 동시 요청 수")
+    parser.add_argument("--gap-seconds", type=float, default=6.0, help="라운드 사이 휴지 시간 (초)")
+    parser.add_argument("--connect-latency-ms", type=float, default=150.0, help="새 연결당 지연 (ms)")
+    parser.add_argument("--latency-ms", type=float, default=300.0, help="OpenAI 대역 서버 지연 (ms)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--output", help="결과 저장 파일 (JSON)")
+    args = parser.parse_args()
+
+    # 요청별 분류 로그 숨김
+    logging.disable(logging.CRITICAL)
+
+    results = asyncio.run(bench(args))
+    print_report(args, results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+AI 응답 형식(AI_OUTPUT_MODE) 벤치마크
+
+자유 텍스트 응답의 일부(--chatty-rate)에 설명을 덧붙이는 OpenAI 대역 서버를 상대로
+text / json_schema / code 응답 형식의 유효하지 않은 응답 비율, 재시도로 늘어난 업스트림 요청 수,
+응답당 토큰 수, 응답 시간을 비교합니다.
+
+대역 서버는 response_format(json_schema)/logit_bias 요청에는 형식을 지켜 응답합니다.
+(실제 OpenAI의 Structured Outputs/logit_bias처럼 결과 타입 밖의 값을 생성하지 않음)
+토큰 수는 대역 서버의 근사치(3글자당 1토큰, 숫자 코드는 글자당 1토큰)입니다.
+
+분류 캐시와 서킷 브레이커는 비활성화합니다.
+
+사용법:
+    python output_mode_bench.py --requests 300 --chatty-rate 0.1
+    python output_mode_bench.py --requests 300 --chatty-rate 0.1 --batch
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import time
+from collections import Counter
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ai_batch_bench import random_survey, summarize  # noqa: E402
+from fake_openai_server import label_for, start_fake_openai  # noqa: E402
+
+MODES = ("text", "json_schema", "code")
+
+
+async def run_mode(classifier, surveys: List[Dict[str, str]]) -> Dict:
+    """동시 classify_with_fallback 호출"""
+    from services.survey_schema import get_default_schema
+
+    times_ms: List[float] = []
+    sources: Counter = Counter()
+    agreed = 0
+    schema = get_default_schema()
+
+    async def one(answers):
+        nonlocal agreed
+        start = time.perf_counter()
+        result_type, source, _ = await classifier.classify_with_fallback(answers)
+        times_ms.append((time.perf_counter() - start) * 1000)
+        sources[source] += 1
+        agreed += result_type == label_for("\n".join(schema.format_answers(answers)))
+
+    await asyncio.gather(*(one(answers) for answers in surveys))
+    return {
+        **summarize(times_ms),
+        "sources": dict(sources),
+        "label_agreement": round(agreed / len(surveys), 4),
+    }
+
+
+async def bench(args) -> Dict:
+    server, state, base_url = start_fake_openai(
+        latency_ms=args.latency_ms, chatty_rate=args.chatty_rate
+    )
+    os.environ["OPENAI_BASE_URL"] = base_url
+
+    from config.ai_config import AIConfig
+    from services import ai_classifier, classification_metrics, classifier
+
+    AIConfig.OPENAI_API_KEY = "fake-key"
+    AIConfig.AI_BATCH_ENABLED = args.batch
+    AIConfig.AI_CACHE_ENABLED = False
+    AIConfig.AI_BREAKER_ENABLED = False
+    AIConfig.AI_MAX_CONCURRENCY = 256
+    AIConfig.AI_LATENCY_BUDGET_SECONDS = 0
+    AIConfig.AI_RETRY_DELAY = 0.05
+
+    rng = random.Random(args.seed)
+    surveys = [random_survey(rng) for _ in range(args.requests)]
+
+    results = {}
+    for mode in MODES:
+        AIConfig.AI_OUTPUT_MODE = mode
+        ai_classifier._classifier_instance = None
+        ai_classifier._batcher_instance = None
+        ai_classifier._retry_policy_instance = None
+        classification_metrics._metrics = None
+
+        before = state.request_count
+        results[mode] = await run_mode(classifier, surveys)
+        stats = classifier.get_classification_stats()
+        results[mode]["upstream_requests"] = state.request_count - before
+        results[mode]["responses"] = stats["responses"]
+        results[mode]["tokens"] = stats["tokens"]
+        results[mode]["retries"] = stats["ai_retries"]["sum"]
+
+    server.shutdown()
+    return results
+
+
+def print_report(args, results: Dict) -> None:
+    """결과 출력"""
+    print("=" * 60)
+    print("AI 응답 형식 벤치마크 (classify_with_fallback)")
+    print("=" * 60)
+    print(
+        f"  동시 요청: {args.requests} / 설명이 붙는 텍스트 응답: {args.chatty_rate:.0%} / "
+        f"일괄 분류: {'사용' if args.batch else '미사용'} / 대역 서버 지연: {args.latency_ms}ms"
+    )
+    for mode in MODES:
+        r = results[mode]
+        tokens = r["tokens"]
+        print("-" * 60)
+        print(f"[{mode}]")
+        print(
+            f"  평균: {r['avg_ms']:.1f}ms / p50: {r['p50_ms']:.1f}ms / "
+            f"p95: {r['p95_ms']:.1f}ms / 최대: {r['max_ms']:.1f}ms"
+        )
+        print(f"  결과 출처: {r['sources']} / 대역 서버 결과와 일치: {r['label_agreement']:.1%}")
+        print(
+            f"  유효하지 않은 응답: {r['responses']['invalid']}/{r['responses']['validated']} "
+            f"({r['responses']['invalid_rate']:.1%}) / 재시도: {r['retries']:.0f} / "
+            f"업스트림 요청: {r['upstream_requests']}"
+        )
+        print(
+            f"  응답당 토큰: 프롬프트 {tokens['avg_prompt_per_response']} / "
+            f"출력 {tokens['avg_completion_per_response']} (출력 합계 {tokens['completion_total']})"
+        )
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AI 응답 형식 벤치마크")
+    parser.add_argument("--requests", type=int, default=300, help="동시 분류 요청 수")
+    parser.add_argument("--chatty-rate", type=float, default=0.1, help="설명이 붙는 텍스트 응답 비율")
+    parser.add_argument("--latency-ms", type=float, default=300.0, help="OpenAI 대역 서버 지연 (ms)")
+    parser.add_argument("--batch", action="store_true", help="마이크로 배칭 사용 (AI_BATCH_ENABLED)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--output", help="결과 저장 파일 (JSON)")
+    args = parser.parse_args()
+
+    # 요청별 분류 로그 숨김
+    logging.disable(logging.CRITICAL)
+
+    results = asyncio.run(bench(args))
+    print_report(args, results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""
+OpenAI 응답 기록/재생 벤치마크 (AI_REPLAY_MODE)
+
+1. record: OpenAI 대역 서버(지연 + 지터 + 오류 주입)를 상대로 설문 --surveys개를 분류하며 응답 기록
+2. replay: 대역 서버를 끈 상태에서 같은 설문 전체를 --repeat 라운드 동시에 분류 (네트워크 없음)
+
+재생 단계의 응답 시간은 OpenAI 대기 시간을 뺀 분류 경로 자체(프롬프트 생성, SDK 직렬화/파싱,
+승인 제어, 재시도 정책, 메트릭)의 처리 비용입니다. 재생 결과가 기록 단계 결과와 같은지도 확인합니다.
+
+분류 캐시/로컬 모델/서킷 브레이커/응답 시간 예산은 비활성화하여 모든 요청이 AI 경로를 거치게 합니다.
+마이크로 배칭은 묶이는 설문 조합이 실행마다 달라 요청 지문이 바뀌므로 사용하지 않습니다.
+
+사용법:
+    python replay_bench.py --surveys 300 --repeat 10
+    python replay_bench.py --surveys 300 --repeat 10 --fail-rate 0.1 --latency-jitter-ms 200
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ai_batch_bench import random_survey, summarize  # noqa: E402
+from fake_openai_server import start_fake_openai  # noqa: E402
+
+
+async def classify_all(classifier, surveys: List[Dict[str, str]], rounds: int = 1) -> Dict:
+    """
+    라운드마다 설문 전체를 동시에 classify_with_fallback (결과 목록 포함)
+
+    같은 라운드의 중복 설문은 single-flight로 합쳐지므로 반복은 라운드를 나눠 순서대로 실행합니다.
+    """
+    times_ms: List[float] = []
+    sources: Counter = Counter()
+
+    async def one(answers):
+        start = time.perf_counter()
+        result_type, source, _ = await classifier.classify_with_fallback(answers)
+        times_ms.append((time.perf_counter() - start) * 1000)
+        sources[source] += 1
+        return result_type
+
+    results = []
+    start = time.perf_counter()
+    for _ in range(rounds):
+        results.extend(await asyncio.gather(*(one(answers) for answers in surveys)))
+    elapsed = time.perf_counter() - start
+    return {
+        **summarize(times_ms),
+        "elapsed_seconds": round(elapsed, 3),
+        "per_second": round(len(results) / elapsed, 1),
+        "sources": dict(sources),
+        "results": results,
+    }
+
+
+async def reset_ai_path() -> None:
+    """AI 분류기/HTTP 클라이언트/메트릭 싱글톤 초기화 (AI_REPLAY_MODE 변경 반영)"""
+    from services import ai_classifier, classification_metrics, openai_http
+
+    await openai_http.close_openai_http_client()
+    ai_classifier._admission_instance = None
+    ai_classifier._retry_policy_instance = None
+    classification_metrics._metrics = None
+
+
+async def bench(args, recording_path: str) -> Dict:
+    server, state, base_url = start_fake_openai(
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        fail_rate=args.fail_rate,
+        seed=args.seed
+    )
+    os.environ["OPENAI_BASE_URL"] = base_url
+
+    from config.ai_config import AIConfig
+    from services import classifier, openai_replay
+
+    AIConfig.OPENAI_API_KEY = "fake-key"
+    AIConfig.AI_BATCH_ENABLED = False
+    AIConfig.AI_CACHE_ENABLED = False
+    AIConfig.AI_LOCAL_MODEL_ENABLED = False
+    AIConfig.AI_BREAKER_ENABLED = False
+    AIConfig.AI_LATENCY_BUDGET_SECONDS = 0
+    AIConfig.AI_MAX_CONCURRENCY = 256
+    AIConfig.AI_RETRY_DELAY = 0.05
+    AIConfig.AI_REPLAY_PATH = recording_path
+
+    rng = random.Random(args.seed)
+    surveys = [random_survey(rng) for _ in range(args.surveys)]
+
+    # 1. 기록
+    AIConfig.AI_REPLAY_MODE = "record"
+    await reset_ai_path()
+    record = await classify_all(classifier, surveys)
+    record["replay"] = openai_replay.get_replay_stats()
+    record["upstream_requests"] = state.request_count + state.failed_count
+    server.shutdown()
+    server.server_close()
+
+    # 2. 재생 (대역 서버 종료 상태)
+    AIConfig.AI_REPLAY_MODE = "replay"
+    await reset_ai_path()
+    replay = await classify_all(classifier, surveys, args.repeat)
+    replay["replay"] = openai_replay.get_replay_stats()
+    replay["matches_record"] = replay["results"] == record["results"] * args.repeat
+    await reset_ai_path()
+
+    del record["results"], replay["results"]
+    return {"record": record, "replay": replay}
+
+
+def print_report(args, results: Dict) -> None:
+    """결과 출력"""
+    record, replay = results["record"], results["replay"]
+    print("=" * 60)
+    print("OpenAI 응답 기록/재생 벤치마크 (classify_with_fallback)")
+    print("=" * 60)
+    print(
+        f"  설문: {args.surveys}개 / 대역 서버 지연: {args.latency_ms}ms "
+        f"(+지터 평균 {args.latency_jitter_ms}ms) / 오류 비율: {args.fail_rate:.0%}"
+    )
+    print("-" * 60)
+    print("[record] 대역 서버 상대")
+    print(
+        f"  평균: {record['avg_ms']:.1f}ms / p95: {record['p95_ms']:.1f}ms / "
+        f"결과 출처: {record['sources']}"
+    )
+    print(
+        f"  업스트림 요청: {record['upstream_requests']} / "
+        f"기록: {record['replay']['recorded']}개"
+    )
+    print("-" * 60)
+    print(f"[replay] 대역 서버 종료, {args.surveys}개 동시 x {args.repeat} 라운드")
+    print(
+        f"  평균: {replay['avg_ms']:.2f}ms / p50: {replay['p50_ms']:.2f}ms / "
+        f"p95: {replay['p95_ms']:.2f}ms / 최대: {replay['max_ms']:.2f}ms"
+    )
+    print(
+        f"  처리량: 초당 {replay['per_second']:,.0f}건 / 결과 출처: {replay['sources']} / "
+        f"재생 적중: {replay['replay']['hits']} / 누락: {replay['replay']['misses']}"
+    )
+    print(f"  기록 단계 결과와 {'동일 ✅' if replay['matches_record'] else '다름 ❌'}")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI 응답 기록/재생 벤치마크")
+    parser.add_argument("--surveys", type=int, default=300, help="기록할 설문 수")
+    parser.add_argument("--repeat", type=int, default=10, help="재생 단계 반복 횟수")
+    parser.add_argument("--latency-ms", type=float, default=300.0, help="OpenAI 대역 서버 지연 (ms)")
+    parser.add_argument("--latency-jitter-ms", type=float, default=100.0, help="대역 서버 추가 지연 평균 (ms)")
+    parser.add_argument("--fail-rate", type=float, default=0.05, help="대역 서버 오류 응답 비율 (0~1)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--output", help="결과 저장 파일 (JSON)")
+    args = parser.parse_args()
+
+    # 요청별 분류/오류 로그 숨김
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        results = asyncio.run(bench(args, os.path.join(workdir, "openai.ndjson")))
+    print_report(args, results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
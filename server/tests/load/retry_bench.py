@@ -0,0 +1,163 @@
+"""
+AI 분류 재시도 정책 벤치마크
+
+오류(--fail-status, 기본 503)를 --fail-rate 비율로 반환하는 OpenAI 대역 서버에 분류 요청을 보내
+기존 재시도 방식과 재시도 정책(services/retry_policy.py)의 재시도 증폭을 비교합니다.
+
+- legacy: OpenAI SDK 기본 재시도 2회 + 고정 대기(AI_RETRY_DELAY) 후 재시도 2회 (기존 동작)
+- policy: SDK 재시도 없음 + 지수 백오프/full jitter + 요청당/프로세스 재시도 예산
+- policy_batch: policy + 마이크로 배칭(AI_BATCH_ENABLED) (실패한 일괄 요청도 같은 예산으로 재시도)
+
+재시도 증폭 = 업스트림 요청 수 / 분류 요청 수
+일괄 요청 증폭 = 업스트림 요청 수 / 재시도 정책이 시작한 요청 수 (policy_batch, 일괄 요청 1건 = 1)
+100ms 최대 요청 = 100ms 구간별 업스트림 요청 수의 최댓값 (재시도가 한꺼번에 몰리는 정도)
+
+분류 캐시, 서킷 브레이커, 응답 시간 예산은 비활성화하여 재시도 자체의 효과만 측정합니다.
+
+사용법:
+    python retry_bench.py --rate 50 --duration 5 --fail-rate 1.0
+    python retry_bench.py --rate 50 --duration 5 --fail-rate 0.3   # 부분 장애
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+from collections import Counter
+from typing import Dict, List
+
+MODES = ("legacy", "policy", "policy_batch")
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from admission_bench import run_mode  # noqa: E402
+from ai_batch_bench import random_survey  # noqa: E402
+from fake_openai_server import start_fake_openai  # noqa: E402
+
+
+def peak_per_window(arrivals: List[float], window: float = 0.1) -> int:
+    """window초 구간별 요청 수의 최댓값"""
+    if not arrivals:
+        return 0
+    buckets = Counter(int((t - arrivals[0]) / window) for t in arrivals)
+    return max(buckets.values())
+
+
+async def bench(args) -> Dict:
+    server, state, base_url = start_fake_openai(
+        latency_ms=args.latency_ms, fail_rate=args.fail_rate, fail_status=args.fail_status
+    )
+    os.environ["OPENAI_BASE_URL"] = base_url
+
+    from config.ai_config import AIConfig
+    from services import ai_classifier, classifier
+    from services.retry_policy import RetryPolicy
+
+    AIConfig.OPENAI_API_KEY = "fake-key"
+    AIConfig.AI_BATCH_ENABLED = False
+    AIConfig.AI_CACHE_ENABLED = False
+    AIConfig.AI_BREAKER_ENABLED = False
+    AIConfig.AI_MAX_CONCURRENCY = 256
+    AIConfig.AI_LATENCY_BUDGET_SECONDS = 0
+
+    rng = random.Random(args.seed)
+    surveys = [random_survey(rng) for _ in range(int(args.rate * args.duration))]
+
+    results = {}
+    for label in MODES:
+        AIConfig.AI_BATCH_ENABLED = label == "policy_batch"
+        ai_classifier._classifier_instance = None
+        ai_classifier._batcher_instance = None
+        ai_classifier._admission_instance = None
+        ai_classifier._retry_policy_instance = None
+        ai = ai_classifier.get_classifier()
+        if label == "legacy":
+            # SDK 기본 재시도(2회) + 고정 대기 재시도, 예산 없음
+            ai.client = ai.client.with_options(max_retries=2)
+            ai.retry_policy = RetryPolicy(
+                max_retries=AIConfig.AI_MAX_RETRIES,
+                base_delay=AIConfig.AI_RETRY_DELAY,
+                max_delay=AIConfig.AI_RETRY_DELAY,
+                request_budget_seconds=float("inf"),
+                rng=lambda: 1.0
+            )
+
+        state.arrivals = []
+        results[label] = await run_mode(classifier, surveys, args.rate)
+        arrivals, state.arrivals = state.arrivals, None
+        results[label]["upstream_requests"] = len(arrivals)
+        results[label]["amplification"] = round(len(arrivals) / len(surveys), 3)
+        results[label]["peak_per_100ms"] = peak_per_window(arrivals)
+        results[label]["retry"] = ai.retry_policy.stats()
+        started = results[label]["retry"]["requests"]
+        results[label]["upstream_per_request"] = round(len(arrivals) / started, 3) if started else 0.0
+
+    server.shutdown()
+    return results
+
+
+def print_report(args, results: Dict) -> None:
+    """결과 출력"""
+    print("=" * 60)
+    print("AI 분류 재시도 정책 벤치마크 (classify_with_fallback)")
+    print("=" * 60)
+    print(
+        f"  요청: 초당 {args.rate}건 x {args.duration}s / 오류 비율: {args.fail_rate:.0%} "
+        f"({args.fail_status}) / 대역 서버 지연: {args.latency_ms}ms"
+    )
+    for label in MODES:
+        r = results[label]
+        print("-" * 60)
+        print(f"[{label}]")
+        print(
+            f"  평균: {r['avg_ms']:.1f}ms / p50: {r['p50_ms']:.1f}ms / "
+            f"p95: {r['p95_ms']:.1f}ms / 최대: {r['max_ms']:.1f}ms"
+        )
+        print(f"  결과 출처: {r['sources']}")
+        print(
+            f"  업스트림 요청: {r['upstream_requests']} / 재시도 증폭: {r['amplification']}배 / "
+            f"100ms 최대 요청: {r['peak_per_100ms']}"
+        )
+        if label == "policy_batch":
+            print(
+                f"  정책 요청(일괄 요청 포함): {r['retry']['requests']} / "
+                f"일괄 요청 증폭: {r['upstream_per_request']}배"
+            )
+        if label != "legacy":
+            retry = r["retry"]
+            print(
+                f"  재시도: {retry['retries']} / 예산 소진 포기: {retry['gave_up_retry_budget']} / "
+                f"시간 예산 포기: {retry['gave_up_request_budget']} / "
+                f"평균 대기: {retry['avg_delay_seconds']}s"
+            )
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AI 분류 재시도 정책 벤치마크")
+    parser.add_argument("--rate", type=float, default=50, help="초당 요청 수")
+    parser.add_argument("--duration", type=float, default=5, help="요청 발생 시간 (초)")
+    parser.add_argument("--fail-rate", type=float, default=1.0, help="대역 서버 오류 응답 비율 (0~1)")
+    parser.add_argument("--fail-status", type=int, default=503, help="오류 응답 상태 코드")
+    parser.add_argument("--latency-ms", type=float, default=200.0, help="OpenAI 대역 서버 지연 (ms)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--output", help="결과 저장 파일 (JSON)")
+    args = parser.parse_args()
+
+    # 요청별 분류/오류 로그 숨김
+    logging.disable(logging.CRITICAL)
+
+    results = asyncio.run(bench(args))
+    print_report(args, results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
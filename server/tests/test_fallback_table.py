@@ -0,0 +1,66 @@
+"""
+Fallback 사전 계산 테이블 검증
+
+저장된 테이블(services/data/fallback_table.bin)이 전체 응답 조합
+(5 x 4^9 = 1,310,720가지)에서 calculate_scores + determine_result_type과
+같은 결과를 내는지 확인합니다.
+
+실행 (server 디렉토리에서):
+    python -m pytest tests/test_fallback_table.py
+"""
+
+import pytest
+
+from services.fallback_classifier import calculate_scores, determine_result_type
+from services.fallback_table import (
+    TABLE_SIZE,
+    FallbackTable,
+    encode_answers,
+    iter_answer_space,
+    rules_fingerprint,
+)
+
+
+@pytest.fixture(scope="module")
+def table() -> FallbackTable:
+    return FallbackTable.load()
+
+
+def test_table_matches_current_rules(table):
+    """테이블 지문이 현재 스코어링 로직과 같음 (다르면 서버가 테이블을 쓰지 않음)"""
+    assert len(table.values) == TABLE_SIZE
+    assert table.fingerprint == rules_fingerprint(), (
+        "'python -m services.fallback_table build'로 테이블을 재생성하세요"
+    )
+
+
+def test_table_equivalent_for_all_combinations(table):
+    """전체 응답 조합에서 테이블 조회 결과 == calculate_scores + determine_result_type"""
+    mismatches = []
+    count = 0
+    for count, answers in enumerate(iter_answer_space(), 1):
+        expected = determine_result_type(calculate_scores(answers))
+        if table.lookup(answers) != expected:
+            mismatches.append(answers)
+    assert count == TABLE_SIZE
+    assert not mismatches, f"불일치 {len(mismatches)}건 (예: {mismatches[0]})"
+
+
+def test_encode_answers_follows_enumeration_order():
+    """응답 조합의 인덱스 == 생성 순서 (표본 추출)"""
+    for index, answers in enumerate(iter_answer_space()):
+        if index % 997 == 0:
+            assert encode_answers(answers) == index
+            # 딕셔너리 키 순서와 무관하게 같은 인덱스
+            reordered = {key: answers[key] for key in reversed(list(answers))}
+            assert encode_answers(reordered) == index
+
+
+def test_out_of_table_answers_not_looked_up(table):
+    """미응답/알 수 없는 답변은 테이블 범위 밖 (기존 계산 경로 사용)"""
+    answers = next(iter_answer_space())
+    missing = dict(answers)
+    del missing["5"]
+    unknown = {**answers, "5": "q5a9"}
+    assert encode_answers(missing) is None
+    assert table.lookup(unknown) is None